@@ -0,0 +1,644 @@
+# Classification (U)
+
+"""Program:  dump_cli.py
+
+    Description:  Library of the functions used by mysql_db_dump.py to check
+        the program options, to create the dump options, engine and server
+        from them and to run the dumps.
+
+    Functions:
+        add_ssl
+        add_tls
+        chk_int_opts
+        chk_codec
+        chk_engine
+        chk_hash
+        chk_load
+        crt_server
+        crt_engine
+        term_handler
+        crt_progress
+        crt_dump_opts
+        dump_full
+        run_dump
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import datetime
+import signal
+import time
+import json
+import threading
+
+# Local
+try:
+    from .lib import gen_libs
+    from .mysql_lib import mysql_libs
+    from .mysql_lib import mysql_class
+    from . import dump_stream
+    from . import dump_file
+    from . import dump_engine
+    from . import dump_watch
+    from . import dump_units
+    from . import dump_sched
+    from . import dump_report
+    from . import dump_state
+    from . import version
+
+except (ValueError, ImportError) as err:
+    import lib.gen_libs as gen_libs                     # pylint:disable=R0402
+    import mysql_lib.mysql_libs as mysql_libs           # pylint:disable=R0402
+    import mysql_lib.mysql_class as mysql_class         # pylint:disable=R0402
+    import dump_stream
+    import dump_file
+    import dump_engine
+    import dump_watch
+    import dump_units
+    import dump_sched
+    import dump_report
+    import dump_state
+    import version
+
+__version__ = version.__version__
+
+# Global
+# Exit codes:  connection or setup error and failed dumps.
+EXIT_ERROR = 1
+EXIT_FAILED = 2
+
+
+def add_ssl(cfg, dump_cmd):
+
+    """Function:  add_ssl
+
+    Description:  Add SSL options to the dump command line.
+
+    Arguments:
+        (input) cfg -> Configuration file module instance
+        (input) dump_cmd -> Database dump command line
+        (output) dump_cmd -> Database dump command line
+        (output) status -> Status of SSL options
+        (output) err_msg -> Error message for SSL options
+
+    """
+
+    ssl_arg = {
+        "ssl_client_ca": "--ssl-ca=", "ssl_ca_path": "--ssl-capath=",
+        "ssl_client_key": "--ssl-key=", "ssl_client_cert": "--ssl-cert=",
+        "ssl_mode": "--ssl-mode="}
+
+    dump_cmd = list(dump_cmd)
+    status = True
+    err_msg = None
+
+    if hasattr(cfg, "ssl_client_ca") and hasattr(cfg, "ssl_client_key") \
+       and hasattr(cfg, "ssl_client_cert"):
+
+        if getattr(cfg, "ssl_client_ca") or (getattr(cfg, "ssl_client_key") and
+                                             getattr(cfg, "ssl_client_cert")):
+
+            data = [ssl_arg[opt] + getattr(cfg, opt)
+                    for opt in list(ssl_arg.keys()) if getattr(cfg, opt)]
+            dump_cmd.extend(data)
+
+        else:
+            status = False
+            err_msg = "One or more values missing for required SSL settings."
+
+    else:
+        status = False
+        err_msg = "Configuration file is missing SSL entries."
+
+    return dump_cmd, status, err_msg
+
+
+def add_tls(cfg, dump_cmd):
+
+    """Function:  add_tls
+
+    Description:  Add TLS option to the dump command line, if available.
+
+    Arguments:
+        (input) cfg -> Configuration file module instance
+        (input) dump_cmd -> Database dump command line
+        (output) dump_cmd -> Database dump command line
+
+    """
+
+    dump_cmd = list(dump_cmd)
+
+    if hasattr(cfg, "tls_versions") and getattr(cfg, "tls_versions"):
+        dump_cmd.append("--tls-version=" + str(getattr(cfg, "tls_versions")))
+
+    return dump_cmd
+
+
+def chk_int_opts(args, opt_int):
+
+    """Function:  chk_int_opts
+
+    Description:  Check that the options requiring an integer value are
+        positive integers.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) opt_int -> List of options requiring positive integer values
+        (output) status -> True|False - All integer options are valid
+
+    """
+
+    status = True
+
+    for opt in list(opt_int):
+        val = args.get_val(opt, def_val=None)
+
+        if val is not None and (not str(val).isdigit() or int(val) < 1):
+            print(f"Error:  Option {opt} requires a positive integer: {val}")
+            status = False
+
+    return status
+
+
+def chk_codec(args):
+
+    """Function:  chk_codec
+
+    Description:  Check the compression codec is supported and available and
+        the compression level is valid for the codec.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (output) status -> True|False - Compression options are valid
+
+    """
+
+    status = True
+    codec = args.get_val("-C", def_val="gzip")
+    level = args.get_val("-L", def_val=None)
+    modules = {"zstd": dump_stream.zstandard, "lz4": dump_stream.lz4}
+
+    if codec not in dump_stream.CODECS:
+        print(f"Error:  Compression codec {codec} is not supported."
+              f"  Valid codecs: {', '.join(dump_stream.CODECS)}")
+        status = False
+
+    elif codec in modules and modules[codec] is None:
+        print(f"Error:  Python module for compression codec {codec} is not"
+              f" installed.")
+        status = False
+
+    elif level is not None:
+        low, high = dump_stream.CODECS[codec]["levels"]
+
+        if not str(level).isdigit() or not low <= int(level) <= high:
+            print(f"Error:  Compression level for {codec} must be between"
+                  f" {low} and {high}: {level}")
+            status = False
+
+    return status
+
+
+def chk_engine(args):
+
+    """Function:  chk_engine
+
+    Description:  Check the dump engine is a valid engine and supports the
+        dump options.  Only the mysqldump engine dumps schema, table, snapshot
+        group and batch units and the mysqlsh engine dump directories cannot
+        be used for incremental dumps or checksummed.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (output) status -> True|False - Dump engine is valid
+
+    """
+
+    status = True
+
+    engine = args.get_val("-E", def_val="mysqldump")
+    opts = [opt for opt in ["-T", "-S", "-G"]
+            if args.get_val(opt, def_val=False)]
+
+    if engine not in dump_engine.ENGINES:
+        print(f"Error:  Dump engine {engine} is not supported."
+              f"  Valid engines: {', '.join(dump_engine.ENGINES)}")
+        status = False
+
+    elif engine != "mysqldump" and opts:
+        print(f"Error:  Dump engine {engine} is not available with the"
+              f" {', '.join(opts)} option(s).")
+        status = False
+
+    elif engine == "mysqlsh" and [opt for opt in ["-I", "-H"]
+                                  if args.get_val(opt, def_val=False)]:
+        print(f"Error:  Dump engine {engine} is not available with the -I"
+              f" or -H option.")
+        status = False
+
+    return status
+
+
+def chk_hash(args):
+
+    """Function:  chk_hash
+
+    Description:  Check the checksum algorithm is supported and available.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (output) status -> True|False - Checksum algorithm is valid
+
+    """
+
+    status = True
+    algo = args.get_val("-H", def_val=None)
+
+    if algo is not None and algo not in dump_file.HASHES:
+        print(f"Error:  Checksum algorithm {algo} is not supported."
+              f"  Valid algorithms: {', '.join(dump_file.HASHES)}")
+        status = False
+
+    elif algo == "xxh3" and dump_file.xxhash is None:
+        print("Error:  Python module for checksum algorithm xxh3 is not"
+              " installed.")
+        status = False
+
+    return status
+
+
+def chk_load(args):
+
+    """Function:  chk_load
+
+    Description:  Check the minimum number of concurrent dumps of the load
+        controller (-a option) is not greater than the number of concurrent
+        dumps (-j option).
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (output) status -> True|False - Load controller option is valid
+
+    """
+
+    status = True
+    floor = args.get_val("-a", def_val=None)
+    workers = args.get_val("-j", def_val=1)
+
+    if floor is not None and int(floor) > int(workers):
+        print(f"Error:  Option -a {floor} is greater than option -j"
+              f" {workers}")
+        status = False
+
+    return status
+
+
+def crt_server(args):
+
+    """Function:  crt_server
+
+    Description:  Create and connect a database server instance.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (output) server -> Database server instance
+
+    """
+
+    server = mysql_libs.create_instance(
+        args.get_val("-c"), args.get_val("-d"), mysql_class.Server)
+    server.connect(silent=True)
+
+    return server
+
+
+def crt_engine(server, args, dump_cmd):
+
+    """Function:  crt_engine
+
+    Description:  Create the dump engine selected by the -E option.  The
+        mysqlpump and mysqlsh command lines are created with the connection
+        and SSL options of the server and mysqlpump keeps the single
+        transaction and GTID options of the dump command.
+
+    Arguments:
+        (input) server -> Database server instance
+        (input) args -> ArgParser class instance
+        (input) dump_cmd -> Database dump command line
+        (output) -> DumpEngine instance
+
+    """
+
+    dump_cmd = list(dump_cmd)
+    engine = args.get_val("-E", def_val="mysqldump")
+
+    if engine == "native":
+        return dump_engine.NativeEngine(lambda: crt_server(args))
+
+    if engine == "mysqldump":
+        return dump_engine.MysqldumpEngine(dump_cmd)
+
+    cmd = mysql_libs.crt_cmd(server, args.arg_set_path("-p", cmd=engine))
+
+    if args.arg_exist("-l"):
+        cfg = gen_libs.load_module(args.get_val("-c"), args.get_val("-d"))
+        cmd = add_tls(cfg, add_ssl(cfg, cmd)[0])
+
+    if engine == "mysqlpump":
+        return dump_engine.PumpEngine(cmd + [
+            opt for opt in dump_cmd
+            if opt.startswith(("--single-transaction", "--set-gtid-purged"))])
+
+    return dump_engine.ShellEngine(cmd)
+
+
+def term_handler(stop, procs):
+
+    """Function:  term_handler
+
+    Description:  Create the SIGTERM signal handler of a run.  The first
+        signal sets the stop event:  the units being dumped are finished but
+        no further units are started.  A second signal abandons the units
+        being dumped by terminating their dump processes.  The completed
+        units are in the journal, so the run can be resumed (-R option).
+
+    Arguments:
+        (input) stop -> Event instance, set to stop dumping
+        (input) procs -> List of the dump processes of the run
+        (output) handler -> Signal handler function
+
+    """
+
+    def handler(signum, frame):                         # pylint:disable=W0613
+
+        """Function:  handler
+
+        Description:  SIGTERM signal handler.
+
+        Arguments:
+            (input) signum -> Signal number
+            (input) frame -> Current stack frame
+
+        """
+
+        if not stop.is_set():
+            stop.set()
+            print("WARNING:  SIGTERM received.  Finishing the current dumps,"
+                  " rerun with the -R option to resume.")
+            return
+
+        print("WARNING:  SIGTERM received.  Abandoning the current dumps.")
+
+        for proc in list(procs):
+            if proc.poll() is None:
+                proc.terminate()
+
+    return handler
+
+
+def crt_progress(args, dmp_path, db_list, db_size, **kwargs):
+
+    """Function:  crt_progress
+
+    Description:  Create the progress reporting watchdog of a run (-g
+        option).  The size estimate of the run is the information_schema
+        size of the databases to be dumped, less the databases completed by
+        the resumed run.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) dmp_path -> Database dump output directory path
+        (input) db_list -> Array of database names, all databases if empty
+        (input) db_size -> Dictionary of database names and sizes in bytes
+        (input) **kwargs:
+            tbl_size -> Dictionary of databases and their table sizes
+            journal -> Journal instance of the run
+            metrics -> Dictionary of unit names and dump metrics of the run
+        (output) -> Progress instance
+
+    """
+
+    done = kwargs["journal"].done if kwargs.get("journal", None) else {}
+    sizes = {dbn: size for dbn, size in db_size.items()
+             if dbn in db_list or not db_list}
+
+    for dbn, tables in (kwargs.get("tbl_size", None) or {}).items():
+        sizes.update({dbn + "." + tbl: size for tbl, size in tables.items()})
+
+    total = sum(size for dbn, size in db_size.items()
+                if (dbn in db_list or not db_list) and dbn not in done)
+    sizes["All_Databases"] = total
+
+    return dump_watch.Progress(
+        dmp_path, total, sizes=sizes, metrics=kwargs.get("metrics", {}),
+        report=int(args.get_val("-g")),
+        budget=int(args.get_val("-M", def_val=0)) or None,
+        stall=int(args.get_val("-W", def_val=0)) or None)
+
+
+def crt_dump_opts(server, args, db_list, dump_cmd, **kwargs):
+
+    """Function:  crt_dump_opts
+
+    Description:  Create the options of the dumps from the command line
+        options:  compression, table sizes and chunks, dump engine, writer,
+        checksums, retries, watchdog and load controller.
+
+    Arguments:
+        (input) server -> Database server instance
+        (input) args -> ArgParser class instance
+        (input) db_list -> Array of database names
+        (input) dump_cmd -> Database dump command line
+        (input) **kwargs:
+            err_sup -> Suppression of standard error to standard out
+            mail -> Email class instance
+        (output) -> Dictionary of dump options (see dump_db)
+
+    """
+
+    comp_opts = {"threads": int(args.get_val("-m", def_val=1)),
+                 "codec": args.get_val("-C", def_val="gzip")}
+
+    if args.arg_exist("-L"):
+        comp_opts["level"] = int(args.get_val("-L"))
+
+    tbl_size = dump_units.fetch_tbl_size(server, db_list)                   \
+        if args.arg_exist("-T") else None
+    watchdog = None
+
+    if (args.arg_exist("-M") or args.arg_exist("-W"))                     \
+       and not args.arg_exist("-g"):
+        watchdog = dump_watch.Watchdog(
+            budget=int(args.get_val("-M", def_val=0)) or None,
+            stall=int(args.get_val("-W", def_val=0)) or None)
+
+    return {
+        "err_sup": kwargs.get("err_sup", False),
+        "mail": kwargs.get("mail", None),
+        "use_mailx": args.get_val("-u", def_val=False),
+        "workers": int(args.get_val("-j", def_val=1)),
+        "comp_opts": comp_opts, "tbl_size": tbl_size,
+        "tbl_chunks": dump_units.fetch_tbl_chunks(
+            server, tbl_size, int(args.get_val("-K")) * 1024 * 1024)
+        if args.arg_exist("-K") else None,
+        "engine": crt_engine(server, args, dump_cmd)
+        if args.arg_exist("-E") else None,
+        "write_opts": {"direct": args.arg_exist("-O"),
+                       "sizes": dump_units.fetch_data_size(server, db_list)}
+        if args.arg_exist("-P") else None,
+        "hash_opts": {"algo": args.get_val("-H"), "digests": {}}
+        if args.arg_exist("-H") else None,
+        "metrics": {}, "retries": int(args.get_val("-n", def_val=0)),
+        "stop": threading.Event(), "procs": [], "watchdog": watchdog,
+        "load": dump_watch.LoadController(
+            server, int(args.get_val("-a")),
+            int(args.get_val("-j", def_val=1)))
+        if args.arg_exist("-a") else None}
+
+
+def dump_full(                                     # pylint:disable=R0913,R0917
+        server, args, dump_cmd, db_list, dmp_path, dump_opts):
+
+    """Function:  dump_full
+
+    Description:  Full dump of the databases (-A, -B or -D option).  The
+        journal of the run is closed once the dumps have ended, even on an
+        error.  With the -g option, the progress watchdog (see crt_progress)
+        is set as the watchdog of the dump options.  The manifest of the run
+        is saved to the dump directory and the binary log position of the
+        run is recorded (see record_binlog_pos) if no dump failed.
+
+    Arguments:
+        (input) server -> Database server instance
+        (input) args -> ArgParser class instance
+        (input) dump_cmd -> Database dump command line
+        (input) db_list -> Array of database names
+        (input) dmp_path -> Database dump output directory path
+        (input) dump_opts -> Dictionary of dump options (see crt_dump_opts)
+        (output) failed -> List of the database or unit names of the failed
+            dumps
+        (output) manifest -> Dictionary of the run (see crt_manifest)
+
+    """
+
+    start = time.time()
+    run = datetime.datetime.strftime(
+        datetime.datetime.fromtimestamp(start), "%Y%m%d_%H%M%S")
+    snapshot = server if args.arg_exist("-S") else None
+    batch_size = int(args.get_val("-G")) * 1024 * 1024                    \
+        if args.arg_exist("-G") else None
+    db_size = dump_units.fetch_db_size(server)                              \
+        if snapshot or batch_size or args.arg_exist("-g") else {}
+    binlog = dump_state.fetch_binlog_pos(server)
+    journal = dump_units.Journal(
+        dmp_path, run, resume=args.arg_exist("-R"),
+        flavor=args.get_val("-y", def_val=None))
+
+    try:
+        if args.arg_exist("-g"):
+            dump_opts["watchdog"] = crt_progress(
+                args, dmp_path, db_list, db_size,
+                tbl_size=dump_opts["tbl_size"], journal=journal,
+                metrics=dump_opts["metrics"])
+
+        failed = dump_sched.dump_db(
+            dump_cmd, db_list, args.get_val("-z", def_val=False), dmp_path,
+            snapshot=snapshot, db_size=db_size, batch_size=batch_size,
+            journal=journal, **dump_opts)
+
+    finally:
+        journal.close()
+
+    manifest = dump_report.crt_manifest(
+        run, start, dump_opts["metrics"], binlog=binlog,
+        hash_opts=dump_opts["hash_opts"], failed=failed,
+        watchdog=dump_opts["watchdog"], load=dump_opts["load"])
+    dump_report.save_manifest(dmp_path, manifest)
+
+    if binlog and not failed:
+        dump_state.record_binlog_pos(dmp_path, binlog)
+
+    return failed, manifest
+
+
+def run_dump(                                      # pylint:disable=R0913,R0917
+        server, args, dump_cmd, db_list, dmp_path, dump_opts):
+
+    """Function:  run_dump
+
+    Description:  Run the dumps of the program:  binary logs (-b option),
+        incremental (-I option) or full dump (see dump_full).  The binary
+        log position of an incremental dump is recorded (see
+        record_binlog_pos) if no dump failed.  The SIGTERM handler is
+        restored and the watchdog and dump engine are closed once the dumps
+        have ended, even on an error.  Displays the watchdog events, dump
+        engine statistics, failed dumps and dumps not started of the run.
+
+    Arguments:
+        (input) server -> Database server instance
+        (input) args -> ArgParser class instance
+        (input) dump_cmd -> Database dump command line
+        (input) db_list -> Array of database names
+        (input) dmp_path -> Database dump output directory path
+        (input) dump_opts -> Dictionary of dump options (see crt_dump_opts)
+        (output) -> 0 if all dumps completed or EXIT_FAILED if a dump failed
+            or was not started
+
+    """
+
+    manifest = None
+    prev_handler = signal.signal(
+        signal.SIGTERM, term_handler(dump_opts["stop"], dump_opts["procs"]))
+
+    try:
+        if args.arg_exist("-b"):
+            failed = [] if dump_state.dump_binlog(server, dump_cmd, dmp_path) \
+                else ["Binary logs"]
+
+        elif args.arg_exist("-I"):
+            binlog = dump_state.fetch_binlog_pos(server)
+            manifest = dump_state.dump_incr(
+                server, args.get_val("-I"), dump_cmd, db_list,
+                args.get_val("-z", def_val=False), dmp_path, binlog=binlog,
+                **dump_opts)
+            failed = manifest["Failed"]
+
+            if binlog and not failed:
+                dump_state.record_binlog_pos(dmp_path, binlog)
+
+        else:
+            failed, manifest = dump_full(
+                server, args, dump_cmd, db_list, dmp_path, dump_opts)
+
+    finally:
+        signal.signal(signal.SIGTERM, prev_handler)
+
+        for item in [dump_opts["watchdog"], dump_opts["engine"]]:
+            if item is not None:
+                item.close()
+
+    if args.arg_exist("-x"):
+        dump_report.save_prom(args.get_val("-x"), manifest, server.name)
+
+    for event in dump_opts["watchdog"].events if dump_opts["watchdog"]     \
+            else []:
+        print(f"Watchdog:  {event['unit']} {event['reason']}"
+              f" after {event['seconds']} seconds ({event['bytes']} bytes)"
+              f"{', requeued' if event['requeued'] else ''}")
+
+    if dump_opts["engine"]:
+        print(f"Dump engine:  {json.dumps(dump_opts['engine'].stats())}")
+
+    skipped = [name for name in dump_units.not_started(
+        dump_opts.get("metrics", {})) if name in failed]
+    failed = [name for name in failed if name not in skipped]
+
+    if failed:
+        print(f"Error:  Dump failed for:  {', '.join(failed)}")
+
+    if skipped:
+        print(f"WARNING:  Dump not started for:  {', '.join(skipped)}")
+
+    return EXIT_FAILED if failed or skipped else 0
@@ -0,0 +1,814 @@
+# Classification (U)
+
+"""Program:  dump_engine.py
+
+    Description:  Library of the dump engines used by mysql_db_dump.py to
+        dump a database or a table:  mysqldump, mysqlpump, MySQL Shell and the
+        native engine.
+
+    Classes:
+        DumpEngine
+        MysqldumpEngine
+        PumpEngine
+        ShellEngine
+        NativeEngine
+
+    Functions:
+        quote_val
+        quote_id
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import subprocess
+import time
+import re
+import queue
+import threading
+
+# Local
+try:
+    from .mysql_lib import mysql_libs
+    from . import dump_stream
+    from . import dump_file
+    from . import dump_proc
+    from . import version
+
+except (ValueError, ImportError) as err:
+    import mysql_lib.mysql_libs as mysql_libs           # pylint:disable=R0402
+    import dump_stream
+    import dump_file
+    import dump_proc
+    import version
+
+__version__ = version.__version__
+
+# Global
+# Dump engines.
+ENGINES = ["mysqldump", "mysqlpump", "mysqlsh", "native"]
+
+# String literal escapes used by mysqldump.
+ESCAPES = {b"\0": b"\\0", b"\n": b"\\n", b"\r": b"\\r", b"\\": b"\\\\",
+           b"'": b"\\'", b'"': b'\\"', b"\x1a": b"\\Z"}
+ESCAPE_RE = re.compile(b"[\\0\\n\\r\\\\'\"\\x1a]")
+# Column data types dumped as unquoted numbers and as hexadecimal literals.
+NUMERIC_TYPES = ["tinyint", "smallint", "mediumint", "int", "integer",
+                 "bigint", "decimal", "numeric", "float", "double", "real",
+                 "year"]
+BINARY_TYPES = ["binary", "varbinary", "tinyblob", "blob", "mediumblob",
+                "longblob", "bit", "geometry", "point", "linestring",
+                "polygon", "multipoint", "multilinestring", "multipolygon",
+                "geometrycollection", "geomcollection"]
+# Session settings at the start and end of the native engine dump files.
+NATIVE_HEADER = b"""-- Dump created by the mysql_db_dump native engine
+
+/*!40101 SET @OLD_CHARACTER_SET_CLIENT=@@CHARACTER_SET_CLIENT */;
+/*!40101 SET @OLD_CHARACTER_SET_RESULTS=@@CHARACTER_SET_RESULTS */;
+/*!40101 SET @OLD_COLLATION_CONNECTION=@@COLLATION_CONNECTION */;
+/*!50503 SET NAMES utf8mb4 */;
+/*!40103 SET @OLD_TIME_ZONE=@@TIME_ZONE */;
+/*!40103 SET TIME_ZONE='+00:00' */;
+/*!40014 SET @OLD_UNIQUE_CHECKS=@@UNIQUE_CHECKS, UNIQUE_CHECKS=0 */;
+/*!40014 SET @OLD_FOREIGN_KEY_CHECKS=@@FOREIGN_KEY_CHECKS,
+    FOREIGN_KEY_CHECKS=0 */;
+/*!40101 SET @OLD_SQL_MODE=@@SQL_MODE, SQL_MODE='NO_AUTO_VALUE_ON_ZERO' */;
+/*!40111 SET @OLD_SQL_NOTES=@@SQL_NOTES, SQL_NOTES=0 */;
+"""
+NATIVE_FOOTER = b"""
+/*!40103 SET TIME_ZONE=@OLD_TIME_ZONE */;
+/*!40101 SET SQL_MODE=@OLD_SQL_MODE */;
+/*!40014 SET FOREIGN_KEY_CHECKS=@OLD_FOREIGN_KEY_CHECKS */;
+/*!40014 SET UNIQUE_CHECKS=@OLD_UNIQUE_CHECKS */;
+/*!40101 SET CHARACTER_SET_CLIENT=@OLD_CHARACTER_SET_CLIENT */;
+/*!40101 SET CHARACTER_SET_RESULTS=@OLD_CHARACTER_SET_RESULTS */;
+/*!40101 SET COLLATION_CONNECTION=@OLD_COLLATION_CONNECTION */;
+/*!40111 SET SQL_NOTES=@OLD_SQL_NOTES */;
+
+-- Dump completed
+"""
+
+
+class DumpEngine():
+
+    """Class:  DumpEngine
+
+    Description:  Base class of the dump engines.  A dump engine plans the
+        units to be dumped, dumps a single unit to its dump file and reports
+        the statistics of the units it has dumped.  Subclasses implement the
+        dump method.  The run method is called concurrently by the dump_pool
+        worker threads.
+
+    Methods:
+        __init__
+        plan
+        run
+        dump
+        fname
+        stats
+        close
+
+    """
+
+    name = None
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization of an instance of the DumpEngine class.
+
+        Arguments:
+
+        """
+
+        self.lock = threading.Lock()
+        self.counts = {"units": 0, "failed": 0, "bytes": 0, "seconds": 0.0}
+
+    def plan(self, units):
+
+        """Method:  plan
+
+        Description:  Return the units to be dumped by the engine, in the
+            order they are to be dumped.
+
+        Arguments:
+            (input) units -> List of unit dictionaries (see crt_units)
+            (output) -> List of unit dictionaries
+
+        """
+
+        return list(units)
+
+    def run(self, unit, dmp_file, compress, **kwargs):
+
+        """Method:  run
+
+        Description:  Dump a unit and record its statistics.  An error
+            raised by the dump fails the unit and is added to its metrics.
+
+        Arguments:
+            (input) unit -> Unit dictionary (see crt_units)
+            (input) dmp_file -> Dump file and path name
+            (input) compress -> Compression flag
+            (input) **kwargs:
+                errfile -> File handler for error file
+                comp_opts -> Dictionary of compression options
+                procs -> List to which the dump process is added once started
+                write_opts -> Dictionary of DumpWriter options (see open_dump)
+                hash_opts -> Dictionary of checksum options (see open_dump)
+                metrics -> Dictionary to which the dump metrics are added
+                    (see dump_metrics)
+            (output) status -> True|False - Dump was successful
+
+        """
+
+        start = time.time()
+        metrics = kwargs.get("metrics", {})
+
+        try:
+            status = self.dump(unit, dmp_file, compress, **kwargs)
+
+        except Exception as msg:                        # pylint:disable=W0718
+            print(f"Error:  {self.name} dump of {unit['name']} failed:"
+                  f"  {msg}")
+            metrics["error"] = str(msg)
+            status = False
+
+        fname = self.fname(dmp_file, compress, kwargs.get("comp_opts", {}))
+        size = dump_file.path_size(fname) if status else 0
+
+        if "file" not in metrics:
+            metrics.update(dump_proc.dump_metrics(fname, start, time.time()))
+
+        with self.lock:
+            self.counts["units"] += 1
+            self.counts["failed"] += 0 if status else 1
+            self.counts["bytes"] += size
+            self.counts["seconds"] += time.time() - start
+
+        return status
+
+    def dump(self, unit, dmp_file, compress, **kwargs):
+
+        """Method:  dump
+
+        Description:  Dump a unit to the dump file.
+
+        Arguments:
+            (input) unit -> Unit dictionary (see crt_units)
+            (input) dmp_file -> Dump file and path name
+            (input) compress -> Compression flag
+            (input) **kwargs:
+                errfile -> File handler for error file
+                comp_opts -> Dictionary of compression options
+                procs -> List to which the dump process is added once started
+            (output) status -> True|False - Dump was successful
+
+        """
+
+        raise NotImplementedError(f"{self.name}: dump is not implemented")
+
+    def fname(self, dmp_file, compress, comp_opts):
+
+        """Method:  fname
+
+        Description:  Return the name of the dump file (or directory) the
+            engine writes for the dump file name.
+
+        Arguments:
+            (input) dmp_file -> Dump file and path name
+            (input) compress -> Compression flag
+            (input) comp_opts -> Dictionary of compression options
+            (output) -> Dump file name
+
+        """
+
+        return dump_stream.dump_fname(dmp_file, compress, comp_opts)
+
+    def stats(self):
+
+        """Method:  stats
+
+        Description:  Return the statistics of the units dumped by the engine.
+
+        Arguments:
+            (output) -> Dictionary of the engine name, number of units dumped
+                and failed, bytes written and seconds spent dumping
+
+        """
+
+        with self.lock:
+            return {"engine": self.name, "units": self.counts["units"],
+                    "failed": self.counts["failed"],
+                    "bytes": self.counts["bytes"],
+                    "seconds": round(self.counts["seconds"], 3)}
+
+    def close(self):
+
+        """Method:  close
+
+        Description:  Release the resources held by the engine.
+
+        Arguments:
+
+        """
+
+
+class MysqldumpEngine(DumpEngine):
+
+    """Class:  MysqldumpEngine
+
+    Description:  Dump engine running a mysqldump process for each unit.
+
+    Methods:
+        __init__
+        crt_args
+        dump
+
+    """
+
+    name = "mysqldump"
+
+    def __init__(self, dump_cmd):
+
+        """Method:  __init__
+
+        Description:  Initialization of an instance of the MysqldumpEngine
+            class.
+
+        Arguments:
+            (input) dump_cmd -> Database dump command line
+
+        """
+
+        super().__init__()
+        self.dump_cmd = list(dump_cmd)
+
+    def crt_args(self, unit):
+
+        """Method:  crt_args
+
+        Description:  Create the dump command line of a unit.
+
+        Arguments:
+            (input) unit -> Unit dictionary (see crt_units)
+            (output) -> Dump command line
+
+        """
+
+        return self.dump_cmd + list(unit["args"])
+
+    def dump(self, unit, dmp_file, compress, **kwargs):
+
+        """Method:  dump
+
+        Description:  Run the dump command of the unit, streaming the output
+            to the dump file.
+
+        Arguments:
+            (input) unit -> Unit dictionary (see crt_units)
+            (input) dmp_file -> Dump file and path name
+            (input) compress -> Compression flag
+            (input) **kwargs:
+                errfile -> File handler for error file
+                comp_opts -> Dictionary of compression options
+                procs -> List to which the dump process is added once started
+                write_opts -> Dictionary of DumpWriter options (see open_dump)
+                hash_opts -> Dictionary of checksum options (see open_dump)
+                metrics -> Dictionary of dump metrics (see dump_run)
+            (output) -> True|False - Dump was successful
+
+        """
+
+        return dump_proc.dump_run(
+            self.crt_args(unit), dmp_file, compress,
+            errfile=kwargs.get("errfile", None),
+            comp_opts=kwargs.get("comp_opts", {}),
+            procs=kwargs.get("procs", []),
+            write_opts=kwargs.get("write_opts", None),
+            hash_opts=kwargs.get("hash_opts", None),
+            metrics=kwargs.get("metrics", {}))
+
+
+class PumpEngine(MysqldumpEngine):
+
+    """Class:  PumpEngine
+
+    Description:  Dump engine running a mysqlpump process for each database
+        unit.  The dump command is the mysqlpump command line.
+
+    """
+
+    name = "mysqlpump"
+
+
+class ShellEngine(DumpEngine):
+
+    """Class:  ShellEngine
+
+    Description:  Dump engine running the MySQL Shell util.dumpSchemas
+        utility for each database unit.  Each database is dumped into its
+        own dump directory, compressed by MySQL Shell with the gzip or zstd
+        codec.
+
+    Methods:
+        __init__
+        crt_args
+        dump
+        fname
+
+    """
+
+    name = "mysqlsh"
+
+    def __init__(self, shell_cmd):
+
+        """Method:  __init__
+
+        Description:  Initialization of an instance of the ShellEngine class.
+
+        Arguments:
+            (input) shell_cmd -> MySQL Shell command line
+
+        """
+
+        super().__init__()
+        self.shell_cmd = list(shell_cmd)
+
+    def crt_args(self, unit, out_dir, compress, comp_opts):
+
+        """Method:  crt_args
+
+        Description:  Create the util.dumpSchemas command line of a unit.
+
+        Arguments:
+            (input) unit -> Unit dictionary (see crt_units)
+            (input) out_dir -> Dump directory name
+            (input) compress -> Compression flag
+            (input) comp_opts -> Dictionary of compression options
+            (output) -> MySQL Shell command line
+
+        """
+
+        codec = comp_opts.get("codec", "gzip") if compress else "none"
+
+        return self.shell_cmd + [
+            "--", "util", "dump-schemas", unit["args"][-1],
+            "--outputUrl=" + out_dir,
+            "--compression=" + (codec if codec in ["gzip", "none"]
+                                else "zstd"),
+            "--threads=" + str(comp_opts.get("threads", 1)),
+            "--showProgress=false"]
+
+    def dump(self, unit, dmp_file, compress, **kwargs):
+
+        """Method:  dump
+
+        Description:  Run util.dumpSchemas for the unit.
+
+        Arguments:
+            (input) unit -> Unit dictionary (see crt_units)
+            (input) dmp_file -> Dump file and path name
+            (input) compress -> Compression flag
+            (input) **kwargs:
+                errfile -> File handler for error file
+                comp_opts -> Dictionary of compression options
+                procs -> List to which the dump process is added once started
+                metrics -> Dictionary to which the usage of the dump process
+                    is added (see wait_proc)
+            (output) -> True|False - Dump was successful
+
+        """
+
+        comp_opts = dict(kwargs.get("comp_opts", {}))
+        e_file = kwargs.get("errfile", None)
+        proc1 = subprocess.Popen(                       # pylint:disable=R1732
+            self.crt_args(unit, self.fname(dmp_file, compress, comp_opts),
+                          compress, comp_opts),
+            stdout=e_file, stderr=e_file)
+        kwargs.get("procs", []).append(proc1)
+        code, usage = dump_proc.wait_proc(proc1)
+        kwargs.get("metrics", {}).update(usage)
+
+        return code == 0
+
+    def fname(self, dmp_file, compress, comp_opts):
+
+        """Method:  fname
+
+        Description:  Return the dump directory name, the dump file name
+            without the extension.
+
+        Arguments:
+            (input) dmp_file -> Dump file and path name
+            (input) compress -> Compression flag
+            (input) comp_opts -> Dictionary of compression options
+            (output) -> Dump directory name
+
+        """
+
+        return os.path.splitext(dmp_file)[0]
+
+
+def quote_val(value, data_type=None):
+
+    """Function:  quote_val
+
+    Description:  Quote a column value (as returned by a raw cursor) as a SQL
+        literal the same way as mysqldump --hex-blob:  a numeric value is
+        not quoted, a binary value (binary strings, blobs, bits and
+        geometries) is a hexadecimal literal and any other value is a string
+        literal.  A NULL value is returned as NULL.
+
+    Arguments:
+        (input) value -> Column value (bytes, str or None)
+        (input) data_type -> Data type of the column (information_schema)
+        (output) -> Quoted value (bytes)
+
+    """
+
+    if value is None:
+        return b"NULL"
+
+    if isinstance(value, str):
+        value = value.encode("UTF-8")
+
+    if data_type in NUMERIC_TYPES:
+        return bytes(value)
+
+    if data_type in BINARY_TYPES and value:
+        return b"0x" + bytes(value).hex().upper().encode("ascii")
+
+    return b"'" + ESCAPE_RE.sub(
+        lambda match: ESCAPES[match.group()], bytes(value)) + b"'"
+
+
+class NativeEngine(DumpEngine):
+
+    """Class:  NativeEngine
+
+    Description:  Native Python dump engine.  Dumps each database as
+        mysqldump compatible SQL (table structures, data, views and triggers)
+        over a pool of persistent database connections, one in use for each
+        worker thread.  The table data is read with unbuffered (server side)
+        raw cursors in a consistent snapshot transaction and written as
+        multi-row INSERT statements of up to the insert size.
+
+    Methods:
+        __init__
+        get_conn
+        put_conn
+        close
+        dump
+        dump_db
+        dump_table
+
+    """
+
+    name = "native"
+
+    def __init__(self, connect, insert_size=dump_stream.BUF_SIZE):
+
+        """Method:  __init__
+
+        Description:  Initialization of an instance of the NativeEngine class.
+
+        Arguments:
+            (input) connect -> Function returning a connected database server
+                instance
+            (input) insert_size -> Maximum size of an INSERT statement
+
+        """
+
+        super().__init__()
+        self.connect = connect
+        self.insert_size = insert_size
+        self.pool = queue.Queue()
+        self.conns = []
+
+    def get_conn(self):
+
+        """Method:  get_conn
+
+        Description:  Get a connection from the pool, connecting a new
+            database server instance if the pool is empty.
+
+        Arguments:
+            (output) server -> Database server instance
+
+        """
+
+        try:
+            return self.pool.get_nowait()
+
+        except queue.Empty:
+            server = self.connect()
+
+            if server.conn_msg:
+                raise RuntimeError(server.conn_msg) from None
+
+            with self.lock:
+                self.conns.append(server)
+
+            return server
+
+    def put_conn(self, server):
+
+        """Method:  put_conn
+
+        Description:  Return a connection to the pool.
+
+        Arguments:
+            (input) server -> Database server instance
+
+        """
+
+        self.pool.put(server)
+
+    def close(self):
+
+        """Method:  close
+
+        Description:  Disconnect all of the pooled connections.
+
+        Arguments:
+
+        """
+
+        with self.lock:
+            for server in self.conns:
+                mysql_libs.disconnect(server)
+
+            self.conns = []
+
+    def dump(self, unit, dmp_file, compress, **kwargs):
+
+        """Method:  dump
+
+        Description:  Dump a database unit to the dump file.  A connection
+            which fails during the dump is disconnected instead of being
+            returned to the pool.
+
+        Arguments:
+            (input) unit -> Unit dictionary (see crt_units)
+            (input) dmp_file -> Dump file and path name
+            (input) compress -> Compression flag
+            (input) **kwargs:
+                errfile -> File handler for error file
+                comp_opts -> Dictionary of compression options
+                write_opts -> Dictionary of DumpWriter options
+                hash_opts -> Dictionary of checksum options
+            (output) status -> True|False - Dump was successful
+
+        """
+
+        comp_opts = dict(kwargs.get("comp_opts", {}))
+        server = None
+
+        try:
+            server = self.get_conn()
+
+            with dump_file.open_dump(
+                    dump_stream.dump_fname(dmp_file, compress, comp_opts),
+                    compress, comp_opts,
+                    write_opts=kwargs.get("write_opts", None),
+                    hash_opts=kwargs.get("hash_opts", None)) as f_hdlr:
+                self.dump_db(server, unit["args"][-1], f_hdlr)
+
+            self.put_conn(server)
+            status = True
+
+        except Exception as msg:                        # pylint:disable=W0718
+            print(f"NativeEngine:  Error dumping {unit['name']}: {msg}",
+                  file=kwargs.get("errfile", None) or sys.stdout)
+
+            if server:
+                with self.lock:
+                    self.conns.remove(server)
+
+                mysql_libs.disconnect(server)
+
+            status = False
+
+        return status
+
+    def dump_db(self, server, dbn, f_hdlr):
+
+        """Method:  dump_db
+
+        Description:  Dump the table structures and data, triggers and views
+            of a database in a consistent snapshot transaction.  The views
+            are created as stand-in views after the tables and replaced by
+            the actual views at the end of the dump, so views using other
+            views can be restored in any order.
+
+        Arguments:
+            (input) server -> Database server instance
+            (input) dbn -> Database name
+            (input) f_hdlr -> File-like instance of the dump file
+
+        """
+
+        server.cmd_sql("set names utf8mb4")
+        server.cmd_sql("set session time_zone = '+00:00'")
+        server.cmd_sql(
+            "set session transaction isolation level repeatable read")
+        server.cmd_sql("start transaction with consistent snapshot")
+        literal = quote_val(dbn).decode("UTF-8")
+        tables = {}
+        views = []
+
+        for item in server.col_sql(
+                "select table_name as 'Table', table_type as 'Type'"
+                " from information_schema.tables where table_schema = "
+                + literal + " order by table_name"):
+            tables[item["Table"]] = []
+
+            if item["Type"] == "VIEW":
+                views.append(item["Table"])
+
+        for item in server.col_sql(
+                "select table_name as 'Table', column_name as 'Column',"
+                " data_type as 'Type', extra as 'Extra'"
+                " from information_schema.columns"
+                " where table_schema = " + literal
+                + " order by table_name, ordinal_position"):
+            if item["Table"] in tables:
+                tables[item["Table"]].append(item)
+
+        f_hdlr.write(NATIVE_HEADER)
+
+        for tbl in [tbl for tbl in tables if tbl not in views]:
+            self.dump_table(server, dbn, tbl, tables[tbl], f_hdlr)
+
+        for tbl in views:
+            name = quote_id(tbl).encode("UTF-8")
+            f_hdlr.write(
+                b"\n--\n-- Temporary view structure for view " + name
+                + b"\n--\n\nDROP TABLE IF EXISTS " + name
+                + b";\n/*!50001 DROP VIEW IF EXISTS " + name
+                + b"*/;\n/*!50001 CREATE VIEW " + name + b" AS SELECT "
+                + b", ".join(b"1 AS " + quote_id(col["Column"]).encode(
+                    "UTF-8") for col in tables[tbl]) + b" */;\n")
+
+        for tbl in views:
+            name = quote_id(tbl).encode("UTF-8")
+            create = server.col_sql(
+                "show create view " + quote_id(dbn) + "." + quote_id(tbl))
+            f_hdlr.write(
+                b"\n--\n-- Final view structure for view " + name
+                + b"\n--\n\n/*!50001 DROP VIEW IF EXISTS " + name
+                + b"*/;\n/*!50001 " + create[0]["Create View"].encode("UTF-8")
+                + b" */;\n")
+
+        server.cmd_sql("commit")
+        f_hdlr.write(NATIVE_FOOTER)
+
+    def dump_table(                                # pylint:disable=R0913,R0914
+            self, server, dbn, tbl, cols, f_hdlr):
+
+        """Method:  dump_table
+
+        Description:  Dump the structure, data and triggers of a table.
+            Generated columns are not dumped.  The column values are quoted
+            by the data types of the columns (see quote_val).
+
+        Arguments:
+            (input) server -> Database server instance
+            (input) dbn -> Database name
+            (input) tbl -> Table name
+            (input) cols -> List of column dictionaries of the table
+            (input) f_hdlr -> File-like instance of the dump file
+
+        """
+
+        name = quote_id(tbl).encode("UTF-8")
+        full_name = quote_id(dbn) + "." + quote_id(tbl)
+        create = server.col_sql("show create table " + full_name)
+        cols_dump = [col for col in cols
+                     if "GENERATED" not in (col["Extra"] or "").upper()]
+        col_list = [quote_id(col["Column"]) for col in cols_dump]
+        types = [(col.get("Type") or "").lower() for col in cols_dump]
+        prefix = b"INSERT INTO " + name + (
+            b" (" + ", ".join(col_list).encode("UTF-8") + b")"
+            if len(col_list) < len(cols) else b"") + b" VALUES "
+
+        f_hdlr.write(
+            b"\n--\n-- Table structure for table " + name
+            + b"\n--\n\nDROP TABLE IF EXISTS " + name + b";\n"
+            + create[0]["Create Table"].encode("UTF-8") + b";\n"
+            + b"\n--\n-- Dumping data for table " + name + b"\n--\n\n"
+            + b"LOCK TABLES " + name + b" WRITE;\n/*!40000 ALTER TABLE "
+            + name + b" DISABLE KEYS */;\n")
+
+        cursor = server.conn.cursor(raw=True)
+
+        try:
+            cursor.execute(
+                "select " + ", ".join(col_list) + " from " + full_name)
+            stmt = []
+            size = 0
+            rows = cursor.fetchmany(1000)
+
+            while rows:
+                for row in rows:
+                    values = b"(" + b",".join(
+                        quote_val(value, data_type)
+                        for value, data_type in zip(row, types)) + b")"
+
+                    if stmt and size + len(values) + 1 > self.insert_size:
+                        f_hdlr.write(prefix + b",".join(stmt) + b";\n")
+                        stmt = []
+                        size = 0
+
+                    stmt.append(values)
+                    size += len(values) + 1
+
+                rows = cursor.fetchmany(1000)
+
+            if stmt:
+                f_hdlr.write(prefix + b",".join(stmt) + b";\n")
+
+        finally:
+            cursor.close()
+
+        f_hdlr.write(b"/*!40000 ALTER TABLE " + name + b" ENABLE KEYS */;\n"
+                     + b"UNLOCK TABLES;\n")
+
+        for item in server.col_sql(
+                "select trigger_name as 'Trigger'"
+                " from information_schema.triggers where trigger_schema = "
+                + quote_val(dbn).decode("UTF-8")
+                + " and event_object_table = "
+                + quote_val(tbl).decode("UTF-8")
+                + " order by action_order"):
+            trigger = server.col_sql(
+                "show create trigger " + quote_id(dbn) + "."
+                + quote_id(item["Trigger"]))[0]
+            f_hdlr.write(
+                b"/*!50003 SET @saved_sql_mode = @@sql_mode */;\n"
+                + b"/*!50003 SET sql_mode = "
+                + quote_val(trigger["sql_mode"]) + b" */;\nDELIMITER ;;\n"
+                + trigger["SQL Original Statement"].encode("UTF-8")
+                + b";;\nDELIMITER ;\n"
+                + b"/*!50003 SET sql_mode = @saved_sql_mode */;\n")
+
+
+def quote_id(name):
+
+    """Function:  quote_id
+
+    Description:  Quote a database, table or column name for use in a SQL
+        statement.
+
+    Arguments:
+        (input) name -> Database, table or column name
+        (output) -> Quoted name
+
+    """
+
+    return "`" + str(name).replace("`", "``") + "`"
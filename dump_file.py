@@ -0,0 +1,586 @@
+# Classification (U)
+
+"""Program:  dump_file.py
+
+    Description:  Library of the dump file writer, checksum and
+        preallocation classes and functions used by mysql_db_dump.py to write
+        the dump files.
+
+    Classes:
+        DumpWriter
+        HashFile
+        ChainFile
+
+    Functions:
+        new_hash
+        prealloc_size
+        open_dump
+        path_size
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import os
+import io
+import mmap
+import fcntl
+import hashlib
+
+# Third-party
+try:
+    import xxhash
+
+except ImportError:
+    xxhash = None
+
+# Local
+try:
+    from . import dump_stream
+    from . import version
+
+except (ValueError, ImportError) as err:
+    import dump_stream
+    import version
+
+__version__ = version.__version__
+
+# Global
+# Size of the aligned chunks written by the page cache friendly writer and
+# the number of chunks written before a chunk is no longer advised to be
+# dropped from the page cache.
+WRITE_CHUNK = 8 * 1024 * 1024
+DROP_LAG = 4
+# Checksum algorithms of the dump files, xxh3 requires the xxhash module.
+HASHES = ["sha256", "blake2b", "xxh3"]
+
+
+class DumpWriter():                                     # pylint:disable=R0902
+
+    """Class:  DumpWriter
+
+    Description:  Page cache friendly dump file writer.  The file is
+        preallocated with posix_fallocate when its size can be estimated and
+        written in large chunks from a page aligned buffer.  The written
+        ranges are advised to be dropped from the page cache
+        (posix_fadvise DONTNEED) as the file is written, so a large dump
+        does not evict the pages cached for the database server.  With the
+        direct option, the file is opened with O_DIRECT and bypasses the
+        page cache, falling back to buffered writes if the file system does
+        not support O_DIRECT.
+
+    Methods:
+        __init__
+        __enter__
+        __exit__
+        write
+        flush
+        close
+        _flush
+
+    """
+
+    def __init__(self, fname, size=None, direct=False, chunk=WRITE_CHUNK):
+
+        """Method:  __init__
+
+        Description:  Initialization of an instance of the DumpWriter class.
+
+        Arguments:
+            (input) fname -> Dump file name
+            (input) size -> Estimated size of the file in bytes
+            (input) direct -> True|False - Open the file with O_DIRECT
+            (input) chunk -> Size of the chunks written, a multiple of the
+                page size
+
+        """
+
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+        self.direct = direct and hasattr(os, "O_DIRECT")
+        self.fd_out = None
+
+        if self.direct:
+            try:
+                self.fd_out = os.open(fname, flags | os.O_DIRECT, 0o644)
+
+            except OSError:
+                self.direct = False
+
+        if self.fd_out is None:
+            self.fd_out = os.open(fname, flags, 0o644)
+
+        self.chunk = chunk
+        self.buf = mmap.mmap(-1, chunk)
+        self.pos = 0
+        self.written = 0
+        self.dropped = 0
+        self.prealloc = False
+        self.closed = False
+
+        if size and hasattr(os, "posix_fallocate"):
+            try:
+                os.posix_fallocate(self.fd_out, 0, size)
+                self.prealloc = True
+
+            except OSError:
+                pass
+
+    def __enter__(self):
+
+        """Method:  __enter__
+
+        Description:  Enter the runtime context.
+
+        Arguments:
+
+        """
+
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+
+        """Method:  __exit__
+
+        Description:  Exit the runtime context and close the file.
+
+        Arguments:
+
+        """
+
+        self.close()
+
+    def write(self, data):
+
+        """Method:  write
+
+        Description:  Buffer the data and write each full chunk.
+
+        Arguments:
+            (input) data -> Data to be written (bytes-like)
+            (output) -> Number of bytes written
+
+        """
+
+        data = memoryview(data).cast("B")
+        offset = 0
+
+        while offset < len(data):
+            count = min(len(data) - offset, self.chunk - self.pos)
+            self.buf[self.pos:self.pos + count] = data[offset:offset + count]
+            self.pos += count
+            offset += count
+
+            if self.pos == self.chunk:
+                self._flush()
+
+        return len(data)
+
+    def flush(self):
+
+        """Method:  flush
+
+        Description:  Does nothing, the data is written in full chunks and
+            the remaining data when the file is closed.
+
+        Arguments:
+
+        """
+
+    def close(self):
+
+        """Method:  close
+
+        Description:  Write the remaining data, truncate the preallocated
+            file to the size written, sync the file and drop it from the
+            page cache and close the file.
+
+        Arguments:
+
+        """
+
+        if self.closed:
+            return
+
+        try:
+            if self.direct and self.pos % mmap.PAGESIZE:
+                fcntl.fcntl(self.fd_out, fcntl.F_SETFL, fcntl.fcntl(
+                    self.fd_out, fcntl.F_GETFL) & ~os.O_DIRECT)
+
+            if self.pos:
+                self._flush()
+
+            if self.prealloc:
+                os.ftruncate(self.fd_out, self.written)
+
+            if hasattr(os, "posix_fadvise"):
+                os.fdatasync(self.fd_out)
+                os.posix_fadvise(
+                    self.fd_out, 0, 0, os.POSIX_FADV_DONTNEED)
+
+        finally:
+            self.closed = True
+            os.close(self.fd_out)
+            self.buf.close()
+
+    def _flush(self):
+
+        """Method:  _flush
+
+        Description:  Write the buffered data to the file and advise the
+            written ranges to be dropped from the page cache.  A range is
+            advised again for DROP_LAG chunks, as only the pages already
+            written back to disk are dropped.
+
+        Arguments:
+
+        """
+
+        view = memoryview(self.buf)[:self.pos]
+        offset = 0
+
+        try:
+            while offset < self.pos:
+                offset += os.write(self.fd_out, view[offset:])
+
+        finally:
+            view.release()
+
+        self.written += self.pos
+        self.pos = 0
+
+        if not self.direct and hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(self.fd_out, self.dropped,
+                             self.written - self.dropped,
+                             os.POSIX_FADV_DONTNEED)
+            self.dropped = max(0, self.written - self.chunk * DROP_LAG)
+
+
+def new_hash(algo):
+
+    """Function:  new_hash
+
+    Description:  Return a new hash instance of the checksum algorithm.
+
+    Arguments:
+        (input) algo -> Checksum algorithm (see HASHES)
+        (output) -> Hash instance
+
+    """
+
+    if algo == "xxh3":
+        return xxhash.xxh3_128()
+
+    return hashlib.new(algo)
+
+
+class HashFile():
+
+    """Class:  HashFile
+
+    Description:  File-like instance computing the checksum of the data as it
+        is written to a file-like instance.  The hex digest is recorded in a
+        dictionary under one or more keys when the instance is closed.
+
+    Methods:
+        __init__
+        __enter__
+        __exit__
+        write
+        flush
+        close
+
+    """
+
+    def __init__(self, f_hdlr, algo, digests=None, keys=None):
+
+        """Method:  __init__
+
+        Description:  Initialization of an instance of the HashFile class.
+
+        Arguments:
+            (input) f_hdlr -> File-like instance the data is written to
+            (input) algo -> Checksum algorithm (see HASHES)
+            (input) digests -> Dictionary the hex digest is recorded in
+            (input) keys -> List of keys the hex digest is recorded under
+
+        """
+
+        self.f_hdlr = f_hdlr
+        self.hasher = new_hash(algo)
+        self.digests = digests if digests is not None else {}
+        self.keys = list(keys or [])
+        self.size = 0
+        self.closed = False
+
+    def __enter__(self):
+
+        """Method:  __enter__
+
+        Description:  Enter the runtime context.
+
+        Arguments:
+
+        """
+
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+
+        """Method:  __exit__
+
+        Description:  Exit the runtime context and close the file.
+
+        Arguments:
+
+        """
+
+        self.close()
+
+    def write(self, data):
+
+        """Method:  write
+
+        Description:  Add the data to the checksum and write it to the file.
+
+        Arguments:
+            (input) data -> Data to be written (bytes-like)
+            (output) -> Number of bytes written
+
+        """
+
+        self.hasher.update(data)
+        self.size += len(data)
+
+        return self.f_hdlr.write(data)
+
+    def flush(self):
+
+        """Method:  flush
+
+        Description:  Flush the file, if supported by the file.
+
+        Arguments:
+
+        """
+
+        if hasattr(self.f_hdlr, "flush"):
+            self.f_hdlr.flush()
+
+    def close(self):
+
+        """Method:  close
+
+        Description:  Close the file and record the hex digest.  Closing an
+            already closed instance does nothing.
+
+        Arguments:
+
+        """
+
+        if self.closed:
+            return
+
+        self.closed = True
+        self.f_hdlr.close()
+
+        for key in self.keys:
+            self.digests[key] = self.hasher.hexdigest()
+
+
+class ChainFile():
+
+    """Class:  ChainFile
+
+    Description:  File-like instance writing to a compressor which writes to
+        a file-like instance, closing both in order.
+
+    Methods:
+        __init__
+        __enter__
+        __exit__
+        write
+        close
+
+    """
+
+    def __init__(self, outer, inner):
+
+        """Method:  __init__
+
+        Description:  Initialization of an instance of the ChainFile class.
+
+        Arguments:
+            (input) outer -> Compressor (file-like instance)
+            (input) inner -> File-like instance the compressor writes to
+
+        """
+
+        self.outer = outer
+        self.inner = inner
+
+    def __enter__(self):
+
+        """Method:  __enter__
+
+        Description:  Enter the runtime context.
+
+        Arguments:
+
+        """
+
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+
+        """Method:  __exit__
+
+        Description:  Exit the runtime context and close the files.
+
+        Arguments:
+
+        """
+
+        self.close()
+
+    def write(self, data):
+
+        """Method:  write
+
+        Description:  Write the data to the compressor.
+
+        Arguments:
+            (input) data -> Data to be written (bytes-like)
+            (output) -> Number of bytes written
+
+        """
+
+        return self.outer.write(data)
+
+    def close(self):
+
+        """Method:  close
+
+        Description:  Close the compressor and then the file.
+
+        Arguments:
+
+        """
+
+        try:
+            self.outer.close()
+
+        finally:
+            self.inner.close()
+
+
+def prealloc_size(size, path, workers=1):
+
+    """Function:  prealloc_size
+
+    Description:  Return the size a dump file is preallocated with.  The
+        estimated size is capped at the free space of the file system
+        divided by the number of concurrent dumps, so the preallocations of
+        the concurrent dumps do not fill the file system.  No size is
+        returned if the size or the free space is unknown.
+
+    Arguments:
+        (input) size -> Estimated size of the dump file in bytes
+        (input) path -> Directory path of the dump file
+        (input) workers -> Number of concurrent dumps
+        (output) -> Size to preallocate in bytes or None
+
+    """
+
+    if not size:
+        return None
+
+    try:
+        stat = os.statvfs(path)
+
+    except (OSError, AttributeError):
+        return None
+
+    return min(size, stat.f_bavail * stat.f_frsize // max(workers, 1)) \
+        or None
+
+
+def open_dump(fname, compress, comp_opts, write_opts=None, hash_opts=None):
+
+    """Function:  open_dump
+
+    Description:  Open the dump file for writing, through the compressor if
+        compression is requested and with the page cache friendly writer if
+        writer options are passed.  If checksum options are passed, the
+        checksums of the raw (uncompressed) data and of the data written to
+        the file are computed as the data is written and recorded under the
+        base name of the dump file when the file is closed.
+
+    Arguments:
+        (input) fname -> Dump file and path name
+        (input) compress -> Compression flag
+        (input) comp_opts -> Dictionary of compression options
+        (input) write_opts -> Dictionary of DumpWriter options
+            size -> Estimated size of the dump file in bytes, not used for
+                compressed dump files
+            direct -> True|False - Write the dump file with O_DIRECT
+        (input) hash_opts -> Dictionary of checksum options
+            algo -> Checksum algorithm (see HASHES)
+            digests -> Dictionary of dump file base names and checksums
+        (output) -> File-like instance
+
+    """
+
+    if write_opts is None and hash_opts is None:
+        return dump_stream.open_compressor(fname, comp_opts) if compress    \
+            else io.open(fname, "wb")
+
+    if write_opts is None:
+        f_hdlr = io.open(fname, "wb")                   # pylint:disable=R1732
+
+    else:
+        f_hdlr = DumpWriter(
+            fname, size=None if compress else write_opts.get("size", None),
+            direct=write_opts.get("direct", False))
+
+    if hash_opts is not None:
+        algo = hash_opts.get("algo", HASHES[0])
+        entry = hash_opts.setdefault("digests", {}).setdefault(
+            os.path.basename(fname), {"algo": algo})
+        f_hdlr = HashFile(f_hdlr, algo, entry,
+                          ["file"] if compress else ["file", "raw"])
+
+    if compress:
+        f_hdlr = ChainFile(
+            dump_stream.open_compressor(f_hdlr, comp_opts), f_hdlr)
+
+        if hash_opts is not None:
+            f_hdlr = HashFile(f_hdlr, algo, entry, ["raw"])
+
+    return f_hdlr
+
+
+def path_size(path):
+
+    """Function:  path_size
+
+    Description:  Return the size of a dump file or the total size of the
+        files in a dump directory.
+
+    Arguments:
+        (input) path -> Dump file or directory name
+        (output) size -> Size in bytes
+
+    """
+
+    size = 0
+
+    if os.path.isdir(path):
+        for dir_name, _, fnames in os.walk(path):
+            size += sum(os.path.getsize(os.path.join(dir_name, fname))
+                        for fname in fnames)
+
+    elif os.path.isfile(path):
+        size = os.path.getsize(path)
+
+    return size
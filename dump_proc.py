@@ -0,0 +1,538 @@
+# Classification (U)
+
+"""Program:  dump_proc.py
+
+    Description:  Library of the functions used by mysql_db_dump.py to run
+        the mysqldump process of a dump and to split its output into a dump
+        file per database.
+
+    Classes:
+        DumpSplitter
+
+    Functions:
+        wait_proc
+        stop_proc
+        dump_metrics
+        dump_run
+        split_footer
+        split_header
+        dump_split
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import os
+import subprocess
+import datetime
+import time
+import re
+
+# Local
+try:
+    from .lib import gen_libs
+    from . import dump_stream
+    from . import dump_file
+    from . import version
+
+except (ValueError, ImportError) as err:
+    import lib.gen_libs as gen_libs                     # pylint:disable=R0402
+    import dump_stream
+    import dump_file
+    import version
+
+__version__ = version.__version__
+
+# Global
+DB_MARKER = b"-- Current Database: "
+# Session settings saved by the dump header and restored by the dump footer.
+RESTORE_RE = re.compile(rb"^(/\*!\d+ SET )@OLD_(\w+)=@@\w+")
+# Binary logging of the session disabled by the dump header and the GTID
+# state of the dump set by the dump header.
+LOG_BIN_SAVE = b"SET @MYSQLDUMP_TEMP_LOG_BIN = @@SESSION.SQL_LOG_BIN;"
+LOG_BIN_RESTORE = b"SET @@SESSION.SQL_LOG_BIN = @MYSQLDUMP_TEMP_LOG_BIN;\n"
+GTID_RE = re.compile(rb"^SET @@GLOBAL\.GTID_PURGED=")
+GTID_MARKER = b"-- GTID state at the beginning of the backup"
+
+
+def wait_proc(proc):
+
+    """Function:  wait_proc
+
+    Description:  Wait for the dump process to exit and return its exit code
+        and resource usage.  The resource usage is not available if the
+        process was already reaped (i.e. polled by sync_snapshot).
+
+    Arguments:
+        (input) proc -> Dump process (subprocess.Popen instance)
+        (output) code -> Exit code of the dump process
+        (output) usage -> Dictionary of the exit code, CPU seconds and
+            maximum resident set size (KB) of the dump process
+
+    """
+
+    rusage = None
+
+    try:
+        _, wstatus, rusage = os.wait4(proc.pid, 0)
+        proc.returncode = os.waitstatus_to_exitcode(wstatus)
+
+    except ChildProcessError:
+        pass
+
+    code = proc.wait()
+    usage = {"exit_code": code}
+
+    if rusage:
+        usage.update({"cpu_user": round(rusage.ru_utime, 3),
+                      "cpu_sys": round(rusage.ru_stime, 3),
+                      "maxrss_kb": rusage.ru_maxrss})
+
+    return code, usage
+
+
+def stop_proc(proc):
+
+    """Function:  stop_proc
+
+    Description:  Terminate the dump process if it is still running and wait
+        for it to exit (see wait_proc), so a dump abandoned on an error does
+        not leave a running or unreaped dump process behind.
+
+    Arguments:
+        (input) proc -> Dump process (subprocess.Popen instance)
+        (output) code -> Exit code of the dump process
+        (output) usage -> Dictionary of the exit code and resource usage of
+            the dump process
+
+    """
+
+    if proc.returncode is None:
+        proc.terminate()
+
+    return wait_proc(proc)
+
+
+def dump_metrics(fname, start, end, raw_bytes=None):
+
+    """Function:  dump_metrics
+
+    Description:  Return the timing and throughput metrics of a dump.  The
+        throughput is based on the raw (uncompressed) bytes if known,
+        otherwise on the size of the dump files.
+
+    Arguments:
+        (input) fname -> Dump file name or list of dump file names
+        (input) start -> Start time of the dump (epoch seconds)
+        (input) end -> End time of the dump (epoch seconds)
+        (input) raw_bytes -> Number of bytes of dump output
+        (output) -> Dictionary of dump metrics
+
+    """
+
+    fnames = [fname] if isinstance(fname, str) else list(fname)
+    size = sum(dump_file.path_size(name) for name in fnames)
+    seconds = max(end - start, 0)
+
+    return {
+        "file": fname if isinstance(fname, str) else fnames,
+        "start": datetime.datetime.fromtimestamp(start).isoformat(
+            timespec="seconds"),
+        "end": datetime.datetime.fromtimestamp(end).isoformat(
+            timespec="seconds"),
+        "seconds": round(seconds, 3), "raw_bytes": raw_bytes, "bytes": size,
+        "mb_per_sec": round((size if raw_bytes is None else raw_bytes)
+                            / 1048576 / seconds, 3) if seconds else 0.0}
+
+
+def dump_run(dump_cmd, dmp_file, compress, **kwargs):   # pylint:disable=R0914
+
+    """Function:  dump_run
+
+    Description:  Run the database dump command and save to file.  The
+        dump output is read from a pipe and copied to the file (see
+        copy_stream), or passed through a stream pipeline if compression,
+        stages, the writer or checksums are requested (see StreamPipeline).
+        If compression is requested, the dump output is compressed as it is
+        streamed to the file (i.e. dmp_file.gz) instead of compressing the
+        file after the dump has completed.  The file extension follows the
+        compression codec.  An error raised while dumping (i.e. the file
+        system is full) fails the dump:  the dump process is terminated and
+        the error is added to the dump metrics.
+
+    Arguments:
+        (input) dump_cmd -> Database dump command line
+        (input) compress -> Compression flag
+        (input) dmp_file -> Dump file and path name
+        (input) **kwargs:
+            errfile -> File handler for error file
+            comp_opts -> Dictionary of compression options
+            procs -> List to which the dump process is added once started
+            stages -> List of Stage instances the dump output is passed
+                through before it is written to the file
+            write_opts -> Dictionary of DumpWriter options, write the file
+                with the page cache friendly writer (see DumpWriter)
+            hash_opts -> Dictionary of checksum options, the checksums of
+                the raw and compressed dump output are computed as the
+                output is written (see open_dump)
+            metrics -> Dictionary to which the dump metrics (see
+                dump_metrics) and the exit code and resource usage of the
+                dump process (see wait_proc) are added
+        (output) status -> True|False - Dump command was successful
+
+    """
+
+    dump_cmd = list(dump_cmd)
+    e_file = kwargs.get("errfile", None)
+    comp_opts = dict(kwargs.get("comp_opts", {}))
+    procs = kwargs.get("procs", [])
+
+    stages = list(kwargs.get("stages", []))
+    write_opts = kwargs.get("write_opts", None)
+    hash_opts = kwargs.get("hash_opts", None)
+    fname = dump_stream.dump_fname(dmp_file, compress, comp_opts)
+    start = time.time()
+    proc1 = None
+    raw_bytes = None
+
+    try:
+        with dump_file.open_dump(fname, compress, comp_opts,
+                                 write_opts=write_opts,
+                                 hash_opts=hash_opts) as f_name:
+            proc1 = subprocess.Popen(                   # pylint:disable=R1732
+                dump_cmd, stdout=subprocess.PIPE, stderr=e_file)
+            procs.append(proc1)
+
+            try:
+                if compress or stages or write_opts or hash_opts:
+                    raw_bytes = dump_stream.StreamPipeline(
+                        stages + [dump_stream.WriteStage(f_name)]).run(
+                            proc1.stdout)
+
+                else:
+                    raw_bytes = dump_stream.copy_stream(
+                        proc1.stdout, f_name, splice=True)
+
+            finally:
+                proc1.stdout.close()
+
+            code, usage = wait_proc(proc1)
+
+    except Exception as msg:                            # pylint:disable=W0718
+        print(f"Error:  Dump to {fname} failed:  {msg}")
+        code, usage = stop_proc(proc1) if proc1 else (None, {})
+        usage.update({"exit_code": code, "error": str(msg)})
+
+    metrics = kwargs.get("metrics", {})
+    metrics.update(dump_metrics(fname, start, time.time(), raw_bytes))
+    metrics.update(usage)
+
+    return code == 0 and "error" not in usage
+
+
+def split_footer(header, dump_cmd):
+
+    """Function:  split_footer
+
+    Description:  Create the footer of a split database dump file from the
+        dump header.  mysqldump writes its footer (restore of the session
+        settings and the "-- Dump completed" line) only at the end of the
+        dump output, so only the last database dump file receives it.  The
+        footer restores the session settings saved by the header and the
+        binary logging of the session disabled by the header.
+
+    Arguments:
+        (input) header -> List of the dump header lines
+        (input) dump_cmd -> Database dump command line
+        (output) -> Footer of the database dump file
+
+    """
+
+    restore = [match.group(1) + match.group(2) + b"=@OLD_" + match.group(2)
+               + b" */;\n"
+               for match in (RESTORE_RE.match(line) for line in header)
+               if match]
+
+    if any(line.startswith(LOG_BIN_SAVE) for line in header):
+        restore.insert(0, LOG_BIN_RESTORE)
+    completed = b"-- Dump completed\n" if "--skip-dump-date" in dump_cmd   \
+        else datetime.datetime.now().strftime(
+            "-- Dump completed on %Y-%m-%d %H:%M:%S\n").encode()
+
+    return b"\n" + b"".join(restore) + b"\n" + completed
+
+
+def split_header(header):
+
+    """Function:  split_header
+
+    Description:  Create the header of the split database dump files after
+        the first one from the dump header.  The GTID_PURGED statement of the
+        header (and its comment) can only be run once when the database dump
+        files are restored, so it is only kept in the header of the first
+        database dump file.
+
+    Arguments:
+        (input) header -> List of the dump header lines
+        (output) lines -> List of the header lines without the GTID_PURGED
+            statement
+
+    """
+
+    lines = []
+    in_gtid = False
+
+    for line in header:
+        if GTID_RE.match(line):
+            marker = [idx for idx, item in enumerate(lines)
+                      if item.startswith(GTID_MARKER)]
+
+            if marker:
+                del lines[max(marker[-1] - 1, 0):]
+
+            in_gtid = True
+
+        if not in_gtid:
+            lines.append(line)
+
+        elif line.rstrip().endswith(b";"):
+            in_gtid = False
+
+    return lines
+
+
+class DumpSplitter():                                   # pylint:disable=R0902
+
+    """Class:  DumpSplitter
+
+    Description:  Split the output of a database dump command against
+        several databases on the "-- Current Database:" markers into a dump
+        file for each database.  The dump header (session settings) is
+        written to the start of each database dump file, without the
+        GTID_PURGED statement after the first file (see split_header), and
+        the dump footer to the end of each database dump file (see
+        split_footer).  Each database dump file contains the CREATE DATABASE
+        and USE statements of its database.
+
+    Methods:
+        __init__
+        write
+        finish
+        close
+        _open
+
+    """
+
+    def __init__(self, dump_cmd, compress, dmp_path, **kwargs):
+
+        """Method:  __init__
+
+        Description:  Initialization of an instance of the DumpSplitter
+            class.
+
+        Arguments:
+            (input) dump_cmd -> Database dump command line
+            (input) compress -> Compression flag
+            (input) dmp_path -> Database dump output directory path
+            (input) **kwargs:
+                comp_opts -> Dictionary of compression options
+                write_opts -> Dictionary of DumpWriter options (see
+                    open_dump)
+                hash_opts -> Dictionary of checksum options (see open_dump)
+
+        """
+
+        self.dump_cmd = list(dump_cmd)
+        self.compress = compress
+        self.dmp_path = dmp_path
+        self.opts = {"comp_opts": dict(kwargs.get("comp_opts", {})),
+                     "write_opts": kwargs.get("write_opts", None),
+                     "hash_opts": kwargs.get("hash_opts", None)}
+        self.header = []
+        self.footer = None
+        self.names = {}
+        self.db_raw = {}
+        self.raw_bytes = 0
+        self.dbn = None
+        self.f_name = None
+        self.pending = b""
+
+    def write(self, line):
+
+        """Method:  write
+
+        Description:  Write a line of the dump output to the dump file of
+            its database, or to the dump header before the first database.
+            A comment line is held back until the next line, as it may start
+            the next database.
+
+        Arguments:
+            (input) line -> Line of the dump output
+
+        """
+
+        self.raw_bytes += len(line)
+
+        if self.dbn is not None:
+            self.db_raw[self.dbn] = self.db_raw.get(self.dbn, 0) + len(line)
+
+        if line.startswith(DB_MARKER):
+            self._open(line)
+            return
+
+        if self.pending:
+            (self.f_name.write if self.f_name
+             else self.header.append)(self.pending)
+
+        self.pending = line if line == b"--\n" else b""
+
+        if not self.pending:
+            (self.f_name.write if self.f_name else self.header.append)(line)
+
+    def finish(self):
+
+        """Method:  finish
+
+        Description:  Write the line held back and close the last database
+            dump file once the dump output has ended.
+
+        Arguments:
+
+        """
+
+        if self.pending and self.f_name:
+            self.f_name.write(self.pending)
+
+        self.f_name, last = None, self.f_name
+
+        if last:
+            last.close()
+
+    def close(self):
+
+        """Method:  close
+
+        Description:  Close the open database dump file of a failed dump,
+            ignoring the errors raised.
+
+        Arguments:
+
+        """
+
+        if self.f_name:
+            try:
+                self.f_name.close()
+
+            except Exception:                           # pylint:disable=W0718
+                pass
+
+            self.f_name = None
+
+    def _open(self, line):
+
+        """Method:  _open
+
+        Description:  Write the footer to and close the current database dump
+            file and open the dump file of the database of the marker line.
+
+        Arguments:
+            (input) line -> "-- Current Database:" marker line
+
+        """
+
+        dbn = line[len(DB_MARKER):].strip().decode("UTF-8")
+        self.dbn = dbn[1:-1].replace("``", "`")                             \
+            if dbn.startswith("`") and dbn.endswith("`") else dbn
+
+        if self.f_name:
+            self.footer = self.footer or split_footer(
+                self.header, self.dump_cmd)
+            self.f_name.write(self.footer)
+            self.f_name.close()
+
+        self.names[self.dbn] = dump_stream.dump_fname(
+            gen_libs.crt_file_time(self.dbn, self.dmp_path, ".sql"),
+            self.compress, self.opts["comp_opts"])
+        self.f_name = dump_file.open_dump(
+            self.names[self.dbn], self.compress, self.opts["comp_opts"],
+            write_opts=self.opts["write_opts"],
+            hash_opts=self.opts["hash_opts"])
+        self.f_name.write(
+            b"".join(self.header if len(self.names) == 1
+                     else split_header(self.header)) + self.pending + line)
+        self.pending = b""
+
+
+def dump_split(dump_cmd, db_list, compress, dmp_path, **kwargs):
+
+    """Function:  dump_split
+
+    Description:  Run a single database dump command against several
+        databases (--databases) and split the dump output on the
+        "-- Current Database:" markers into a dump file for each database.
+        (see DumpSplitter).  An error raised while dumping fails the dump
+        (see dump_run).
+
+    Arguments:
+        (input) dump_cmd -> Database dump command line, with the
+            --databases option and the database names
+        (input) db_list -> Array of database names in the dump
+        (input) compress -> Compression flag
+        (input) dmp_path -> Database dump output directory path
+        (input) **kwargs:
+            errfile -> File handler for error file
+            comp_opts -> Dictionary of compression options
+            procs -> List to which the dump process is added once started
+            files -> Dictionary to which the database names and dump file
+                names are added if the dump was successful
+            write_opts -> Dictionary of DumpWriter options (see open_dump)
+            hash_opts -> Dictionary of checksum options (see open_dump)
+            metrics -> Dictionary to which the dump metrics of the dump
+                files, the raw bytes and dump file bytes of each database
+                (databases) and the usage of the dump process are added
+        (output) status -> True|False - Dump command was successful
+
+    """
+
+    start = time.time()
+    split = DumpSplitter(
+        dump_cmd, compress, dmp_path, comp_opts=kwargs.get("comp_opts", {}),
+        write_opts=kwargs.get("write_opts", None),
+        hash_opts=kwargs.get("hash_opts", None))
+    proc1 = subprocess.Popen(                           # pylint:disable=R1732
+        list(dump_cmd), stdout=subprocess.PIPE,
+        stderr=kwargs.get("errfile", None))
+    kwargs.get("procs", []).append(proc1)
+
+    try:
+        for line in proc1.stdout:
+            split.write(line)
+
+        split.finish()
+        code, usage = wait_proc(proc1)
+
+    except Exception as msg:                            # pylint:disable=W0718
+        print(f"Error:  Dump of {', '.join(db_list)} failed:  {msg}")
+        code, usage = stop_proc(proc1)
+        usage.update({"exit_code": code, "error": str(msg)})
+
+    finally:
+        split.close()
+        proc1.stdout.close()
+
+    status = code == 0 and "error" not in usage \
+        and set(split.names) == set(db_list)
+    metrics = kwargs.get("metrics", {})
+    metrics.update(dump_metrics(list(split.names.values()), start,
+                                time.time(), split.raw_bytes))
+    metrics["databases"] = {
+        name: {"raw_bytes": split.db_raw.get(name, 0),
+               "bytes": dump_file.path_size(fname)}
+        for name, fname in split.names.items()}
+    metrics.update(usage)
+
+    if status:
+        kwargs.get("files", {}).update(split.names)
+
+    return status
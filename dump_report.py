@@ -0,0 +1,269 @@
+# Classification (U)
+
+"""Program:  dump_report.py
+
+    Description:  Library of the functions used by mysql_db_dump.py to
+        report a dump run:  the run manifest and the Prometheus textfile
+        collector metrics.
+
+    Functions:
+        crt_manifest
+        save_manifest
+        prom_labels
+        crt_prom
+        save_prom
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import os
+import datetime
+import io
+import time
+import json
+import re
+
+# Local
+try:
+    from .lib import gen_libs
+    from . import dump_units
+    from . import version
+
+except (ValueError, ImportError) as err:
+    import lib.gen_libs as gen_libs                     # pylint:disable=R0402
+    import dump_units
+    import version
+
+__version__ = version.__version__
+
+# Global
+# Prefix of the Prometheus metric names and textfile collector file name.
+PROM_PREFIX = "mysql_db_dump"
+PROM_SUCCESS_RE = re.compile(
+    "^" + PROM_PREFIX + r"_last_success_timestamp_seconds\{.*\} ([0-9.e+]+)$",
+    re.M)
+
+
+def crt_manifest(run, start, metrics, **kwargs):
+
+    """Function:  crt_manifest
+
+    Description:  Create the manifest of a run:  the start and end times,
+        wall time, total bytes and throughput of the run, the binary log and
+        GTID position and the dump metrics of each database or unit.
+
+    Arguments:
+        (input) run -> Run name (date and time of the run)
+        (input) start -> Start time of the run (epoch seconds)
+        (input) metrics -> Dictionary of unit names and dump metrics
+        (input) **kwargs:
+            binlog -> Binary log and GTID position of the run
+            hash_opts -> Dictionary of checksum options, the checksums are
+                added to the manifest
+            failed -> List of the database or unit names of the failed
+                dumps, the units not started (see not_started) are recorded
+                as Not_Started instead
+            watchdog -> Watchdog instance, the timeouts and stalls of the
+                run are added to the manifest
+            load -> LoadController instance, the changes of the number of
+                concurrent dumps are added to the manifest
+        (output) manifest -> Dictionary of the run
+
+    """
+
+    end = time.time()
+    seconds = max(end - start, 0)
+    raw_bytes = sum(item.get("raw_bytes") or 0 for item in metrics.values())
+    size = sum(item.get("bytes", 0) for item in metrics.values())
+    skipped = dump_units.not_started(metrics)
+    manifest = {
+        "Run": run,
+        "Start": datetime.datetime.fromtimestamp(start).isoformat(
+            timespec="seconds"),
+        "End": datetime.datetime.fromtimestamp(end).isoformat(
+            timespec="seconds"),
+        "Seconds": round(seconds, 3), "Raw_Bytes": raw_bytes, "Bytes": size,
+        "MB_Per_Sec": round((raw_bytes or size) / 1048576 / seconds, 3)
+        if seconds else 0.0,
+        "Binlog": kwargs.get("binlog", None), "Dumps": dict(metrics),
+        "Failed": [name for name in kwargs.get("failed", [])
+                   if name not in skipped],
+        "Not_Started": skipped}
+
+    if kwargs.get("hash_opts", None) is not None:
+        manifest["Checksums"] = kwargs["hash_opts"].get("digests", {})
+
+    if kwargs.get("watchdog", None) is not None:
+        manifest["Watchdog"] = list(kwargs["watchdog"].events)
+
+    if kwargs.get("load", None) is not None:
+        manifest["Load"] = list(kwargs["load"].events)
+
+    return manifest
+
+
+def save_manifest(dmp_path, manifest):
+
+    """Function:  save_manifest
+
+    Description:  Save the manifest of a run to a Manifest json file in the
+        dump directory.
+
+    Arguments:
+        (input) dmp_path -> Database dump output directory path
+        (input) manifest -> Dictionary of the run
+        (output) fname -> Name of the Manifest json file
+
+    """
+
+    fname = gen_libs.crt_file_time("Manifest", dmp_path, ".json")
+
+    with io.open(fname, mode="w", encoding="UTF-8") as f_hdlr:
+        json.dump(manifest, f_hdlr, indent=4)
+
+    return fname
+
+
+def prom_labels(labels):
+
+    """Function:  prom_labels
+
+    Description:  Format the labels of a Prometheus metric sample, escaping
+        the label values.
+
+    Arguments:
+        (input) labels -> Dictionary of label names and values
+        (output) -> Labels in the Prometheus text format
+
+    """
+
+    return "{" + ",".join(
+        name + '="' + str(value).replace("\\", "\\\\").replace(
+            '"', '\\"').replace("\n", "\\n") + '"'
+        for name, value in labels.items()) + "}"
+
+
+def crt_prom(manifest, name, last_success=None):        # pylint:disable=R0914
+
+    """Function:  crt_prom
+
+    Description:  Create the Prometheus metrics of a run, in the text
+        exposition format, from the manifest of the run (see crt_manifest).
+        The raw bytes, dump file bytes, retries and queue wait time of the
+        units of a database (schema, tables and chunks) are summed for the
+        database, taken from the database of the unit (db) or the databases
+        of a split unit (databases) in the unit metrics.  The retries and
+        queue wait time of a split unit are counted for each of its
+        databases.  A unit without a database (All_Databases) is labeled
+        with the unit name.  The raw bytes are the dump file bytes if
+        unknown.
+
+    Arguments:
+        (input) manifest -> Dictionary of the run
+        (input) name -> Server name, added as the server label
+        (input) last_success -> End time (epoch seconds) of the last run
+            with all dumps completed, replaced by the end time of the run if
+            all dumps completed
+        (output) -> Prometheus metrics text
+
+    """
+
+    server = {"server": name}
+    end = datetime.datetime.fromisoformat(manifest["End"]).timestamp()
+    failed = list(manifest.get("Failed", []))
+    skipped = list(manifest.get("Not_Started", []))
+    last_success = last_success if failed or skipped else end
+    seconds = manifest.get("Seconds", 0)
+    dbs = {}
+
+    for unit, item in manifest.get("Dumps", {}).items():
+        for dbn, sizes in (item.get("databases")
+                           or {item.get("db") or unit: item}).items():
+            totals = dbs.setdefault(
+                dbn, {"raw": 0, "file": 0, "retries": 0, "wait": 0.0})
+            totals["raw"] += sizes.get("raw_bytes") or sizes.get("bytes", 0)
+            totals["file"] += sizes.get("bytes", 0)
+            totals["retries"] += max(item.get("attempts", 1) - 1, 0)
+            totals["wait"] += item.get("queue_seconds", 0)
+
+    metrics = [
+        ("last_success_timestamp_seconds",
+         "End time of the last run without failed dumps.",
+         [] if last_success is None else [(server, last_success)]),
+        ("last_run_timestamp_seconds", "End time of the last run.",
+         [(server, end)]),
+        ("last_run_success",
+         "1 if all dumps of the last run completed.",
+         [(server, 0 if failed or skipped else 1)]),
+        ("duration_seconds", "Wall time of the last run.",
+         [(server, seconds)]),
+        ("throughput_bytes_per_second",
+         "Raw bytes dumped per second by the last run.",
+         [(server, round((manifest.get("Raw_Bytes", 0)
+                          or manifest.get("Bytes", 0)) / seconds, 3)
+           if seconds else 0.0)]),
+        ("failures", "Number of failed dumps of the last run.",
+         [(server, len(failed))]),
+        ("not_started",
+         "Number of dumps not started by the last run (stopped).",
+         [(server, len(skipped))]),
+        ("retries", "Number of dump retries of the last run.",
+         [(server, sum(item["retries"] for item in dbs.values()))]),
+        ("raw_bytes", "Raw (uncompressed) bytes dumped for the database.",
+         [(dict(server, database=dbn), item["raw"])
+          for dbn, item in dbs.items()]),
+        ("file_bytes", "Size of the dump files of the database.",
+         [(dict(server, database=dbn), item["file"])
+          for dbn, item in dbs.items()]),
+        ("queue_wait_seconds",
+         "Time the dumps of the database waited for a dump worker.",
+         [(dict(server, database=dbn), round(item["wait"], 3))
+          for dbn, item in dbs.items()])]
+    lines = []
+
+    for metric, text, samples in metrics:
+        if samples:
+            lines.extend([f"# HELP {PROM_PREFIX}_{metric} {text}",
+                          f"# TYPE {PROM_PREFIX}_{metric} gauge"])
+            lines.extend(f"{PROM_PREFIX}_{metric}{prom_labels(labels)} {value}"
+                         for labels, value in samples)
+
+    return "\n".join(lines) + "\n"
+
+
+def save_prom(prom_dir, manifest, name):
+
+    """Function:  save_prom
+
+    Description:  Save the Prometheus metrics of a run (see crt_prom) to the
+        mysql_db_dump_<server>.prom file of the node_exporter textfile
+        collector directory.  The last success time is kept from the
+        previous file if a dump failed.  The file is replaced atomically, so
+        the collector never reads a partial file.
+
+    Arguments:
+        (input) prom_dir -> Textfile collector directory path
+        (input) manifest -> Dictionary of the run
+        (input) name -> Server name
+        (output) fname -> Name of the prom file
+
+    """
+
+    fname = os.path.join(
+        prom_dir, PROM_PREFIX + "_" + re.sub(r"\W", "_", name) + ".prom")
+    last_success = None
+
+    if os.path.isfile(fname):
+        with io.open(fname, mode="r", encoding="UTF-8") as f_hdlr:
+            match = PROM_SUCCESS_RE.search(f_hdlr.read())
+
+        last_success = float(match.group(1)) if match else None
+
+    with io.open(fname + ".tmp", mode="w", encoding="UTF-8") as f_hdlr:
+        f_hdlr.write(crt_prom(manifest, name, last_success))
+
+    os.replace(fname + ".tmp", fname)
+
+    return fname
@@ -0,0 +1,871 @@
+# Classification (U)
+
+"""Program:  dump_sched.py
+
+    Description:  Library of the functions used by mysql_db_dump.py to
+        schedule and run the dump of each unit:  retries, the worker pool, the
+        consistent snapshot and the dump of the databases.
+
+    Functions:
+        dump_attempt
+        dump_retry
+        publish_dump
+        dump_unit
+        run_unit
+        dump_pool
+        sync_snapshot
+        dump_consistent
+        dump_seq
+        plan_units
+        dump_db
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import io
+import shutil
+import tempfile
+import time
+import json
+import re
+import threading
+import concurrent.futures
+
+# Local
+try:
+    from .lib import gen_libs
+    from .mysql_lib import mysql_class
+    from . import dump_stream
+    from . import dump_file
+    from . import dump_proc
+    from . import dump_units
+    from . import version
+
+except (ValueError, ImportError) as err:
+    import lib.gen_libs as gen_libs                     # pylint:disable=R0402
+    import mysql_lib.mysql_class as mysql_class         # pylint:disable=R0402
+    import dump_stream
+    import dump_file
+    import dump_proc
+    import dump_units
+    import version
+
+__version__ = version.__version__
+
+# Global
+SNAPSHOT_TIMEOUT = 60
+# Seconds to wait before the first retry of a failed dump, doubled for each
+# following retry, and the errors of a dump which are worth a retry.
+RETRY_BACKOFF = 5
+TRANSIENT_RE = re.compile(
+    r"Lost connection to MySQL server|MySQL server has gone away"
+    r"|Lock wait timeout exceeded|Deadlock found"
+    r"|Can't connect to MySQL server|Too many connections")
+
+
+def dump_attempt(dump_cmd, unit, compress, dmp_file, **kwargs):
+
+    """Function:  dump_attempt
+
+    Description:  Dump a unit once:  a batch unit is split into a dump file
+        for each database (see dump_split), other units are dumped by the
+        dump engine or the database dump command.  The dump processes are
+        watched by the watchdog while the unit is dumped.
+
+    Arguments:
+        (input) dump_cmd -> Database dump command line of the unit
+        (input) unit -> Unit dictionary (see crt_units)
+        (input) compress -> Compression flag
+        (input) dmp_file -> Dump file name of the unit (without extension)
+        (input) **kwargs:
+            errfile -> File handler the error stream is written to
+            files -> Dictionary to which the unit (or database) names and
+                dump file names are added if the dump was successful
+            comp_opts, procs, engine, write_opts, hash_opts, watchdog -> See
+                dump_unit
+        (output) status -> True|False - Dump of the unit was successful
+        (output) metrics -> Dictionary of the dump metrics of the attempt
+
+    """
+
+    files = kwargs.get("files", {})
+    comp_opts = kwargs.get("comp_opts", {})
+    watchdog = kwargs.get("watchdog", None)
+    opts = {"errfile": kwargs.get("errfile", None), "comp_opts": comp_opts,
+            "procs": watchdog.watch(unit["name"], kwargs.get("procs"))
+            if watchdog else kwargs.get("procs", []),
+            "write_opts": kwargs.get("write_opts", None),
+            "hash_opts": kwargs.get("hash_opts", None), "metrics": {}}
+
+    if unit.get("split"):
+        status = dump_proc.dump_split(
+            dump_cmd, unit["split"], compress,
+            os.path.join(os.path.dirname(dmp_file), ""), files=files, **opts)
+
+    elif kwargs.get("engine", None):
+        status = kwargs["engine"].run(unit, dmp_file, compress, **opts)
+
+        if status:
+            files[unit["name"]] = kwargs["engine"].fname(
+                dmp_file, compress, comp_opts)
+
+    else:
+        status = dump_proc.dump_run(dump_cmd, dmp_file, compress, **opts)
+
+        if status:
+            files[unit["name"]] = dump_stream.dump_fname(
+                dmp_file, compress, comp_opts)
+
+    if watchdog and watchdog.unwatch(opts["procs"]):
+        opts["metrics"]["watchdog"] = opts["procs"].reason
+
+    return status, opts["metrics"]
+
+
+def dump_retry(dump_cmd, unit, compress, dmp_file, **kwargs):
+
+    """Function:  dump_retry
+
+    Description:  Dump a unit (see dump_attempt), retrying a dump failing
+        with a transient error (see TRANSIENT_RE).  The first retry waits
+        RETRY_BACKOFF seconds and each following retry twice as long.  The
+        output of a failed dump is removed.  The unit is not dumped once the
+        stop event is set and a unit killed by the watchdog is not retried.
+
+    Arguments:
+        (input) dump_cmd -> Database dump command line of the unit
+        (input) unit -> Unit dictionary (see crt_units)
+        (input) compress -> Compression flag
+        (input) dmp_file -> Dump file name of the unit (without extension)
+        (input) **kwargs:
+            errfile -> File handler the error stream is written to, the
+                errors of a failed dump are read back from it
+            retries -> Number of retries of a dump failing with a transient
+                error
+            stop -> Event instance, set to stop dumping
+            Other arguments are passed to dump_attempt
+        (output) status -> True|False - Dump of the unit was successful
+        (output) files -> Dictionary of the unit (or database) names and
+            dump file names
+        (output) metrics -> Dictionary of the dump metrics of the unit
+
+    """
+
+    retries = kwargs.pop("retries", 0)
+    stop = kwargs.pop("stop", None) or threading.Event()
+    e_file = kwargs.get("errfile", None)
+    files = {}
+    status = False
+
+    for attempt in range(retries + 1):
+        if stop.is_set():
+            metrics = {"status": False, "attempts": attempt, "stopped": True}
+            break
+
+        if attempt:
+            delay = RETRY_BACKOFF * 2 ** (attempt - 1)
+            print(f"WARNING:  Dump of {unit['name']} failed with a transient"
+                  f" error.  Retry {attempt} of {retries} in {delay}"
+                  f" seconds.")
+            time.sleep(delay)
+
+        err_pos = e_file.tell() if e_file else 0
+        status, metrics = dump_attempt(
+            dump_cmd, unit, compress, dmp_file, files=files, **kwargs)
+        metrics.update({"status": status, "attempts": attempt + 1})
+
+        if status:
+            break
+
+        dump_units.remove_dump(metrics.get("file", None))
+
+        if not e_file or "watchdog" in metrics:
+            break
+
+        e_file.seek(err_pos)
+
+        if not TRANSIENT_RE.search(e_file.read()):
+            break
+
+    return status, files, metrics
+
+
+def publish_dump(unit, dmp_files, metrics, dmp_path, **kwargs):
+
+    """Function:  publish_dump
+
+    Description:  Move (rename) the dump files of a successful unit from the
+        partial directory into the dump directory and record the unit in the
+        journal.  The files are only moved once the sync event is set.  The
+        dump files of a cancelled unit are removed instead and the unit
+        fails if one of its dump files is missing from the partial
+        directory.  The dump file names of the metrics are updated to the
+        moved dump files.
+
+    Arguments:
+        (input) unit -> Unit dictionary (see crt_units)
+        (input) dmp_files -> Dictionary of the unit (or database) names and
+            dump file names in the partial directory
+        (input) metrics -> Dictionary of the dump metrics of the unit
+        (input) dmp_path -> Database dump output directory path
+        (input) **kwargs:
+            files -> Dictionary to which the unit (or database) names and
+                moved dump file names are added
+            journal -> Journal instance the completed unit is recorded in
+            hash_opts -> Dictionary of checksum options (see open_dump)
+            sync -> Event instance, the dump files are only moved once it
+                is set
+            cancel -> Event instance, set if the unit is cancelled
+        (output) -> True|False - Dump files of the unit were moved
+
+    """
+
+    if kwargs.get("sync", None):
+        kwargs["sync"].wait()
+
+    if not metrics["status"]:
+        return False
+
+    if kwargs.get("cancel", None) and kwargs["cancel"].is_set():
+        dump_units.remove_dump(list(dmp_files.values()))
+        metrics.update({"status": False,
+                        "error": "Consistent snapshot failed"})
+
+        return False
+
+    moved, missing = dump_units.move_dump(list(dmp_files.values()), dmp_path)
+
+    if missing:
+        print(f"Error:  Dump of {unit['name']} failed, missing dump"
+              f" files:  {', '.join(missing)}")
+        metrics.update({"status": False, "error": "Missing dump files:  "
+                        + ", ".join(missing)})
+
+        return False
+
+    if "file" in metrics:
+        metrics["file"] = moved.get(metrics["file"], metrics["file"])      \
+            if isinstance(metrics["file"], str) else [
+                moved.get(name, name) for name in metrics["file"]]
+
+    kwargs.get("files", {}).update(
+        {key: moved[name] for key, name in dmp_files.items()})
+
+    if kwargs.get("journal", None):
+        kwargs["journal"].record(
+            unit, list(moved.values()), kwargs.get("hash_opts", None))
+
+    return True
+
+
+def dump_unit(dump_cmd, unit, compress, dmp_path, **kwargs):
+
+    """Function:  dump_unit
+
+    Description:  Dump a single unit (database or table) using its own copy
+        of the dump command, its own dump file and its own error stream.  The
+        error stream is appended to the shared error file once the dump has
+        completed.  A batch unit (several databases) is split into a dump
+        file for each database.  The output of a failed dump is removed and
+        a dump failing with a transient error (see TRANSIENT_RE) is retried,
+        waiting RETRY_BACKOFF seconds before the first retry and twice as
+        long before each following retry (see dump_retry).  The dump files
+        are written to the partial directory of the run (see part_dir) and
+        moved (renamed) into the dump directory once the dump has completed
+        (see publish_dump), so the dump directory only holds completed dump
+        files.  A unit killed by the watchdog is not retried, it is requeued
+        by the caller (see Watchdog.requeue).
+
+    Arguments:
+        (input) dump_cmd -> Database dump command line
+        (input) unit -> Unit dictionary (see crt_units)
+        (input) compress -> Compression flag
+        (input) dmp_path -> Database dump output directory path
+        (input) **kwargs:
+            errfile -> File handler for shared error file
+            lock -> Lock instance protecting the shared error file
+            comp_opts -> Dictionary of compression options
+            procs -> List to which the dump process is added once started
+            files -> Dictionary to which the unit name and dump file name are
+                added if the dump was successful
+            engine -> DumpEngine instance, dumps the unit instead of the
+                database dump command
+            write_opts -> Dictionary of page cache friendly writer options
+                direct -> True|False - Write the dump files with O_DIRECT
+                sizes -> Dictionary of unit names and estimated dump sizes
+                workers -> Number of concurrent dumps (see prealloc_size)
+            hash_opts -> Dictionary of checksum options (see open_dump)
+            metrics -> Dictionary to which the unit name and the dump
+                metrics of the unit are added (see dump_run)
+            retries -> Number of retries of a dump failing with a transient
+                error
+            journal -> Journal instance the completed unit is recorded in
+            stop -> Event instance, set to stop dumping (see term_handler)
+            watchdog -> Watchdog instance watching the dump processes
+            queued -> Time the unit was queued (epoch seconds), the queue
+                wait time is added to the dump metrics
+            sync -> Event instance, the dump files are only moved once it
+                is set (see dump_consistent)
+            cancel -> Event instance, set if the consistent snapshot of the
+                unit failed, the dump files are removed instead of moved
+            The database of the unit (db) is added to the dump metrics
+        (output) -> Name of the unit
+        (output) status -> True|False - Dump of the unit was successful
+
+    """
+
+    part_path = dump_units.part_dir(dmp_path)
+    errfile = kwargs.get("errfile", None)
+    e_file = None
+    wait = round(max(time.time() - kwargs["queued"], 0), 3)                \
+        if kwargs.get("queued", None) else None
+    opts = {key: kwargs[key] for key in [
+        "comp_opts", "procs", "engine", "hash_opts", "watchdog", "retries",
+        "stop"] if key in kwargs}
+    os.makedirs(part_path, exist_ok=True)
+
+    if kwargs.get("write_opts", None) is not None:
+        opts["write_opts"] = {
+            "direct": kwargs["write_opts"].get("direct", False),
+            "size": dump_file.prealloc_size(
+                kwargs["write_opts"].get("sizes", {}).get(unit["name"]),
+                part_path, kwargs["write_opts"].get("workers", 1))}
+
+    if errfile:
+        efile = gen_libs.crt_file_time(
+            "ErrOut_" + unit["file"], dmp_path, ".log")
+        e_file = io.open(                               # pylint:disable=R1732
+            efile, mode="w+", encoding="UTF-8")
+
+    elif kwargs.get("retries", 0):
+        # The error stream is kept to check the errors of a failed dump.
+        e_file = tempfile.TemporaryFile(                # pylint:disable=R1732
+            mode="w+", encoding="UTF-8")
+
+    status, files, metrics = dump_retry(
+        list(dump_cmd) + list(unit["args"]), unit, compress,
+        gen_libs.crt_file_time(unit["file"], part_path, ".sql"),
+        errfile=e_file, **opts)
+    status = publish_dump(
+        unit, files, metrics, dmp_path, files=kwargs.get("files", {}),
+        journal=kwargs.get("journal", None),
+        hash_opts=kwargs.get("hash_opts", None),
+        sync=kwargs.get("sync", None), cancel=kwargs.get("cancel", None))
+
+    if wait is not None:
+        metrics["queue_seconds"] = wait
+
+    if unit.get("db"):
+        metrics["db"] = unit["db"]
+
+    kwargs.get("metrics", {})[unit["name"]] = metrics
+
+    if e_file:
+        e_file.seek(0)
+
+        with kwargs.get("lock", threading.Lock()):
+            (errfile or sys.stderr).write(e_file.read())
+            (errfile or sys.stderr).flush()
+
+        e_file.close()
+
+        if errfile:
+            os.remove(efile)
+
+    return unit["name"], status
+
+
+def run_unit(dump_cmd, unit, compress, dmp_path, **kwargs):
+
+    """Function:  run_unit
+
+    Description:  Dump a single unit (see dump_unit).  An error raised by the
+        dump of the unit fails the unit instead of the run, so the remaining
+        units are still dumped.
+
+    Arguments:
+        (input) dump_cmd -> Database dump command line
+        (input) unit -> Unit dictionary (see crt_units)
+        (input) compress -> Compression flag
+        (input) dmp_path -> Database dump output directory path
+        (input) **kwargs:
+            metrics -> Dictionary to which the unit name and the dump
+                metrics of the unit are added
+            Other arguments are passed to dump_unit
+        (output) -> Name of the unit
+        (output) status -> True|False - Dump of the unit was successful
+
+    """
+
+    try:
+        return dump_unit(dump_cmd, unit, compress, dmp_path, **kwargs)
+
+    except Exception as msg:                            # pylint:disable=W0718
+        print(f"Error:  Dump of {unit['name']} failed:  {msg}")
+        kwargs.get("metrics", {}).setdefault(unit["name"], {}).update(
+            {"status": False, "error": str(msg)})
+
+        return unit["name"], False
+
+
+def dump_pool(                                     # pylint:disable=R0913,R0914
+        dump_cmd, units, compress, dmp_path, workers, **kwargs):
+
+    """Function:  dump_pool
+
+    Description:  Runs the unit dumps concurrently using a pool of worker
+        threads, each worker running its own database dump process.  A unit
+        killed by the watchdog is requeued at the end of the pool queue (see
+        Watchdog.requeue).  The number of dumps running is adjusted to the
+        load of the database server if a load controller is passed, the
+        running dumps are not stopped.  Prints the status of each unit dump
+        once all dumps have completed.
+
+    Arguments:
+        (input) dump_cmd -> Database dump command line
+        (input) units -> List of unit dictionaries (see crt_units)
+        (input) compress -> Compression flag
+        (input) dmp_path -> Database dump output directory path
+        (input) workers -> Number of concurrent database dumps
+        (input) **kwargs:
+            errfile -> File handler for error file
+            comp_opts -> Dictionary of compression options
+            files -> Dictionary to which the unit names and dump file names
+                are added
+            engine -> Dump engine instance (see dump_unit)
+            write_opts -> Dictionary of writer options (see dump_unit)
+            hash_opts -> Dictionary of checksum options (see open_dump)
+            metrics -> Dictionary of unit names and dump metrics (see
+                dump_unit)
+            retries -> Number of retries of a failed dump (see dump_unit)
+            journal -> Journal instance (see dump_unit)
+            stop -> Event instance (see dump_unit)
+            procs -> List to which the dump processes are added once started
+            watchdog -> Watchdog instance (see dump_unit)
+            load -> LoadController instance, the number of workers is the
+                maximum number of concurrent dumps
+        (output) results -> Dictionary of unit names and dump status
+
+    """
+
+    dump_cmd = list(dump_cmd)
+    units = list(units)
+    results = {}
+    lock = threading.Lock()
+    files = kwargs.get("files", {})
+    metrics = kwargs.get("metrics", {})
+    watchdog = kwargs.get("watchdog", None)
+    load = kwargs.get("load", None)
+    pending = [(unit, time.time()) for unit in units]
+    futures = {}
+    unit_opts = {
+        "errfile": kwargs.get("errfile", None), "lock": lock,
+        "comp_opts": kwargs.get("comp_opts", {}), "files": files,
+        "engine": kwargs.get("engine", None),
+        "write_opts": kwargs.get("write_opts", None),
+        "hash_opts": kwargs.get("hash_opts", None), "metrics": metrics,
+        "retries": kwargs.get("retries", 0),
+        "journal": kwargs.get("journal", None),
+        "stop": kwargs.get("stop", None), "procs": kwargs.get("procs", []),
+        "watchdog": watchdog}
+
+    with concurrent.futures.ThreadPoolExecutor(
+            max_workers=workers) as executor:
+
+        while pending or futures:
+            limit = load.adjust(len(futures)) if load else workers
+
+            while pending and len(futures) < limit:
+                unit, queued = pending.pop(0)
+                futures[executor.submit(
+                    run_unit, dump_cmd, unit, compress, dmp_path,
+                    queued=queued, **unit_opts)] = unit
+
+            finished, _ = concurrent.futures.wait(
+                futures, timeout=load.interval if load else None,
+                return_when=concurrent.futures.FIRST_COMPLETED)
+
+            for future in finished:
+                unit = futures.pop(future)
+                name, status = future.result()
+
+                if not status and watchdog \
+                   and watchdog.requeue(name, metrics.get(name, {})):
+                    pending.append((unit, time.time()))
+
+                else:
+                    results[name] = status
+
+    dump_units.print_status(units, results, metrics)
+
+    return results
+
+
+def sync_snapshot(server, procs, count, timeout=SNAPSHOT_TIMEOUT):
+
+    """Function:  sync_snapshot
+
+    Description:  Wait for each dump process to start its consistent snapshot
+        transaction.  The dump processes are matched to their server sessions
+        by the client process id connection attribute.  A dump process which
+        has already completed successfully is treated as synchronized.
+
+    Arguments:
+        (input) server -> Database server instance
+        (input) procs -> List of dump processes
+        (input) count -> Number of dump processes expected
+        (input) timeout -> Maximum number of seconds to wait
+        (output) -> True|False - All snapshots started
+
+    """
+
+    end_time = time.time() + timeout
+
+    while time.time() < end_time:
+        procs_run = list(procs)
+
+        if any(proc.poll() not in [None, 0] for proc in procs_run):
+            return False
+
+        pids = [str(proc.pid) for proc in procs_run if proc.poll() is None]
+
+        if len(procs_run) == count and not pids:
+            return True
+
+        if len(procs_run) == count:
+            cmd = "select distinct a.processlist_id as 'Id'"             \
+                  " from performance_schema.session_connect_attrs a"     \
+                  " join information_schema.innodb_trx t"                \
+                  " on t.trx_mysql_thread_id = a.processlist_id"         \
+                  " where a.attr_name = '_pid' and a.attr_value in ("    \
+                  + ", ".join(f"'{pid}'" for pid in pids) + ")"
+
+            if len(server.col_sql(cmd)) == len(pids):
+                return True
+
+        time.sleep(0.1)
+
+    return False
+
+
+def dump_consistent(                               # pylint:disable=R0913,R0914
+        server, dump_cmd, units, compress, dmp_path, **kwargs):
+
+    """Function:  dump_consistent
+
+    Description:  Runs the unit dumps concurrently from a single point in
+        time.  A global read lock is taken, a dump process is started for each
+        unit and, once every dump process has started its consistent snapshot
+        transaction, the binary log and GTID coordinates are recorded and the
+        lock is released.  The coordinates are saved to a Snapshot json file
+        in the dump directory and added to the dump metrics of each unit.
+        The dump files are only moved into the dump directory once the
+        snapshots are known to be synchronized.  If the snapshots fail to
+        start, the dump processes are terminated and the dump files of the
+        units (including the units already completed) are removed instead,
+        so no dump file of an inconsistent snapshot is published.
+
+    Arguments:
+        (input) server -> Database server instance
+        (input) dump_cmd -> Database dump command line
+        (input) units -> List of unit dictionaries (see crt_groups)
+        (input) compress -> Compression flag
+        (input) dmp_path -> Database dump output directory path
+        (input) **kwargs:
+            errfile -> File handler for error file
+            comp_opts -> Dictionary of compression options
+            write_opts -> Dictionary of writer options (see dump_unit)
+            hash_opts -> Dictionary of checksum options (see open_dump)
+            metrics -> Dictionary of unit names and dump metrics (see
+                dump_unit)
+            watchdog -> Watchdog instance (see dump_unit), the units killed
+                by the watchdog are not requeued
+        (output) results -> Dictionary of unit names and dump status
+
+    """
+
+    dump_cmd = list(dump_cmd)
+    units = list(units)
+    results = {}
+    procs = []
+    lock = threading.Lock()
+    metrics = kwargs.get("metrics", {})
+    sync = threading.Event()
+    cancel = threading.Event()
+    synced = False
+    coords = []
+
+    server.cmd_sql("flush tables with read lock")
+
+    with concurrent.futures.ThreadPoolExecutor(
+            max_workers=max(len(units), 1)) as executor:
+
+        try:
+            futures = [
+                executor.submit(
+                    run_unit, dump_cmd, unit, compress, dmp_path,
+                    errfile=kwargs.get("errfile", None), lock=lock,
+                    comp_opts=kwargs.get("comp_opts", {}), procs=procs,
+                    write_opts=kwargs.get("write_opts", None),
+                    hash_opts=kwargs.get("hash_opts", None),
+                    metrics=metrics, watchdog=kwargs.get("watchdog", None),
+                    sync=sync, cancel=cancel)
+                for unit in units]
+            synced = sync_snapshot(server, procs, len(units))
+            coords = mysql_class.show_master_stat(server) if synced else []
+
+        finally:
+            server.cmd_sql("unlock tables")
+
+            if not synced:
+                cancel.set()
+
+            sync.set()
+
+        if not synced:
+            print("Error:  Dump processes failed to start a consistent"
+                  " snapshot.  Dumps cancelled.")
+
+            for proc in list(procs):
+                if proc.poll() is None:
+                    proc.terminate()
+
+        for future in concurrent.futures.as_completed(futures):
+            name, status = future.result()
+            results[name] = status and synced
+
+    if synced:
+        snapshot = {"Units": {unit["name"]: unit["args"][2:]
+                              for unit in units},
+                    "Coordinates": coords[0] if coords else {}}
+
+        for unit in units:
+            metrics.get(unit["name"], {})["coordinates"] = \
+                snapshot["Coordinates"]
+
+        with io.open(gen_libs.crt_file_time("Snapshot", dmp_path, ".json"),
+                     mode="w", encoding="UTF-8") as f_hdlr:
+            json.dump(snapshot, f_hdlr, indent=4, default=str)
+
+    dump_units.print_status(units, results, metrics)
+
+    return results
+
+
+def dump_seq(dump_cmd, units, compress, dmp_path, **kwargs):
+
+    """Function:  dump_seq
+
+    Description:  Dump the units one after the other (see run_unit).  A unit
+        killed by the watchdog is requeued at the end of the units (see
+        Watchdog.requeue).
+
+    Arguments:
+        (input) dump_cmd -> Database dump command line
+        (input) units -> List of unit dictionaries (see crt_units)
+        (input) compress -> Compression flag
+        (input) dmp_path -> Database dump output directory path
+        (input) **kwargs:
+            metrics -> Dictionary to which the unit names and dump metrics
+                are added
+            watchdog -> Watchdog instance watching the dump processes
+            Other arguments are passed to run_unit
+        (output) results -> Dictionary of unit names and dump status
+
+    """
+
+    units = list(units)
+    metrics = kwargs.setdefault("metrics", {})
+    watchdog = kwargs.get("watchdog", None)
+    queued = time.time()
+    results = {}
+
+    while units:
+        unit = units.pop(0)
+        name, status = run_unit(
+            dump_cmd, unit, compress, dmp_path, queued=queued, **kwargs)
+
+        if not status and watchdog \
+           and watchdog.requeue(name, metrics.get(name, {})):
+            units.append(unit)
+
+        else:
+            results[name] = status
+
+    return results
+
+
+def plan_units(dump_cmd, db_list, done, **kwargs):
+
+    """Function:  plan_units
+
+    Description:  Create the units of a dump:  the databases batched by size
+        (batch_size), the units passed or a unit for each database, table or
+        table chunk (see crt_units) planned by the dump engine, or a single
+        unit for all databases if the dump command dumps all databases.
+        The units completed by the previous run are left out.
+
+    Arguments:
+        (input) dump_cmd -> Database dump command line
+        (input) db_list -> Array of database names
+        (input) done -> Dictionary of the units completed by the previous run
+        (input) **kwargs:
+            batch_size, db_size, units, tbl_size, tbl_chunks, engine -> See
+                dump_db
+        (output) -> List of unit dictionaries or None if there is nothing to
+            dump
+
+    """
+
+    engine = kwargs.get("engine", None)
+
+    if db_list and kwargs.get("batch_size", None):
+        return dump_units.crt_batches(
+            [dbn for dbn in db_list if dbn not in done],
+            kwargs.get("db_size", {}), kwargs["batch_size"])
+
+    if db_list:
+        units = dump_units.crt_units(
+            db_list, tbl_size=kwargs.get("tbl_size", None),
+            tbl_chunks=kwargs.get("tbl_chunks", None))                    \
+            if kwargs.get("units", None) is None else kwargs["units"]
+        units = [unit for unit in units if unit["name"] not in done]
+
+        return engine.plan(units) if engine else units
+
+    if "--all-databases" not in dump_cmd:
+        return None
+
+    return [{"name": "All_Databases", "args": [], "file": "All_Databases"}] \
+        if "All_Databases" not in done else []
+
+
+def dump_db(dump_cmd, db_list, compress, dmp_path, **kwargs):
+
+    """Function:  dump_db
+
+    Description:  Runs the database dump command against one or more databases
+        in the database list.  Will create a dump file for each database.
+
+    Arguments:
+        (input) dump_cmd -> Database dump command line
+        (input) db_list -> Array of database names
+        (input) compress -> Compression flag
+        (input) dmp_path -> Database dump output directory path
+        (input) **kwargs:
+            err_sup -> Suppression of standard error to standard out
+            mail -> Email class instance
+            use_mailx -> True|False - Override postfix and use mailx
+            workers -> Number of concurrent database dumps
+            comp_opts -> Dictionary of compression options
+            tbl_size -> Dictionary of databases and their table sizes, dump
+                each table to its own dump file
+            tbl_chunks -> Dictionary of databases and their chunked tables
+            snapshot -> Database server instance, dump the databases from a
+                single consistent snapshot
+            db_size -> Dictionary of database names and sizes in bytes
+            batch_size -> Batch the databases smaller than the batch size
+                (bytes) into a single database dump command
+            units -> List of unit dictionaries to dump (see crt_units)
+                instead of the units created from the database list
+            engine -> DumpEngine instance, dumps the units planned by the
+                engine instead of the database dump command
+            files -> Dictionary to which the database or unit names and dump
+                file names of the successful dumps are added
+            write_opts -> Dictionary of page cache friendly writer options
+                direct -> True|False - Write the dump files with O_DIRECT
+                sizes -> Dictionary of unit names and estimated dump sizes
+                    (see fetch_data_size), the dump files are preallocated
+                    with their share of the free space (see prealloc_size)
+            hash_opts -> Dictionary of checksum options (see open_dump)
+            metrics -> Dictionary to which the database or unit names and
+                dump metrics are added (see dump_run)
+            retries -> Number of retries of a failed dump (see dump_unit),
+                the dumps of a consistent snapshot are not retried
+            journal -> Journal instance the completed units are recorded in,
+                the units already completed in the journal are skipped
+            stop -> Event instance, set to stop dumping (see term_handler)
+            procs -> List to which the dump processes are added once started
+            watchdog -> Watchdog instance watching the dump processes, the
+                units killed by the watchdog are requeued (see dump_pool)
+            load -> LoadController instance adjusting the number of
+                concurrent dumps (see dump_pool)
+        (output) -> List of the database or unit names of the failed dumps
+
+    """
+
+    dump_cmd = list(dump_cmd)
+    db_list = list(db_list)
+    workers = kwargs.get("workers", 1)
+    done = kwargs["journal"].done if kwargs.get("journal", None) else {}
+    opts = {"comp_opts": dict(kwargs.get("comp_opts", {})),
+            "write_opts": kwargs.get("write_opts", None),
+            "hash_opts": kwargs.get("hash_opts", None),
+            "metrics": kwargs.get("metrics", {}),
+            "watchdog": kwargs.get("watchdog", None), "errfile": None}
+    pool_opts = {"files": kwargs.get("files", {}),
+                 "retries": kwargs.get("retries", 0),
+                 "journal": kwargs.get("journal", None),
+                 "stop": kwargs.get("stop", None),
+                 "procs": kwargs.get("procs", []),
+                 "load": kwargs.get("load", None)}
+
+    if opts["write_opts"] is not None:
+        opts["write_opts"] = {
+            "direct": opts["write_opts"].get("direct", False),
+            "sizes": dict(opts["write_opts"].get("sizes", {})),
+            "workers": workers}
+
+    if kwargs.get("err_sup", False):
+        efile = gen_libs.crt_file_time("ErrOut", dmp_path, ".log")
+        opts["errfile"] = open(                         # pylint:disable=R1732
+            efile, mode="a", encoding="UTF-8")
+
+    units = None if db_list and kwargs.get("snapshot", None)              \
+        else plan_units(dump_cmd, db_list, done, **kwargs)
+    pooled = workers > 1 or kwargs.get("batch_size", None) or any(
+        kwargs.get(key, None) is not None
+        for key in ["tbl_size", "units", "engine"])
+
+    if units is None and db_list:
+        results = dump_consistent(
+            kwargs["snapshot"], dump_cmd,
+            dump_units.crt_groups(db_list, kwargs.get("db_size", {}), workers),
+            compress, dmp_path, **opts)
+
+    elif units is None:
+        results = {}
+        print("WARNING:  No databases to dump or missing -D option.")
+
+    elif db_list and pooled:
+        results = dump_pool(
+            dump_cmd, units, compress, dmp_path, workers,
+            engine=kwargs.get("engine", None), **opts, **pool_opts)
+
+    else:
+        results = dump_seq(
+            dump_cmd, units, compress, dmp_path, **opts, **pool_opts)
+
+    if done:
+        print(f"Resumed:  Skipped {len(done)} databases or units completed"
+              f" by the previous run.")
+
+    # Remove the partial dump files of the units which were abandoned.
+    shutil.rmtree(dump_units.part_dir(dmp_path), ignore_errors=True)
+
+    if opts["errfile"]:
+        opts["errfile"].close()
+        mail = kwargs.get("mail", None)
+
+        if mail and not gen_libs.is_empty_file(efile):
+
+            for line in gen_libs.file_2_list(efile):
+                mail.add_2_msg(line)
+
+            mail.send_mail(use_mailx=kwargs.get("use_mailx", False))
+
+    return [name for name, status in results.items() if not status]
@@ -0,0 +1,544 @@
+# Classification (U)
+
+"""Program:  dump_state.py
+
+    Description:  Library of the functions used by mysql_db_dump.py for the
+        incremental dumps and the binary log position:  table fingerprints,
+        the incremental state and the binary log dumps.
+
+    Functions:
+        crt_fprint
+        fetch_fprint_rows
+        checksum_tables
+        fetch_fprint
+        unit_fprint
+        load_state
+        save_state
+        link_unchanged
+        dump_incr
+        fetch_binlog_pos
+        record_binlog_pos
+        dump_binlog
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import os
+import subprocess
+import datetime
+import io
+import time
+import json
+import hashlib
+
+# Local
+try:
+    from .lib import gen_libs
+    from .mysql_lib import mysql_class
+    from . import dump_engine
+    from . import dump_units
+    from . import dump_sched
+    from . import dump_report
+    from . import version
+
+except (ValueError, ImportError) as err:
+    import lib.gen_libs as gen_libs                     # pylint:disable=R0402
+    import mysql_lib.mysql_class as mysql_class         # pylint:disable=R0402
+    import dump_engine
+    import dump_units
+    import dump_sched
+    import dump_report
+    import version
+
+__version__ = version.__version__
+
+# Global
+# Largest table (data length) checksummed when its update time is unknown.
+CHECKSUM_SIZE = 64 * 1024 * 1024
+BINLOG_MANIFEST = "Binlog_Manifest.json"
+
+
+def crt_fprint(data):
+
+    """Function:  crt_fprint
+
+    Description:  Create a fingerprint (sha256 hex digest) of the data.
+
+    Arguments:
+        (input) data -> List or dictionary of the data to fingerprint
+        (output) -> Fingerprint of the data
+
+    """
+
+    return hashlib.sha256(
+        json.dumps(data, default=str, sort_keys=True).encode("UTF-8")
+    ).hexdigest()
+
+
+def fetch_fprint_rows(server, db_list):
+
+    """Function:  fetch_fprint_rows
+
+    Description:  Get the information_schema rows the fingerprints of the
+        databases are created from (see fetch_fprint):  the statistics of
+        the tables and views and the alter times of the routines, triggers,
+        events and views.  The information_schema statistics cache is
+        disabled for the session where the server supports it.
+
+    Arguments:
+        (input) server -> Database server instance
+        (input) db_list -> Array of database names
+        (output) db_rows -> Dictionary of databases and their rows
+        (output) tbl_rows -> Dictionary of databases and the statistics rows
+            of their base tables {database: {table: [row]}}
+        (output) unknown -> Dictionary of databases and their base tables
+            with an unknown update time
+
+    """
+
+    db_rows = {dbn: [] for dbn in db_list}
+    tbl_rows = {dbn: {} for dbn in db_list}
+    unknown = {dbn: [] for dbn in db_list}
+
+    if server.col_sql("show variables like 'information_schema_stats_expiry'"):
+        server.cmd_sql("set session information_schema_stats_expiry = 0")
+
+    cmd = "select table_schema as 'Database', table_name as 'Table',"     \
+          " table_type as 'Type', engine as 'Engine',"                   \
+          " table_rows as 'Rows', data_length as 'Data',"                \
+          " index_length as 'Index', create_time as 'Create',"           \
+          " update_time as 'Update', update_time is null"                \
+          " or update_time >= now() - interval 1 second as 'Unknown'"    \
+          " from information_schema.tables"
+
+    for item in server.col_sql(cmd):
+        stale = item.pop("Unknown", None)
+
+        if item["Database"] in db_rows:
+            db_rows[item["Database"]].append(item)
+
+            if item["Type"] == "BASE TABLE":
+                tbl_rows[item["Database"]][item["Table"]] = [item]
+
+                if stale:
+                    unknown[item["Database"]].append(item["Table"])
+
+    cmd = "select routine_schema as 'Database', routine_name as 'Name',"  \
+          " last_altered as 'Altered' from information_schema.routines"  \
+          " union all select trigger_schema, trigger_name, created"      \
+          " from information_schema.triggers"                            \
+          " union all select event_schema, event_name, last_altered"     \
+          " from information_schema.events"                              \
+          " union all select table_schema, table_name, md5(view_definition)" \
+          " from information_schema.views"
+
+    for item in server.col_sql(cmd):
+        if item["Database"] in db_rows:
+            db_rows[item["Database"]].append(item)
+
+    return db_rows, tbl_rows, unknown
+
+
+def checksum_tables(server, dbn, tables):
+
+    """Function:  checksum_tables
+
+    Description:  Get the checksums of the tables of a database (CHECKSUM
+        TABLE, reads every row of the tables).
+
+    Arguments:
+        (input) server -> Database server instance
+        (input) dbn -> Database name
+        (input) tables -> List of table names
+        (output) -> Dictionary of the table names and their checksum rows,
+            the tables without a checksum (NULL, i.e. the table was dropped
+            while fetching) are left out
+
+    """
+
+    if not tables:
+        return {}
+
+    cmd = "checksum table " + ", ".join(
+        dump_engine.quote_id(dbn) + "." + dump_engine.quote_id(tbl)
+        for tbl in tables)
+
+    return {item["Table"][len(dbn) + 1:]: item for item in server.col_sql(cmd)
+            if item.get("Checksum") is not None}
+
+
+def fetch_fprint(server, db_list, checksum_size=CHECKSUM_SIZE):
+
+    """Function:  fetch_fprint
+
+    Description:  Get a fingerprint of each database, of its schema and of
+        each of its base tables.  The table fingerprints are created from the
+        table statistics (rows, lengths, create and update times), which are
+        read from the information_schema without reading the tables.  The
+        update time of a table is unknown if it is not set (i.e. InnoDB
+        update times are not persisted across a server restart) or is within
+        the last second (a later change in the same second keeps the same
+        update time).  A table with an unknown update time is checksummed
+        (CHECKSUM TABLE, reads every row) if its data length is at most
+        checksum_size, else the GTID position (or binary log position
+        without GTIDs) of the server is added to its fingerprint, so it is
+        unchanged only if nothing was written to the server since the last
+        run.  A table with an unknown update time and no checksum or position
+        (binary logging disabled) has no fingerprint and is always dumped.
+        The database and schema fingerprints are created from the table
+        statistics and fingerprints and the alter times of the routines,
+        triggers, events and views (see fetch_fprint_rows), a database with
+        a table without a fingerprint has no fingerprint.
+
+    Arguments:
+        (input) server -> Database server instance
+        (input) db_list -> Array of database names
+        (input) checksum_size -> Largest data length (bytes) of a table with
+            an unknown update time which is checksummed
+        (output) fprint -> Dictionary of unit names and fingerprints
+            {database: fprint, database:schema: fprint, database.table:
+            fprint}, the fingerprint is None if not available
+
+    """
+
+    fprint = {}
+    position = fetch_binlog_pos(server)
+    db_rows, tbl_rows, unknown = fetch_fprint_rows(server, db_list)
+
+    if position:
+        position = position["Executed_Gtid_Set"]                          \
+            or [position["File"], position["Position"]]
+
+    for dbn in db_list:
+        checksums = checksum_tables(
+            server, dbn,
+            [tbl for tbl in sorted(unknown[dbn])
+             if int(tbl_rows[dbn][tbl][0]["Data"] or 0) <= checksum_size])
+
+        for tbl, rows in tbl_rows[dbn].items():
+            if tbl not in unknown[dbn]:
+                fprint[dbn + "." + tbl] = crt_fprint(rows)
+
+            elif tbl in checksums:
+                fprint[dbn + "." + tbl] = crt_fprint(rows + [checksums[tbl]])
+
+            else:
+                fprint[dbn + "." + tbl] = crt_fprint(rows + [position])     \
+                    if position else None
+
+        tables = [fprint[dbn + "." + tbl] for tbl in sorted(tbl_rows[dbn])]
+        fprint[dbn] = None if None in tables                               \
+            else crt_fprint([sorted(db_rows[dbn], key=str), tables])
+        fprint[dbn + ":schema"] = fprint[dbn]
+
+    return fprint
+
+
+def unit_fprint(unit, fprint, opts=None):
+
+    """Function:  unit_fprint
+
+    Description:  Create the fingerprint of a unit from the fingerprint of
+        its database, schema or table, the unit's dump arguments and the dump
+        options, so a changed primary key range of a chunked table or changed
+        dump options change the fingerprint.
+
+    Arguments:
+        (input) unit -> Unit dictionary (see crt_units)
+        (input) fprint -> Dictionary of unit names and fingerprints
+        (input) opts -> Dump options (see dump_incr)
+        (output) -> Fingerprint of the unit or None if not available
+
+    """
+
+    name = unit["name"].partition("#")[0]
+
+    return crt_fprint([fprint[name], unit["args"], opts]) \
+        if fprint.get(name) else None
+
+
+def load_state(state_file):
+
+    """Function:  load_state
+
+    Description:  Load the incremental state file.  A missing state file
+        returns an empty state.
+
+    Arguments:
+        (input) state_file -> Name of the state file
+        (output) -> Dictionary of unit names and their state
+            {unit: {"fprint": fingerprint, "file": dump file name,
+            "run": run the dump file was dumped in}}
+
+    """
+
+    if not os.path.isfile(state_file):
+        return {}
+
+    with io.open(state_file, mode="r", encoding="UTF-8") as f_hdlr:
+        return json.load(f_hdlr)
+
+
+def save_state(state_file, state):
+
+    """Function:  save_state
+
+    Description:  Save the incremental state file.  The state is written to
+        a temporary file which then replaces the state file.
+
+    Arguments:
+        (input) state_file -> Name of the state file
+        (input) state -> Dictionary of unit names and their state
+
+    """
+
+    with io.open(state_file + ".tmp", mode="w", encoding="UTF-8") as f_hdlr:
+        json.dump(state, f_hdlr, indent=4, sort_keys=True)
+
+    os.replace(state_file + ".tmp", state_file)
+
+
+def link_unchanged(units, fprint, state, dmp_path, opts=None):
+
+    """Function:  link_unchanged
+
+    Description:  Hard link the previous dump file of each unit whose
+        fingerprint has not changed into the dump directory under a new time
+        stamped name instead of dumping the unit again.  Units which have
+        changed, have no previous dump file or which cannot be linked are
+        returned to be dumped.  The state is updated with the new file name
+        of each linked unit.
+
+    Arguments:
+        (input) units -> List of unit dictionaries (see crt_units)
+        (input) fprint -> Dictionary of unit names and fingerprints
+        (input) state -> Dictionary of unit names and their state
+        (input) dmp_path -> Database dump output directory path
+        (input) opts -> Dump options (see unit_fprint)
+        (output) changed -> List of unit dictionaries to be dumped
+
+    """
+
+    changed = []
+
+    for unit in units:
+        entry = state.get(unit["name"], {})
+        old_file = entry.get("file", "")
+        u_fprint = unit_fprint(unit, fprint, opts)
+
+        if not u_fprint or entry.get("fprint") != u_fprint \
+           or not os.path.isfile(old_file):
+            changed.append(unit)
+            continue
+
+        _, sep, ext = old_file.rpartition(".sql")
+        new_file = gen_libs.crt_file_time(unit["file"], dmp_path, sep + ext)
+
+        try:
+            if new_file != old_file:
+                os.link(old_file, new_file)
+
+        except OSError as msg:
+            print(f"Warning:  Unable to link {old_file}: {msg}")
+            changed.append(unit)
+            continue
+
+        entry["file"] = new_file
+        print(f"{unit['name']} is unchanged, linked to {new_file}")
+
+    return changed
+
+
+def dump_incr(                               # pylint:disable=R0913,R0914,R0917
+        server, state_file, dump_cmd, db_list, compress, dmp_path, **kwargs):
+
+    """Function:  dump_incr
+
+    Description:  Incremental dump.  Dumps only the units (databases or
+        schemas and tables) which have changed since the last dump, hard
+        linking the last dump file of the unchanged units.  The state file is
+        updated with the fingerprint, dump file name and run of each unit and
+        a Manifest json file recording the dump file of each unit and the run
+        it was dumped in is saved in the dump directory, so a full restore
+        set can be assembled.  The dump command (-s and -r options),
+        compression (-z, -C and -L options) and dump engine (-E option) are
+        part of the fingerprints, so the units are dumped again when they
+        change.  The timing and dump metrics of the run (see
+        crt_manifest) are added to the manifest.
+
+    Arguments:
+        (input) server -> Database server instance
+        (input) state_file -> Name of the state file
+        (input) dump_cmd -> Database dump command line
+        (input) db_list -> Array of database names
+        (input) compress -> Compression flag
+        (input) dmp_path -> Database dump output directory path
+        (input) **kwargs:
+            tbl_size -> Dictionary of databases and their table sizes
+            tbl_chunks -> Dictionary of databases and their chunked tables
+            comp_opts -> Dictionary of compression options
+            engine -> DumpEngine instance (see dump_db)
+            hash_opts -> Dictionary of checksum options (see open_dump)
+            binlog -> Binary log and GTID position of the run
+            watchdog -> Watchdog instance (see crt_manifest)
+            load -> LoadController instance (see crt_manifest)
+            Other arguments are passed to dump_db
+        (output) manifest -> Dictionary of the run and unit dump files
+
+    """
+
+    start = time.time()
+    run = datetime.datetime.strftime(
+        datetime.datetime.fromtimestamp(start), "%Y%m%d_%H%M%S")
+    kwargs.setdefault("metrics", {})
+    units = dump_units.crt_units(
+        db_list, tbl_size=kwargs.get("tbl_size", None),
+        tbl_chunks=kwargs.get("tbl_chunks", None))
+    comp_opts = kwargs.get("comp_opts", {})
+    engine = kwargs.get("engine", None)
+    opts = {"cmd": list(dump_cmd), "compress": compress,
+            "codec": comp_opts.get("codec") if compress else None,
+            "level": comp_opts.get("level") if compress else None,
+            "engine": engine.name if engine else None}
+    fprint = fetch_fprint(server, db_list)
+    state = load_state(state_file)
+    changed = link_unchanged(units, fprint, state, dmp_path, opts)
+    files = {}
+    new_state = {}
+
+    if changed:
+        dump_sched.dump_db(dump_cmd, db_list, compress, dmp_path,
+                           units=changed, files=files, **kwargs)
+
+    for unit in units:
+        if unit["name"] in files:
+            new_state[unit["name"]] = {
+                "fprint": unit_fprint(unit, fprint, opts),
+                "file": files[unit["name"]], "run": run}
+
+        elif unit not in changed:
+            new_state[unit["name"]] = state[unit["name"]]
+
+    save_state(state_file, new_state)
+    manifest = dump_report.crt_manifest(
+        run, start, kwargs["metrics"], binlog=kwargs.get("binlog", None),
+        hash_opts=kwargs.get("hash_opts", None),
+        watchdog=kwargs.get("watchdog", None),
+        load=kwargs.get("load", None),
+        failed=[unit["name"] for unit in changed
+                if unit["name"] not in files])
+    manifest["Units"] = {
+        name: {"File": entry["file"], "Run": entry.get("run", "")}
+        for name, entry in new_state.items()}
+    dump_report.save_manifest(dmp_path, manifest)
+
+    return manifest
+
+
+def fetch_binlog_pos(server):
+
+    """Function:  fetch_binlog_pos
+
+    Description:  Get the binary log and GTID position of the server at the
+        start of a full dump (see record_binlog_pos).
+
+    Arguments:
+        (input) server -> Database server instance
+        (output) -> Full dump position or None if binary logging is disabled
+
+    """
+
+    stat = mysql_class.show_master_stat(server)
+
+    if not stat:
+        return None
+
+    return {
+        "Run": datetime.datetime.strftime(
+            datetime.datetime.now(), "%Y%m%d_%H%M%S"),
+        "File": stat[0].get("File"), "Position": stat[0].get("Position"),
+        "Executed_Gtid_Set": stat[0].get("Executed_Gtid_Set", "")}
+
+
+def record_binlog_pos(dmp_path, position):
+
+    """Function:  record_binlog_pos
+
+    Description:  Record the binary log and GTID position of a completed
+        full dump in the binary log manifest in the dump directory.  The
+        binary logs streamed by the -b option are applied from this
+        position.  The binary logs recorded for the previous full dump are
+        cleared from the manifest, so it is only recorded once the full dump
+        has completed without failed dumps.
+
+    Arguments:
+        (input) dmp_path -> Database dump output directory path
+        (input) position -> Full dump position (see fetch_binlog_pos)
+
+    """
+
+    save_state(os.path.join(dmp_path, BINLOG_MANIFEST),
+               {"Full_Dump": position, "Binlogs": {}})
+
+
+def dump_binlog(server, binlog_cmd, dmp_path):
+
+    """Function:  dump_binlog
+
+    Description:  Stream the binary logs from the server into the dump
+        directory using mysqlbinlog --read-from-remote-server --raw.  The
+        binary logs are streamed from the last binary log streamed (which
+        may have been incomplete) or, after a full dump, from the binary log
+        position recorded by the full dump, up to the current binary log.
+        The binary log manifest in the dump directory ties the streamed
+        binary logs to the full dump.
+
+    Arguments:
+        (input) server -> Database server instance
+        (input) binlog_cmd -> mysqlbinlog command line
+        (input) dmp_path -> Database dump output directory path
+        (output) status -> True|False - Binary logs were streamed
+
+    """
+
+    manifest_file = os.path.join(dmp_path, BINLOG_MANIFEST)
+    manifest = load_state(manifest_file)
+
+    if not manifest.get("Full_Dump"):
+        print(f"Error:  No full dump recorded in {manifest_file}.")
+        return False
+
+    run = datetime.datetime.strftime(
+        datetime.datetime.now(), "%Y%m%d_%H%M%S")
+    streamed = sorted(manifest["Binlogs"])
+    start = streamed[-1] if streamed else manifest["Full_Dump"]["File"]
+    log_list = [item["Log_name"]
+                for item in server.col_sql("show binary logs")]
+
+    if start not in log_list:
+        print(f"Error:  Binary log {start} is no longer on the server."
+              "  A full dump is required.")
+        return False
+
+    log_list = log_list[log_list.index(start):]
+    binlog_cmd = list(binlog_cmd) + [
+        "--read-from-remote-server", "--raw", "--to-last-log",
+        "--result-file=" + os.path.join(dmp_path, ""), start]
+    proc1 = subprocess.Popen(binlog_cmd)                # pylint:disable=R1732
+    status = proc1.wait() == 0
+
+    if status:
+        for log_name in log_list:
+            fname = os.path.join(dmp_path, log_name)
+
+            if os.path.isfile(fname):
+                manifest["Binlogs"][log_name] = {
+                    "Run": run, "Size": os.path.getsize(fname)}
+
+        save_state(manifest_file, manifest)
+
+    print(f"Binary log dump status:  {'Success' if status else 'Failed'}")
+
+    return status
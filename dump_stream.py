@@ -0,0 +1,599 @@
+# Classification (U)
+
+"""Program:  dump_stream.py
+
+    Description:  Library of the compression and stream pipeline classes
+        and functions used by mysql_db_dump.py to move the dump output from
+        the dump process to the dump file.
+
+    Classes:
+        ParallelGzip
+        BufferPool
+        Stage
+        WriteStage
+        StreamPipeline
+
+    Functions:
+        open_compressor
+        dump_fname
+        copy_stream
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import os
+import io
+import queue
+import gzip
+import lzma
+import collections
+import threading
+import concurrent.futures
+
+# Third-party
+try:
+    import zstandard
+
+except ImportError:
+    zstandard = None
+
+try:
+    import lz4.frame
+
+except ImportError:
+    lz4 = None                                          # pylint:disable=C0103
+
+# Local
+try:
+    from . import version
+
+except (ValueError, ImportError) as err:
+    import version
+
+__version__ = version.__version__
+
+# Global
+BUF_SIZE = 1024 * 1024
+# Number of buffers in the buffer pool of a stream pipeline.
+PIPE_BUFFERS = 4
+# Compression codecs:  file extension, default level and valid level range.
+CODECS = {
+    "gzip": {"ext": ".gz", "level": 6, "levels": (1, 9)},
+    "zstd": {"ext": ".zst", "level": 3, "levels": (1, 22)},
+    "lz4": {"ext": ".lz4", "level": 0, "levels": (0, 16)},
+    "xz": {"ext": ".xz", "level": 6, "levels": (0, 9)}}
+
+
+class ParallelGzip():                                   # pylint:disable=R0902
+
+    """Class:  ParallelGzip
+
+    Description:  File-like compressor which splits the data stream into
+        blocks, compresses the blocks concurrently in a pool of threads and
+        writes them in order to the file as a multi-member gzip file.  The
+        file is readable by gzip, gunzip and zcat.
+
+    Methods:
+        __init__
+        __enter__
+        __exit__
+        write
+        close
+        _submit
+        _drain
+
+    """
+
+    def __init__(self, fname, threads, level=6, block_size=BUF_SIZE):
+
+        """Method:  __init__
+
+        Description:  Initialization of an instance of ParallelGzip class.
+
+        Arguments:
+            (input) fname -> Name of compressed file or file-like instance
+            (input) threads -> Number of compression threads
+            (input) level -> Compression level
+            (input) block_size -> Size of the blocks compressed in bytes
+
+        """
+
+        self.level = level
+        self.block_size = block_size
+        self.max_pending = threads * 2
+        self.pending = collections.deque()
+        self.buf = bytearray()
+        self.members = 0
+        self.executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=threads)
+        self.f_hdlr = io.open(                          # pylint:disable=R1732
+            fname, "wb") if isinstance(fname, str) else fname
+
+    def __enter__(self):
+
+        """Method:  __enter__
+
+        Description:  Enter the runtime context.
+
+        Arguments:
+
+        """
+
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+
+        """Method:  __exit__
+
+        Description:  Exit the runtime context and close the file.
+
+        Arguments:
+
+        """
+
+        self.close()
+
+    def write(self, data):
+
+        """Method:  write
+
+        Description:  Buffer the data and submit each full block for
+            compression.
+
+        Arguments:
+            (input) data -> Data to be compressed
+            (output) -> Number of bytes written
+
+        """
+
+        self.buf.extend(data)
+
+        while len(self.buf) >= self.block_size:
+            self._submit(bytes(self.buf[:self.block_size]))
+            del self.buf[:self.block_size]
+
+        return len(data)
+
+    def close(self):
+
+        """Method:  close
+
+        Description:  Compress any remaining data, write all outstanding
+            blocks to the file and close the file.
+
+        Arguments:
+
+        """
+
+        if self.f_hdlr.closed:
+            return
+
+        if self.buf or not self.members:
+            self._submit(bytes(self.buf))
+            del self.buf[:]
+
+        self._drain(0)
+        self.executor.shutdown()
+        self.f_hdlr.close()
+
+    def _submit(self, block):
+
+        """Method:  _submit
+
+        Description:  Submit a block for compression.  Limits the number of
+            blocks in flight to bound memory usage.
+
+        Arguments:
+            (input) block -> Block of data
+
+        """
+
+        self._drain(self.max_pending - 1)
+        self.pending.append(
+            self.executor.submit(gzip.compress, block, self.level))
+        self.members += 1
+
+    def _drain(self, keep):
+
+        """Method:  _drain
+
+        Description:  Write compressed blocks to the file, in order, until
+            only keep blocks are still outstanding.
+
+        Arguments:
+            (input) keep -> Number of blocks left outstanding
+
+        """
+
+        while len(self.pending) > keep:
+            self.f_hdlr.write(self.pending.popleft().result())
+
+
+def open_compressor(fname, comp_opts):
+
+    """Function:  open_compressor
+
+    Description:  Open a file-like compressor for the compressed dump file
+        using the requested compression codec.
+
+    Arguments:
+        (input) fname -> Name of compressed file or file-like instance
+        (input) comp_opts -> Dictionary of compression options
+            codec -> Compression codec name (see CODECS)
+            level -> Compression level
+            threads -> Number of compression threads
+        (output) -> File-like compressor instance
+
+    """
+
+    codec = comp_opts.get("codec", "gzip")
+    level = comp_opts.get("level", CODECS[codec]["level"])
+    threads = comp_opts.get("threads", 1)
+
+    if codec == "zstd":
+        cctx = zstandard.ZstdCompressor(
+            level=level, threads=threads if threads > 1 else 0)
+
+        return cctx.stream_writer(
+            io.open(fname, "wb") if isinstance(fname, str) else fname)
+
+    if codec == "lz4":
+        return lz4.frame.open(fname, "wb", compression_level=level)
+
+    if codec == "xz":
+        return lzma.open(fname, "wb", preset=level)
+
+    if threads > 1:
+        return ParallelGzip(fname, threads, level=level)
+
+    return gzip.open(fname, "wb", compresslevel=level)
+
+
+class BufferPool():
+
+    """Class:  BufferPool
+
+    Description:  Pool of preallocated buffers.  A buffer is taken from the
+        pool before it is filled and returned to the pool once the data has
+        been consumed, so the memory used is bounded by the number of
+        buffers and no buffer is allocated while streaming.  Taking a buffer
+        from an empty pool blocks until a buffer is returned (backpressure).
+
+    Methods:
+        __init__
+        get
+        put
+
+    """
+
+    def __init__(self, count=PIPE_BUFFERS, size=BUF_SIZE):
+
+        """Method:  __init__
+
+        Description:  Initialization of an instance of the BufferPool class.
+
+        Arguments:
+            (input) count -> Number of buffers
+            (input) size -> Size of each buffer in bytes
+
+        """
+
+        self.size = size
+        self.free = queue.Queue()
+
+        for _ in range(count):
+            self.free.put(bytearray(size))
+
+    def get(self):
+
+        """Method:  get
+
+        Description:  Take a buffer from the pool, waiting for a buffer to be
+            returned if none are free.
+
+        Arguments:
+            (output) -> Buffer (bytearray)
+
+        """
+
+        return self.free.get()
+
+    def put(self, buf):
+
+        """Method:  put
+
+        Description:  Return a buffer to the pool.
+
+        Arguments:
+            (input) buf -> Buffer (bytearray)
+
+        """
+
+        self.free.put(buf)
+
+
+class Stage():
+
+    """Class:  Stage
+
+    Description:  Stage of a stream pipeline.  A stage is passed each block
+        of the stream in order and returns the data passed to the next
+        stage, either the block itself (i.e. hashing or counting), a
+        transformed block (i.e. filtering) or None to drop the block.  The
+        data passed to a stage is a memoryview of a pooled buffer and is
+        only valid until the stage returns, it must be copied if it is kept.
+
+    Methods:
+        write
+        close
+
+    """
+
+    def write(self, data):
+
+        """Method:  write
+
+        Description:  Process a block of the stream.
+
+        Arguments:
+            (input) data -> Block of data (bytes-like)
+            (output) -> Data passed to the next stage
+
+        """
+
+        return data
+
+    def close(self):
+
+        """Method:  close
+
+        Description:  End of the stream.
+
+        Arguments:
+
+        """
+
+
+class WriteStage(Stage):
+
+    """Class:  WriteStage
+
+    Description:  Stage writing the stream to a file or compressor.
+
+    Methods:
+        __init__
+        write
+
+    """
+
+    def __init__(self, f_hdlr):
+
+        """Method:  __init__
+
+        Description:  Initialization of an instance of the WriteStage class.
+
+        Arguments:
+            (input) f_hdlr -> File-like instance
+
+        """
+
+        self.f_hdlr = f_hdlr
+
+    def write(self, data):
+
+        """Method:  write
+
+        Description:  Write a block of the stream.
+
+        Arguments:
+            (input) data -> Block of data (bytes-like)
+            (output) -> Block of data
+
+        """
+
+        self.f_hdlr.write(data)
+
+        return data
+
+
+class StreamPipeline():                                 # pylint:disable=R0903
+
+    """Class:  StreamPipeline
+
+    Description:  Chain of stages run in their own threads, connected by
+        bounded queues.  The stream is read with readinto into buffers of a
+        buffer pool and each block is passed down the chain as a memoryview.
+        The buffer is returned to the pool once the last stage has processed
+        the block, so the memory used stays flat regardless of the size of
+        the stream and a slow stage holds back the reader (backpressure).
+        If a stage fails, the rest of the stream is drained without being
+        processed and the error is raised by run.
+
+    Methods:
+        __init__
+        run
+        _stage
+
+    """
+
+    def __init__(self, stages, pool=None):
+
+        """Method:  __init__
+
+        Description:  Initialization of an instance of the StreamPipeline
+            class.
+
+        Arguments:
+            (input) stages -> List of Stage instances
+            (input) pool -> BufferPool instance
+
+        """
+
+        self.stages = list(stages)
+        self.pool = pool or BufferPool()
+        self.errors = []
+
+    def run(self, src):
+
+        """Method:  run
+
+        Description:  Pass the stream through the stages.
+
+        Arguments:
+            (input) src -> Source stream (file-like instance)
+            (output) copied -> Number of bytes read from the stream
+
+        """
+
+        queues = [queue.Queue(maxsize=PIPE_BUFFERS) for _ in self.stages]
+        threads = [
+            threading.Thread(
+                target=self._stage, args=(stage, queues[cnt],
+                                          queues[cnt + 1:cnt + 2]),
+                daemon=True)
+            for cnt, stage in enumerate(self.stages)]
+        copied = 0
+
+        for thr in threads:
+            thr.start()
+
+        try:
+            buf = self.pool.get()
+            count = src.readinto(buf)
+
+            while count and not self.errors:
+                queues[0].put((buf, memoryview(buf)[:count]))
+                copied += count
+                buf = self.pool.get()
+                count = src.readinto(buf)
+
+            self.pool.put(buf)
+
+        finally:
+            queues[0].put(None)
+
+            for thr in threads:
+                thr.join()
+
+        if self.errors:
+            raise self.errors[0]
+
+        return copied
+
+    def _stage(self, stage, q_in, q_out):
+
+        """Method:  _stage
+
+        Description:  Run a stage, passing its output to the next queue or,
+            for the last stage, returning the buffer to the pool.
+
+        Arguments:
+            (input) stage -> Stage instance
+            (input) q_in -> Input queue
+            (input) q_out -> List with the output queue, empty for the last
+                stage
+
+        """
+
+        item = q_in.get()
+
+        while item is not None:
+            buf, data = item
+
+            try:
+                data = stage.write(data) if not self.errors else None
+
+            except Exception as msg:                    # pylint:disable=W0718
+                self.errors.append(msg)
+                data = None
+
+            if q_out and data is not None:
+                q_out[0].put((buf, data))
+
+            else:
+                self.pool.put(buf)
+
+            item = q_in.get()
+
+        try:
+            if not self.errors:
+                stage.close()
+
+        except Exception as msg:                        # pylint:disable=W0718
+            self.errors.append(msg)
+
+        if q_out:
+            q_out[0].put(None)
+
+
+def dump_fname(dmp_file, compress, comp_opts):
+
+    """Function:  dump_fname
+
+    Description:  Return the name of the dump file as written by dump_run,
+        adding the file extension of the compression codec if compressed.
+
+    Arguments:
+        (input) dmp_file -> Dump file and path name
+        (input) compress -> Compression flag
+        (input) comp_opts -> Dictionary of compression options
+        (output) -> Dump file and path name
+
+    """
+
+    if compress:
+        dmp_file = dmp_file + CODECS[comp_opts.get("codec", "gzip")]["ext"]
+
+    return dmp_file
+
+
+def copy_stream(src, dst, splice=False, size=BUF_SIZE):
+
+    """Function:  copy_stream
+
+    Description:  Copy a stream (i.e. the pipe of a dump process) to a file.
+        If splice is requested and os.splice is available (Linux), the data
+        is moved from the pipe to the file in the kernel without passing
+        through Python buffers.  Otherwise, or if the file descriptors do not
+        support splicing, the data is copied with a readinto loop over a
+        single reused buffer.
+
+    Arguments:
+        (input) src -> Source stream (file-like instance)
+        (input) dst -> Destination file (file-like instance)
+        (input) splice -> True|False - Move the data with os.splice, dst
+            must be a plain file (not a compressor)
+        (input) size -> Size of each transfer in bytes
+        (output) copied -> Number of bytes copied
+
+    """
+
+    copied = 0
+
+    if splice and hasattr(os, "splice"):
+        try:
+            src_fd = src.fileno()
+            dst_fd = dst.fileno()
+            count = os.splice(src_fd, dst_fd, size)
+
+            while count:
+                copied += count
+                count = os.splice(src_fd, dst_fd, size)
+
+            return copied
+
+        except OSError:
+            pass
+
+    buf = bytearray(size)
+    view = memoryview(buf)
+    count = src.readinto(buf)
+
+    while count:
+        dst.write(view[:count])
+        copied += count
+        count = src.readinto(buf)
+
+    return copied
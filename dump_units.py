@@ -0,0 +1,646 @@
+# Classification (U)
+
+"""Program:  dump_units.py
+
+    Description:  Library of the functions and classes used by
+        mysql_db_dump.py to plan the units of a dump and to track the dump
+        files of the units:  unit creation, data sizes, table chunks, the
+        partial dump directory and the journal.
+
+    Classes:
+        Journal
+
+    Functions:
+        crt_where
+        crt_units
+        remove_dump
+        part_dir
+        move_dump
+        not_started
+        print_status
+        crt_groups
+        crt_batches
+        fetch_db_size
+        fetch_tbl_size
+        fetch_data_size
+        fetch_tbl_chunks
+        order_db_list
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import os
+import io
+import shutil
+import json
+import threading
+
+# Local
+try:
+    from . import dump_file
+    from . import dump_engine
+    from . import version
+
+except (ValueError, ImportError) as err:
+    import dump_file
+    import dump_engine
+    import version
+
+__version__ = version.__version__
+
+# Global
+# Journal of the completed units of a run and the directory the dump files
+# are written to until the dump of their unit has completed.
+JOURNAL = "Journal.jsonl"
+PART_DIR = ".partial"
+
+
+def crt_where(pkey, bounds):
+
+    """Function:  crt_where
+
+    Description:  Create the where clauses of the primary key ranges of a
+        chunked table.  The first range is open below and the last range is
+        open above so every row of the table is in exactly one range.
+
+    Arguments:
+        (input) pkey -> Name of the primary key column
+        (input) bounds -> List of range boundaries, in ascending order
+        (output) where -> List of where clauses, one for each chunk
+
+    """
+
+    where = []
+    col = dump_engine.quote_id(pkey) if pkey else None
+    bounds = list(bounds)
+
+    if col and bounds:
+        where.append(f"{col} < {bounds[0]}")
+
+        for low, high in zip(bounds, bounds[1:]):
+            where.append(f"{col} >= {low} AND {col} < {high}")
+
+        where.append(f"{col} >= {bounds[-1]}")
+
+    return where
+
+
+def crt_units(db_list, tbl_size=None, tbl_chunks=None):
+
+    """Function:  crt_units
+
+    Description:  Create the units of work to be dumped.  Each database is a
+        single unit unless table sizes are passed, in which case each
+        database is split into a schema unit (table definitions, views,
+        triggers, routines and events) and a data unit for each table.  A
+        chunked table is split into a data unit for each primary key range.
+        The schema units are placed first, followed by the table units
+        largest first.
+
+    Arguments:
+        (input) db_list -> Array of database names
+        (input) tbl_size -> Dictionary of databases and their table sizes
+        (input) tbl_chunks -> Dictionary of databases and their chunked
+            tables (see fetch_tbl_chunks)
+        (output) units -> List of unit dictionaries
+            name -> Name of the unit
+            args -> Arguments added to the dump command line
+            file -> Prefix of the dump file name
+            db -> Name of the database of the unit
+
+    """
+
+    db_list = list(db_list)
+    tbl_chunks = dict(tbl_chunks) if tbl_chunks else {}
+    units = []
+
+    if tbl_size is None:
+        units = [{"name": dbn, "args": [dbn], "file": dbn, "db": dbn}
+                 for dbn in db_list]
+
+    else:
+        tbl_units = []
+
+        for dbn in db_list:
+            units.append(
+                {"name": dbn + ":schema",
+                 "args": ["--no-data", "--routines", "--events", "--triggers",
+                          dbn],
+                 "file": dbn + "_schema", "db": dbn})
+
+            for tbl, size in tbl_size.get(dbn, {}).items():
+                tbl_args = ["--no-create-info", "--skip-triggers"]
+                pkey, bounds = tbl_chunks.get(dbn, {}).get(tbl, (None, []))
+                where = crt_where(pkey, bounds)
+
+                if not where:
+                    tbl_units.append(
+                        (size, {"name": dbn + "." + tbl,
+                                "args": tbl_args + [dbn, tbl],
+                                "file": dbn + "." + tbl, "db": dbn}))
+
+                for cnt, clause in enumerate(where, 1):
+                    tbl_units.append(
+                        (size // len(where),
+                         {"name": f"{dbn}.{tbl}#{cnt:04d}",
+                          "args": tbl_args + ["--where=" + clause, dbn, tbl],
+                          "file": f"{dbn}.{tbl}.{cnt:04d}", "db": dbn}))
+
+        tbl_units.sort(key=lambda item: (-item[0], item[1]["name"]))
+        units.extend([unit for _, unit in tbl_units])
+
+    return units
+
+
+def remove_dump(fname):
+
+    """Function:  remove_dump
+
+    Description:  Remove the dump files or dump directories of a failed
+        dump, so an incomplete dump is not mistaken for a complete dump.
+
+    Arguments:
+        (input) fname -> Dump file or directory name or list of names
+
+    """
+
+    for name in [fname] if isinstance(fname, str) else list(fname or []):
+        if os.path.isdir(name):
+            shutil.rmtree(name, ignore_errors=True)
+
+        elif os.path.isfile(name):
+            os.remove(name)
+
+
+def part_dir(dmp_path):
+
+    """Function:  part_dir
+
+    Description:  Return the partial directory of the run in the dump
+        directory.  Each run (process) writes its dump files to its own
+        partial directory (PART_DIR and the process id), so runs sharing a
+        dump directory do not remove or overwrite the dump files of each
+        other.
+
+    Arguments:
+        (input) dmp_path -> Database dump output directory path
+        (output) -> Partial directory path of the run
+
+    """
+
+    return os.path.join(dmp_path, f"{PART_DIR}_{os.getpid()}", "")
+
+
+def move_dump(fnames, dmp_path):
+
+    """Function:  move_dump
+
+    Description:  Move (rename) the dump files or directories of a completed
+        unit from the partial directory into the dump directory.  No dump
+        file is moved if one of them is missing (i.e. removed from the
+        partial directory during the dump).
+
+    Arguments:
+        (input) fnames -> List of the dump file names in the partial directory
+        (input) dmp_path -> Database dump output directory path
+        (output) moved -> Dictionary of the partial and moved dump file names
+        (output) missing -> List of the missing dump file names
+
+    """
+
+    moved = {}
+    missing = [name for name in fnames if not os.path.exists(name)]
+
+    if not missing:
+        for name in fnames:
+            moved[name] = os.path.join(dmp_path, os.path.basename(name))
+            os.replace(name, moved[name])
+
+    return moved, missing
+
+
+class Journal():
+
+    """Class:  Journal
+
+    Description:  Append-only journal of the units completed by a run.  A
+        line is written to the journal file in the dump directory as each
+        unit dump completes, with the dump files of the unit, their sizes
+        and checksums (if computed), and flushed to disk, so a resumed run
+        can skip the units already completed.  With a flavor id (-y option),
+        the journal file name includes the flavor id so the runs of each
+        flavor sharing a dump directory keep their own journal.
+
+    Methods:
+        __init__
+        load
+        record
+        close
+
+    """
+
+    def __init__(self, dmp_path, run, resume=False, flavor=None):
+
+        """Method:  __init__
+
+        Description:  Initialization of an instance of the Journal class.
+            The journal file is truncated unless the run is resumed, in
+            which case the completed units are loaded first.
+
+        Arguments:
+            (input) dmp_path -> Database dump output directory path
+            (input) run -> Run name (date and time of the run)
+            (input) resume -> True|False - Resume the run of the journal
+            (input) flavor -> Flavor id of the program lock (-y option)
+
+        """
+
+        name, ext = os.path.splitext(JOURNAL)
+        self.dmp_path = dmp_path
+        self.fname = os.path.join(
+            dmp_path, f"{name}_{flavor}{ext}" if flavor else JOURNAL)
+        self.run = run
+        self.lock = threading.Lock()
+        self.done = self.load() if resume else {}
+        self.f_hdlr = io.open(                          # pylint:disable=R1732
+            self.fname, mode="a" if resume else "w", encoding="UTF-8")
+
+    def load(self):
+
+        """Method:  load
+
+        Description:  Load the completed units from the journal file.  A unit
+            is only completed if each of its dump files is still in the dump
+            directory with the size recorded in the journal.  A truncated
+            last line (run killed while writing) is ignored.
+
+        Arguments:
+            (output) done -> Dictionary of database or unit names and their
+                journal entries
+
+        """
+
+        done = {}
+
+        if not os.path.isfile(self.fname):
+            return done
+
+        with io.open(self.fname, mode="r", encoding="UTF-8") as f_hdlr:
+            for line in f_hdlr:
+                try:
+                    entry = json.loads(line)
+
+                except ValueError:
+                    continue
+
+                paths = {os.path.join(self.dmp_path, fname): size
+                         for fname, size in entry["files"].items()}
+
+                if all(os.path.exists(path)
+                       and dump_file.path_size(path) == size
+                       for path, size in paths.items()):
+                    done.update({name: entry for name in entry["names"]})
+
+        return done
+
+    def record(self, unit, fnames, hash_opts=None):
+
+        """Method:  record
+
+        Description:  Record a completed unit and flush the journal file to
+            disk.
+
+        Arguments:
+            (input) unit -> Unit dictionary (see crt_units)
+            (input) fnames -> List of the dump file names of the unit
+            (input) hash_opts -> Dictionary of checksum options, the
+                checksums of the dump files are recorded (see open_dump)
+
+        """
+
+        digests = (hash_opts or {}).get("digests", {})
+        entry = {
+            "unit": unit["name"], "names": unit.get("split", [unit["name"]]),
+            "run": self.run,
+            "files": {os.path.basename(fname): dump_file.path_size(fname)
+                      for fname in fnames},
+            "checksums": {
+                os.path.basename(fname):
+                digests.get(os.path.basename(fname), {}).get("file")
+                for fname in fnames if os.path.basename(fname) in digests}}
+
+        with self.lock:
+            self.f_hdlr.write(json.dumps(entry) + "\n")
+            self.f_hdlr.flush()
+            os.fsync(self.f_hdlr.fileno())
+
+    def close(self):
+
+        """Method:  close
+
+        Description:  Close the journal file.
+
+        Arguments:
+
+        """
+
+        self.f_hdlr.close()
+
+
+def not_started(metrics):
+
+    """Function:  not_started
+
+    Description:  Return the names of the units which were never started
+        because the run was stopped (see term_handler).
+
+    Arguments:
+        (input) metrics -> Dictionary of unit names and dump metrics (see
+            dump_unit)
+        (output) -> List of the unit names not started
+
+    """
+
+    return [name for name, item in metrics.items()
+            if item.get("stopped") and not item.get("attempts")]
+
+
+def print_status(units, results, metrics=None):
+
+    """Function:  print_status
+
+    Description:  Print the dump status of each unit.
+
+    Arguments:
+        (input) units -> List of unit dictionaries (see crt_units)
+        (input) results -> Dictionary of unit names and dump status
+        (input) metrics -> Dictionary of unit names and dump metrics, the
+            units not started (see not_started) are reported as such
+
+    """
+
+    skipped = not_started(metrics or {})
+    print("Database dump status:")
+
+    for unit in units:
+        status = "Success" if results.get(unit["name"])                    \
+            else "Not started" if unit["name"] in skipped else "Failed"
+        print(f"    {unit['name']}:  {status}")
+
+
+def crt_groups(db_list, db_size, count):
+
+    """Function:  crt_groups
+
+    Description:  Split the databases into groups of about the same total
+        size (largest database to the smallest group first) and create a
+        unit for each group.  Each group is dumped by a single dump process.
+
+    Arguments:
+        (input) db_list -> Array of database names
+        (input) db_size -> Dictionary of database names and sizes in bytes
+        (input) count -> Maximum number of groups
+        (output) -> List of unit dictionaries (see crt_units), each group
+            unit is split into a dump file for each database
+
+    """
+
+    groups = [[0, []] for _ in range(min(count, len(db_list)))]
+
+    for dbn in order_db_list(db_list, db_size):
+        group = min(groups, key=lambda item: item[0])
+        group[0] += db_size.get(dbn, 0)
+        group[1].append(dbn)
+
+    return [{"name": f"snapshot_{cnt:02d}",
+             "args": ["--single-transaction", "--databases"] + group[1],
+             "file": f"Snapshot_{cnt:02d}", "split": group[1]}
+            for cnt, group in enumerate(groups, 1)]
+
+
+def crt_batches(db_list, db_size, batch_size):
+
+    """Function:  crt_batches
+
+    Description:  Batch the small databases into units dumped by a single
+        dump process (--databases), each batch holding databases with a total
+        size of up to the batch size.  A database of the batch size or larger
+        is a unit of its own.  The database order is kept.
+
+    Arguments:
+        (input) db_list -> Array of database names
+        (input) db_size -> Dictionary of database names and sizes in bytes
+        (input) batch_size -> Maximum total size of a batch in bytes
+        (output) units -> List of unit dictionaries (see crt_units)
+
+    """
+
+    units = []
+    batches = [[]]
+    total = 0
+
+    for dbn in db_list:
+        size = db_size.get(dbn, 0)
+
+        if size >= batch_size:
+            units.append({"name": dbn, "args": [dbn], "file": dbn, "db": dbn})
+            continue
+
+        if batches[-1] and total + size > batch_size:
+            batches.append([])
+            total = 0
+
+        batches[-1].append(dbn)
+        total += size
+
+    for cnt, batch in enumerate([item for item in batches if item], 1):
+        if len(batch) == 1:
+            units.append({"name": batch[0], "args": batch, "file": batch[0],
+                          "db": batch[0]})
+
+        else:
+            units.append({"name": f"batch_{cnt:04d}",
+                          "args": ["--databases"] + batch,
+                          "file": f"Batch_{cnt:04d}", "split": batch})
+
+    return units
+
+
+def fetch_db_size(server):
+
+    """Function:  fetch_db_size
+
+    Description:  Get the size of each database (data and index lengths) from
+        the information_schema tables.
+
+    Arguments:
+        (input) server -> Database server instance
+        (output) -> Dictionary of database names and sizes in bytes
+
+    """
+
+    cmd = "select table_schema as 'Database',"                 \
+          " sum(data_length + index_length) as 'Size'"        \
+          " from information_schema.tables group by table_schema"
+
+    return {item["Database"]: int(item["Size"] or 0)
+            for item in server.col_sql(cmd)}
+
+
+def fetch_tbl_size(server, db_list):
+
+    """Function:  fetch_tbl_size
+
+    Description:  Get the size of each base table (data and index lengths)
+        in the databases from the information_schema tables.
+
+    Arguments:
+        (input) server -> Database server instance
+        (input) db_list -> Array of database names
+        (output) tbl_size -> Dictionary of databases and their table sizes
+            {database: {table: size in bytes}}
+
+    """
+
+    tbl_size = {dbn: {} for dbn in db_list}
+    cmd = "select table_schema as 'Database', table_name as 'Table',"     \
+          " data_length + index_length as 'Size'"                        \
+          " from information_schema.tables where table_type = 'BASE TABLE'"
+
+    for item in server.col_sql(cmd):
+        if item["Database"] in tbl_size:
+            tbl_size[item["Database"]][item["Table"]] = int(item["Size"] or 0)
+
+    return tbl_size
+
+
+def fetch_data_size(server, db_list):
+
+    """Function:  fetch_data_size
+
+    Description:  Get the estimated dump sizes of the databases, their base
+        tables and all databases (All_Databases) from the data lengths in
+        the information_schema tables.  The index lengths are left out as
+        the indexes are not dumped.  A database with a table of unknown
+        data length has no estimated size.
+
+    Arguments:
+        (input) server -> Database server instance
+        (input) db_list -> Array of database names
+        (output) -> Dictionary of unit names and estimated sizes in bytes
+
+    """
+
+    sizes = {}
+    unknown = set()
+    cmd = "select table_schema as 'Database', table_name as 'Table',"     \
+          " data_length as 'Size'"                                         \
+          " from information_schema.tables where table_type = 'BASE TABLE'"
+
+    for item in server.col_sql(cmd):
+        dbn = item["Database"]
+        names = ["All_Databases"] + (
+            [dbn, dbn + "." + item["Table"]] if dbn in db_list else [])
+
+        if item["Size"] is None:
+            unknown.update(names)
+            continue
+
+        for name in names:
+            sizes[name] = sizes.get(name, 0) + int(item["Size"])
+
+    return {name: size for name, size in sizes.items()
+            if size and name not in unknown}
+
+
+def fetch_tbl_chunks(server, tbl_size, chunk_size):     # pylint:disable=R0914
+
+    """Function:  fetch_tbl_chunks
+
+    Description:  Get the primary key ranges of the tables larger than the
+        chunk size.  Only tables with a single integer primary key column are
+        chunked.  The ranges are derived from the table size and the primary
+        key minimum and maximum values, which are read from the primary key
+        index without scanning the table.
+
+    Arguments:
+        (input) server -> Database server instance
+        (input) tbl_size -> Dictionary of databases and their table sizes
+        (input) chunk_size -> Target size of a chunk in bytes
+        (output) tbl_chunks -> Dictionary of databases and chunked tables
+            {database: {table: (primary key column, [range boundaries])}}
+
+    """
+
+    int_types = ["tinyint", "smallint", "mediumint", "int", "bigint"]
+    pk_cols = {}
+    tbl_chunks = {}
+    cmd = "select table_schema as 'Database', table_name as 'Table',"     \
+          " column_name as 'Column', data_type as 'Type'"                 \
+          " from information_schema.columns where column_key = 'PRI'"
+
+    for item in server.col_sql(cmd):
+        pk_cols.setdefault(
+            (item["Database"], item["Table"]), []).append(item)
+
+    for dbn, tbls in tbl_size.items():
+        for tbl, size in tbls.items():
+            cols = pk_cols.get((dbn, tbl), [])
+
+            if size <= chunk_size or len(cols) != 1                      \
+               or cols[0]["Type"].lower() not in int_types:
+                continue
+
+            pkey = cols[0]["Column"]
+            data = server.col_sql(
+                f"select min({dump_engine.quote_id(pkey)}) as 'Min',"
+                f" max({dump_engine.quote_id(pkey)}) as 'Max'"
+                f" from {dump_engine.quote_id(dbn)}."
+                f"{dump_engine.quote_id(tbl)}")
+
+            if not data or data[0]["Min"] is None:
+                continue
+
+            low, high = int(data[0]["Min"]), int(data[0]["Max"])
+            chunks = min(-(-size // chunk_size), high - low + 1)
+            step = -(-(high - low + 1) // chunks)
+            bounds = list(range(low + step, high + 1, step))
+
+            if bounds:
+                tbl_chunks.setdefault(dbn, {})[tbl] = (pkey, bounds)
+
+    return tbl_chunks
+
+
+def order_db_list(db_list, db_size, interleave=False):
+
+    """Function:  order_db_list
+
+    Description:  Order the database list by database size, largest first
+        (longest processing time first).  If interleave is set, the smallest
+        remaining database is placed after each large database.
+
+    Arguments:
+        (input) db_list -> Array of database names
+        (input) db_size -> Dictionary of database names and sizes in bytes
+        (input) interleave -> True|False - Interleave small databases
+        (output) dump_list -> Ordered array of database names
+
+    """
+
+    db_list = sorted(db_list, key=lambda dbn: (-db_size.get(dbn, 0), dbn))
+    dump_list = []
+
+    if interleave:
+        while db_list:
+            dump_list.append(db_list.pop(0))
+
+            if db_list:
+                dump_list.append(db_list.pop())
+
+    else:
+        dump_list = db_list
+
+    return dump_list
@@ -0,0 +1,644 @@
+# Classification (U)
+
+"""Program:  dump_watch.py
+
+    Description:  Library of the classes used by mysql_db_dump.py to watch
+        the running dumps:  the watchdog, the progress file and the load
+        controller.
+
+    Classes:
+        UnitWatch
+        Watchdog
+        Progress
+        LoadController
+
+    Functions:
+        proc_bytes
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import os
+import datetime
+import io
+import time
+import json
+import threading
+
+# Local
+try:
+    from . import version
+
+except (ValueError, ImportError) as err:
+    import version
+
+__version__ = version.__version__
+
+# Global
+PROGRESS = "Progress.json"
+# Seconds between the checks of the watchdog and the number of times a unit
+# killed by the watchdog is requeued.
+WATCH_INTERVAL = 5
+WATCH_REQUEUES = 1
+# Seconds between the polls of the database server load and the thresholds
+# of a loaded server:  threads running (excluding the dumps) and row lock
+# waits per second.  Any wait of the buffer pool for a free page is over the
+# threshold.
+LOAD_INTERVAL = 10
+LOAD_THREADS = 16
+LOAD_LOCK_WAITS = 1.0
+
+
+def proc_bytes(pid):
+
+    """Function:  proc_bytes
+
+    Description:  Return the number of bytes written by a process so far
+        (wchar of /proc/pid/io).
+
+    Arguments:
+        (input) pid -> Process id
+        (output) -> Number of bytes written or None if not available
+
+    """
+
+    try:
+        with io.open(f"/proc/{pid}/io", mode="r", encoding="UTF-8") as f_hdlr:
+            for line in f_hdlr:
+                if line.startswith("wchar:"):
+                    return int(line.split()[1])
+
+    except (OSError, ValueError):
+        pass
+
+    return None
+
+
+class UnitWatch():
+
+    """Class:  UnitWatch
+
+    Description:  Dump processes of a unit watched by the watchdog.  Used as
+        the list the dump processes are added to once started (see
+        dump_run), each process is also added to the list of the dump
+        processes of the run.
+
+    Methods:
+        __init__
+        append
+        progress
+
+    """
+
+    def __init__(self, name, procs=None):
+
+        """Method:  __init__
+
+        Description:  Initialization of an instance of the UnitWatch class.
+
+        Arguments:
+            (input) name -> Name of the unit
+            (input) procs -> List of the dump processes of the run
+
+        """
+
+        self.name = name
+        self.run_procs = procs if procs is not None else []
+        self.procs = []
+        self.start = time.time()
+        self.last = self.start
+        self.bytes = 0
+        self.reason = None
+
+    def append(self, proc):
+
+        """Method:  append
+
+        Description:  Add a dump process of the unit.
+
+        Arguments:
+            (input) proc -> Dump process (subprocess.Popen instance)
+
+        """
+
+        self.procs.append(proc)
+        self.run_procs.append(proc)
+
+    def progress(self, now):
+
+        """Method:  progress
+
+        Description:  Update the bytes written by the running dump processes
+            of the unit and the time of the last output.  The output is
+            assumed to progress while no dump process is running or if the
+            bytes written are not available.
+
+        Arguments:
+            (input) now -> Current time (epoch seconds)
+
+        """
+
+        counts = [proc_bytes(proc.pid) for proc in self.procs
+                  if proc.poll() is None]
+
+        if not counts or None in counts:
+            self.last = now
+
+        elif sum(counts) > self.bytes:
+            self.bytes = sum(counts)
+            self.last = now
+
+
+class Watchdog():                                       # pylint:disable=R0902
+
+    """Class:  Watchdog
+
+    Description:  Watches the dump processes of the units being dumped from
+        a thread of its own.  The dump processes of a unit exceeding its wall
+        clock budget (timeout) or producing no output for the stall interval
+        (stall) are killed, so the unit fails and can be requeued (see
+        dump_pool).  The timeouts and stalls are recorded as events.
+
+    Methods:
+        __init__
+        watch
+        unwatch
+        check
+        requeue
+        run
+        close
+
+    """
+
+    def __init__(self, budget=None, stall=None, interval=WATCH_INTERVAL):
+
+        """Method:  __init__
+
+        Description:  Initialization of an instance of the Watchdog class and
+            start of its thread.
+
+        Arguments:
+            (input) budget -> Wall clock budget of a unit in seconds
+            (input) stall -> Seconds without output before a unit stalls
+            (input) interval -> Seconds between the checks
+
+        """
+
+        self.budget = budget
+        self.stall = stall
+        self.interval = interval
+        self.watches = []
+        self.events = []
+        self.requeues = {}
+        self.lock = threading.Lock()
+        self.done = threading.Event()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def watch(self, name, procs=None):
+
+        """Method:  watch
+
+        Description:  Start watching a unit.
+
+        Arguments:
+            (input) name -> Name of the unit
+            (input) procs -> List of the dump processes of the run
+            (output) watch -> UnitWatch instance the dump processes of the
+                unit are added to
+
+        """
+
+        watch = UnitWatch(name, procs)
+
+        with self.lock:
+            self.watches.append(watch)
+
+        return watch
+
+    def unwatch(self, watch):
+
+        """Method:  unwatch
+
+        Description:  Stop watching a unit.
+
+        Arguments:
+            (input) watch -> UnitWatch instance
+            (output) -> Reason the unit was killed (timeout or stall) or None
+
+        """
+
+        with self.lock:
+            self.watches.remove(watch)
+
+        return watch.reason
+
+    def check(self, now=None):
+
+        """Method:  check
+
+        Description:  Check the units being dumped and kill the dump
+            processes of the units which timed out or stalled.
+
+        Arguments:
+            (input) now -> Current time (epoch seconds)
+
+        """
+
+        now = time.time() if now is None else now
+
+        with self.lock:
+            watches = [watch for watch in self.watches if not watch.reason]
+
+        for watch in watches:
+            watch.progress(now)
+
+            if self.budget and now - watch.start > self.budget:
+                watch.reason = "timeout"
+
+            elif self.stall and now - watch.last > self.stall:
+                watch.reason = "stall"
+
+            else:
+                continue
+
+            print(f"WARNING:  Dump of {watch.name} killed by the watchdog"
+                  f" ({watch.reason}).")
+
+            for proc in list(watch.procs):
+                if proc.poll() is None:
+                    proc.kill()
+
+            with self.lock:
+                self.events.append(
+                    {"unit": watch.name, "reason": watch.reason,
+                     "seconds": round(now - watch.start, 3),
+                     "bytes": watch.bytes, "requeued": False})
+
+    def requeue(self, name, metrics):
+
+        """Method:  requeue
+
+        Description:  Return whether a unit killed by the watchdog is to be
+            requeued, each unit is requeued up to WATCH_REQUEUES times.
+
+        Arguments:
+            (input) name -> Name of the unit
+            (input) metrics -> Dump metrics of the last dump of the unit
+            (output) -> True|False - Requeue the unit
+
+        """
+
+        with self.lock:
+            if not metrics.get("watchdog", None)                            \
+               or self.requeues.get(name, 0) >= WATCH_REQUEUES:
+                return False
+
+            self.requeues[name] = self.requeues.get(name, 0) + 1
+            event = [item for item in self.events if item["unit"] == name]
+
+            if event:
+                event[-1]["requeued"] = True
+
+        print(f"WARNING:  Requeued the dump of {name}.")
+
+        return True
+
+    def run(self):
+
+        """Method:  run
+
+        Description:  Check the units every interval until closed.
+
+        Arguments:
+
+        """
+
+        while not self.done.wait(self.interval):
+            self.check()
+
+    def close(self):
+
+        """Method:  close
+
+        Description:  Stop the thread of the watchdog.
+
+        Arguments:
+
+        """
+
+        self.done.set()
+        self.thread.join()
+
+
+class Progress(Watchdog):
+
+    """Class:  Progress
+
+    Description:  Watchdog reporting the progress of the run.  Every report
+        interval, the bytes streamed by the completed units (see dump_run)
+        and by the dump processes of the running units are compared against
+        the information_schema size estimate of the run.  A status line is
+        printed and the progress is saved to the Progress json file in the
+        dump directory:  the running units, throughput (MB/s), percent done
+        and estimated time of arrival (ETA).
+
+    Methods:
+        __init__
+        check
+        crt_report
+        report
+        close
+
+    """
+
+    def __init__(self, dmp_path, total, **kwargs):
+
+        """Method:  __init__
+
+        Description:  Initialization of an instance of the Progress class
+            and start of its thread.
+
+        Arguments:
+            (input) dmp_path -> Database dump output directory path
+            (input) total -> Estimated size of the run in bytes
+            (input) **kwargs:
+                sizes -> Dictionary of unit names and estimated sizes
+                metrics -> Dictionary of unit names and dump metrics of the
+                    run (see dump_unit)
+                report -> Seconds between the progress reports
+                Other arguments are passed to Watchdog
+
+        """
+
+        self.fname = os.path.join(dmp_path, PROGRESS)
+        self.total = total
+        self.sizes = dict(kwargs.pop("sizes", {}))
+        self.metrics = kwargs.pop("metrics", {})
+        self.report_interval = kwargs.pop("report", WATCH_INTERVAL)
+        self.start = time.time()
+        self.reported = self.start
+        kwargs.setdefault("interval",
+                          min(WATCH_INTERVAL, self.report_interval))
+        super().__init__(**kwargs)
+
+    def check(self, now=None):
+
+        """Method:  check
+
+        Description:  Check the units being dumped (see Watchdog.check) and
+            report the progress once the report interval has elapsed.
+
+        Arguments:
+            (input) now -> Current time (epoch seconds)
+
+        """
+
+        now = time.time() if now is None else now
+        super().check(now)
+
+        if now - self.reported >= self.report_interval:
+            self.report(now)
+
+    def crt_report(self, now, finished=False):
+
+        """Method:  crt_report
+
+        Description:  Create the progress report.  The percent done is
+            capped at 99.9 until the run has finished, as the size estimate
+            of information_schema is not exact.
+
+        Arguments:
+            (input) now -> Current time (epoch seconds)
+            (input) finished -> True|False - Run has finished
+            (output) -> Dictionary of the progress of the run
+
+        """
+
+        with self.lock:
+            watches = list(self.watches)
+
+        done = sum(item.get("raw_bytes") or item.get("bytes", 0)
+                   for item in list(self.metrics.values()))
+        streamed = done + sum(watch.bytes for watch in watches)
+        seconds = max(now - self.start, 0)
+        rate = streamed / seconds if seconds else 0.0
+        percent = 100.0 if finished else min(
+            streamed * 100.0 / self.total, 99.9) if self.total else None
+        eta = max(self.total - streamed, 0) / rate                         \
+            if rate and self.total and not finished else 0.0
+
+        return {
+            "Time": datetime.datetime.fromtimestamp(now).isoformat(
+                timespec="seconds"),
+            "Seconds": round(seconds, 3), "Bytes": streamed,
+            "Total_Bytes": self.total,
+            "Percent": None if percent is None else round(percent, 1),
+            "MB_Per_Sec": round(rate / 1048576, 3),
+            "ETA_Seconds": round(eta),
+            "ETA": datetime.datetime.fromtimestamp(now + eta).isoformat(
+                timespec="seconds"),
+            "Units_Done": len(self.metrics), "Finished": finished,
+            "Running": [
+                {"Unit": watch.name, "Bytes": watch.bytes,
+                 "Percent": round(min(
+                     watch.bytes * 100.0 / self.sizes[watch.name], 99.9), 1)
+                 if self.sizes.get(watch.name) else None}
+                for watch in watches]}
+
+    def report(self, now=None, finished=False):
+
+        """Method:  report
+
+        Description:  Print the progress status line and save the progress
+            to the Progress json file.  The file is replaced atomically, so
+            a reader never sees a partial file.
+
+        Arguments:
+            (input) now -> Current time (epoch seconds)
+            (input) finished -> True|False - Run has finished
+
+        """
+
+        now = time.time() if now is None else now
+        self.reported = now
+        progress = self.crt_report(now, finished)
+        running = ", ".join(
+            item["Unit"] if item["Percent"] is None
+            else f"{item['Unit']} {item['Percent']}%"
+            for item in progress["Running"])
+        percent = "" if progress["Percent"] is None                        \
+            else f"{progress['Percent']}% done,"
+        print(f"Progress:  {percent} {progress['Bytes'] / 1048576:.1f} of"
+              f" {progress['Total_Bytes'] / 1048576:.1f} MB,"
+              f" {progress['MB_Per_Sec']} MB/s, ETA {progress['ETA']}"
+              f" ({datetime.timedelta(seconds=progress['ETA_Seconds'])})"
+              f"{'  Running:  ' + running if running else ''}")
+        tmp_file = self.fname + ".tmp"
+
+        with io.open(tmp_file, mode="w", encoding="UTF-8") as f_hdlr:
+            json.dump(progress, f_hdlr, indent=4)
+
+        os.replace(tmp_file, self.fname)
+
+    def close(self):
+
+        """Method:  close
+
+        Description:  Stop the thread of the watchdog and report the final
+            progress.
+
+        Arguments:
+
+        """
+
+        super().close()
+        self.report(finished=True)
+
+
+class LoadController():                                 # pylint:disable=R0902
+
+    """Class:  LoadController
+
+    Description:  Adapts the number of concurrent dumps to the load of the
+        database server.  The global status of the server (Threads_running,
+        Innodb_buffer_pool_wait_free and Innodb_row_lock_waits) is polled
+        through the server connection of the run and the number of workers
+        is halved when the server is loaded or increased by one when it is
+        not, between the minimum and maximum number of workers.  The changes
+        are recorded as events.  Only server side signals are used:  the OS
+        load of the host running the dumps includes the dumps themselves and
+        is not the load of the database server.
+
+    Methods:
+        __init__
+        poll
+        loaded
+        adjust
+
+    """
+
+    def __init__(self, server, min_workers, max_workers,
+                 interval=LOAD_INTERVAL):
+
+        """Method:  __init__
+
+        Description:  Initialization of an instance of the LoadController
+            class.  The dumps start with the minimum number of workers.
+
+        Arguments:
+            (input) server -> Database server instance
+            (input) min_workers -> Minimum number of concurrent dumps
+            (input) max_workers -> Maximum number of concurrent dumps
+            (input) interval -> Seconds between the polls of the server
+
+        """
+
+        self.server = server
+        self.min_workers = min_workers
+        self.max_workers = max(max_workers, min_workers)
+        self.workers = min_workers
+        self.interval = interval
+        self.polled = None
+        self.status = None
+        self.events = []
+
+    def poll(self, now):
+
+        """Method:  poll
+
+        Description:  Get the global status counters of the database server.
+
+        Arguments:
+            (input) now -> Current time (epoch seconds)
+            (output) status -> Dictionary of status names and values
+
+        """
+
+        status = {
+            item["Variable_name"]: int(item["Value"])
+            for item in self.server.col_sql(
+                "show global status where Variable_name in"
+                " ('Threads_running', 'Innodb_buffer_pool_wait_free',"
+                " 'Innodb_row_lock_waits')")}
+        status["Time"] = now
+
+        return status
+
+    def loaded(self, status, running):
+
+        """Method:  loaded
+
+        Description:  Compare the status of the database server against the
+            previous status and the load thresholds.
+
+        Arguments:
+            (input) status -> Dictionary of status names and values
+            (input) running -> Number of dumps running
+            (output) reasons -> List of the thresholds exceeded
+
+        """
+
+        reasons = []
+        seconds = max(status["Time"] - self.status["Time"], 1)
+        # The dump connections and the status query are not server load.
+        threads = status.get("Threads_running", 0) - running - 1
+        lock_waits = (status.get("Innodb_row_lock_waits", 0)
+                      - self.status.get("Innodb_row_lock_waits", 0)) / seconds
+
+        if threads > LOAD_THREADS:
+            reasons.append(f"Threads_running {threads}")
+
+        if status.get("Innodb_buffer_pool_wait_free", 0)                   \
+           > self.status.get("Innodb_buffer_pool_wait_free", 0):
+            reasons.append("Innodb_buffer_pool_wait_free")
+
+        if lock_waits > LOAD_LOCK_WAITS:
+            reasons.append(f"Innodb_row_lock_waits {lock_waits:.1f}/s")
+
+        return reasons
+
+    def adjust(self, running, now=None):
+
+        """Method:  adjust
+
+        Description:  Poll the database server once the poll interval has
+            elapsed and adjust the number of workers to its load.  The first
+            poll only records the status counters.
+
+        Arguments:
+            (input) running -> Number of dumps running
+            (input) now -> Current time (epoch seconds)
+            (output) workers -> Number of concurrent dumps
+
+        """
+
+        now = time.time() if now is None else now
+
+        if self.polled is not None and now - self.polled < self.interval:
+            return self.workers
+
+        self.polled = now
+        status = self.poll(now)
+
+        if self.status is None:
+            self.status = status
+            return self.workers
+
+        reasons = self.loaded(status, running)
+        self.status = status
+        workers = max(self.workers // 2, self.min_workers) if reasons     \
+            else min(self.workers + 1, self.max_workers)
+
+        if workers != self.workers:
+            self.events.append(
+                {"time": datetime.datetime.fromtimestamp(now).isoformat(
+                    timespec="seconds"),
+                 "workers": workers, "reasons": reasons})
+            print(f"Load:  {self.workers} -> {workers} concurrent dumps"
+                  f"{' (' + ', '.join(reasons) + ')' if reasons else ''}")
+            self.workers = workers
+
+        return self.workers
@@ -10,13 +10,22 @@
         mysql_db_dump.py -c file -d path
             {-B db_name [db_name ...] -o /path/name [-s] [-z] [-r] [-w]
                 [-e email {email2 email3 ...} {-t subject_line} [-u]]
-                [-p dir_path] [-l] |
+                [-p dir_path] [-l] [-j N [-a N]] [-m N] [-C codec]
+                [-L level] [-i] [[-T [-K MB]] [-I file] | -S | -G MB]
+                [-E engine] [-P [-O]] [-H algo] [-n N] [-R]
+                [-W secs] [-M secs] [-g secs] [-x dir] |
              -A -o /path/name [-s] [-z] [-r] [-w]
                 [-e email {email2 email3 ...} {-t subject_line} [-u]]
-                [-p dir_path] [-l] |
+                [-p dir_path] [-l] [-j N [-a N]] [-m N] [-C codec]
+                [-L level] [-i] [[-T [-K MB]] [-I file] | -S | -G MB]
+                [-E engine] [-P [-O]] [-H algo] [-n N] [-R]
+                [-W secs] [-M secs] [-g secs] [-x dir] |
              -D -o /path/name [-s] [-z] [-r] [-w]
                 [-e email {email2 email3 ...} {-t subject_line} [-u]]
-                [-p dir_path] [-l]}
+                [-p dir_path] [-l] [-m N] [-C codec] [-L level] [-P [-O]]
+                [-H algo] [-n N] [-R] [-W secs] [-M secs] [-g secs]
+                [-x dir] |
+             -b -o /path/name [-p dir_path] [-l]}
             [-y flavor_id]
             [-v | -h]
 
@@ -25,10 +34,48 @@
         -d dir path => Directory path to config file (-c). Required arg.
 
         -B databases [db_name ...] => Database names, space delimited.
-            -o dir path => Directory path to dump directory.
+            -o dir path => Directory path to dump directory.  A Manifest json
+                file is saved to the dump directory for each run, recording
+                the start and end times, wall time, raw and compressed bytes,
+                throughput (MB/s), exit code and CPU and memory usage of each
+                database dump and the binary log and GTID position.
             -s => Run dump as a single transaction.
             -r => Remove GTID entries from dump file.
-            -z => Compress database dump files.
+            -z => Compress database dump files.  The dump output is
+                compressed as it is written to the dump file.
+                -m N => Number of threads used to compress each dump file.
+                    For gzip, the dump output is compressed in blocks in
+                    parallel and written as a multi-member gzip file.  For
+                    zstd, the zstd library threads are used.  Default is 1.
+                -C codec => Compression codec:  gzip, zstd, lz4 or xz.  The
+                    dump file extension follows the codec (.gz, .zst, .lz4
+                    or .xz).  Default is gzip.
+                -L level => Compression level for the codec.  Valid levels:
+                    gzip 1-9, zstd 1-22, lz4 0-16 and xz 0-9.  Default is the
+                    codec's default level.
+            -P => Page cache friendly writes.  The dump files are written in
+                large aligned chunks and the written ranges are dropped from
+                the page cache, so the dump does not evict the pages cached
+                for the database server.  Uncompressed dump files are
+                preallocated with the estimated database or table size
+                (data length), capped at the free space divided by -j.
+                -O => Write the dump files with O_DIRECT, bypassing the page
+                    cache.  Falls back to -P if the file system does not
+                    support O_DIRECT.
+            -H algo => Compute the checksums of the dump output as it is
+                written:  sha256, blake2b or xxh3.  The checksums of the raw
+                (uncompressed) dump output and of the dump file are added to
+                the Manifest json file of the run.
+            -n N => Number of times to retry a database dump that failed
+                with a transient error (lost connection, server gone away,
+                lock wait timeout, deadlock or too many connections).  The
+                partial dump file of a failed attempt is removed and the
+                retries are backed off exponentially.  Default is 0.
+            -R => Resume the last run in the dump directory (see Run options).
+            -W secs => Stall interval of the watchdog (see Run options).
+            -M secs => Wall clock budget of each dump (see Run options).
+            -g secs => Report the progress of the run (see Run options).
+            -x dir => Prometheus textfile collector (see Run options).
             -p dir_path => Directory path to mysql programs.  Only required
                 if the mysql binary programs do not run properly.  (i.e. not
                 in the $PATH variable.)
@@ -39,12 +86,113 @@
                 -t subject_line => Subject line of email.
                 -u => Override the default mail command and use mailx.
             -l => Use SSL connection.
+            -j N => Number of databases to dump concurrently.  Each database
+                is dumped by its own mysqldump process into its own dump file.
+                The status of each database dump is displayed at the end.
+                Default is 1.
+            -a N => Adaptive concurrency (see Run options).
+            -i => Interleave the small databases between the large databases.
+                By default, the databases are dumped largest first.
+            -T => Dump each table to its own dump file.  Each database is
+                dumped to a schema dump file (database_schema) containing the
+                table definitions, views, triggers, routines and events and to
+                a data dump file for each table (database.table).  The table
+                dumps are run concurrently with the -j option, largest first.
+                To restore, load the schema dump file before the table dump
+                files.
+                -K MB => Split the tables larger than MB megabytes into
+                    primary key ranges of about MB megabytes each.  Each range
+                    is dumped to its own numbered dump file
+                    (database.table.0001) and the ranges are dumped
+                    concurrently with the -j option.  Only tables with a
+                    single integer primary key column are split.
+            -S => Dump the databases from a single consistent snapshot.  The
+                databases are split into -j groups of about the same size and
+                each group is dumped by its own mysqldump process, split into
+                a dump file for each database.  A global read lock is held only
+                until every mysqldump process has started its consistent
+                snapshot transaction.  The binary log and GTID coordinates of
+                the snapshot are saved to a Snapshot json file.  Requires the
+                PROCESS privilege and the performance_schema to be enabled.
+            -I file => Incremental dump, skip the unchanged databases.  A
+                fingerprint of each database (table statistics and update
+                times and routine, trigger, event and view alter times) is
+                kept in the state file along with the name of its last dump
+                file.  The last dump file of a database whose fingerprint has
+                not changed is hard linked into the dump directory under a
+                new time stamped name instead of dumping the database again.
+                The databases are dumped again when the dump options (-s, -r,
+                -z, -C, -L and -E) change.  The tables without an update time
+                (i.e. InnoDB tables after a server restart) are checksummed
+                if smaller than 64 MB, else they are unchanged only if the
+                GTID (or binary log) position of the server is unchanged.
+                With the -T option, each schema and table (and table range
+                with the -K option) is fingerprinted and skipped on its own.
+                A Manifest json file in the dump directory records the dump
+                file of each database, schema or table and the run it was
+                dumped in.
+            -G MB => Batch the databases smaller than MB megabytes into a
+                single mysqldump process (--databases) for each batch of up
+                to MB megabytes, splitting the dump output into a dump file
+                for each database.  Saves the start up and connection time of
+                a mysqldump process for each database.  The batched database
+                dump files contain the CREATE DATABASE and USE statements.
+            -E engine => Dump engine:  mysqldump, mysqlpump, mysqlsh or
+                native.  Default is mysqldump.  Each database is dumped by
+                the engine, concurrently with the -j option.
+                mysqlpump => Dumps each database with mysqlpump.
+                mysqlsh => Dumps each database with the MySQL Shell
+                    util.dumpSchemas utility into a dump directory, using the
+                    -z codec (gzip or zstd) and -m threads.
+                native => Dumps each database as mysqldump compatible SQL
+                    (table structures, data, triggers and views) over a pool
+                    of persistent database connections (one for each -j
+                    worker) in a consistent snapshot transaction, instead of
+                    starting a dump process for each database.  Routines and
+                    events are not dumped by the native engine.  Binary
+                    columns are dumped as hexadecimal literals (as with
+                    mysqldump --hex-blob).
 
         -A => Dump all databases to individual files.
-            -o dir path => Directory path to dump directory.
+            -o dir path => Directory path to dump directory.  A Manifest json
+                file is saved to the dump directory for each run (see -B).
             -s => Run dump as a single transaction.
             -r => Remove GTID entries from dump file.
-            -z => Compress database dump files.
+            -z => Compress database dump files.  The dump output is
+                compressed as it is written to the dump file.
+                -m N => Number of threads used to compress each dump file.
+                    For gzip, the dump output is compressed in blocks in
+                    parallel and written as a multi-member gzip file.  For
+                    zstd, the zstd library threads are used.  Default is 1.
+                -C codec => Compression codec:  gzip, zstd, lz4 or xz.  The
+                    dump file extension follows the codec (.gz, .zst, .lz4
+                    or .xz).  Default is gzip.
+                -L level => Compression level for the codec.  Valid levels:
+                    gzip 1-9, zstd 1-22, lz4 0-16 and xz 0-9.  Default is the
+                    codec's default level.
+            -P => Page cache friendly writes.  The dump files are written in
+                large aligned chunks and the written ranges are dropped from
+                the page cache, so the dump does not evict the pages cached
+                for the database server.  Uncompressed dump files are
+                preallocated with the estimated database or table size
+                (data length), capped at the free space divided by -j.
+                -O => Write the dump files with O_DIRECT, bypassing the page
+                    cache.  Falls back to -P if the file system does not
+                    support O_DIRECT.
+            -H algo => Compute the checksums of the dump output as it is
+                written:  sha256, blake2b or xxh3.  The checksums of the raw
+                (uncompressed) dump output and of the dump file are added to
+                the Manifest json file of the run.
+            -n N => Number of times to retry a database dump that failed
+                with a transient error (lost connection, server gone away,
+                lock wait timeout, deadlock or too many connections).  The
+                partial dump file of a failed attempt is removed and the
+                retries are backed off exponentially.  Default is 0.
+            -R => Resume the last run in the dump directory (see Run options).
+            -W secs => Stall interval of the watchdog (see Run options).
+            -M secs => Wall clock budget of each dump (see Run options).
+            -g secs => Report the progress of the run (see Run options).
+            -x dir => Prometheus textfile collector (see Run options).
             -p dir_path => Directory path to mysql programs.  Only required
                 if the mysql binary programs do not run properly.  (i.e. not
                 in the $PATH variable.)
@@ -55,12 +203,113 @@
                 -t subject_line => Subject line of email.
                 -u => Override the default mail command and use mailx.
             -l => Use SSL connection.
+            -j N => Number of databases to dump concurrently.  Each database
+                is dumped by its own mysqldump process into its own dump file.
+                The status of each database dump is displayed at the end.
+                Default is 1.
+            -a N => Adaptive concurrency (see Run options).
+            -i => Interleave the small databases between the large databases.
+                By default, the databases are dumped largest first.
+            -T => Dump each table to its own dump file.  Each database is
+                dumped to a schema dump file (database_schema) containing the
+                table definitions, views, triggers, routines and events and to
+                a data dump file for each table (database.table).  The table
+                dumps are run concurrently with the -j option, largest first.
+                To restore, load the schema dump file before the table dump
+                files.
+                -K MB => Split the tables larger than MB megabytes into
+                    primary key ranges of about MB megabytes each.  Each range
+                    is dumped to its own numbered dump file
+                    (database.table.0001) and the ranges are dumped
+                    concurrently with the -j option.  Only tables with a
+                    single integer primary key column are split.
+            -S => Dump the databases from a single consistent snapshot.  The
+                databases are split into -j groups of about the same size and
+                each group is dumped by its own mysqldump process, split into
+                a dump file for each database.  A global read lock is held only
+                until every mysqldump process has started its consistent
+                snapshot transaction.  The binary log and GTID coordinates of
+                the snapshot are saved to a Snapshot json file.  Requires the
+                PROCESS privilege and the performance_schema to be enabled.
+            -I file => Incremental dump, skip the unchanged databases.  A
+                fingerprint of each database (table statistics and update
+                times and routine, trigger, event and view alter times) is
+                kept in the state file along with the name of its last dump
+                file.  The last dump file of a database whose fingerprint has
+                not changed is hard linked into the dump directory under a
+                new time stamped name instead of dumping the database again.
+                The databases are dumped again when the dump options (-s, -r,
+                -z, -C, -L and -E) change.  The tables without an update time
+                (i.e. InnoDB tables after a server restart) are checksummed
+                if smaller than 64 MB, else they are unchanged only if the
+                GTID (or binary log) position of the server is unchanged.
+                With the -T option, each schema and table (and table range
+                with the -K option) is fingerprinted and skipped on its own.
+                A Manifest json file in the dump directory records the dump
+                file of each database, schema or table and the run it was
+                dumped in.
+            -G MB => Batch the databases smaller than MB megabytes into a
+                single mysqldump process (--databases) for each batch of up
+                to MB megabytes, splitting the dump output into a dump file
+                for each database.  Saves the start up and connection time of
+                a mysqldump process for each database.  The batched database
+                dump files contain the CREATE DATABASE and USE statements.
+            -E engine => Dump engine:  mysqldump, mysqlpump, mysqlsh or
+                native.  Default is mysqldump.  Each database is dumped by
+                the engine, concurrently with the -j option.
+                mysqlpump => Dumps each database with mysqlpump.
+                mysqlsh => Dumps each database with the MySQL Shell
+                    util.dumpSchemas utility into a dump directory, using the
+                    -z codec (gzip or zstd) and -m threads.
+                native => Dumps each database as mysqldump compatible SQL
+                    (table structures, data, triggers and views) over a pool
+                    of persistent database connections (one for each -j
+                    worker) in a consistent snapshot transaction, instead of
+                    starting a dump process for each database.  Routines and
+                    events are not dumped by the native engine.  Binary
+                    columns are dumped as hexadecimal literals (as with
+                    mysqldump --hex-blob).
 
         -D => Dump all databases to a single dump file.
-            -o dir path => Directory path to dump directory.
+            -o dir path => Directory path to dump directory.  A Manifest json
+                file is saved to the dump directory for each run (see -B).
             -s => Run dump as a single transaction.
             -r => Remove GTID entries from dump file.
-            -z => Compress database dump files.
+            -z => Compress database dump files.  The dump output is
+                compressed as it is written to the dump file.
+                -m N => Number of threads used to compress each dump file.
+                    For gzip, the dump output is compressed in blocks in
+                    parallel and written as a multi-member gzip file.  For
+                    zstd, the zstd library threads are used.  Default is 1.
+                -C codec => Compression codec:  gzip, zstd, lz4 or xz.  The
+                    dump file extension follows the codec (.gz, .zst, .lz4
+                    or .xz).  Default is gzip.
+                -L level => Compression level for the codec.  Valid levels:
+                    gzip 1-9, zstd 1-22, lz4 0-16 and xz 0-9.  Default is the
+                    codec's default level.
+            -P => Page cache friendly writes.  The dump files are written in
+                large aligned chunks and the written ranges are dropped from
+                the page cache, so the dump does not evict the pages cached
+                for the database server.  Uncompressed dump files are
+                preallocated with the estimated database or table size
+                (data length), capped at the free space divided by -j.
+                -O => Write the dump files with O_DIRECT, bypassing the page
+                    cache.  Falls back to -P if the file system does not
+                    support O_DIRECT.
+            -H algo => Compute the checksums of the dump output as it is
+                written:  sha256, blake2b or xxh3.  The checksums of the raw
+                (uncompressed) dump output and of the dump file are added to
+                the Manifest json file of the run.
+            -n N => Number of times to retry a database dump that failed
+                with a transient error (lost connection, server gone away,
+                lock wait timeout, deadlock or too many connections).  The
+                partial dump file of a failed attempt is removed and the
+                retries are backed off exponentially.  Default is 0.
+            -R => Resume the last run in the dump directory (see Run options).
+            -W secs => Stall interval of the watchdog (see Run options).
+            -M secs => Wall clock budget of each dump (see Run options).
+            -g secs => Report the progress of the run (see Run options).
+            -x dir => Prometheus textfile collector (see Run options).
             -p dir_path => Directory path to mysql programs.  Only required
                 if the mysql binary programs do not run properly.  (i.e. not
                 in the $PATH variable.)
@@ -72,12 +321,100 @@
                 -u => Override the default mail command and use mailx.
             -l => Use SSL connection.
 
+        Run options => Options of the -A, -B and -D dumps.
+            -R => Resume the last run in the dump directory.  Each completed
+                database, table or table range dump is recorded in the
+                Journal.jsonl file (Journal_flavor_id.jsonl with the -y
+                option) of the dump directory, with the size of its dump
+                files and their checksums (-H option).  The dumps completed
+                by the last run, whose dump files are still in the dump
+                directory, are skipped.  The dump files are written to the
+                .partial_pid directory of the run and moved into the dump
+                directory once completed.  On SIGTERM, the current dumps are
+                finished and no further dumps are started; a second SIGTERM
+                abandons the current dumps.
+            -W secs => Stall interval.  The dump processes of a database or
+                table dump producing no output for secs seconds (i.e. waiting
+                on a metadata lock) are killed by a watchdog and the dump is
+                requeued once, at the end of the queue.
+            -M secs => Wall clock budget of each database or table dump.  The
+                dump processes of a dump running for more than secs seconds
+                are killed by the watchdog and the dump is requeued once.
+                The timeouts, stalls and requeues are displayed at the end of
+                the run and recorded in the Manifest json file.  The
+                watchdog does not apply to the native engine.
+            -g secs => Report the progress of the run every secs seconds.
+                The bytes streamed by the dumps are compared against the
+                information_schema size estimate of the databases (and
+                tables) to print a status line with the percent done,
+                throughput (MB/s), estimated time of arrival (ETA) and the
+                progress of each running dump.  The same progress is saved
+                to the Progress.json file in the dump directory.  The percent
+                done is an estimate, the size of a dump differs from the
+                size of the database.
+            -a N => Adaptive concurrency.  The dumps start with N concurrent
+                dumps, growing by one up to the -j number while the database
+                server is idle and halving down to N when it is loaded.  The
+                server is loaded when Threads_running (excluding the dumps)
+                exceeds 16, the buffer pool waited for a free page or there
+                were more than 1 row lock waits per second since the last
+                poll (every 10 seconds).  Only the database server status
+                is used, the OS load of the host running the program (which
+                includes its own dumps) is not.
+            -x dir => Prometheus node_exporter textfile collector directory.
+                The metrics of the run (last success timestamp, duration,
+                throughput, failures, retries and the raw bytes, dump file
+                bytes and queue wait time of each database) are written
+                atomically to the mysql_db_dump_<server>.prom file in dir.
+
+        -b => Binary log incremental dump.  Streams the binary logs from the
+            server into the dump directory using mysqlbinlog
+            --read-from-remote-server --raw, from the binary log position
+            recorded by the last full dump (-A, -B or -D option) in the same
+            dump directory, or from the last binary log streamed, up to the
+            current binary log.  The binary logs and the position of the full
+            dump are recorded in the Binlog_Manifest.json file.  To recover,
+            restore the full dump and apply the binary logs from the recorded
+            position with mysqlbinlog.  The full dump position is taken
+            before the dump starts and recorded once the full dump has
+            completed without failed dumps, a failed full dump keeps the
+            previous full dump and its binary logs.  On a server without
+            GTIDs use the coordinates saved by the -S option as the start
+            position.
+            -o dir path => Directory path to dump directory.
+            -p dir_path => Directory path to mysql programs.  Only required
+                if the mysql binary programs do not run properly.  (i.e. not
+                in the $PATH variable.)
+            -l => Use SSL connection.
+
         -y value => A flavor id for the program lock.  To create unique lock.
         -v => Display version of this program.
         -h => Help and usage message.
 
         NOTE 1:  -v or -h overrides the other options.
-        NOTE 2:  -A, -B, and -D are XOR arguments.
+        NOTE 2:  -A, -B, -D and -b are XOR arguments.
+        NOTE 3:  -j, -i, -T, -S, -I, -G and -E options are only available with
+            the -A or -B options.  -S is XOR with the -T, -I, -G, -n and -R
+            options, -G is XOR with the -T and -I options and -R and -g are
+            XOR with the -I option.  The -a option requires the -j option,
+            can not be greater than -j and is XOR with the -S option.  The
+            -T, -S and -G options require the mysqldump engine and the -I
+            and -H options are not available with the mysqlsh engine.  The
+            -S dumps killed by the watchdog (-W and -M options) are not
+            requeued.
+        NOTE 4:  -m, -C and -L options require the -z option and the -O
+            option requires the -P option.
+        NOTE 5:  The zstd and lz4 codecs require the zstandard and lz4 Python
+            modules and the xxh3 checksum requires the xxhash Python module
+            to be installed.
+
+    Exit status:
+        0 => All dumps completed.
+        1 => Invalid arguments, program lock in place, connection or setup
+            error, no dumps were run.
+        2 => One or more dumps failed or were not started (the run was
+            stopped by SIGTERM).  The failed and not started databases are
+            displayed and recorded in the Manifest json file of the run.
 
     Notes:
         Database configuration file format (config/mysql_cfg.py.TEMPLATE):
@@ -144,23 +481,23 @@
 
 # Standard
 import sys
-import subprocess
 import datetime
-import io
 
 # Local
 try:
     from .lib import gen_libs
     from .lib import gen_class
     from .mysql_lib import mysql_libs
-    from .mysql_lib import mysql_class
+    from . import dump_units
+    from . import dump_cli
     from . import version
 
 except (ValueError, ImportError) as err:
     import lib.gen_libs as gen_libs                     # pylint:disable=R0402
     import lib.gen_class as gen_class                   # pylint:disable=R0402
     import mysql_lib.mysql_libs as mysql_libs           # pylint:disable=R0402
-    import mysql_lib.mysql_class as mysql_class         # pylint:disable=R0402
+    import dump_units
+    import dump_cli
     import version
 
 __version__ = version.__version__
@@ -210,95 +547,14 @@ def crt_dump_cmd(server, args, opt_arg_list, opt_dump_list):
     return gen_libs.is_add_cmd(args, dump_args, opt_dump_list)
 
 
-def dump_run(dump_cmd, dmp_file, compress, **kwargs):
-
-    """Function:  dump_run
-
-    Description:  Run the database dump command, save to file, and compress.
-
-    Arguments:
-        (input) dump_cmd -> Database dump command line
-        (input) compress -> Compression flag
-        (input) dmp_file -> Dump file and path name
-        (input) **kwargs:
-            errfile -> File handler for error file
-
-    """
-
-    dump_cmd = list(dump_cmd)
-    e_file = kwargs.get("errfile", None)
-
-    with io.open(dmp_file, "wb") as f_name:
-        proc1 = subprocess.Popen(                       # pylint:disable=R1732
-            dump_cmd, stdout=f_name, stderr=e_file)
-        proc1.wait()
-
-    if compress:
-        gen_libs.compress(dmp_file)
-
-
-def dump_db(dump_cmd, db_list, compress, dmp_path, **kwargs):
-
-    """Function:  dump_db
-
-    Description:  Runs the database dump command against one or more databases
-        in the database list.  Will create a dump file for each database.
-
-    Arguments:
-        (input) dump_cmd -> Database dump command line
-        (input) db_list -> Array of database names
-        (input) compress -> Compression flag
-        (input) dmp_path -> Database dump output directory path
-        (input) **kwargs:
-            err_sup -> Suppression of standard error to standard out
-            mail -> Email class instance
-            use_mailx -> True|False - Override postfix and use mailx
-
-    """
-
-    dump_cmd = list(dump_cmd)
-    db_list = list(db_list)
-    errfile = None
-
-    if kwargs.get("err_sup", False):
-        efile = gen_libs.crt_file_time("ErrOut", dmp_path, ".log")
-        errfile = open(                                 # pylint:disable=R1732
-            efile, mode="a", encoding="UTF-8")
-
-    if db_list:
-        for item in db_list:
-            dump_cmd = gen_libs.add_cmd(dump_cmd, arg=item)
-            dmp_file = gen_libs.crt_file_time(item, dmp_path, ".sql")
-            dump_run(dump_cmd, dmp_file, compress, errfile=errfile)
-
-            # Remove database name from command.
-            dump_cmd.pop(len(dump_cmd) - 1)
-
-    elif "--all-databases" in dump_cmd:
-        dmp_file = gen_libs.crt_file_time("All_Databases", dmp_path, ".sql")
-        dump_run(dump_cmd, dmp_file, compress, errfile=errfile)
-
-    else:
-        print("WARNING:  No databases to dump or missing -D option.")
-
-    if errfile:
-        errfile.close()
-        mail = kwargs.get("mail", None)
-
-        if mail and not gen_libs.is_empty_file(efile):
-
-            for line in gen_libs.file_2_list(efile):
-                mail.add_2_msg(line)
-
-            mail.send_mail(use_mailx=kwargs.get("use_mailx", False))
-
-
 def set_db_list(server, args):
 
     """Function:  set_db_list
 
     Description:  Get the database list and check if all databases or a single
-        database is being selected.
+        database is being selected.  The database list is ordered by
+        database size, largest first, or with the small databases
+        interleaved between the large databases if the -i option is passed.
 
     Arguments:
         (input) server -> Database server instance
@@ -325,73 +581,12 @@ def set_db_list(server, args):
     elif args.arg_exist("-A"):
         dump_list = list(db_list)
 
-    return dump_list
-
-
-def add_ssl(cfg, dump_cmd):
-
-    """Function:  add_ssl
-
-    Description:  Add SSL options to the dump command line.
-
-    Arguments:
-        (input) cfg -> Configuration file module instance
-        (input) dump_cmd -> Database dump command line
-        (output) dump_cmd -> Database dump command line
-        (output) status -> Status of SSL options
-        (output) err_msg -> Error message for SSL options
-
-    """
-
-    ssl_arg = {
-        "ssl_client_ca": "--ssl-ca=", "ssl_ca_path": "--ssl-capath=",
-        "ssl_client_key": "--ssl-key=", "ssl_client_cert": "--ssl-cert=",
-        "ssl_mode": "--ssl-mode="}
-
-    dump_cmd = list(dump_cmd)
-    status = True
-    err_msg = None
-
-    if hasattr(cfg, "ssl_client_ca") and hasattr(cfg, "ssl_client_key") \
-       and hasattr(cfg, "ssl_client_cert"):
-
-        if getattr(cfg, "ssl_client_ca") or (getattr(cfg, "ssl_client_key") and
-                                             getattr(cfg, "ssl_client_cert")):
-
-            data = [ssl_arg[opt] + getattr(cfg, opt)
-                    for opt in list(ssl_arg.keys()) if getattr(cfg, opt)]
-            dump_cmd.extend(data)
-
-        else:
-            status = False
-            err_msg = "One or more values missing for required SSL settings."
+    if dump_list:
+        dump_list = dump_units.order_db_list(
+            dump_list, dump_units.fetch_db_size(server),
+            interleave=args.arg_exist("-i"))
 
-    else:
-        status = False
-        err_msg = "Configuration file is missing SSL entries."
-
-    return dump_cmd, status, err_msg
-
-
-def add_tls(cfg, dump_cmd):
-
-    """Function:  add_tls
-
-    Description:  Add TLS option to the dump command line, if available.
-
-    Arguments:
-        (input) cfg -> Configuration file module instance
-        (input) dump_cmd -> Database dump command line
-        (output) dump_cmd -> Database dump command line
-
-    """
-
-    dump_cmd = list(dump_cmd)
-
-    if hasattr(cfg, "tls_versions") and getattr(cfg, "tls_versions"):
-        dump_cmd.append("--tls-version=" + str(getattr(cfg, "tls_versions")))
-
-    return dump_cmd
+    return dump_list
 
 
 def run_program(                                        # pylint:disable=R0914
@@ -400,32 +595,39 @@ def run_program(                                        # pylint:disable=R0914
     """Function:  run_program
 
     Description:  Creates class instance(s) and controls flow of the program.
+        The database connection is closed once the dumps have ended, even on
+        an error.
 
     Arguments:
         (input) args -> ArgParser class instance
         (input) opt_arg_list -> List of commands to add to cmd line
         (input) opt_dump_list -> Dictionary of additional options
+        (output) exit_code -> 0 if successful, EXIT_ERROR on a connection or
+            setup error or EXIT_FAILED if any dump failed
 
     """
 
     status = True
+    exit_code = dump_cli.EXIT_ERROR
     err_msg = None
     opt_dump_list = dict(opt_dump_list)
     opt_arg_list = list(opt_arg_list)
     mail = None
-    server = mysql_libs.create_instance(
-        args.get_val("-c"), args.get_val("-d"), mysql_class.Server)
-    server.connect(silent=True)
+    server = dump_cli.crt_server(args)
 
     if server.conn_msg:
         print(
             f"run_program:  Error encountered on server {server.name}:"
             f" {server.conn_msg}")
 
-    else:
+        return exit_code
+
+    try:
         server.set_srv_gtid()
-        dump_cmd = crt_dump_cmd(
-            server, args, opt_arg_list, opt_dump_list)
+        dump_cmd = mysql_libs.crt_cmd(
+            server, args.arg_set_path("-p", cmd="mysqlbinlog"))           \
+            if args.arg_exist("-b") else crt_dump_cmd(
+                server, args, opt_arg_list, opt_dump_list)
         db_list = set_db_list(server, args, **kwargs)
 
         # Remove the -r option if database is not GTID enabled.
@@ -433,7 +635,6 @@ def run_program(                                        # pylint:disable=R0914
            and opt_dump_list["-r"] in dump_cmd:
             dump_cmd.remove(opt_dump_list["-r"])
 
-        compress = args.get_val("-z", def_val=False)
         dmp_path = None
 
         if args.arg_exist("-o"):
@@ -450,18 +651,23 @@ def run_program(                                        # pylint:disable=R0914
 
         if args.arg_exist("-l"):
             cfg = gen_libs.load_module(args.get_val("-c"), args.get_val("-d"))
-            dump_cmd, status, err_msg = add_ssl(cfg, dump_cmd)
-            dump_cmd = add_tls(cfg, dump_cmd)
+            dump_cmd, status, err_msg = dump_cli.add_ssl(cfg, dump_cmd)
+            dump_cmd = dump_cli.add_tls(cfg, dump_cmd)
 
         if status:
-            dump_db(dump_cmd, db_list, compress, dmp_path, err_sup=err_sup,
-                    mail=mail, use_mailx=args.get_val("-u", def_val=False))
+            exit_code = dump_cli.run_dump(
+                server, args, dump_cmd, db_list, dmp_path,
+                dump_cli.crt_dump_opts(server, args, db_list, dump_cmd,
+                                       err_sup=err_sup, mail=mail))
 
         else:
             print(f"run_program:  Error encountered with SSL setup: {err_msg}")
 
+    finally:
         mysql_libs.disconnect(server)
 
+    return exit_code
+
 
 def main():
 
@@ -479,52 +685,86 @@ def main():
         opt_arg_list -> contains arguments to add to command line by default
         opt_con_req_dict -> contains options requiring other options
         opt_dump_list -> contains optional arguments to mysqldump
+        opt_int -> contains options which require positive integer values
         opt_req_list -> contains the options that are required for the program
         opt_val -> contains options which require values
         opt_xor_dict -> contains options which are XOR with its values
 
     Arguments:
         (input) argv -> Arguments from the command line
+        (output) exit_code -> Exit code of the program (see run_program),
+            EXIT_ERROR if the arguments are invalid or the program lock is
+            in place
 
     """
 
-    dir_perms_chk = {"-d": 5, "-p": 5}
+    exit_code = dump_cli.EXIT_ERROR
+    dir_perms_chk = {"-d": 5, "-p": 5, "-x": 7}
     dir_perms_crt = {"-o": 7}
     multi_val = ["-B", "-e", "-t"]
     # --ignore-table=mysql.event -> Skips dumping the event table.
     opt_arg_list = ["--ignore-table=mysql.event"]
     opt_con_req_dict = {
-        "-t": ["-e"], "-A": ["-o"], "-B": ["-o"], "-D": ["-o"], "-u": ["-e"]}
+        "-t": ["-e"], "-A": ["-o"], "-B": ["-o"], "-D": ["-o"], "-u": ["-e"],
+        "-b": ["-o"],
+        "-j": ["-A", "-B"], "-i": ["-A", "-B"], "-T": ["-A", "-B"],
+        "-K": ["-T"], "-S": ["-A", "-B"], "-I": ["-A", "-B"],
+        "-G": ["-A", "-B"], "-E": ["-A", "-B"], "-m": ["-z"], "-C": ["-z"],
+        "-L": ["-z"], "-P": ["-A", "-B", "-D"], "-O": ["-P"],
+        "-H": ["-A", "-B", "-D"],
+        "-n": ["-A", "-B", "-D"], "-R": ["-A", "-B", "-D"],
+        "-W": ["-A", "-B", "-D"], "-M": ["-A", "-B", "-D"],
+        "-g": ["-A", "-B", "-D"], "-x": ["-A", "-B", "-D"],
+        "-a": ["-j"]}
     opt_dump_list = {
         "-s": "--single-transaction",
         "-D": ["--all-databases", "--triggers", "--routines", "--events"],
         "-r": "--set-gtid-purged=OFF"}
+    opt_int = ["-j", "-m", "-K", "-G", "-n", "-W", "-M", "-g", "-a"]
     opt_req_list = ["-c", "-d"]
-    opt_val = ["-B", "-c", "-d", "-o", "-p", "-y", "-e", "-t"]
-    opt_xor_dict = {"-A": ["-B", "-D"], "-B": ["-A", "-D"], "-D": ["-A", "-B"]}
+    opt_val = ["-B", "-c", "-d", "-o", "-p", "-y", "-e", "-t", "-j",
+               "-m", "-C", "-L", "-K", "-I", "-G", "-E", "-H",
+               "-n", "-W", "-M", "-g", "-x", "-a"]
+    opt_xor_dict = {"-A": ["-B", "-D", "-b"], "-B": ["-A", "-D", "-b"],
+                    "-D": ["-A", "-B", "-b"], "-b": ["-A", "-B", "-D"],
+                    "-S": ["-T", "-I", "-G", "-n", "-R", "-a"],
+                    "-T": ["-S", "-G"],
+                    "-I": ["-S", "-G", "-R", "-g"], "-G": ["-S", "-T", "-I"],
+                    "-n": ["-S"], "-R": ["-S", "-I"], "-g": ["-I"],
+                    "-a": ["-S"]}
 
     # Process argument list from command line.
     args = gen_class.ArgParser(
         sys.argv, opt_val=opt_val, multi_val=multi_val)
 
-    if args.arg_parse2()                                                    \
-       and not gen_libs.help_func(args, __version__, help_message)          \
-       and args.arg_require(opt_req=opt_req_list)                           \
+    status = args.arg_parse2()
+
+    if status and gen_libs.help_func(args, __version__, help_message):
+        exit_code = 0
+
+    elif status and args.arg_require(opt_req=opt_req_list)                 \
        and args.arg_xor_dict(opt_xor_val=opt_xor_dict)                      \
        and args.arg_dir_chk(dir_perms_chk=dir_perms_chk)                    \
        and args.arg_dir_crt(dir_chk=dir_perms_crt, dir_crt=dir_perms_crt)   \
-       and args.arg_cond_req_or(opt_con_or=opt_con_req_dict):
+       and args.arg_cond_req_or(opt_con_or=opt_con_req_dict)               \
+       and dump_cli.chk_int_opts(args, opt_int)                             \
+       and dump_cli.chk_codec(args)                                         \
+       and dump_cli.chk_engine(args)                                        \
+       and dump_cli.chk_hash(args)                                          \
+       and dump_cli.chk_load(args):
 
         try:
             prog_lock = gen_class.ProgramLock(
                 sys.argv, args.get_val("-y", def_val=""))
-            run_program(args, opt_arg_list, opt_dump_list)
+            exit_code = run_program(args, opt_arg_list, opt_dump_list)
             del prog_lock
 
         except gen_class.SingleInstanceException:
             print(f'WARNING:  Lock in place for mysql_db_dump with id:'
                   f' {args.get_val("-y", def_val="")}')
 
+    return exit_code
+
 
 if __name__ == "__main__":
     sys.exit(main())
@@ -2,10 +2,10 @@
 
 """Program:  add_ssl.py
 
-    Description:  Unit testing of add_ssl in mysql_db_dump.py.
+    Description:  Unit testing of add_ssl in dump_cli.py.
 
     Usage:
-        test/unit/mysql_db_dump/add_ssl.py
+        test/unit/dump_cli/add_ssl.py
 
     Arguments:
 
@@ -20,7 +20,7 @@ import unittest
 
 # Local
 sys.path.append(os.getcwd())
-import mysql_db_dump                            # pylint:disable=E0401,C0413
+import dump_cli                                 # pylint:disable=E0401,C0413
 import version                                  # pylint:disable=E0401,C0413
 
 __version__ = version.__version__
@@ -166,7 +166,7 @@ class UnitTest(unittest.TestCase):
         self.cfg.ssl_client_key = self.key
         self.cfg.ssl_client_cert = self.cert
         self.cfg.ssl_ca_path = self.ca_path
-        dump_cmd = mysql_db_dump.add_ssl(self.cfg, self.dump_cmd)
+        dump_cmd = dump_cli.add_ssl(self.cfg, self.dump_cmd)
 
         self.assertEqual((dump_cmd[1], dump_cmd[2]), (True, None))
 
@@ -184,7 +184,7 @@ class UnitTest(unittest.TestCase):
         self.cfg.ssl_client_key = self.key
         self.cfg.ssl_client_cert = self.cert
         self.cfg.ssl_ca_path = self.ca_path
-        dump_cmd = mysql_db_dump.add_ssl(self.cfg, self.dump_cmd)
+        dump_cmd = dump_cli.add_ssl(self.cfg, self.dump_cmd)
 
         self.assertEqual(dump_cmd[0].sort(), self.results4.sort())
 
@@ -201,7 +201,7 @@ class UnitTest(unittest.TestCase):
         self.cfg.ssl_client_ca = self.ca_pem
         self.cfg.ssl_client_key = self.key
         self.cfg.ssl_client_cert = self.cert
-        dump_cmd = mysql_db_dump.add_ssl(self.cfg, self.dump_cmd)
+        dump_cmd = dump_cli.add_ssl(self.cfg, self.dump_cmd)
 
         self.assertEqual((dump_cmd[1], dump_cmd[2]), (True, None))
 
@@ -218,7 +218,7 @@ class UnitTest(unittest.TestCase):
         self.cfg.ssl_client_ca = self.ca_pem
         self.cfg.ssl_client_key = self.key
         self.cfg.ssl_client_cert = self.cert
-        dump_cmd = mysql_db_dump.add_ssl(self.cfg, self.dump_cmd)
+        dump_cmd = dump_cli.add_ssl(self.cfg, self.dump_cmd)
 
         self.assertEqual(dump_cmd[0].sort(), self.results3.sort())
 
@@ -233,7 +233,7 @@ class UnitTest(unittest.TestCase):
         """
 
         self.cfg.ssl_client_cert = self.cert
-        dump_cmd = mysql_db_dump.add_ssl(self.cfg, self.dump_cmd)
+        dump_cmd = dump_cli.add_ssl(self.cfg, self.dump_cmd)
 
         self.assertEqual((dump_cmd[1], dump_cmd[2]), (False, self.err_msg1))
 
@@ -248,7 +248,7 @@ class UnitTest(unittest.TestCase):
         """
 
         self.cfg.ssl_client_cert = self.cert
-        dump_cmd = mysql_db_dump.add_ssl(self.cfg, self.dump_cmd)
+        dump_cmd = dump_cli.add_ssl(self.cfg, self.dump_cmd)
 
         self.assertEqual(dump_cmd[0], self.dump_cmd)
 
@@ -263,7 +263,7 @@ class UnitTest(unittest.TestCase):
         """
 
         self.cfg.ssl_client_key = self.key
-        dump_cmd = mysql_db_dump.add_ssl(self.cfg, self.dump_cmd)
+        dump_cmd = dump_cli.add_ssl(self.cfg, self.dump_cmd)
 
         self.assertEqual((dump_cmd[1], dump_cmd[2]), (False, self.err_msg1))
 
@@ -278,7 +278,7 @@ class UnitTest(unittest.TestCase):
         """
 
         self.cfg.ssl_client_key = self.key
-        dump_cmd = mysql_db_dump.add_ssl(self.cfg, self.dump_cmd)
+        dump_cmd = dump_cli.add_ssl(self.cfg, self.dump_cmd)
 
         self.assertEqual(dump_cmd[0], self.dump_cmd)
 
@@ -294,7 +294,7 @@ class UnitTest(unittest.TestCase):
 
         self.cfg.ssl_client_key = self.key
         self.cfg.ssl_client_cert = self.cert
-        dump_cmd = mysql_db_dump.add_ssl(self.cfg, self.dump_cmd)
+        dump_cmd = dump_cli.add_ssl(self.cfg, self.dump_cmd)
 
         self.assertEqual((dump_cmd[1], dump_cmd[2]), (True, None))
 
@@ -310,7 +310,7 @@ class UnitTest(unittest.TestCase):
 
         self.cfg.ssl_client_key = self.key
         self.cfg.ssl_client_cert = self.cert
-        dump_cmd = mysql_db_dump.add_ssl(self.cfg, self.dump_cmd)
+        dump_cmd = dump_cli.add_ssl(self.cfg, self.dump_cmd)
 
         self.assertEqual(dump_cmd[0].sort(), self.results2.sort())
 
@@ -325,7 +325,7 @@ class UnitTest(unittest.TestCase):
         """
 
         self.cfg.ssl_client_ca = self.ca_pem
-        dump_cmd = mysql_db_dump.add_ssl(self.cfg, self.dump_cmd)
+        dump_cmd = dump_cli.add_ssl(self.cfg, self.dump_cmd)
 
         self.assertEqual((dump_cmd[1], dump_cmd[2]), (True, None))
 
@@ -340,7 +340,7 @@ class UnitTest(unittest.TestCase):
         """
 
         self.cfg.ssl_client_ca = self.ca_pem
-        dump_cmd = mysql_db_dump.add_ssl(self.cfg, self.dump_cmd)
+        dump_cmd = dump_cli.add_ssl(self.cfg, self.dump_cmd)
 
         self.assertEqual(dump_cmd[0], self.results)
 
@@ -354,7 +354,7 @@ class UnitTest(unittest.TestCase):
 
         """
 
-        dump_cmd = mysql_db_dump.add_ssl(self.cfg2, self.dump_cmd)
+        dump_cmd = dump_cli.add_ssl(self.cfg2, self.dump_cmd)
 
         self.assertEqual((dump_cmd[1], dump_cmd[2]), (False, self.err_msg2))
 
@@ -368,7 +368,7 @@ class UnitTest(unittest.TestCase):
 
         """
 
-        dump_cmd = mysql_db_dump.add_ssl(self.cfg2, self.dump_cmd)
+        dump_cmd = dump_cli.add_ssl(self.cfg2, self.dump_cmd)
 
         self.assertEqual(dump_cmd[0], self.dump_cmd)
 
@@ -382,7 +382,7 @@ class UnitTest(unittest.TestCase):
 
         """
 
-        dump_cmd = mysql_db_dump.add_ssl(self.cfg, self.dump_cmd)
+        dump_cmd = dump_cli.add_ssl(self.cfg, self.dump_cmd)
 
         self.assertEqual((dump_cmd[1], dump_cmd[2]), (False, self.err_msg1))
 
@@ -396,7 +396,7 @@ class UnitTest(unittest.TestCase):
 
         """
 
-        dump_cmd = mysql_db_dump.add_ssl(self.cfg, self.dump_cmd)
+        dump_cmd = dump_cli.add_ssl(self.cfg, self.dump_cmd)
 
         self.assertEqual(dump_cmd[0], self.dump_cmd)
 
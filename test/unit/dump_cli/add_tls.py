@@ -2,10 +2,10 @@
 
 """Program:  add_tls.py
 
-    Description:  Unit testing of add_tls in mysql_db_dump.py.
+    Description:  Unit testing of add_tls in dump_cli.py.
 
     Usage:
-        test/unit/mysql_db_dump/add_tls.py
+        test/unit/dump_cli/add_tls.py
 
     Arguments:
 
@@ -20,7 +20,7 @@ import unittest
 
 # Local
 sys.path.append(os.getcwd())
-import mysql_db_dump                            # pylint:disable=E0401,C0413
+import dump_cli                                 # pylint:disable=E0401,C0413
 import version                                  # pylint:disable=E0401,C0413
 
 __version__ = version.__version__
@@ -140,7 +140,7 @@ class UnitTest(unittest.TestCase):
 
         """
 
-        dump_cmd = mysql_db_dump.add_tls(self.cfg3, self.dump_cmd)
+        dump_cmd = dump_cli.add_tls(self.cfg3, self.dump_cmd)
 
         self.assertEqual(dump_cmd, self.results2)
 
@@ -154,7 +154,7 @@ class UnitTest(unittest.TestCase):
 
         """
 
-        dump_cmd = mysql_db_dump.add_tls(self.cfg2, self.dump_cmd)
+        dump_cmd = dump_cli.add_tls(self.cfg2, self.dump_cmd)
 
         self.assertEqual(dump_cmd, self.results2)
 
@@ -168,7 +168,7 @@ class UnitTest(unittest.TestCase):
 
         """
 
-        dump_cmd = mysql_db_dump.add_tls(self.cfg, self.dump_cmd)
+        dump_cmd = dump_cli.add_tls(self.cfg, self.dump_cmd)
 
         self.assertEqual(dump_cmd, self.results)
 
@@ -0,0 +1,218 @@
+# Classification (U)
+
+"""Program:  chk_codec.py
+
+    Description:  Unit testing of chk_codec in dump_cli.py.
+
+    Usage:
+        test/unit/dump_cli/chk_codec.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import dump_cli                                 # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {"-c": "mysql_cfg", "-d": "config", "-z": True}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_module_missing
+        test_module_installed
+        test_invalid_codec
+        test_level_not_integer
+        test_level_out_of_range
+        test_level_zero
+        test_level_valid
+        test_default_codec
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+
+    @mock.patch("dump_stream.zstandard", None)
+    def test_module_missing(self):
+
+        """Function:  test_module_missing
+
+        Description:  Test with codec module not installed.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-C"] = "zstd"
+
+        with gen_libs.no_std_out():
+            self.assertFalse(dump_cli.chk_codec(self.args))
+
+    @mock.patch("dump_stream.lz4", mock.Mock())
+    def test_module_installed(self):
+
+        """Function:  test_module_installed
+
+        Description:  Test with codec module installed.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-C"] = "lz4"
+
+        self.assertTrue(dump_cli.chk_codec(self.args))
+
+    def test_invalid_codec(self):
+
+        """Function:  test_invalid_codec
+
+        Description:  Test with codec not supported.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-C"] = "bzip2"
+
+        with gen_libs.no_std_out():
+            self.assertFalse(dump_cli.chk_codec(self.args))
+
+    def test_level_not_integer(self):
+
+        """Function:  test_level_not_integer
+
+        Description:  Test with level not an integer.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-L"] = "fast"
+
+        with gen_libs.no_std_out():
+            self.assertFalse(dump_cli.chk_codec(self.args))
+
+    def test_level_out_of_range(self):
+
+        """Function:  test_level_out_of_range
+
+        Description:  Test with level out of range for the codec.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-L"] = "10"
+
+        with gen_libs.no_std_out():
+            self.assertFalse(dump_cli.chk_codec(self.args))
+
+    def test_level_zero(self):
+
+        """Function:  test_level_zero
+
+        Description:  Test with level zero for xz codec.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-C"] = "xz"
+        self.args.args_array["-L"] = "0"
+
+        self.assertTrue(dump_cli.chk_codec(self.args))
+
+    def test_level_valid(self):
+
+        """Function:  test_level_valid
+
+        Description:  Test with valid level for the codec.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-L"] = "9"
+
+        self.assertTrue(dump_cli.chk_codec(self.args))
+
+    def test_default_codec(self):
+
+        """Function:  test_default_codec
+
+        Description:  Test with no codec passed.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(dump_cli.chk_codec(self.args))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,199 @@
+# Classification (U)
+
+"""Program:  chk_engine.py
+
+    Description:  Unit testing of chk_engine in dump_cli.py.
+
+    Usage:
+        test/unit/dump_cli/chk_engine.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import dump_cli                                 # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_invalid_engine
+        test_native_engine
+        test_table_option
+        test_mysqldump_options
+        test_mysqlsh_incr
+        test_mysqlsh_hash
+        test_default_engine
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+
+    def test_invalid_engine(self):
+
+        """Function:  test_invalid_engine
+
+        Description:  Test with an invalid engine.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-E": "mydumper"}
+
+        with gen_libs.no_std_out():
+            self.assertFalse(dump_cli.chk_engine(self.args))
+
+    def test_native_engine(self):
+
+        """Function:  test_native_engine
+
+        Description:  Test with the native engine.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-E": "native"}
+
+        self.assertTrue(dump_cli.chk_engine(self.args))
+
+    def test_table_option(self):
+
+        """Function:  test_table_option
+
+        Description:  Test an engine not supporting the -T and -G options.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-E": "mysqlpump", "-T": True, "-G": "10"}
+
+        with gen_libs.no_std_out():
+            self.assertFalse(dump_cli.chk_engine(self.args))
+
+    def test_mysqldump_options(self):
+
+        """Function:  test_mysqldump_options
+
+        Description:  Test the mysqldump engine with the -T option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-E": "mysqldump", "-T": True}
+
+        self.assertTrue(dump_cli.chk_engine(self.args))
+
+    def test_mysqlsh_incr(self):
+
+        """Function:  test_mysqlsh_incr
+
+        Description:  Test the mysqlsh engine with the -I option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-E": "mysqlsh", "-I": "state.json"}
+
+        with gen_libs.no_std_out():
+            self.assertFalse(dump_cli.chk_engine(self.args))
+
+    def test_mysqlsh_hash(self):
+
+        """Function:  test_mysqlsh_hash
+
+        Description:  Test the mysqlsh engine with the -H option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-E": "mysqlsh", "-H": "sha256"}
+
+        with gen_libs.no_std_out():
+            self.assertFalse(dump_cli.chk_engine(self.args))
+
+    def test_default_engine(self):
+
+        """Function:  test_default_engine
+
+        Description:  Test with the default engine.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(dump_cli.chk_engine(self.args))
+
+
+if __name__ == "__main__":
+    unittest.main()
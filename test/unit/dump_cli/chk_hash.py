@@ -0,0 +1,170 @@
+# Classification (U)
+
+"""Program:  chk_hash.py
+
+    Description:  Unit testing of chk_hash in dump_cli.py.
+
+    Usage:
+        test/unit/dump_cli/chk_hash.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import dump_cli                                 # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {"-c": "mysql_cfg", "-d": "config"}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_hash
+        test_valid_hash
+        test_invalid_hash
+        test_module_missing
+        test_module_installed
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+
+    def test_no_hash(self):
+
+        """Function:  test_no_hash
+
+        Description:  Test with no checksum algorithm passed.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(dump_cli.chk_hash(self.args))
+
+    def test_valid_hash(self):
+
+        """Function:  test_valid_hash
+
+        Description:  Test with a valid checksum algorithm.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-H"] = "blake2b"
+
+        self.assertTrue(dump_cli.chk_hash(self.args))
+
+    def test_invalid_hash(self):
+
+        """Function:  test_invalid_hash
+
+        Description:  Test with checksum algorithm not supported.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-H"] = "md5"
+
+        with gen_libs.no_std_out():
+            self.assertFalse(dump_cli.chk_hash(self.args))
+
+    @mock.patch("dump_file.xxhash", None)
+    def test_module_missing(self):
+
+        """Function:  test_module_missing
+
+        Description:  Test with checksum module not installed.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-H"] = "xxh3"
+
+        with gen_libs.no_std_out():
+            self.assertFalse(dump_cli.chk_hash(self.args))
+
+    @mock.patch("dump_file.xxhash", mock.Mock())
+    def test_module_installed(self):
+
+        """Function:  test_module_installed
+
+        Description:  Test with checksum module installed.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-H"] = "xxh3"
+
+        self.assertTrue(dump_cli.chk_hash(self.args))
+
+
+if __name__ == "__main__":
+    unittest.main()
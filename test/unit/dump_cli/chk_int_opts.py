@@ -0,0 +1,155 @@
+# Classification (U)
+
+"""Program:  chk_int_opts.py
+
+    Description:  Unit testing of chk_int_opts in dump_cli.py.
+
+    Usage:
+        test/unit/dump_cli/chk_int_opts.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import dump_cli                                 # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {"-c": "mysql_cfg", "-d": "config"}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_zero_value
+        test_not_integer
+        test_valid_value
+        test_no_option
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.opt_int = ["-j"]
+
+    def test_zero_value(self):
+
+        """Function:  test_zero_value
+
+        Description:  Test with option set to zero.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-j"] = "0"
+
+        with gen_libs.no_std_out():
+            self.assertFalse(
+                dump_cli.chk_int_opts(self.args, self.opt_int))
+
+    def test_not_integer(self):
+
+        """Function:  test_not_integer
+
+        Description:  Test with option not set to an integer.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-j"] = "four"
+
+        with gen_libs.no_std_out():
+            self.assertFalse(
+                dump_cli.chk_int_opts(self.args, self.opt_int))
+
+    def test_valid_value(self):
+
+        """Function:  test_valid_value
+
+        Description:  Test with option set to a positive integer.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-j"] = "4"
+
+        self.assertTrue(dump_cli.chk_int_opts(self.args, self.opt_int))
+
+    def test_no_option(self):
+
+        """Function:  test_no_option
+
+        Description:  Test with option not passed.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(dump_cli.chk_int_opts(self.args, self.opt_int))
+
+
+if __name__ == "__main__":
+    unittest.main()
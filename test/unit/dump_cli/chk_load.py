@@ -0,0 +1,169 @@
+# Classification (U)
+
+"""Program:  chk_load.py
+
+    Description:  Unit testing of chk_load in dump_cli.py.
+
+    Usage:
+        test/unit/dump_cli/chk_load.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import dump_cli                                 # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {"-c": "mysql_cfg", "-d": "config"}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_load
+        test_load_below
+        test_load_equal
+        test_load_above
+        test_no_workers
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+
+    def test_no_load(self):
+
+        """Function:  test_no_load
+
+        Description:  Test with no -a option passed.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-j"] = "4"
+
+        self.assertTrue(dump_cli.chk_load(self.args))
+
+    def test_load_below(self):
+
+        """Function:  test_load_below
+
+        Description:  Test with -a less than -j.
+
+        Arguments:
+
+        """
+
+        self.args.args_array.update({"-j": "8", "-a": "2"})
+
+        self.assertTrue(dump_cli.chk_load(self.args))
+
+    def test_load_equal(self):
+
+        """Function:  test_load_equal
+
+        Description:  Test with -a equal to -j.
+
+        Arguments:
+
+        """
+
+        self.args.args_array.update({"-j": "4", "-a": "4"})
+
+        self.assertTrue(dump_cli.chk_load(self.args))
+
+    def test_load_above(self):
+
+        """Function:  test_load_above
+
+        Description:  Test with -a greater than -j.
+
+        Arguments:
+
+        """
+
+        self.args.args_array.update({"-j": "4", "-a": "8"})
+
+        with gen_libs.no_std_out():
+            self.assertFalse(dump_cli.chk_load(self.args))
+
+    def test_no_workers(self):
+
+        """Function:  test_no_workers
+
+        Description:  Test with -a greater than the default -j of one.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-a"] = "2"
+
+        with gen_libs.no_std_out():
+            self.assertFalse(dump_cli.chk_load(self.args))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,29 @@
+#!/bin/bash
+# Unit test code coverage for program module.
+# This will run the Python code coverage module against all unit test modules.
+# This will show the amount of code that was tested and which lines of code
+#   that was skipped during the test.
+
+coverage erase
+
+echo ""
+echo "Running unit test modules in conjunction with coverage"
+coverage run -a --source=dump_cli test/unit/dump_cli/add_ssl.py
+coverage run -a --source=dump_cli test/unit/dump_cli/add_tls.py
+coverage run -a --source=dump_cli test/unit/dump_cli/chk_codec.py
+coverage run -a --source=dump_cli test/unit/dump_cli/chk_engine.py
+coverage run -a --source=dump_cli test/unit/dump_cli/chk_hash.py
+coverage run -a --source=dump_cli test/unit/dump_cli/chk_int_opts.py
+coverage run -a --source=dump_cli test/unit/dump_cli/chk_load.py
+coverage run -a --source=dump_cli test/unit/dump_cli/crt_dump_opts.py
+coverage run -a --source=dump_cli test/unit/dump_cli/crt_engine.py
+coverage run -a --source=dump_cli test/unit/dump_cli/crt_progress.py
+coverage run -a --source=dump_cli test/unit/dump_cli/crt_server.py
+coverage run -a --source=dump_cli test/unit/dump_cli/dump_full.py
+coverage run -a --source=dump_cli test/unit/dump_cli/run_dump.py
+coverage run -a --source=dump_cli test/unit/dump_cli/term_handler.py
+
+echo ""
+echo "Producing code coverage report"
+coverage combine
+coverage report -m
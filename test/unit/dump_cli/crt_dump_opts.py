@@ -0,0 +1,183 @@
+# Classification (U)
+
+"""Program:  crt_dump_opts.py
+
+    Description:  Unit testing of crt_dump_opts in dump_cli.py.
+
+    Usage:
+        test/unit/dump_cli/crt_dump_opts.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import dump_cli                                 # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+
+class ArgParser():
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {"-c": "mysql_cfg", "-d": "config"}
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_defaults
+        test_options
+        test_progress_option
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = "Server"
+        self.args = ArgParser()
+        self.db_list = ["db1", "db2"]
+        self.dump_cmd = ["dump_command"]
+
+    def test_defaults(self):
+
+        """Function:  test_defaults
+
+        Description:  Test the dump options without options.
+
+        Arguments:
+
+        """
+
+        opts = dump_cli.crt_dump_opts(
+            self.server, self.args, self.db_list, self.dump_cmd,
+            err_sup=True)
+
+        self.assertEqual(opts["comp_opts"], {"threads": 1, "codec": "gzip"})
+        self.assertEqual(opts["workers"], 1)
+        self.assertEqual(opts["retries"], 0)
+        self.assertTrue(opts["err_sup"])
+        self.assertFalse(opts["stop"].is_set())
+
+        for key in ["mail", "tbl_size", "tbl_chunks", "engine", "write_opts",
+                    "hash_opts", "watchdog", "load"]:
+            self.assertIsNone(opts[key])
+
+    @mock.patch("dump_units.fetch_data_size",
+                mock.Mock(return_value={"db1": 100}))
+    @mock.patch("dump_watch.LoadController")
+    @mock.patch("dump_watch.Watchdog")
+    def test_options(self, mock_watch, mock_load):
+
+        """Function:  test_options
+
+        Description:  Test the dump options with options.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {
+            "-j": "4", "-L": "3", "-P": True, "-H": "sha256", "-n": "2",
+            "-W": "60", "-a": "8"}
+
+        opts = dump_cli.crt_dump_opts(
+            self.server, self.args, self.db_list, self.dump_cmd)
+
+        self.assertEqual(opts["comp_opts"]["level"], 3)
+        self.assertEqual(opts["write_opts"],
+                         {"direct": False, "sizes": {"db1": 100}})
+        self.assertEqual(opts["hash_opts"], {"algo": "sha256", "digests": {}})
+        self.assertEqual(opts["retries"], 2)
+        mock_watch.assert_called_once_with(budget=None, stall=60)
+        mock_load.assert_called_once_with(self.server, 8, 4)
+
+    @mock.patch("dump_watch.Watchdog")
+    def test_progress_option(self, mock_watch):
+
+        """Function:  test_progress_option
+
+        Description:  Test no watchdog is created with the -g option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-M": "600", "-g": True}
+
+        self.assertIsNone(dump_cli.crt_dump_opts(
+            self.server, self.args, self.db_list,
+            self.dump_cmd)["watchdog"])
+        mock_watch.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
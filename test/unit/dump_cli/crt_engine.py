@@ -0,0 +1,252 @@
+# Classification (U)
+
+"""Program:  crt_engine.py
+
+    Description:  Unit testing of crt_engine in dump_cli.py.
+
+    Usage:
+        test/unit/dump_cli/crt_engine.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import dump_cli                                 # pylint:disable=E0401,C0413
+import dump_engine                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+        arg_exist
+        arg_set_path
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {"-c": "mysql_cfg", "-d": "config"}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+    def arg_set_path(self, arg_opt, **kwargs):
+
+        """Method:  arg_set_path
+
+        Description:  Method stub holder for
+            gen_class.ArgParser.arg_set_path.
+
+        Arguments:
+
+        """
+
+        return os.path.join(self.args_array.get(arg_opt, ""),
+                            kwargs.get("cmd", ""))
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_default
+        test_mysqldump
+        test_mysqlpump
+        test_mysqlsh
+        test_ssl
+        test_native
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.server = "Server"
+        self.dump_cmd = ["mysqldump", "-u", "user", "--single-transaction",
+                         "--set-gtid-purged=OFF", "--ignore-table=db1.t1"]
+        self.cmd = ["-u", "user"]
+
+    def test_default(self):
+
+        """Function:  test_default
+
+        Description:  Test with the default engine.
+
+        Arguments:
+
+        """
+
+        engine = dump_cli.crt_engine(
+            self.server, self.args, self.dump_cmd)
+
+        self.assertIsInstance(engine, dump_engine.MysqldumpEngine)
+        self.assertEqual(engine.dump_cmd, self.dump_cmd)
+
+    def test_mysqldump(self):
+
+        """Function:  test_mysqldump
+
+        Description:  Test with the mysqldump engine.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-E"] = "mysqldump"
+
+        self.assertEqual(dump_cli.crt_engine(
+            self.server, self.args, self.dump_cmd).name, "mysqldump")
+
+    @mock.patch("dump_cli.mysql_libs.crt_cmd")
+    def test_mysqlpump(self, mock_cmd):
+
+        """Function:  test_mysqlpump
+
+        Description:  Test with the mysqlpump engine.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-E"] = "mysqlpump"
+        mock_cmd.side_effect = lambda server, prog: [prog] + self.cmd
+
+        engine = dump_cli.crt_engine(
+            self.server, self.args, self.dump_cmd)
+
+        self.assertIsInstance(engine, dump_engine.PumpEngine)
+        self.assertEqual(engine.dump_cmd, [
+            "mysqlpump", "-u", "user", "--single-transaction",
+            "--set-gtid-purged=OFF"])
+
+    @mock.patch("dump_cli.mysql_libs.crt_cmd")
+    def test_mysqlsh(self, mock_cmd):
+
+        """Function:  test_mysqlsh
+
+        Description:  Test with the mysqlsh engine.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-E"] = "mysqlsh"
+        self.args.args_array["-p"] = "/usr/bin"
+        mock_cmd.side_effect = lambda server, prog: [prog] + self.cmd
+
+        engine = dump_cli.crt_engine(
+            self.server, self.args, self.dump_cmd)
+
+        self.assertIsInstance(engine, dump_engine.ShellEngine)
+        self.assertEqual(engine.shell_cmd, ["/usr/bin/mysqlsh", "-u", "user"])
+
+    @mock.patch("dump_cli.add_tls")
+    @mock.patch("dump_cli.add_ssl")
+    @mock.patch("dump_cli.gen_libs.load_module",
+                mock.Mock(return_value="Cfg"))
+    @mock.patch("dump_cli.mysql_libs.crt_cmd",
+                mock.Mock(return_value=["mysqlsh"]))
+    def test_ssl(self, mock_ssl, mock_tls):
+
+        """Function:  test_ssl
+
+        Description:  Test with the SSL options.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-E"] = "mysqlsh"
+        self.args.args_array["-l"] = True
+        mock_ssl.return_value = (["mysqlsh", "--ssl-ca=ca"], True, None)
+        mock_tls.side_effect = lambda cfg, cmd: cmd + ["--tls-version=1.2"]
+
+        engine = dump_cli.crt_engine(
+            self.server, self.args, self.dump_cmd)
+
+        self.assertEqual(engine.shell_cmd,
+                         ["mysqlsh", "--ssl-ca=ca", "--tls-version=1.2"])
+
+    @mock.patch("dump_cli.crt_server")
+    def test_native(self, mock_server):
+
+        """Function:  test_native
+
+        Description:  Test with the native engine.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-E"] = "native"
+
+        engine = dump_cli.crt_engine(
+            self.server, self.args, self.dump_cmd)
+
+        self.assertIsInstance(engine, dump_engine.NativeEngine)
+        self.assertEqual(engine.connect(), mock_server.return_value)
+        mock_server.assert_called_once_with(self.args)
+
+
+if __name__ == "__main__":
+    unittest.main()
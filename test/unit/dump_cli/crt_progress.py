@@ -0,0 +1,172 @@
+# Classification (U)
+
+"""Program:  crt_progress.py
+
+    Description:  Unit testing of crt_progress in dump_cli.py.
+
+    Usage:
+        test/unit/dump_cli/crt_progress.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import dump_cli                                 # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {"-g": "30", "-W": "300"}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+@mock.patch("dump_watch.Progress")
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_databases
+        test_all_databases
+        test_tables
+        test_resume
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.dmp_path = "./test/unit/dump_cli/tmp/"
+        self.db_size = {"db1": 100, "db2": 200, "db3": 400}
+        self.metrics = {}
+
+    def test_databases(self, mock_prog):
+
+        """Function:  test_databases
+
+        Description:  Test the size estimate of the databases dumped.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            dump_cli.crt_progress(
+                self.args, self.dmp_path, ["db1", "db2"], self.db_size,
+                metrics=self.metrics), mock_prog.return_value)
+        mock_prog.assert_called_once_with(
+            self.dmp_path, 300,
+            sizes={"db1": 100, "db2": 200, "All_Databases": 300},
+            metrics=self.metrics, report=30, budget=None, stall=300)
+
+    def test_all_databases(self, mock_prog):
+
+        """Function:  test_all_databases
+
+        Description:  Test the size estimate of all databases.
+
+        Arguments:
+
+        """
+
+        dump_cli.crt_progress(
+            self.args, self.dmp_path, [], self.db_size)
+
+        self.assertEqual(mock_prog.call_args[0][1], 700)
+
+    def test_tables(self, mock_prog):
+
+        """Function:  test_tables
+
+        Description:  Test the size estimates of the tables.
+
+        Arguments:
+
+        """
+
+        dump_cli.crt_progress(
+            self.args, self.dmp_path, ["db1"], self.db_size,
+            tbl_size={"db1": {"t1": 60, "t2": 40}})
+
+        self.assertEqual(
+            mock_prog.call_args[1]["sizes"],
+            {"db1": 100, "db1.t1": 60, "db1.t2": 40, "All_Databases": 100})
+
+    def test_resume(self, mock_prog):
+
+        """Function:  test_resume
+
+        Description:  Test the databases completed by the resumed run are
+            not in the size estimate.
+
+        Arguments:
+
+        """
+
+        journal = mock.Mock()
+        journal.done = {"db2": {}}
+
+        dump_cli.crt_progress(
+            self.args, self.dmp_path, ["db1", "db2"], self.db_size,
+            journal=journal)
+
+        self.assertEqual(mock_prog.call_args[0][1], 100)
+
+
+if __name__ == "__main__":
+    unittest.main()
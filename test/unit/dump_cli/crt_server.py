@@ -0,0 +1,148 @@
+# Classification (U)
+
+"""Program:  crt_server.py
+
+    Description:  Unit testing of crt_server in dump_cli.py.
+
+    Usage:
+        test/unit/dump_cli/crt_server.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import dump_cli                                 # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {"-c": "mysql_cfg", "-d": "config"}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        connect
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.silent = None
+
+    def connect(self, silent=False):
+
+        """Method:  connect
+
+        Description:  Stub method holder for mysql_class.Server.connect.
+
+        Arguments:
+
+        """
+
+        self.silent = silent
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_crt_server
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.server = Server()
+
+    @mock.patch("dump_cli.mysql_libs.create_instance")
+    def test_crt_server(self, mock_inst):
+
+        """Function:  test_crt_server
+
+        Description:  Test creating and connecting the server instance.
+
+        Arguments:
+
+        """
+
+        mock_inst.return_value = self.server
+
+        self.assertEqual(dump_cli.crt_server(self.args), self.server)
+        self.assertTrue(self.server.silent)
+        self.assertEqual(mock_inst.call_args[0][:2], ("mysql_cfg", "config"))
+
+
+if __name__ == "__main__":
+    unittest.main()
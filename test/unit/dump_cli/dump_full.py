@@ -0,0 +1,183 @@
+# Classification (U)
+
+"""Program:  dump_full.py
+
+    Description:  Unit testing of dump_full in dump_cli.py.
+
+    Usage:
+        test/unit/dump_cli/dump_full.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import dump_cli                                 # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+
+class ArgParser():
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {"-c": "mysql_cfg", "-d": "config"}
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+@mock.patch("dump_report.save_manifest", mock.Mock(return_value=None))
+@mock.patch("dump_state.fetch_binlog_pos",
+            mock.Mock(return_value={"File": "binlog.000003"}))
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_dump_full
+        test_binlog_pos
+        test_dump_error
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.dump_cmd = ["dump_command"]
+        self.db_list = ["db1", "db2"]
+        self.dmp_path = "./test/unit/dump_cli/tmp/"
+        self.dump_opts = {
+            "tbl_size": None, "write_opts": None, "hash_opts": None,
+            "metrics": {}, "watchdog": None, "load": None}
+
+    @mock.patch("dump_state.record_binlog_pos")
+    @mock.patch("dump_units.Journal")
+    @mock.patch("dump_sched.dump_db", mock.Mock(return_value=["db2"]))
+    def test_dump_full(self, mock_journal, mock_record):
+
+        """Function:  test_dump_full
+
+        Description:  Test the failed dumps and manifest are returned.
+
+        Arguments:
+
+        """
+
+        failed, manifest = dump_cli.dump_full(
+            "Server", self.args, self.dump_cmd, self.db_list, self.dmp_path,
+            self.dump_opts)
+
+        self.assertEqual(failed, ["db2"])
+        self.assertEqual(manifest["Failed"], ["db2"])
+        mock_journal.return_value.close.assert_called_once_with()
+        mock_record.assert_not_called()
+
+    @mock.patch("dump_state.record_binlog_pos")
+    @mock.patch("dump_units.Journal", mock.Mock())
+    @mock.patch("dump_sched.dump_db", mock.Mock(return_value=[]))
+    def test_binlog_pos(self, mock_record):
+
+        """Function:  test_binlog_pos
+
+        Description:  Test the binary log position is recorded once the dump
+            has completed.
+
+        Arguments:
+
+        """
+
+        dump_cli.dump_full(
+            "Server", self.args, self.dump_cmd, self.db_list, self.dmp_path,
+            self.dump_opts)
+
+        mock_record.assert_called_once_with(
+            self.dmp_path, {"File": "binlog.000003"})
+
+    @mock.patch("dump_state.record_binlog_pos")
+    @mock.patch("dump_units.Journal")
+    @mock.patch("dump_sched.dump_db",
+                mock.Mock(side_effect=OSError(28, "No space left")))
+    def test_dump_error(self, mock_journal, mock_record):
+
+        """Function:  test_dump_error
+
+        Description:  Test the journal is closed on an error.
+
+        Arguments:
+
+        """
+
+        with self.assertRaises(OSError):
+            dump_cli.dump_full(
+                "Server", self.args, self.dump_cmd, self.db_list,
+                self.dmp_path, self.dump_opts)
+
+        mock_journal.return_value.close.assert_called_once_with()
+        mock_record.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,294 @@
+# Classification (U)
+
+"""Program:  run_dump.py
+
+    Description:  Unit testing of run_dump in dump_cli.py.
+
+    Usage:
+        test/unit/dump_cli/run_dump.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import io
+import signal
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import dump_cli                                 # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+
+class ArgParser():
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {"-c": "mysql_cfg", "-d": "config"}
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "ServerName"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_b_option
+        test_i_option
+        test_i_option_failed
+        test_dump_full
+        test_not_started
+        test_dump_error
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+        self.args = ArgParser()
+        self.dump_cmd = ["dump_command"]
+        self.db_list = ["db1", "db2"]
+        self.dmp_path = "./test/unit/dump_cli/tmp/"
+        self.dump_opts = {
+            "stop": mock.Mock(), "procs": [], "watchdog": mock.Mock(),
+            "engine": mock.Mock()}
+        self.dump_opts["watchdog"].events = []
+        self.dump_opts["engine"].stats.return_value = {}
+
+    @mock.patch("dump_state.dump_binlog", mock.Mock(return_value=False))
+    def test_b_option(self):
+
+        """Function:  test_b_option
+
+        Description:  Test the exit code with a failed binary log dump.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-b"] = True
+
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                dump_cli.run_dump(
+                    self.server, self.args, self.dump_cmd, self.db_list,
+                    self.dmp_path, self.dump_opts),
+                dump_cli.EXIT_FAILED)
+
+    @mock.patch("dump_state.record_binlog_pos")
+    @mock.patch("dump_state.fetch_binlog_pos",
+                mock.Mock(return_value={"File": "binlog.000003"}))
+    @mock.patch("dump_state.dump_incr",
+                mock.Mock(return_value={"Failed": []}))
+    def test_i_option(self, mock_record):
+
+        """Function:  test_i_option
+
+        Description:  Test the binary log position is recorded once the
+            incremental dump has completed.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-I"] = "state_file"
+
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                dump_cli.run_dump(
+                    self.server, self.args, self.dump_cmd, self.db_list,
+                    self.dmp_path, self.dump_opts), 0)
+
+        mock_record.assert_called_once_with(
+            self.dmp_path, {"File": "binlog.000003"})
+
+    @mock.patch("dump_state.record_binlog_pos")
+    @mock.patch("dump_state.fetch_binlog_pos",
+                mock.Mock(return_value={"File": "binlog.000003"}))
+    @mock.patch("dump_state.dump_incr",
+                mock.Mock(return_value={"Failed": ["db1"]}))
+    def test_i_option_failed(self, mock_record):
+
+        """Function:  test_i_option_failed
+
+        Description:  Test the binary log position is not recorded if an
+            incremental dump failed.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-I"] = "state_file"
+
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                dump_cli.run_dump(
+                    self.server, self.args, self.dump_cmd, self.db_list,
+                    self.dmp_path, self.dump_opts),
+                dump_cli.EXIT_FAILED)
+
+        mock_record.assert_not_called()
+
+    @mock.patch("dump_cli.dump_full",
+                mock.Mock(return_value=([], {"Failed": []})))
+    def test_dump_full(self):
+
+        """Function:  test_dump_full
+
+        Description:  Test the exit code and cleanup of a full dump.
+
+        Arguments:
+
+        """
+
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                dump_cli.run_dump(
+                    self.server, self.args, self.dump_cmd, self.db_list,
+                    self.dmp_path, self.dump_opts), 0)
+
+        self.dump_opts["watchdog"].close.assert_called_once_with()
+        self.dump_opts["engine"].close.assert_called_once_with()
+
+    @mock.patch("dump_cli.dump_full")
+    def test_not_started(self, mock_full):
+
+        """Function:  test_not_started
+
+        Description:  Test the dumps not started are reported apart from the
+            failed dumps.
+
+        Arguments:
+
+        """
+
+        self.dump_opts["metrics"] = {
+            "db1": {"status": False, "attempts": 1},
+            "db2": {"status": False, "attempts": 0, "stopped": True}}
+        mock_full.return_value = (["db1", "db2"], {})
+
+        with mock.patch("sys.stdout", new_callable=io.StringIO) as mock_out:
+            self.assertEqual(
+                dump_cli.run_dump(
+                    self.server, self.args, self.dump_cmd, self.db_list,
+                    self.dmp_path, self.dump_opts),
+                dump_cli.EXIT_FAILED)
+
+        self.assertIn("Dump failed for:  db1\n", mock_out.getvalue())
+        self.assertIn("Dump not started for:  db2\n", mock_out.getvalue())
+
+    @mock.patch("dump_cli.dump_full",
+                mock.Mock(side_effect=OSError(28, "No space left")))
+    def test_dump_error(self):
+
+        """Function:  test_dump_error
+
+        Description:  Test the signal handler is restored and the watchdog
+            and dump engine are closed on an error.
+
+        Arguments:
+
+        """
+
+        handler = signal.getsignal(signal.SIGTERM)
+
+        with self.assertRaises(OSError):
+            dump_cli.run_dump(
+                self.server, self.args, self.dump_cmd, self.db_list,
+                self.dmp_path, self.dump_opts)
+
+        self.assertEqual(signal.getsignal(signal.SIGTERM), handler)
+        self.dump_opts["watchdog"].close.assert_called_once_with()
+        self.dump_opts["engine"].close.assert_called_once_with()
+
+
+if __name__ == "__main__":
+    unittest.main()
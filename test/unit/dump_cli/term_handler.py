@@ -0,0 +1,100 @@
+# Classification (U)
+
+"""Program:  term_handler.py
+
+    Description:  Unit testing of term_handler in dump_cli.py.
+
+    Usage:
+        test/unit/dump_cli/term_handler.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import signal
+import threading
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import dump_cli                                 # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_first_signal
+        test_second_signal
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.stop = threading.Event()
+        self.proc = mock.Mock()
+        self.proc.poll.return_value = None
+        self.proc2 = mock.Mock()
+        self.proc2.poll.return_value = 0
+        self.handler = dump_cli.term_handler(
+            self.stop, [self.proc, self.proc2])
+
+    def test_first_signal(self):
+
+        """Function:  test_first_signal
+
+        Description:  Test the first signal stops starting dumps.
+
+        Arguments:
+
+        """
+
+        with gen_libs.no_std_out():
+            self.handler(signal.SIGTERM, None)
+
+        self.assertTrue(self.stop.is_set())
+        self.proc.terminate.assert_not_called()
+
+    def test_second_signal(self):
+
+        """Function:  test_second_signal
+
+        Description:  Test the second signal terminates the running dump
+            processes.
+
+        Arguments:
+
+        """
+
+        with gen_libs.no_std_out():
+            self.handler(signal.SIGTERM, None)
+            self.handler(signal.SIGTERM, None)
+
+        self.proc.terminate.assert_called_once_with()
+        self.proc2.terminate.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,22 @@
+#!/bin/bash
+# Unit testing program for the program module.
+# This will run all the units tests for this program.
+# Will need to run this from the base directory where the module file
+#   is located at.
+
+echo ""
+echo "Unit testing..."
+/usr/bin/python test/unit/dump_cli/add_ssl.py
+/usr/bin/python test/unit/dump_cli/add_tls.py
+/usr/bin/python test/unit/dump_cli/chk_codec.py
+/usr/bin/python test/unit/dump_cli/chk_engine.py
+/usr/bin/python test/unit/dump_cli/chk_hash.py
+/usr/bin/python test/unit/dump_cli/chk_int_opts.py
+/usr/bin/python test/unit/dump_cli/chk_load.py
+/usr/bin/python test/unit/dump_cli/crt_dump_opts.py
+/usr/bin/python test/unit/dump_cli/crt_engine.py
+/usr/bin/python test/unit/dump_cli/crt_progress.py
+/usr/bin/python test/unit/dump_cli/crt_server.py
+/usr/bin/python test/unit/dump_cli/dump_full.py
+/usr/bin/python test/unit/dump_cli/run_dump.py
+/usr/bin/python test/unit/dump_cli/term_handler.py
@@ -0,0 +1,22 @@
+#!/bin/bash
+# Unit test code coverage for program module.
+# This will run the Python code coverage module against all unit test modules.
+# This will show the amount of code that was tested and which lines of code
+#   that was skipped during the test.
+
+coverage erase
+
+echo ""
+echo "Running unit test modules in conjunction with coverage"
+coverage run -a --source=dump_engine test/unit/dump_engine/dumpengine.py
+coverage run -a --source=dump_engine test/unit/dump_engine/mysqldumpengine.py
+coverage run -a --source=dump_engine test/unit/dump_engine/nativeengine.py
+coverage run -a --source=dump_engine test/unit/dump_engine/pumpengine.py
+coverage run -a --source=dump_engine test/unit/dump_engine/quote_id.py
+coverage run -a --source=dump_engine test/unit/dump_engine/quote_val.py
+coverage run -a --source=dump_engine test/unit/dump_engine/shellengine.py
+
+echo ""
+echo "Producing code coverage report"
+coverage combine
+coverage report -m
@@ -0,0 +1,208 @@
+# Classification (U)
+
+"""Program:  dumpengine.py
+
+    Description:  Unit testing of DumpEngine class in dump_engine.py.
+
+    Usage:
+        test/unit/dump_engine/dumpengine.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import dump_engine                              # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Engine(dump_engine.DumpEngine):
+
+    """Class:  Engine
+
+    Description:  Dump engine writing a fixed dump file.
+
+    Methods:
+        dump
+
+    """
+
+    name = "test"
+
+    def dump(self, unit, dmp_file, compress, **kwargs):
+
+        """Method:  dump
+
+        Description:  Write the unit name to the dump file.
+
+        Arguments:
+
+        """
+
+        if unit["name"] == "fail":
+            return False
+
+        with open(dmp_file, "wb") as f_hdlr:
+            f_hdlr.write(unit["name"].encode("UTF-8"))
+
+        return True
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_plan
+        test_run
+        test_run_failed
+        test_fname
+        test_not_implemented
+        test_run_error
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.dmp_file = "./test/unit/dump_engine/tmp/test_engine.sql"
+        self.units = [{"name": "db1", "args": ["db1"], "file": "db1"},
+                      {"name": "fail", "args": ["fail"], "file": "fail"}]
+
+    def test_plan(self):
+
+        """Function:  test_plan
+
+        Description:  Test the units planned by the engine.
+
+        Arguments:
+
+        """
+
+        engine = Engine()
+
+        self.assertEqual(engine.plan(iter(self.units)), self.units)
+
+    def test_run(self):
+
+        """Function:  test_run
+
+        Description:  Test the statistics of a dumped unit.
+
+        Arguments:
+
+        """
+
+        engine = Engine()
+
+        self.assertTrue(engine.run(self.units[0], self.dmp_file, False))
+
+        stats = engine.stats()
+        self.assertEqual(
+            (stats["engine"], stats["units"], stats["failed"],
+             stats["bytes"]), ("test", 1, 0, 3))
+        self.assertGreaterEqual(stats["seconds"], 0)
+
+    def test_run_failed(self):
+
+        """Function:  test_run_failed
+
+        Description:  Test the statistics of a failed unit.
+
+        Arguments:
+
+        """
+
+        engine = Engine()
+
+        self.assertFalse(engine.run(self.units[1], self.dmp_file, False))
+        self.assertEqual(
+            (engine.stats()["units"], engine.stats()["failed"],
+             engine.stats()["bytes"]), (1, 1, 0))
+
+    def test_fname(self):
+
+        """Function:  test_fname
+
+        Description:  Test the dump file name with compression.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            Engine().fname(self.dmp_file, True, {"codec": "zstd"}),
+            self.dmp_file + ".zst")
+
+    def test_not_implemented(self):
+
+        """Function:  test_not_implemented
+
+        Description:  Test the base class does not dump.
+
+        Arguments:
+
+        """
+
+        with self.assertRaises(NotImplementedError):
+            dump_engine.DumpEngine().dump(
+                self.units[0], self.dmp_file, False)
+
+    def test_run_error(self):
+
+        """Function:  test_run_error
+
+        Description:  Test an error raised by the dump fails the unit.
+
+        Arguments:
+
+        """
+
+        engine = dump_engine.DumpEngine()
+        metrics = {}
+
+        with gen_libs.no_std_out():
+            self.assertFalse(engine.run(self.units[0], self.dmp_file, False,
+                                        metrics=metrics))
+
+        self.assertIn("not implemented", metrics["error"])
+        self.assertEqual(engine.stats()["failed"], 1)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        if os.path.isfile(self.dmp_file):
+            os.remove(self.dmp_file)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,151 @@
+# Classification (U)
+
+"""Program:  mysqldumpengine.py
+
+    Description:  Unit testing of MysqldumpEngine class in dump_engine.py.
+
+    Usage:
+        test/unit/dump_engine/mysqldumpengine.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import gzip
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import dump_engine                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_crt_args
+        test_dump
+        test_dump_compress
+        test_dump_failed
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.dmp_file = "./test/unit/dump_engine/tmp/test_mysqldump.sql"
+        self.unit = {"name": "db1", "args": ["db1"], "file": "db1"}
+
+        # Stand-in executable for mysqldump, dumps its arguments.
+        self.dump_cmd = [
+            sys.executable, "-c",
+            "import sys; print('-- ' + ' '.join(sys.argv[1:]))", "-s"]
+
+    def test_crt_args(self):
+
+        """Function:  test_crt_args
+
+        Description:  Test the dump command line of a unit.
+
+        Arguments:
+
+        """
+
+        engine = dump_engine.MysqldumpEngine(self.dump_cmd)
+
+        self.assertEqual(engine.crt_args(self.unit), self.dump_cmd + ["db1"])
+        self.assertEqual(engine.dump_cmd, self.dump_cmd)
+
+    def test_dump(self):
+
+        """Function:  test_dump
+
+        Description:  Test dumping a unit.
+
+        Arguments:
+
+        """
+
+        engine = dump_engine.MysqldumpEngine(self.dump_cmd)
+        procs = []
+
+        self.assertTrue(
+            engine.run(self.unit, self.dmp_file, False, procs=procs))
+
+        with open(self.dmp_file, "rb") as f_hdlr:
+            self.assertEqual(f_hdlr.read(), b"-- -s db1\n")
+
+        self.assertEqual(len(procs), 1)
+        self.assertEqual(engine.stats()["bytes"], 10)
+
+    def test_dump_compress(self):
+
+        """Function:  test_dump_compress
+
+        Description:  Test dumping a unit with compression.
+
+        Arguments:
+
+        """
+
+        engine = dump_engine.MysqldumpEngine(self.dump_cmd)
+
+        self.assertTrue(engine.run(self.unit, self.dmp_file, True,
+                                   comp_opts={"codec": "gzip"}))
+
+        with gzip.open(self.dmp_file + ".gz", "rb") as f_hdlr:
+            self.assertEqual(f_hdlr.read(), b"-- -s db1\n")
+
+    def test_dump_failed(self):
+
+        """Function:  test_dump_failed
+
+        Description:  Test with a failed dump command.
+
+        Arguments:
+
+        """
+
+        engine = dump_engine.MysqldumpEngine(
+            [sys.executable, "-c", "import sys; sys.exit(2)"])
+
+        self.assertFalse(engine.run(self.unit, self.dmp_file, False))
+        self.assertEqual(engine.stats()["failed"], 1)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        for fname in [self.dmp_file, self.dmp_file + ".gz"]:
+            if os.path.isfile(fname):
+                os.remove(fname)
+
+
+if __name__ == "__main__":
+    unittest.main()
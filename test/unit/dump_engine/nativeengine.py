@@ -0,0 +1,454 @@
+# Classification (U)
+
+"""Program:  nativeengine.py
+
+    Description:  Unit testing of NativeEngine class in dump_engine.py.
+
+    Usage:
+        test/unit/dump_engine/nativeengine.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import dump_engine                              # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Cursor():
+
+    """Class:  Cursor
+
+    Description:  Class stub holder for a raw database cursor.
+
+    Methods:
+        __init__
+        execute
+        fetchmany
+        close
+
+    """
+
+    def __init__(self, rows, fail=False):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.rows = list(rows)
+        self.fail = fail
+        self.cmd = None
+        self.closed = False
+
+    def execute(self, cmd):
+
+        """Method:  execute
+
+        Description:  Stub method holder for cursor.execute.
+
+        Arguments:
+
+        """
+
+        if self.fail:
+            raise RuntimeError("Lost connection")
+
+        self.cmd = cmd
+
+    def fetchmany(self, size):
+
+        """Method:  fetchmany
+
+        Description:  Stub method holder for cursor.fetchmany.
+
+        Arguments:
+
+        """
+
+        rows = self.rows[:size]
+        self.rows = self.rows[size:]
+
+        return rows
+
+    def close(self):
+
+        """Method:  close
+
+        Description:  Stub method holder for cursor.close.
+
+        Arguments:
+
+        """
+
+        self.closed = True
+
+
+class Conn():                                           # pylint:disable=R0903
+
+    """Class:  Conn
+
+    Description:  Class stub holder for a database connection.
+
+    Methods:
+        __init__
+        cursor
+
+    """
+
+    def __init__(self, cursors):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cursors = cursors
+
+    def cursor(self, raw=False):
+
+        """Method:  cursor
+
+        Description:  Stub method holder for connection.cursor.
+
+        Arguments:
+
+        """
+
+        if not raw:
+            raise ValueError("Raw cursor expected")
+
+        return self.cursors.pop(0)
+
+
+class Server():
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        cmd_sql
+        col_sql
+
+    """
+
+    def __init__(self, cursors=None, conn_msg=None):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.conn_msg = conn_msg
+        self.conn = Conn(cursors or [])
+        self.cmds = []
+        self.tables = [{"Table": "t1", "Type": "BASE TABLE"},
+                       {"Table": "v1", "Type": "VIEW"}]
+        self.columns = [
+            {"Table": "t1", "Column": "id", "Type": "int", "Extra": ""},
+            {"Table": "t1", "Column": "name", "Type": "varchar",
+             "Extra": None},
+            {"Table": "v1", "Column": "id", "Type": "int", "Extra": ""}]
+        self.triggers = [{"Trigger": "trg1"}]
+
+    def cmd_sql(self, cmd):
+
+        """Method:  cmd_sql
+
+        Description:  Stub method holder for mysql_class.Server.cmd_sql.
+
+        Arguments:
+
+        """
+
+        self.cmds.append(cmd)
+
+    def col_sql(self, cmd):
+
+        """Method:  col_sql
+
+        Description:  Stub method holder for mysql_class.Server.col_sql.
+
+        Arguments:
+
+        """
+
+        results = []
+
+        if "information_schema.tables" in cmd:
+            results = self.tables
+
+        elif "information_schema.columns" in cmd:
+            results = self.columns
+
+        elif "information_schema.triggers" in cmd:
+            results = self.triggers
+
+        elif cmd.startswith("show create table"):
+            results = [{"Create Table": "CREATE TABLE `t1` (`id` int)"}]
+
+        elif cmd.startswith("show create view"):
+            results = [{"Create View": "CREATE VIEW `v1` AS select 1"}]
+
+        elif cmd.startswith("show create trigger"):
+            results = [{"sql_mode": "STRICT_TRANS_TABLES",
+                        "SQL Original Statement": "CREATE TRIGGER `trg1`"}]
+
+        return results
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        read_dump
+        test_run
+        test_insert_size
+        test_generated_column
+        test_binary_column
+        test_pool_reuse
+        test_connect_failed
+        test_dump_failed
+        test_close
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.dmp_file = "./test/unit/dump_engine/tmp/test_native.sql"
+        self.unit = {"name": "db1", "args": ["--databases", "db1"],
+                     "file": "db1"}
+        self.rows = [(b"1", b"It's"), (b"2", None)]
+
+    def read_dump(self):
+
+        """Function:  read_dump
+
+        Description:  Return the contents of the dump file.
+
+        Arguments:
+
+        """
+
+        with open(self.dmp_file, "rb") as f_hdlr:
+            return f_hdlr.read()
+
+    def test_run(self):
+
+        """Function:  test_run
+
+        Description:  Test dumping a database.
+
+        Arguments:
+
+        """
+
+        cursor = Cursor(self.rows)
+        server = Server([cursor])
+        engine = dump_engine.NativeEngine(lambda: server)
+
+        self.assertTrue(engine.run(self.unit, self.dmp_file, False))
+
+        data = self.read_dump()
+        self.assertTrue(data.startswith(dump_engine.NATIVE_HEADER))
+        self.assertTrue(data.endswith(dump_engine.NATIVE_FOOTER))
+        self.assertIn(b"CREATE TABLE `t1` (`id` int);\n", data)
+        self.assertIn(
+            b"INSERT INTO `t1` VALUES (1,'It\\'s'),(2,NULL);\n", data)
+        self.assertIn(b"/*!50001 CREATE VIEW `v1` AS SELECT 1 AS `id` */;",
+                      data)
+        self.assertIn(b"/*!50001 CREATE VIEW `v1` AS select 1 */;", data)
+        self.assertIn(b"DELIMITER ;;\nCREATE TRIGGER `trg1`;;\n", data)
+        self.assertEqual(cursor.cmd, "select `id`, `name` from `db1`.`t1`")
+        self.assertTrue(cursor.closed)
+        self.assertEqual(server.cmds[-2:], [
+            "start transaction with consistent snapshot", "commit"])
+
+    def test_insert_size(self):
+
+        """Function:  test_insert_size
+
+        Description:  Test splitting rows over multiple INSERT statements.
+
+        Arguments:
+
+        """
+
+        engine = dump_engine.NativeEngine(
+            lambda: Server([Cursor(self.rows)]), insert_size=15)
+
+        self.assertTrue(engine.run(self.unit, self.dmp_file, False))
+        self.assertIn(b"INSERT INTO `t1` VALUES (1,'It\\'s');\n"
+                      b"INSERT INTO `t1` VALUES (2,NULL);\n",
+                      self.read_dump())
+
+    def test_generated_column(self):
+
+        """Function:  test_generated_column
+
+        Description:  Test a table with a generated column.
+
+        Arguments:
+
+        """
+
+        cursor = Cursor([(b"1",)])
+        server = Server([cursor])
+        server.columns[1]["Extra"] = "VIRTUAL GENERATED"
+        engine = dump_engine.NativeEngine(lambda: server)
+
+        self.assertTrue(engine.run(self.unit, self.dmp_file, False))
+        self.assertEqual(cursor.cmd, "select `id` from `db1`.`t1`")
+        self.assertIn(b"INSERT INTO `t1` (`id`) VALUES (1);\n",
+                      self.read_dump())
+
+    def test_binary_column(self):
+
+        """Function:  test_binary_column
+
+        Description:  Test a table with a binary column.
+
+        Arguments:
+
+        """
+
+        server = Server([Cursor([(b"1", b"\x00\xff'")])])
+        server.columns[1]["Type"] = "BLOB"
+        engine = dump_engine.NativeEngine(lambda: server)
+
+        self.assertTrue(engine.run(self.unit, self.dmp_file, False))
+        self.assertIn(b"INSERT INTO `t1` VALUES (1,0x00FF27);\n",
+                      self.read_dump())
+
+    def test_pool_reuse(self):
+
+        """Function:  test_pool_reuse
+
+        Description:  Test the connection is reused for the next unit.
+
+        Arguments:
+
+        """
+
+        server = Server([Cursor(self.rows), Cursor(self.rows)])
+        connect = mock.Mock(return_value=server)
+        engine = dump_engine.NativeEngine(connect)
+
+        self.assertTrue(engine.run(self.unit, self.dmp_file, False))
+        self.assertTrue(engine.run(self.unit, self.dmp_file, False))
+        self.assertEqual(connect.call_count, 1)
+        self.assertEqual(engine.conns, [server])
+
+    @mock.patch("dump_engine.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    def test_connect_failed(self):
+
+        """Function:  test_connect_failed
+
+        Description:  Test with a failed database connection.
+
+        Arguments:
+
+        """
+
+        engine = dump_engine.NativeEngine(
+            lambda: Server(conn_msg="Access denied"))
+
+        with gen_libs.no_std_out():
+            self.assertFalse(engine.run(self.unit, self.dmp_file, False))
+
+        self.assertEqual(engine.conns, [])
+
+    @mock.patch("dump_engine.mysql_libs.disconnect")
+    def test_dump_failed(self, mock_disconn):
+
+        """Function:  test_dump_failed
+
+        Description:  Test with a connection failing during the dump.
+
+        Arguments:
+
+        """
+
+        server = Server([Cursor(self.rows, fail=True)])
+        engine = dump_engine.NativeEngine(lambda: server)
+
+        with gen_libs.no_std_out():
+            self.assertFalse(engine.run(self.unit, self.dmp_file, False))
+
+        mock_disconn.assert_called_once_with(server)
+        self.assertEqual(engine.conns, [])
+        self.assertTrue(engine.pool.empty())
+
+    @mock.patch("dump_engine.mysql_libs.disconnect")
+    def test_close(self, mock_disconn):
+
+        """Function:  test_close
+
+        Description:  Test disconnecting the pooled connections.
+
+        Arguments:
+
+        """
+
+        server = Server([Cursor(self.rows)])
+        engine = dump_engine.NativeEngine(lambda: server)
+        engine.run(self.unit, self.dmp_file, False)
+        engine.close()
+
+        mock_disconn.assert_called_once_with(server)
+        self.assertEqual(engine.conns, [])
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        if os.path.isfile(self.dmp_file):
+            os.remove(self.dmp_file)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+# Classification (U)
+
+"""Program:  pumpengine.py
+
+    Description:  Unit testing of PumpEngine class in dump_engine.py.
+
+    Usage:
+        test/unit/dump_engine/pumpengine.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import dump_engine                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_dump
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.dmp_file = "./test/unit/dump_engine/tmp/test_mysqlpump.sql"
+        self.unit = {"name": "db1", "args": ["db1"], "file": "db1"}
+
+        # Stand-in executable for mysqlpump, dumps its arguments.
+        self.pump_cmd = [
+            sys.executable, "-c",
+            "import sys; print('-- ' + ' '.join(sys.argv[1:]))",
+            "--single-transaction"]
+
+    def test_dump(self):
+
+        """Function:  test_dump
+
+        Description:  Test dumping a unit.
+
+        Arguments:
+
+        """
+
+        engine = dump_engine.PumpEngine(self.pump_cmd)
+
+        self.assertTrue(engine.run(self.unit, self.dmp_file, False))
+
+        with open(self.dmp_file, "rb") as f_hdlr:
+            self.assertEqual(f_hdlr.read(), b"-- --single-transaction db1\n")
+
+        self.assertEqual(engine.stats()["engine"], "mysqlpump")
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        if os.path.isfile(self.dmp_file):
+            os.remove(self.dmp_file)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+# Classification (U)
+
+"""Program:  quote_id.py
+
+    Description:  Unit testing of quote_id in dump_engine.py.
+
+    Usage:
+        test/unit/dump_engine/quote_id.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import dump_engine                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_backtick
+        test_quote_id
+
+    """
+
+    def test_backtick(self):
+
+        """Function:  test_backtick
+
+        Description:  Test with a name containing a backtick.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(dump_engine.quote_id("my`tbl"), "`my``tbl`")
+
+    def test_quote_id(self):
+
+        """Function:  test_quote_id
+
+        Description:  Test with a plain name.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(dump_engine.quote_id("tbl1"), "`tbl1`")
+
+
+if __name__ == "__main__":
+    unittest.main()
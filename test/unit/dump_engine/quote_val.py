@@ -0,0 +1,151 @@
+# Classification (U)
+
+"""Program:  quote_val.py
+
+    Description:  Unit testing of quote_val in dump_engine.py.
+
+    Usage:
+        test/unit/dump_engine/quote_val.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import dump_engine                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_null
+        test_string
+        test_escapes
+        test_bytes
+        test_numeric
+        test_binary
+        test_empty_binary
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.value = b"It's a \"test\"\\\n\r\x00\x1a"
+        self.result = b"'It\\'s a \\\"test\\\"\\\\\\n\\r\\0\\Z'"
+
+    def test_null(self):
+
+        """Function:  test_null
+
+        Description:  Test with a NULL value.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(dump_engine.quote_val(None), b"NULL")
+
+    def test_string(self):
+
+        """Function:  test_string
+
+        Description:  Test with a str value.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(dump_engine.quote_val("déjà"),
+                         b"'d\xc3\xa9j\xc3\xa0'")
+
+    def test_escapes(self):
+
+        """Function:  test_escapes
+
+        Description:  Test the escaped characters.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(dump_engine.quote_val(self.value), self.result)
+
+    def test_bytes(self):
+
+        """Function:  test_bytes
+
+        Description:  Test with a bytearray value.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            dump_engine.quote_val(bytearray(b"123")), b"'123'")
+
+    def test_numeric(self):
+
+        """Function:  test_numeric
+
+        Description:  Test with a numeric value.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            dump_engine.quote_val(b"-12.50", "decimal"), b"-12.50")
+
+    def test_binary(self):
+
+        """Function:  test_binary
+
+        Description:  Test with a binary value.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            dump_engine.quote_val(self.value, "varbinary"),
+            b"0x497427732061202274657374225C0A0D001A")
+
+    def test_empty_binary(self):
+
+        """Function:  test_empty_binary
+
+        Description:  Test with an empty binary value.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(dump_engine.quote_val(b"", "blob"), b"''")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,199 @@
+# Classification (U)
+
+"""Program:  shellengine.py
+
+    Description:  Unit testing of ShellEngine class in dump_engine.py.
+
+    Usage:
+        test/unit/dump_engine/shellengine.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import shutil
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import dump_engine                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+# Stand-in executable for MySQL Shell, writes its arguments into the
+# output directory.
+SHELL_SCRIPT = """import os, sys
+out_dir = [arg for arg in sys.argv if arg.startswith("--outputUrl=")][0][12:]
+os.makedirs(out_dir)
+with open(os.path.join(out_dir, "@.json"), "w") as f_hdlr:
+    f_hdlr.write(" ".join(sys.argv[1:]))
+print("Dump finished")
+"""
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_crt_args
+        test_crt_args_codec
+        test_crt_args_no_compress
+        test_fname
+        test_dump
+        test_dump_failed
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.dmp_path = "./test/unit/dump_engine/tmp"
+        self.dmp_file = os.path.join(self.dmp_path, "db1_20260101_120000.sql")
+        self.out_dir = os.path.join(self.dmp_path, "db1_20260101_120000")
+        self.unit = {"name": "db1", "args": ["db1"], "file": "db1"}
+        self.shell_cmd = [sys.executable, "-c", SHELL_SCRIPT]
+        self.errfile = os.path.join(self.dmp_path, "test_shell.log")
+
+    def test_crt_args(self):
+
+        """Function:  test_crt_args
+
+        Description:  Test the util.dumpSchemas command line.
+
+        Arguments:
+
+        """
+
+        engine = dump_engine.ShellEngine(["mysqlsh", "-u", "user"])
+
+        self.assertEqual(
+            engine.crt_args(self.unit, self.out_dir, True,
+                            {"codec": "zstd", "threads": 4}),
+            ["mysqlsh", "-u", "user", "--", "util", "dump-schemas", "db1",
+             "--outputUrl=" + self.out_dir, "--compression=zstd",
+             "--threads=4", "--showProgress=false"])
+
+    def test_crt_args_codec(self):
+
+        """Function:  test_crt_args_codec
+
+        Description:  Test with codecs not supported by MySQL Shell.
+
+        Arguments:
+
+        """
+
+        engine = dump_engine.ShellEngine(["mysqlsh"])
+
+        self.assertIn("--compression=gzip", engine.crt_args(
+            self.unit, self.out_dir, True, {"codec": "gzip"}))
+        self.assertIn("--compression=zstd", engine.crt_args(
+            self.unit, self.out_dir, True, {"codec": "xz"}))
+
+    def test_crt_args_no_compress(self):
+
+        """Function:  test_crt_args_no_compress
+
+        Description:  Test without compression.
+
+        Arguments:
+
+        """
+
+        engine = dump_engine.ShellEngine(["mysqlsh"])
+
+        self.assertIn("--compression=none", engine.crt_args(
+            self.unit, self.out_dir, False, {"codec": "zstd"}))
+
+    def test_fname(self):
+
+        """Function:  test_fname
+
+        Description:  Test the dump directory name.
+
+        Arguments:
+
+        """
+
+        engine = dump_engine.ShellEngine(["mysqlsh"])
+
+        self.assertEqual(engine.fname(self.dmp_file, True, {}), self.out_dir)
+
+    def test_dump(self):
+
+        """Function:  test_dump
+
+        Description:  Test dumping a unit into a dump directory.
+
+        Arguments:
+
+        """
+
+        engine = dump_engine.ShellEngine(self.shell_cmd)
+
+        with open(self.errfile, "w+", encoding="UTF-8") as e_file:
+            self.assertTrue(engine.run(self.unit, self.dmp_file, False,
+                                       errfile=e_file))
+            e_file.seek(0)
+            self.assertEqual(e_file.read(), "Dump finished\n")
+
+        with open(os.path.join(self.out_dir, "@.json"),
+                  encoding="UTF-8") as f_hdlr:
+            self.assertIn("dump-schemas db1", f_hdlr.read())
+
+        self.assertGreater(engine.stats()["bytes"], 0)
+
+    def test_dump_failed(self):
+
+        """Function:  test_dump_failed
+
+        Description:  Test with a failed util.dumpSchemas command.
+
+        Arguments:
+
+        """
+
+        engine = dump_engine.ShellEngine(
+            [sys.executable, "-c", "import sys; sys.exit(1)"])
+
+        self.assertFalse(engine.run(self.unit, self.dmp_file, False))
+        self.assertEqual(engine.stats()["failed"], 1)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        if os.path.isdir(self.out_dir):
+            shutil.rmtree(self.out_dir)
+
+        if os.path.isfile(self.errfile):
+            os.remove(self.errfile)
+
+
+if __name__ == "__main__":
+    unittest.main()
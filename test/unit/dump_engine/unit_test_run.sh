@@ -0,0 +1,15 @@
+#!/bin/bash
+# Unit testing program for the program module.
+# This will run all the units tests for this program.
+# Will need to run this from the base directory where the module file
+#   is located at.
+
+echo ""
+echo "Unit testing..."
+/usr/bin/python test/unit/dump_engine/dumpengine.py
+/usr/bin/python test/unit/dump_engine/mysqldumpengine.py
+/usr/bin/python test/unit/dump_engine/nativeengine.py
+/usr/bin/python test/unit/dump_engine/pumpengine.py
+/usr/bin/python test/unit/dump_engine/quote_id.py
+/usr/bin/python test/unit/dump_engine/quote_val.py
+/usr/bin/python test/unit/dump_engine/shellengine.py
@@ -0,0 +1,109 @@
+# Classification (U)
+
+"""Program:  chainfile.py
+
+    Description:  Unit testing of ChainFile class in dump_file.py.
+
+    Usage:
+        test/unit/dump_file/chainfile.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import dump_file                                # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_write
+        test_close
+        test_close_failed
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.files = mock.Mock()
+        self.chain = dump_file.ChainFile(
+            self.files.outer, self.files.inner)
+
+    def test_write(self):
+
+        """Function:  test_write
+
+        Description:  Test the data is written to the compressor.
+
+        Arguments:
+
+        """
+
+        self.files.outer.write.return_value = 9
+
+        self.assertEqual(self.chain.write(b"Dump Data"), 9)
+        self.files.outer.write.assert_called_once_with(b"Dump Data")
+        self.files.inner.write.assert_not_called()
+
+    def test_close(self):
+
+        """Function:  test_close
+
+        Description:  Test the compressor is closed before the file.
+
+        Arguments:
+
+        """
+
+        with self.chain:
+            pass
+
+        self.assertEqual(self.files.mock_calls,
+                         [mock.call.outer.close(), mock.call.inner.close()])
+
+    def test_close_failed(self):
+
+        """Function:  test_close_failed
+
+        Description:  Test the file is closed when the compressor fails.
+
+        Arguments:
+
+        """
+
+        self.files.outer.close.side_effect = OSError("No space left")
+
+        with self.assertRaises(OSError):
+            self.chain.close()
+
+        self.files.inner.close.assert_called_once_with()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,22 @@
+#!/bin/bash
+# Unit test code coverage for program module.
+# This will run the Python code coverage module against all unit test modules.
+# This will show the amount of code that was tested and which lines of code
+#   that was skipped during the test.
+
+coverage erase
+
+echo ""
+echo "Running unit test modules in conjunction with coverage"
+coverage run -a --source=dump_file test/unit/dump_file/chainfile.py
+coverage run -a --source=dump_file test/unit/dump_file/dumpwriter.py
+coverage run -a --source=dump_file test/unit/dump_file/hashfile.py
+coverage run -a --source=dump_file test/unit/dump_file/new_hash.py
+coverage run -a --source=dump_file test/unit/dump_file/open_dump.py
+coverage run -a --source=dump_file test/unit/dump_file/path_size.py
+coverage run -a --source=dump_file test/unit/dump_file/prealloc_size.py
+
+echo ""
+echo "Producing code coverage report"
+coverage combine
+coverage report -m
@@ -0,0 +1,244 @@
+# Classification (U)
+
+"""Program:  dumpwriter.py
+
+    Description:  Unit testing of DumpWriter class in dump_file.py.
+
+    Usage:
+        test/unit/dump_file/dumpwriter.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import mmap
+import errno
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import dump_file                                # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+# os.open before it is patched (mysql_db_dump shares the os module).
+OS_OPEN = os.open
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        read_file
+        test_small_write
+        test_chunks
+        test_preallocate
+        test_fadvise
+        test_direct
+        test_direct_fallback
+        test_close_twice
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.fname = "./test/unit/dump_file/tmp/test_writer.sql"
+        self.chunk = mmap.PAGESIZE
+        self.data = b"INSERT INTO t1 VALUES (1),(2),(3);\n" * 1000
+
+    def read_file(self):
+
+        """Function:  read_file
+
+        Description:  Return the contents of the file.
+
+        Arguments:
+
+        """
+
+        with open(self.fname, "rb") as f_hdlr:
+            return f_hdlr.read()
+
+    def test_small_write(self):
+
+        """Function:  test_small_write
+
+        Description:  Test data smaller than a chunk.
+
+        Arguments:
+
+        """
+
+        with dump_file.DumpWriter(self.fname) as writer:
+            self.assertEqual(writer.write(b"Dump Data"), 9)
+            self.assertEqual(writer.written, 0)
+
+        self.assertEqual(self.read_file(), b"Dump Data")
+
+    def test_chunks(self):
+
+        """Function:  test_chunks
+
+        Description:  Test data written in full chunks.
+
+        Arguments:
+
+        """
+
+        with dump_file.DumpWriter(self.fname, chunk=self.chunk) as writer:
+            for pos in range(0, len(self.data), 1000):
+                writer.write(memoryview(self.data)[pos:pos + 1000])
+
+            self.assertEqual(writer.written % self.chunk, 0)
+            self.assertEqual(writer.written,
+                             len(self.data) // self.chunk * self.chunk)
+
+        self.assertEqual(self.read_file(), self.data)
+
+    @unittest.skipUnless(hasattr(os, "posix_fallocate"),
+                         "posix_fallocate not available")
+    def test_preallocate(self):
+
+        """Function:  test_preallocate
+
+        Description:  Test the preallocated file is truncated to the size
+            written.
+
+        Arguments:
+
+        """
+
+        with dump_file.DumpWriter(
+                self.fname, size=len(self.data) * 2) as writer:
+            writer.write(self.data)
+
+        self.assertEqual(os.path.getsize(self.fname), len(self.data))
+        self.assertEqual(self.read_file(), self.data)
+
+    @unittest.skipUnless(hasattr(os, "posix_fadvise"),
+                         "posix_fadvise not available")
+    @mock.patch("dump_file.os.posix_fadvise")
+    def test_fadvise(self, mock_fadvise):
+
+        """Function:  test_fadvise
+
+        Description:  Test the written ranges are dropped from the page
+            cache.
+
+        Arguments:
+
+        """
+
+        with dump_file.DumpWriter(self.fname, chunk=self.chunk) as writer:
+            writer.write(self.data[:self.chunk * 6])
+
+        self.assertEqual(mock_fadvise.call_count, 7)
+        self.assertEqual(mock_fadvise.call_args_list[5][0][1:3],
+                         (self.chunk, self.chunk * 5))
+        self.assertEqual(mock_fadvise.call_args[0][1:3], (0, 0))
+
+    def test_direct(self):
+
+        """Function:  test_direct
+
+        Description:  Test writing with O_DIRECT, an unaligned tail is written
+            without O_DIRECT.
+
+        Arguments:
+
+        """
+
+        with dump_file.DumpWriter(
+                self.fname, direct=True, chunk=self.chunk) as writer:
+            writer.write(self.data)
+
+        self.assertEqual(self.read_file(), self.data)
+
+    @mock.patch("dump_file.os.open")
+    def test_direct_fallback(self, mock_open):
+
+        """Function:  test_direct_fallback
+
+        Description:  Test with a file system not supporting O_DIRECT.
+
+        Arguments:
+
+        """
+
+        def fake_open(fname, flags, mode):
+
+            """Function:  fake_open
+
+            Description:  Reject O_DIRECT.
+
+            Arguments:
+
+            """
+
+            if flags & getattr(os, "O_DIRECT", 0):
+                raise OSError(errno.EINVAL, "Invalid argument")
+
+            return OS_OPEN(fname, flags, mode)
+
+        mock_open.side_effect = fake_open
+
+        with dump_file.DumpWriter(self.fname, direct=True) as writer:
+            writer.write(b"Dump Data")
+            self.assertFalse(writer.direct)
+
+        self.assertEqual(self.read_file(), b"Dump Data")
+
+    def test_close_twice(self):
+
+        """Function:  test_close_twice
+
+        Description:  Test closing the writer twice.
+
+        Arguments:
+
+        """
+
+        writer = dump_file.DumpWriter(self.fname)
+        writer.write(b"Dump Data")
+        writer.close()
+        writer.close()
+
+        self.assertTrue(writer.closed)
+        self.assertEqual(self.read_file(), b"Dump Data")
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        if os.path.isfile(self.fname):
+            os.remove(self.fname)
+
+
+if __name__ == "__main__":
+    unittest.main()
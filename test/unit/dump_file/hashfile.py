@@ -0,0 +1,146 @@
+# Classification (U)
+
+"""Program:  hashfile.py
+
+    Description:  Unit testing of HashFile class in dump_file.py.
+
+    Usage:
+        test/unit/dump_file/hashfile.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import hashlib
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import dump_file                                # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_write
+        test_close
+        test_close_twice
+        test_flush
+        test_flush_not_supported
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.f_hdlr = mock.Mock()
+        self.digests = {}
+        self.hash_file = dump_file.HashFile(
+            self.f_hdlr, "sha256", self.digests, ["raw", "file"])
+        self.digest = hashlib.sha256(b"Dump Data").hexdigest()
+
+    def test_write(self):
+
+        """Function:  test_write
+
+        Description:  Test the data is written to the file.
+
+        Arguments:
+
+        """
+
+        self.f_hdlr.write.return_value = 4
+
+        self.assertEqual(self.hash_file.write(b"Dump"), 4)
+        self.assertEqual(self.hash_file.write(memoryview(b" Data")), 4)
+        self.assertEqual(self.hash_file.size, 9)
+        self.f_hdlr.write.assert_called_with(mock.ANY)
+
+    def test_close(self):
+
+        """Function:  test_close
+
+        Description:  Test the hex digest is recorded under each key when
+            the file is closed.
+
+        Arguments:
+
+        """
+
+        with self.hash_file as f_hdlr:
+            f_hdlr.write(b"Dump Data")
+
+        self.assertEqual(self.digests,
+                         {"raw": self.digest, "file": self.digest})
+        self.f_hdlr.close.assert_called_once_with()
+
+    def test_close_twice(self):
+
+        """Function:  test_close_twice
+
+        Description:  Test closing the instance twice closes the file once.
+
+        Arguments:
+
+        """
+
+        self.hash_file.close()
+        self.hash_file.close()
+
+        self.f_hdlr.close.assert_called_once_with()
+
+    def test_flush(self):
+
+        """Function:  test_flush
+
+        Description:  Test the file is flushed.
+
+        Arguments:
+
+        """
+
+        self.hash_file.flush()
+
+        self.f_hdlr.flush.assert_called_once_with()
+
+    def test_flush_not_supported(self):
+
+        """Function:  test_flush_not_supported
+
+        Description:  Test with a file not supporting flush.
+
+        Arguments:
+
+        """
+
+        hash_file = dump_file.HashFile(mock.Mock(spec=["write"]),
+                                           "sha256")
+
+        hash_file.flush()
+
+        self.assertEqual(hash_file.digests, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+# Classification (U)
+
+"""Program:  new_hash.py
+
+    Description:  Unit testing of new_hash in dump_file.py.
+
+    Usage:
+        test/unit/dump_file/new_hash.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import hashlib
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import dump_file                                # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_sha256
+        test_blake2b
+        test_xxh3
+
+    """
+
+    def test_sha256(self):
+
+        """Function:  test_sha256
+
+        Description:  Test with the sha256 algorithm.
+
+        Arguments:
+
+        """
+
+        hasher = dump_file.new_hash("sha256")
+        hasher.update(b"Dump Data")
+
+        self.assertEqual(hasher.hexdigest(),
+                         hashlib.sha256(b"Dump Data").hexdigest())
+
+    def test_blake2b(self):
+
+        """Function:  test_blake2b
+
+        Description:  Test with the blake2b algorithm.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(dump_file.new_hash("blake2b").name, "blake2b")
+
+    @mock.patch("dump_file.xxhash")
+    def test_xxh3(self, mock_xxhash):
+
+        """Function:  test_xxh3
+
+        Description:  Test with the xxh3 algorithm.
+
+        Arguments:
+
+        """
+
+        mock_xxhash.xxh3_128.return_value = "Hasher"
+
+        self.assertEqual(dump_file.new_hash("xxh3"), "Hasher")
+
+
+if __name__ == "__main__":
+    unittest.main()
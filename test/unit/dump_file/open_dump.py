@@ -0,0 +1,200 @@
+# Classification (U)
+
+"""Program:  open_dump.py
+
+    Description:  Unit testing of open_dump in dump_file.py.
+
+    Usage:
+        test/unit/dump_file/open_dump.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import gzip
+import hashlib
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import dump_file                                # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_compress
+        test_no_compress
+        test_writer
+        test_writer_compress
+        test_hash
+        test_hash_compress
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.fname = "./test/unit/dump_file/tmp/test_open_dump.sql"
+        self.data = b"Dump Data\n"
+
+    def test_compress(self):
+
+        """Function:  test_compress
+
+        Description:  Test with compression.
+
+        Arguments:
+
+        """
+
+        with dump_file.open_dump(
+                self.fname, True, {"codec": "gzip"}) as f_hdlr:
+            f_hdlr.write(self.data)
+
+        with gzip.open(self.fname, "rb") as f_hdlr:
+            self.assertEqual(f_hdlr.read(), self.data)
+
+    def test_no_compress(self):
+
+        """Function:  test_no_compress
+
+        Description:  Test with no compression.
+
+        Arguments:
+
+        """
+
+        with dump_file.open_dump(self.fname, False, {}) as f_hdlr:
+            f_hdlr.write(self.data)
+
+        with open(self.fname, "rb") as f_hdlr:
+            self.assertEqual(f_hdlr.read(), self.data)
+
+    def test_writer(self):
+
+        """Function:  test_writer
+
+        Description:  Test with the page cache friendly writer.
+
+        Arguments:
+
+        """
+
+        with dump_file.open_dump(
+                self.fname, False, {}, write_opts={"size": 100}) as f_name:
+            self.assertIsInstance(f_name, dump_file.DumpWriter)
+            f_name.write(self.data)
+
+        with open(self.fname, "rb") as f_hdlr:
+            self.assertEqual(f_hdlr.read(), self.data)
+
+    def test_writer_compress(self):
+
+        """Function:  test_writer_compress
+
+        Description:  Test with the page cache friendly writer and
+            compression.
+
+        Arguments:
+
+        """
+
+        with dump_file.open_dump(
+                self.fname, True, {}, write_opts={"size": 100}) as f_name:
+            self.assertIsInstance(f_name, dump_file.ChainFile)
+            self.assertFalse(f_name.inner.prealloc)
+            f_name.write(self.data)
+
+        with gzip.open(self.fname, "rb") as f_hdlr:
+            self.assertEqual(f_hdlr.read(), self.data)
+
+    def test_hash(self):
+
+        """Function:  test_hash
+
+        Description:  Test the raw and file checksums are the same for an
+            uncompressed dump file.
+
+        Arguments:
+
+        """
+
+        hash_opts = {"algo": "blake2b"}
+
+        with dump_file.open_dump(
+                self.fname, False, {}, hash_opts=hash_opts) as f_name:
+            self.assertIsInstance(f_name, dump_file.HashFile)
+            f_name.write(self.data)
+
+        digest = hashlib.blake2b(self.data).hexdigest()
+
+        self.assertEqual(hash_opts["digests"],
+                         {"test_open_dump.sql": {"algo": "blake2b",
+                                                 "raw": digest,
+                                                 "file": digest}})
+
+    def test_hash_compress(self):
+
+        """Function:  test_hash_compress
+
+        Description:  Test the checksums of a compressed dump file written
+            with the page cache friendly writer.
+
+        Arguments:
+
+        """
+
+        hash_opts = {"algo": "sha256", "digests": {}}
+
+        with dump_file.open_dump(
+                self.fname, True, {}, write_opts={},
+                hash_opts=hash_opts) as f_name:
+            f_name.write(self.data)
+
+        with open(self.fname, "rb") as f_hdlr:
+            data = f_hdlr.read()
+
+        self.assertEqual(gzip.decompress(data), self.data)
+        self.assertEqual(
+            hash_opts["digests"]["test_open_dump.sql"],
+            {"algo": "sha256", "raw": hashlib.sha256(self.data).hexdigest(),
+             "file": hashlib.sha256(data).hexdigest()})
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        if os.path.isfile(self.fname):
+            os.remove(self.fname)
+
+
+if __name__ == "__main__":
+    unittest.main()
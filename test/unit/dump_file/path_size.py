@@ -0,0 +1,122 @@
+# Classification (U)
+
+"""Program:  path_size.py
+
+    Description:  Unit testing of path_size in dump_file.py.
+
+    Usage:
+        test/unit/dump_file/path_size.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import shutil
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import dump_file                                # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_missing
+        test_file
+        test_directory
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.dmp_path = "./test/unit/dump_file/tmp"
+        self.fname = os.path.join(self.dmp_path, "test_size.sql")
+        self.dir_name = os.path.join(self.dmp_path, "test_size")
+
+    def test_missing(self):
+
+        """Function:  test_missing
+
+        Description:  Test with a missing dump file.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(dump_file.path_size(self.fname), 0)
+
+    def test_file(self):
+
+        """Function:  test_file
+
+        Description:  Test with a dump file.
+
+        Arguments:
+
+        """
+
+        with open(self.fname, "wb") as f_hdlr:
+            f_hdlr.write(b"x" * 100)
+
+        self.assertEqual(dump_file.path_size(self.fname), 100)
+
+    def test_directory(self):
+
+        """Function:  test_directory
+
+        Description:  Test with a dump directory.
+
+        Arguments:
+
+        """
+
+        os.makedirs(os.path.join(self.dir_name, "sub"))
+
+        for fname, size in [("a.tsv", 10), ("sub/b.tsv", 20)]:
+            with open(os.path.join(self.dir_name, fname), "wb") as f_hdlr:
+                f_hdlr.write(b"x" * size)
+
+        self.assertEqual(dump_file.path_size(self.dir_name), 30)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        if os.path.isfile(self.fname):
+            os.remove(self.fname)
+
+        if os.path.isdir(self.dir_name):
+            shutil.rmtree(self.dir_name)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,159 @@
+# Classification (U)
+
+"""Program:  prealloc_size.py
+
+    Description:  Unit testing of prealloc_size in dump_file.py.
+
+    Usage:
+        test/unit/dump_file/prealloc_size.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import dump_file                                # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class StatVfs():                                        # pylint:disable=R0903
+
+    """Class:  StatVfs
+
+    Description:  Class stub holder for os.statvfs_result class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.f_bavail = 100
+        self.f_frsize = 4096
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_size
+        test_size
+        test_capped
+        test_no_space
+        test_stat_error
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.path = "./test/unit/dump_file/tmp/"
+
+    @mock.patch("dump_file.os.statvfs")
+    def test_no_size(self, mock_stat):
+
+        """Function:  test_no_size
+
+        Description:  Test with no estimated size.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(dump_file.prealloc_size(None, self.path))
+        self.assertIsNone(dump_file.prealloc_size(0, self.path))
+        mock_stat.assert_not_called()
+
+    @mock.patch("dump_file.os.statvfs", mock.Mock(return_value=StatVfs()))
+    def test_size(self):
+
+        """Function:  test_size
+
+        Description:  Test with an estimated size within the free space.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            dump_file.prealloc_size(100000, self.path, workers=4), 100000)
+
+    @mock.patch("dump_file.os.statvfs", mock.Mock(return_value=StatVfs()))
+    def test_capped(self):
+
+        """Function:  test_capped
+
+        Description:  Test the size is capped at the free space divided by
+            the number of concurrent dumps.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            dump_file.prealloc_size(409600, self.path, workers=4), 102400)
+
+    @mock.patch("dump_file.os.statvfs")
+    def test_no_space(self, mock_stat):
+
+        """Function:  test_no_space
+
+        Description:  Test with no free space.
+
+        Arguments:
+
+        """
+
+        mock_stat.return_value = StatVfs()
+        mock_stat.return_value.f_bavail = 0
+
+        self.assertIsNone(dump_file.prealloc_size(409600, self.path))
+
+    @mock.patch("dump_file.os.statvfs",
+                mock.Mock(side_effect=OSError("No such file")))
+    def test_stat_error(self):
+
+        """Function:  test_stat_error
+
+        Description:  Test with the free space unknown.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(dump_file.prealloc_size(409600, self.path))
+
+
+if __name__ == "__main__":
+    unittest.main()
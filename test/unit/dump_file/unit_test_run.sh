@@ -0,0 +1,15 @@
+#!/bin/bash
+# Unit testing program for the program module.
+# This will run all the units tests for this program.
+# Will need to run this from the base directory where the module file
+#   is located at.
+
+echo ""
+echo "Unit testing..."
+/usr/bin/python test/unit/dump_file/chainfile.py
+/usr/bin/python test/unit/dump_file/dumpwriter.py
+/usr/bin/python test/unit/dump_file/hashfile.py
+/usr/bin/python test/unit/dump_file/new_hash.py
+/usr/bin/python test/unit/dump_file/open_dump.py
+/usr/bin/python test/unit/dump_file/path_size.py
+/usr/bin/python test/unit/dump_file/prealloc_size.py
@@ -0,0 +1,23 @@
+#!/bin/bash
+# Unit test code coverage for program module.
+# This will run the Python code coverage module against all unit test modules.
+# This will show the amount of code that was tested and which lines of code
+#   that was skipped during the test.
+
+coverage erase
+
+echo ""
+echo "Running unit test modules in conjunction with coverage"
+coverage run -a --source=dump_proc test/unit/dump_proc/dump_metrics.py
+coverage run -a --source=dump_proc test/unit/dump_proc/dump_run.py
+coverage run -a --source=dump_proc test/unit/dump_proc/dump_split.py
+coverage run -a --source=dump_proc test/unit/dump_proc/dumpsplitter.py
+coverage run -a --source=dump_proc test/unit/dump_proc/split_footer.py
+coverage run -a --source=dump_proc test/unit/dump_proc/split_header.py
+coverage run -a --source=dump_proc test/unit/dump_proc/stop_proc.py
+coverage run -a --source=dump_proc test/unit/dump_proc/wait_proc.py
+
+echo ""
+echo "Producing code coverage report"
+coverage combine
+coverage report -m
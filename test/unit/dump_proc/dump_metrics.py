@@ -0,0 +1,144 @@
+# Classification (U)
+
+"""Program:  dump_metrics.py
+
+    Description:  Unit testing of dump_metrics in dump_proc.py.
+
+    Usage:
+        test/unit/dump_proc/dump_metrics.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import dump_proc                                # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_raw_bytes
+        test_file_size
+        test_file_list
+        test_no_time
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.fname = "./test/unit/dump_proc/tmp/dump_metrics.sql"
+        self.fname2 = "./test/unit/dump_proc/tmp/dump_metrics2.sql"
+
+        for fname in [self.fname, self.fname2]:
+            with open(fname, "wb") as f_hdlr:
+                f_hdlr.write(b"x" * 1048576)
+
+    def test_raw_bytes(self):
+
+        """Function:  test_raw_bytes
+
+        Description:  Test the throughput is based on the raw bytes.
+
+        Arguments:
+
+        """
+
+        metrics = dump_proc.dump_metrics(
+            self.fname, 100.0, 102.0, 4194304)
+
+        self.assertEqual(metrics["file"], self.fname)
+        self.assertEqual(metrics["seconds"], 2.0)
+        self.assertEqual(metrics["raw_bytes"], 4194304)
+        self.assertEqual(metrics["bytes"], 1048576)
+        self.assertEqual(metrics["mb_per_sec"], 2.0)
+
+    def test_file_size(self):
+
+        """Function:  test_file_size
+
+        Description:  Test the throughput is based on the file size if the
+            raw bytes are not known.
+
+        Arguments:
+
+        """
+
+        metrics = dump_proc.dump_metrics(self.fname, 100.0, 104.0)
+
+        self.assertIsNone(metrics["raw_bytes"])
+        self.assertEqual(metrics["mb_per_sec"], 0.25)
+
+    def test_file_list(self):
+
+        """Function:  test_file_list
+
+        Description:  Test with a list of dump files.
+
+        Arguments:
+
+        """
+
+        metrics = dump_proc.dump_metrics(
+            [self.fname, self.fname2], 100.0, 101.0)
+
+        self.assertEqual(metrics["file"], [self.fname, self.fname2])
+        self.assertEqual(metrics["bytes"], 2097152)
+
+    def test_no_time(self):
+
+        """Function:  test_no_time
+
+        Description:  Test with no time elapsed.
+
+        Arguments:
+
+        """
+
+        metrics = dump_proc.dump_metrics(self.fname, 100.0, 100.0, 10)
+
+        self.assertEqual(metrics["mb_per_sec"], 0.0)
+        self.assertEqual(metrics["start"], metrics["end"])
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        for fname in [self.fname, self.fname2]:
+            if os.path.isfile(fname):
+                os.remove(fname)
+
+
+if __name__ == "__main__":
+    unittest.main()
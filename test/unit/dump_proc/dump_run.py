@@ -0,0 +1,367 @@
+# Classification (U)
+
+"""Program:  dump_run.py
+
+    Description:  Unit testing of dump_run in dump_proc.py.
+
+    Usage:
+        test/unit/dump_proc/dump_run.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import hashlib
+import io
+import gzip
+import lzma
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import dump_proc                                # pylint:disable=E0401,C0413
+import dump_stream                              # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class SubProcess():                                     # pylint:disable=R0903
+
+    """Class:  SubProcess
+
+    Description:  Class which is a representation of the subprocess class.
+
+    Methods:
+        __init__
+        wait
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Initialization instance of the ZipFile class.
+
+        Arguments:
+
+        """
+
+        self.stdout = io.BytesIO(b"Dump Data")
+        self.pid = os.getpid()
+
+    def wait(self):
+
+        """Method:  wait
+
+        Description:  Mock representation of subprocess.wait method.
+
+        Arguments:
+
+        """
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_error_file
+        test_compress_true
+        test_compress_stream
+        test_compress_threads
+        test_compress_codec
+        test_compress_false
+        test_pipe
+        test_stages
+        test_hash
+        test_metrics
+        test_write_error
+        test_dump_run
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.dump_cmd = []
+        self.dmp_file = "./test/unit/dump_proc/tmp/test_run_prog"
+        self.err_file = "Error File"
+        self.subp = SubProcess()
+
+    @mock.patch("dump_proc.subprocess.Popen")
+    def test_error_file(self, mock_subp):
+
+        """Function:  test_error_file
+
+        Description:  Test with error file passed.
+
+        Arguments:
+
+        """
+
+        mock_subp.return_value = self.subp
+
+        self.assertFalse(dump_proc.dump_run(self.dump_cmd, self.dmp_file,
+                                                False, errfile=self.err_file))
+
+    @mock.patch("dump_proc.subprocess.Popen")
+    def test_compress_true(self, mock_subp):
+
+        """Function:  test_compress_true
+
+        Description:  Test with compression set to True.
+
+        Arguments:
+
+        """
+
+        mock_subp.return_value = self.subp
+
+        self.assertFalse(dump_proc.dump_run(self.dump_cmd, self.dmp_file,
+                                                True))
+
+    @mock.patch("dump_proc.subprocess.Popen")
+    def test_compress_stream(self, mock_subp):
+
+        """Function:  test_compress_stream
+
+        Description:  Test dump output is streamed to the compressed file.
+
+        Arguments:
+
+        """
+
+        mock_subp.return_value = self.subp
+
+        dump_proc.dump_run(self.dump_cmd, self.dmp_file, True)
+
+        self.assertFalse(os.path.isfile(self.dmp_file))
+
+        with gzip.open(self.dmp_file + ".gz", "rb") as f_hdlr:
+            self.assertEqual(f_hdlr.read(), b"Dump Data")
+
+    @mock.patch("dump_proc.subprocess.Popen")
+    def test_compress_threads(self, mock_subp):
+
+        """Function:  test_compress_threads
+
+        Description:  Test with multiple compression threads.
+
+        Arguments:
+
+        """
+
+        mock_subp.return_value = self.subp
+
+        dump_proc.dump_run(
+            self.dump_cmd, self.dmp_file, True, comp_opts={"threads": 2})
+
+        with gzip.open(self.dmp_file + ".gz", "rb") as f_hdlr:
+            self.assertEqual(f_hdlr.read(), b"Dump Data")
+
+    @mock.patch("dump_proc.subprocess.Popen")
+    def test_compress_codec(self, mock_subp):
+
+        """Function:  test_compress_codec
+
+        Description:  Test the dump file extension follows the codec.
+
+        Arguments:
+
+        """
+
+        mock_subp.return_value = self.subp
+
+        dump_proc.dump_run(
+            self.dump_cmd, self.dmp_file, True, comp_opts={"codec": "xz"})
+
+        with lzma.open(self.dmp_file + ".xz", "rb") as f_hdlr:
+            self.assertEqual(f_hdlr.read(), b"Dump Data")
+
+    @mock.patch("dump_proc.subprocess.Popen")
+    def test_compress_false(self, mock_subp):
+
+        """Function:  test_compress_false
+
+        Description:  Test with compression set to False.
+
+        Arguments:
+
+        """
+
+        mock_subp.return_value = self.subp
+
+        self.assertFalse(dump_proc.dump_run(self.dump_cmd, self.dmp_file,
+                                                False))
+
+        with open(self.dmp_file, "rb") as f_hdlr:
+            self.assertEqual(f_hdlr.read(), b"Dump Data")
+
+    def test_pipe(self):
+
+        """Function:  test_pipe
+
+        Description:  Test copying the dump output from the pipe of a stand-in
+            dump executable.
+
+        Arguments:
+
+        """
+
+        procs = []
+
+        self.assertTrue(dump_proc.dump_run(
+            [sys.executable, "-c", "print('-- Dump Data')"], self.dmp_file,
+            False, procs=procs))
+        self.assertEqual(len(procs), 1)
+
+        with open(self.dmp_file, "rb") as f_hdlr:
+            self.assertEqual(f_hdlr.read(), b"-- Dump Data\n")
+
+    def test_stages(self):
+
+        """Function:  test_stages
+
+        Description:  Test passing the dump output through stages.
+
+        Arguments:
+
+        """
+
+        stage = dump_stream.Stage()
+        stage.write = mock.Mock(side_effect=lambda data: bytes(data).upper())
+
+        self.assertTrue(dump_proc.dump_run(
+            [sys.executable, "-c", "print('-- Dump Data')"], self.dmp_file,
+            False, stages=[stage]))
+
+        with open(self.dmp_file, "rb") as f_hdlr:
+            self.assertEqual(f_hdlr.read(), b"-- DUMP DATA\n")
+
+    def test_hash(self):
+
+        """Function:  test_hash
+
+        Description:  Test the checksums of the raw and compressed dump
+            output are recorded.
+
+        Arguments:
+
+        """
+
+        hash_opts = {"algo": "sha256", "digests": {}}
+
+        self.assertTrue(dump_proc.dump_run(
+            [sys.executable, "-c", "print('-- Dump Data')"], self.dmp_file,
+            True, hash_opts=hash_opts))
+
+        with open(self.dmp_file + ".gz", "rb") as f_hdlr:
+            data = f_hdlr.read()
+
+        self.assertEqual(
+            hash_opts["digests"][os.path.basename(self.dmp_file + ".gz")],
+            {"algo": "sha256",
+             "raw": hashlib.sha256(b"-- Dump Data\n").hexdigest(),
+             "file": hashlib.sha256(data).hexdigest()})
+
+    def test_metrics(self):
+
+        """Function:  test_metrics
+
+        Description:  Test the dump metrics and usage of the dump process are
+            recorded.
+
+        Arguments:
+
+        """
+
+        metrics = {}
+
+        self.assertFalse(dump_proc.dump_run(
+            [sys.executable, "-c", "print('-- Dump Data'); exit(2)"],
+            self.dmp_file, False, metrics=metrics))
+        self.assertEqual(metrics["file"], self.dmp_file)
+        self.assertEqual(metrics["raw_bytes"], 13)
+        self.assertEqual(metrics["bytes"], 13)
+        self.assertEqual(metrics["exit_code"], 2)
+        self.assertIn("maxrss_kb", metrics)
+
+    @mock.patch("dump_stream.copy_stream",
+                mock.Mock(side_effect=OSError(28, "No space left on device")))
+    def test_write_error(self):
+
+        """Function:  test_write_error
+
+        Description:  Test an error writing the dump file terminates the dump
+            process and fails the dump.
+
+        Arguments:
+
+        """
+
+        procs = []
+        metrics = {}
+
+        with gen_libs.no_std_out():
+            self.assertFalse(dump_proc.dump_run(
+                [sys.executable, "-c", "import time; time.sleep(30)"],
+                self.dmp_file, False, procs=procs, metrics=metrics))
+
+        self.assertIsNotNone(procs[0].returncode)
+        self.assertIn("No space left on device", metrics["error"])
+        self.assertEqual(metrics["file"], self.dmp_file)
+
+    @mock.patch("dump_proc.subprocess.Popen")
+    def test_dump_run(self, mock_subp):
+
+        """Function:  test_dump_run
+
+        Description:  Test with only default arguments passed.
+
+        Arguments:
+
+        """
+
+        mock_subp.return_value = self.subp
+
+        self.assertFalse(dump_proc.dump_run(self.dump_cmd, self.dmp_file,
+                                                False))
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        for fname in [self.dmp_file, self.dmp_file + ".gz",
+                      self.dmp_file + ".xz"]:
+            if os.path.isfile(fname):
+                os.remove(fname)
+
+
+if __name__ == "__main__":
+    unittest.main()
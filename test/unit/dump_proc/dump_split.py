@@ -0,0 +1,355 @@
+# Classification (U)
+
+"""Program:  dump_split.py
+
+    Description:  Unit testing of dump_split in dump_proc.py.
+
+    Usage:
+        test/unit/dump_proc/dump_split.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import io
+import gzip
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import dump_proc                                # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class SubProcess():                                     # pylint:disable=R0903
+
+    """Class:  SubProcess
+
+    Description:  Class stub holder for subprocess.Popen class.
+
+    Methods:
+        __init__
+        terminate
+        wait
+
+    """
+
+    def __init__(self, data, code=0):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.stdout = io.BytesIO(data)
+        self.pid = os.getpid()
+        self.code = code
+        self.returncode = None
+        self.terminated = False
+
+    def terminate(self):
+
+        """Method:  terminate
+
+        Description:  Stub method holder for subprocess.Popen.terminate.
+
+        Arguments:
+
+        """
+
+        self.terminated = True
+
+    def wait(self):
+
+        """Method:  wait
+
+        Description:  Stub method holder for subprocess.Popen.wait.
+
+        Arguments:
+
+        """
+
+        return self.code
+
+
+def crt_file_time(fname, path, ext=""):
+
+    """Function:  crt_file_time
+
+    Description:  Stub holder for gen_libs.crt_file_time function.
+
+    Arguments:
+
+    """
+
+    return path + fname + ext
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_missing_database
+        test_failed_dump
+        test_write_error
+        test_quoted_name
+        test_compress
+        test_gtid
+        test_split
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.dump_cmd = ["dump_command", "--skip-dump-date", "--databases",
+                         "db1", "db2"]
+        self.db_list = ["db1", "db2"]
+        self.dmp_path = "./test/unit/dump_proc/tmp/"
+        self.header = b"-- MySQL dump\n/*!40101 SET NAMES utf8mb4 */;\n"    \
+            + b"/*!40101 SET @OLD_SQL_MODE=@@SQL_MODE, SQL_MODE='' */;\n"
+        self.footer = b"\n/*!40101 SET SQL_MODE=@OLD_SQL_MODE */;\n\n"      \
+            + b"-- Dump completed\n"
+        self.data = self.header                                          \
+            + b"\n--\n-- Current Database: `db1`\n--\n\nUSE `db1`;\n"    \
+            + b"\n--\n-- Current Database: `db2`\n--\n\nUSE `db2`;\n"    \
+            + self.footer
+        self.db1 = self.header                                           \
+            + b"\n--\n-- Current Database: `db1`\n--\n\nUSE `db1`;\n\n"  \
+            + self.footer
+        self.db2 = self.header                                           \
+            + b"\n--\n-- Current Database: `db2`\n--\n\nUSE `db2`;\n"    \
+            + self.footer
+        self.files = [os.path.join(self.dmp_path, item)
+                      for item in ["db1.sql", "db2.sql", "db1.sql.gz",
+                                   "db2.sql.gz", "my`db.sql"]]
+
+    @mock.patch("dump_proc.gen_libs.crt_file_time", crt_file_time)
+    @mock.patch("dump_proc.subprocess.Popen")
+    def test_missing_database(self, mock_popen):
+
+        """Function:  test_missing_database
+
+        Description:  Test with a database missing from the dump output.
+
+        Arguments:
+
+        """
+
+        mock_popen.return_value = SubProcess(self.db1)
+        files = {}
+
+        self.assertFalse(
+            dump_proc.dump_split(
+                self.dump_cmd, self.db_list, False, self.dmp_path,
+                files=files))
+        self.assertEqual(files, {})
+
+    @mock.patch("dump_proc.gen_libs.crt_file_time", crt_file_time)
+    @mock.patch("dump_proc.subprocess.Popen")
+    def test_failed_dump(self, mock_popen):
+
+        """Function:  test_failed_dump
+
+        Description:  Test with a failed dump command.
+
+        Arguments:
+
+        """
+
+        mock_popen.return_value = SubProcess(self.data, 2)
+
+        self.assertFalse(
+            dump_proc.dump_split(
+                self.dump_cmd, self.db_list, False, self.dmp_path))
+
+    @mock.patch("dump_file.open_dump",
+                mock.Mock(side_effect=OSError(28, "No space left on device")))
+    @mock.patch("dump_proc.gen_libs.crt_file_time", crt_file_time)
+    @mock.patch("dump_proc.subprocess.Popen")
+    def test_write_error(self, mock_popen):
+
+        """Function:  test_write_error
+
+        Description:  Test an error writing a dump file terminates the dump
+            process and fails the dump.
+
+        Arguments:
+
+        """
+
+        mock_popen.return_value = SubProcess(self.data)
+        metrics = {}
+
+        with gen_libs.no_std_out():
+            self.assertFalse(
+                dump_proc.dump_split(
+                    self.dump_cmd, self.db_list, False, self.dmp_path,
+                    metrics=metrics))
+
+        self.assertTrue(mock_popen.return_value.terminated)
+        self.assertIn("No space left on device", metrics["error"])
+
+    @mock.patch("dump_proc.gen_libs.crt_file_time", crt_file_time)
+    @mock.patch("dump_proc.subprocess.Popen")
+    def test_quoted_name(self, mock_popen):
+
+        """Function:  test_quoted_name
+
+        Description:  Test with a quoted database name.
+
+        Arguments:
+
+        """
+
+        mock_popen.return_value = SubProcess(
+            self.header + b"--\n-- Current Database: `my``db`\n--\n")
+        files = {}
+
+        self.assertTrue(
+            dump_proc.dump_split(
+                self.dump_cmd, ["my`db"], False, self.dmp_path, files=files))
+        self.assertEqual(list(files), ["my`db"])
+
+    @mock.patch("dump_proc.gen_libs.crt_file_time", crt_file_time)
+    @mock.patch("dump_proc.subprocess.Popen")
+    def test_compress(self, mock_popen):
+
+        """Function:  test_compress
+
+        Description:  Test with compression.
+
+        Arguments:
+
+        """
+
+        mock_popen.return_value = SubProcess(self.data)
+        files = {}
+
+        self.assertTrue(
+            dump_proc.dump_split(
+                self.dump_cmd, self.db_list, True, self.dmp_path,
+                comp_opts={"codec": "gzip"}, files=files))
+
+        with gzip.open(files["db2"], "rb") as f_hdlr:
+            self.assertEqual(f_hdlr.read(), self.db2)
+
+    @mock.patch("dump_proc.gen_libs.crt_file_time", crt_file_time)
+    @mock.patch("dump_proc.subprocess.Popen")
+    def test_gtid(self, mock_popen):
+
+        """Function:  test_gtid
+
+        Description:  Test the split database dump files restore the binary
+            logging of the session and only the first one sets the
+            GTID_PURGED.
+
+        Arguments:
+
+        """
+
+        header = self.header                                             \
+            + b"SET @MYSQLDUMP_TEMP_LOG_BIN = @@SESSION.SQL_LOG_BIN;\n"  \
+            + b"SET @@SESSION.SQL_LOG_BIN= 0;\n\n--\n"                    \
+            + b"-- GTID state at the beginning of the backup \n--\n\n"    \
+            + b"SET @@GLOBAL.GTID_PURGED=/*!80000 '+'*/ 'a:1-5,\n"       \
+            + b"b:1-3';\n"
+        restore = b"SET @@SESSION.SQL_LOG_BIN = @MYSQLDUMP_TEMP_LOG_BIN;\n"
+        mock_popen.return_value = SubProcess(
+            header
+            + b"\n--\n-- Current Database: `db1`\n--\n\nUSE `db1`;\n"
+            + b"\n--\n-- Current Database: `db2`\n--\n\nUSE `db2`;\n"
+            + b"\n" + restore + self.footer)
+        files = {}
+
+        self.assertTrue(
+            dump_proc.dump_split(
+                self.dump_cmd, self.db_list, False, self.dmp_path,
+                files=files))
+
+        with open(files["db1"], "rb") as f_hdlr:
+            data = f_hdlr.read()
+
+        self.assertIn(b"GTID_PURGED", data)
+        self.assertIn(b"\n" + restore, data)
+
+        with open(files["db2"], "rb") as f_hdlr:
+            data = f_hdlr.read()
+
+        self.assertNotIn(b"GTID", data)
+        self.assertIn(b"SET @@SESSION.SQL_LOG_BIN= 0;", data)
+        self.assertIn(b"\n" + restore, data)
+
+    @mock.patch("dump_proc.gen_libs.crt_file_time", crt_file_time)
+    @mock.patch("dump_proc.subprocess.Popen")
+    def test_split(self, mock_popen):
+
+        """Function:  test_split
+
+        Description:  Test splitting the dump output into database files.
+
+        Arguments:
+
+        """
+
+        mock_popen.return_value = SubProcess(self.data)
+        files = {}
+        metrics = {}
+
+        self.assertTrue(
+            dump_proc.dump_split(
+                self.dump_cmd, self.db_list, False, self.dmp_path,
+                files=files, metrics=metrics))
+        self.assertEqual(files, {"db1": self.files[0], "db2": self.files[1]})
+        self.assertEqual(list(metrics["databases"]), ["db1", "db2"])
+        self.assertEqual(metrics["databases"]["db1"]["bytes"], len(self.db1))
+        self.assertEqual(metrics["databases"]["db2"]["bytes"], len(self.db2))
+        self.assertGreater(metrics["databases"]["db1"]["raw_bytes"], 0)
+
+        with open(files["db1"], "rb") as f_hdlr:
+            self.assertEqual(f_hdlr.read(), self.db1)
+
+        with open(files["db2"], "rb") as f_hdlr:
+            self.assertEqual(f_hdlr.read(), self.db2)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        for item in self.files:
+            if os.path.isfile(item):
+                os.remove(item)
+
+
+if __name__ == "__main__":
+    unittest.main()
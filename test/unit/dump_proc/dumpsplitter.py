@@ -0,0 +1,199 @@
+# Classification (U)
+
+"""Program:  dumpsplitter.py
+
+    Description:  Unit testing of DumpSplitter in dump_proc.py.
+
+    Usage:
+        test/unit/dump_proc/dumpsplitter.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import io
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import dump_proc                                # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+def crt_file_time(fname, path, ext=""):
+
+    """Function:  crt_file_time
+
+    Description:  Stub holder for gen_libs.crt_file_time function.
+
+    Arguments:
+
+    """
+
+    return path + fname + ext
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_header
+        test_split
+        test_quoted_name
+        test_close
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.dump_cmd = ["dump_command", "--skip-dump-date", "--databases",
+                         "db1", "db2"]
+        self.dmp_path = "./test/unit/dump_proc/tmp/"
+        self.header = [b"-- MySQL dump\n", b"/*!40101 SET NAMES utf8mb4 */;\n",
+                       b"/*!40101 SET @OLD_SQL_MODE=@@SQL_MODE, SQL_MODE=''"
+                       b" */;\n"]
+        self.lines = [b"\n", b"--\n", b"-- Current Database: `db1`\n",
+                      b"--\n", b"\n", b"USE `db1`;\n", b"\n", b"--\n",
+                      b"-- Current Database: `db2`\n", b"--\n", b"\n",
+                      b"USE `db2`;\n"]
+        self.fnames = [os.path.join(self.dmp_path, "db1.sql"),
+                       os.path.join(self.dmp_path, "db2.sql"),
+                       os.path.join(self.dmp_path, "db`1.sql")]
+
+    def test_header(self):
+
+        """Function:  test_header
+
+        Description:  Test the lines before the first database are kept as
+            the dump header.
+
+        Arguments:
+
+        """
+
+        split = dump_proc.DumpSplitter(
+            self.dump_cmd, False, self.dmp_path)
+
+        for line in self.header:
+            split.write(line)
+
+        self.assertEqual(split.header, self.header)
+        self.assertEqual(split.names, {})
+        self.assertEqual(split.raw_bytes, len(b"".join(self.header)))
+
+    @mock.patch("dump_proc.gen_libs.crt_file_time", crt_file_time)
+    def test_split(self):
+
+        """Function:  test_split
+
+        Description:  Test a dump file is written for each database, each
+            with the header and all but the last with the footer.
+
+        Arguments:
+
+        """
+
+        split = dump_proc.DumpSplitter(
+            self.dump_cmd, False, self.dmp_path)
+
+        for line in self.header + self.lines:
+            split.write(line)
+
+        split.finish()
+
+        self.assertEqual(split.names, {"db1": self.fnames[0],
+                                       "db2": self.fnames[1]})
+        self.assertIsNone(split.f_name)
+
+        with io.open(self.fnames[0], "rb") as f_hdlr:
+            data = f_hdlr.read()
+
+        self.assertTrue(data.startswith(b"".join(self.header) + b"\n--\n"))
+        self.assertIn(b"USE `db1`;\n", data)
+        self.assertTrue(data.endswith(
+            b"\n/*!40101 SET SQL_MODE=@OLD_SQL_MODE */;\n\n"
+            b"-- Dump completed\n"))
+
+        with io.open(self.fnames[1], "rb") as f_hdlr:
+            data = f_hdlr.read()
+
+        self.assertTrue(data.startswith(b"".join(self.header)))
+        self.assertTrue(data.endswith(b"USE `db2`;\n"))
+        self.assertEqual(split.db_raw["db1"], len(b"".join(self.lines[3:9])))
+
+    @mock.patch("dump_proc.gen_libs.crt_file_time", crt_file_time)
+    def test_quoted_name(self):
+
+        """Function:  test_quoted_name
+
+        Description:  Test a database name with a quoted backtick.
+
+        Arguments:
+
+        """
+
+        split = dump_proc.DumpSplitter(
+            self.dump_cmd, False, self.dmp_path)
+        split.write(b"-- Current Database: `db``1`\n")
+        split.finish()
+
+        self.assertEqual(split.names, {"db`1": self.fnames[2]})
+
+    @mock.patch("dump_proc.gen_libs.crt_file_time", crt_file_time)
+    def test_close(self):
+
+        """Function:  test_close
+
+        Description:  Test the open dump file of a failed dump is closed.
+
+        Arguments:
+
+        """
+
+        split = dump_proc.DumpSplitter(
+            self.dump_cmd, False, self.dmp_path)
+        split.write(b"-- Current Database: `db1`\n")
+        f_name = split.f_name
+        split.close()
+
+        self.assertTrue(f_name.closed)
+        self.assertIsNone(split.f_name)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        for fname in self.fnames:
+            if os.path.isfile(fname):
+                os.remove(fname)
+
+
+if __name__ == "__main__":
+    unittest.main()
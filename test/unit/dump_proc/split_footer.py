@@ -0,0 +1,118 @@
+# Classification (U)
+
+"""Program:  split_footer.py
+
+    Description:  Unit testing of split_footer in dump_proc.py.
+
+    Usage:
+        test/unit/dump_proc/split_footer.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import dump_proc                                # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_dump_date
+        test_log_bin
+        test_split_footer
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.header = [
+            b"-- MySQL dump\n",
+            b"/*!40101 SET @OLD_CHARACTER_SET_CLIENT=@@CHARACTER_SET_CLIENT"
+            b" */;\n",
+            b"/*!50503 SET NAMES utf8mb4 */;\n",
+            b"/*!40103 SET @OLD_TIME_ZONE=@@TIME_ZONE */;\n",
+            b"/*!40103 SET TIME_ZONE='+00:00' */;\n",
+            b"/*!40111 SET @OLD_SQL_NOTES=@@SQL_NOTES, SQL_NOTES=0 */;\n"]
+
+    def test_dump_date(self):
+
+        """Function:  test_dump_date
+
+        Description:  Test the footer with the dump date.
+
+        Arguments:
+
+        """
+
+        self.assertRegex(
+            dump_proc.split_footer(self.header, ["dump_command"]),
+            b"\n-- Dump completed on [0-9-]+ [0-9:]+\n$")
+
+    def test_log_bin(self):
+
+        """Function:  test_log_bin
+
+        Description:  Test the binary logging of the session disabled by the
+            header is restored.
+
+        Arguments:
+
+        """
+
+        header = self.header + [
+            b"SET @MYSQLDUMP_TEMP_LOG_BIN = @@SESSION.SQL_LOG_BIN;\n",
+            b"SET @@SESSION.SQL_LOG_BIN= 0;\n"]
+
+        self.assertTrue(
+            dump_proc.split_footer(
+                header, ["dump_command", "--skip-dump-date"]).startswith(
+                    b"\nSET @@SESSION.SQL_LOG_BIN = @MYSQLDUMP_TEMP_LOG_BIN;"
+                    b"\n/*!40101 SET CHARACTER_SET_CLIENT="))
+
+    def test_split_footer(self):
+
+        """Function:  test_split_footer
+
+        Description:  Test the session settings saved by the header are
+            restored.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            dump_proc.split_footer(
+                self.header, ["dump_command", "--skip-dump-date"]),
+            b"\n/*!40101 SET CHARACTER_SET_CLIENT=@OLD_CHARACTER_SET_CLIENT"
+            b" */;\n/*!40103 SET TIME_ZONE=@OLD_TIME_ZONE */;\n"
+            b"/*!40111 SET SQL_NOTES=@OLD_SQL_NOTES */;\n\n"
+            b"-- Dump completed\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+# Classification (U)
+
+"""Program:  split_header.py
+
+    Description:  Unit testing of split_header in dump_proc.py.
+
+    Usage:
+        test/unit/dump_proc/split_header.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import dump_proc                                # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_gtid
+        test_split_header
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.header = [
+            b"-- MySQL dump\n",
+            b"/*!40101 SET @OLD_CHARACTER_SET_CLIENT=@@CHARACTER_SET_CLIENT"
+            b" */;\n",
+            b"SET @MYSQLDUMP_TEMP_LOG_BIN = @@SESSION.SQL_LOG_BIN;\n",
+            b"SET @@SESSION.SQL_LOG_BIN= 0;\n"]
+        self.gtid = [
+            b"\n", b"--\n",
+            b"-- GTID state at the beginning of the backup \n", b"--\n",
+            b"\n", b"SET @@GLOBAL.GTID_PURGED=/*!80000 '+'*/ 'a:1-5,\n",
+            b"b:1-3';\n"]
+
+    def test_no_gtid(self):
+
+        """Function:  test_no_gtid
+
+        Description:  Test a header without the GTID_PURGED statement is not
+            changed.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            dump_proc.split_header(self.header), self.header)
+
+    def test_split_header(self):
+
+        """Function:  test_split_header
+
+        Description:  Test the GTID_PURGED statement and its comment are
+            removed from the header.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            dump_proc.split_header(
+                self.header + self.gtid + [b"\n", b"-- End\n"]),
+            self.header + [b"\n", b"\n", b"-- End\n"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+# Classification (U)
+
+"""Program:  stop_proc.py
+
+    Description:  Unit testing of stop_proc in dump_proc.py.
+
+    Usage:
+        test/unit/dump_proc/stop_proc.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import subprocess
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import dump_proc                                # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_running
+        test_exited
+
+    """
+
+    def test_running(self):
+
+        """Function:  test_running
+
+        Description:  Test a running dump process is terminated and reaped.
+
+        Arguments:
+
+        """
+
+        proc = subprocess.Popen(                        # pylint:disable=R1732
+            [sys.executable, "-c", "import time; time.sleep(30)"])
+
+        code, usage = dump_proc.stop_proc(proc)
+
+        self.assertLess(code, 0)
+        self.assertEqual(usage["exit_code"], code)
+        self.assertEqual(proc.returncode, code)
+
+    def test_exited(self):
+
+        """Function:  test_exited
+
+        Description:  Test an exited dump process is reaped.
+
+        Arguments:
+
+        """
+
+        proc = subprocess.Popen(                        # pylint:disable=R1732
+            [sys.executable, "-c", "exit(3)"])
+        proc.wait()
+
+        self.assertEqual(dump_proc.stop_proc(proc)[0], 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,16 @@
+#!/bin/bash
+# Unit testing program for the program module.
+# This will run all the units tests for this program.
+# Will need to run this from the base directory where the module file
+#   is located at.
+
+echo ""
+echo "Unit testing..."
+/usr/bin/python test/unit/dump_proc/dump_metrics.py
+/usr/bin/python test/unit/dump_proc/dump_run.py
+/usr/bin/python test/unit/dump_proc/dump_split.py
+/usr/bin/python test/unit/dump_proc/dumpsplitter.py
+/usr/bin/python test/unit/dump_proc/split_footer.py
+/usr/bin/python test/unit/dump_proc/split_header.py
+/usr/bin/python test/unit/dump_proc/stop_proc.py
+/usr/bin/python test/unit/dump_proc/wait_proc.py
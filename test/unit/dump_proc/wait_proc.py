@@ -0,0 +1,103 @@
+# Classification (U)
+
+"""Program:  wait_proc.py
+
+    Description:  Unit testing of wait_proc in dump_proc.py.
+
+    Usage:
+        test/unit/dump_proc/wait_proc.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import subprocess
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import dump_proc                                # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_exit_code
+        test_failed
+        test_reaped
+
+    """
+
+    def test_exit_code(self):
+
+        """Function:  test_exit_code
+
+        Description:  Test the exit code and resource usage of the process.
+
+        Arguments:
+
+        """
+
+        proc = subprocess.Popen(                        # pylint:disable=R1732
+            [sys.executable, "-c", "pass"])
+
+        code, usage = dump_proc.wait_proc(proc)
+
+        self.assertEqual(code, 0)
+        self.assertEqual(proc.returncode, 0)
+        self.assertEqual(
+            sorted(usage), ["cpu_sys", "cpu_user", "exit_code", "maxrss_kb"])
+        self.assertGreater(usage["maxrss_kb"], 0)
+
+    def test_failed(self):
+
+        """Function:  test_failed
+
+        Description:  Test with a process exiting with an error.
+
+        Arguments:
+
+        """
+
+        proc = subprocess.Popen(                        # pylint:disable=R1732
+            [sys.executable, "-c", "raise SystemExit(3)"])
+
+        code, usage = dump_proc.wait_proc(proc)
+
+        self.assertEqual(code, 3)
+        self.assertEqual(usage["exit_code"], 3)
+
+    @mock.patch("dump_proc.os.wait4",
+                mock.Mock(side_effect=ChildProcessError))
+    def test_reaped(self):
+
+        """Function:  test_reaped
+
+        Description:  Test with a process already reaped.
+
+        Arguments:
+
+        """
+
+        proc = mock.Mock()
+        proc.wait.return_value = 0
+
+        self.assertEqual(dump_proc.wait_proc(proc),
+                         (0, {"exit_code": 0}))
+
+
+if __name__ == "__main__":
+    unittest.main()
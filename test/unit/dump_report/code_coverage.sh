@@ -0,0 +1,20 @@
+#!/bin/bash
+# Unit test code coverage for program module.
+# This will run the Python code coverage module against all unit test modules.
+# This will show the amount of code that was tested and which lines of code
+#   that was skipped during the test.
+
+coverage erase
+
+echo ""
+echo "Running unit test modules in conjunction with coverage"
+coverage run -a --source=dump_report test/unit/dump_report/crt_manifest.py
+coverage run -a --source=dump_report test/unit/dump_report/crt_prom.py
+coverage run -a --source=dump_report test/unit/dump_report/prom_labels.py
+coverage run -a --source=dump_report test/unit/dump_report/save_manifest.py
+coverage run -a --source=dump_report test/unit/dump_report/save_prom.py
+
+echo ""
+echo "Producing code coverage report"
+coverage combine
+coverage report -m
@@ -0,0 +1,211 @@
+# Classification (U)
+
+"""Program:  crt_manifest.py
+
+    Description:  Unit testing of crt_manifest in dump_report.py.
+
+    Usage:
+        test/unit/dump_report/crt_manifest.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import dump_report                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_totals
+        test_no_raw_bytes
+        test_binlog
+        test_checksums
+        test_failed
+        test_not_started
+        test_watchdog
+        test_load
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.run = "20260101_000000"
+        self.metrics = {
+            "db1": {"raw_bytes": 3145728, "bytes": 1048576},
+            "db2": {"raw_bytes": 1048576, "bytes": 524288}}
+
+    @mock.patch("dump_report.time.time", mock.Mock(return_value=104.0))
+    def test_totals(self):
+
+        """Function:  test_totals
+
+        Description:  Test the totals and throughput of the run.
+
+        Arguments:
+
+        """
+
+        manifest = dump_report.crt_manifest(self.run, 100.0, self.metrics)
+
+        self.assertEqual(manifest["Run"], self.run)
+        self.assertEqual(manifest["Seconds"], 4.0)
+        self.assertEqual(manifest["Raw_Bytes"], 4194304)
+        self.assertEqual(manifest["Bytes"], 1572864)
+        self.assertEqual(manifest["MB_Per_Sec"], 1.0)
+        self.assertEqual(manifest["Dumps"], self.metrics)
+        self.assertIsNone(manifest["Binlog"])
+        self.assertNotIn("Checksums", manifest)
+
+    @mock.patch("dump_report.time.time", mock.Mock(return_value=102.0))
+    def test_no_raw_bytes(self):
+
+        """Function:  test_no_raw_bytes
+
+        Description:  Test the throughput is based on the file sizes if the
+            raw bytes are not known.
+
+        Arguments:
+
+        """
+
+        manifest = dump_report.crt_manifest(
+            self.run, 100.0, {"db1": {"raw_bytes": None, "bytes": 2097152}})
+
+        self.assertEqual(manifest["Raw_Bytes"], 0)
+        self.assertEqual(manifest["MB_Per_Sec"], 1.0)
+
+    def test_binlog(self):
+
+        """Function:  test_binlog
+
+        Description:  Test with the binary log position of the run.
+
+        Arguments:
+
+        """
+
+        binlog = {"File": "binlog.000001", "Position": 4}
+
+        self.assertEqual(
+            dump_report.crt_manifest(self.run, 100.0, {},
+                                       binlog=binlog)["Binlog"], binlog)
+
+    def test_checksums(self):
+
+        """Function:  test_checksums
+
+        Description:  Test the checksums are added to the manifest.
+
+        Arguments:
+
+        """
+
+        digests = {"db1.sql": {"algo": "sha256"}}
+
+        manifest = dump_report.crt_manifest(
+            self.run, 100.0, {}, hash_opts={"digests": digests})
+
+        self.assertEqual(manifest["Checksums"], digests)
+
+    def test_failed(self):
+
+        """Function:  test_failed
+
+        Description:  Test the failed dumps are added to the manifest.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            dump_report.crt_manifest(self.run, 100.0, self.metrics,
+                                       failed=["db2"])["Failed"], ["db2"])
+
+    def test_not_started(self):
+
+        """Function:  test_not_started
+
+        Description:  Test the dumps not started are not added to the failed
+            dumps.
+
+        Arguments:
+
+        """
+
+        self.metrics["db3"] = {"status": False, "attempts": 0,
+                               "stopped": True}
+
+        manifest = dump_report.crt_manifest(
+            self.run, 100.0, self.metrics, failed=["db2", "db3"])
+
+        self.assertEqual(manifest["Failed"], ["db2"])
+        self.assertEqual(manifest["Not_Started"], ["db3"])
+
+    def test_watchdog(self):
+
+        """Function:  test_watchdog
+
+        Description:  Test the watchdog events are added to the manifest.
+
+        Arguments:
+
+        """
+
+        watchdog = mock.Mock()
+        watchdog.events = [{"unit": "db1", "reason": "stall"}]
+
+        self.assertEqual(
+            dump_report.crt_manifest(self.run, 100.0, self.metrics,
+                                       watchdog=watchdog)["Watchdog"],
+            watchdog.events)
+
+    def test_load(self):
+
+        """Function:  test_load
+
+        Description:  Test the load controller events are added to the
+            manifest.
+
+        Arguments:
+
+        """
+
+        load = mock.Mock()
+        load.events = [{"time": "2026-01-01T00:00:00", "workers": 2,
+                        "reasons": []}]
+
+        self.assertEqual(
+            dump_report.crt_manifest(self.run, 100.0, self.metrics,
+                                       load=load)["Load"],
+            load.events)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,223 @@
+# Classification (U)
+
+"""Program:  crt_prom.py
+
+    Description:  Unit testing of crt_prom in dump_report.py.
+
+    Usage:
+        test/unit/dump_report/crt_prom.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import datetime
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import dump_report                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_database_totals
+        test_split_unit
+        test_no_database
+        test_run_metrics
+        test_failed
+        test_not_started
+        test_never_succeeded
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.manifest = {
+            "End": "2026-01-01T01:00:00", "Seconds": 10.0, "Raw_Bytes": 3000,
+            "Bytes": 1000, "Failed": [],
+            "Dumps": {
+                "db1:schema": {"raw_bytes": 100, "bytes": 50, "attempts": 1,
+                               "queue_seconds": 0.5, "db": "db1"},
+                "db.1.tbl1#0001": {"raw_bytes": 1900, "bytes": 500,
+                                   "attempts": 2, "queue_seconds": 1.0,
+                                   "db": "db1"},
+                "db2": {"raw_bytes": None, "bytes": 450, "attempts": 1,
+                        "db": "db2"}}}
+        self.end = datetime.datetime(2026, 1, 1, 1, 0, 0).timestamp()
+
+    def test_database_totals(self):
+
+        """Function:  test_database_totals
+
+        Description:  Test the units are summed for each database.
+
+        Arguments:
+
+        """
+
+        data = dump_report.crt_prom(self.manifest, "srv1")
+
+        self.assertIn(
+            'mysql_db_dump_raw_bytes{server="srv1",database="db1"} 2000\n',
+            data)
+        self.assertIn(
+            'mysql_db_dump_raw_bytes{server="srv1",database="db2"} 450\n',
+            data)
+        self.assertIn(
+            'mysql_db_dump_file_bytes{server="srv1",database="db1"} 550\n',
+            data)
+        self.assertIn('mysql_db_dump_queue_wait_seconds{server="srv1",'
+                      'database="db1"} 1.5\n', data)
+
+    def test_split_unit(self):
+
+        """Function:  test_split_unit
+
+        Description:  Test the databases of a split unit.
+
+        Arguments:
+
+        """
+
+        self.manifest["Dumps"] = {"batch_0001": {
+            "raw_bytes": 300, "bytes": 30, "attempts": 1,
+            "queue_seconds": 2.0,
+            "databases": {"db3": {"raw_bytes": 100, "bytes": 10},
+                          "db4": {"raw_bytes": 200, "bytes": 20}}}}
+
+        data = dump_report.crt_prom(self.manifest, "srv1")
+
+        self.assertIn(
+            'mysql_db_dump_raw_bytes{server="srv1",database="db3"} 100\n',
+            data)
+        self.assertIn(
+            'mysql_db_dump_file_bytes{server="srv1",database="db4"} 20\n',
+            data)
+        self.assertIn('mysql_db_dump_queue_wait_seconds{server="srv1",'
+                      'database="db4"} 2.0\n', data)
+        self.assertNotIn('database="batch_0001"', data)
+
+    def test_no_database(self):
+
+        """Function:  test_no_database
+
+        Description:  Test a unit without a database is labeled with the
+            unit name.
+
+        Arguments:
+
+        """
+
+        self.manifest["Dumps"] = {"All_Databases": {"bytes": 30}}
+
+        self.assertIn('mysql_db_dump_file_bytes{server="srv1",'
+                      'database="All_Databases"} 30\n',
+                      dump_report.crt_prom(self.manifest, "srv1"))
+
+    def test_run_metrics(self):
+
+        """Function:  test_run_metrics
+
+        Description:  Test the metrics of the run.
+
+        Arguments:
+
+        """
+
+        data = dump_report.crt_prom(self.manifest, "srv1")
+
+        self.assertIn("# TYPE mysql_db_dump_duration_seconds gauge\n", data)
+        self.assertIn('mysql_db_dump_duration_seconds{server="srv1"} 10.0\n',
+                      data)
+        self.assertIn('mysql_db_dump_throughput_bytes_per_second'
+                      '{server="srv1"} 300.0\n', data)
+        self.assertIn('mysql_db_dump_retries{server="srv1"} 1\n', data)
+        self.assertIn('mysql_db_dump_last_run_success{server="srv1"} 1\n',
+                      data)
+        self.assertIn(f'mysql_db_dump_last_success_timestamp_seconds'
+                      f'{{server="srv1"}} {self.end}\n', data)
+
+    def test_failed(self):
+
+        """Function:  test_failed
+
+        Description:  Test the last success time is kept if a dump failed.
+
+        Arguments:
+
+        """
+
+        self.manifest["Failed"] = ["db2"]
+
+        data = dump_report.crt_prom(self.manifest, "srv1", 1000.0)
+
+        self.assertIn('mysql_db_dump_failures{server="srv1"} 1\n', data)
+        self.assertIn('mysql_db_dump_last_run_success{server="srv1"} 0\n',
+                      data)
+        self.assertIn('mysql_db_dump_last_success_timestamp_seconds'
+                      '{server="srv1"} 1000.0\n', data)
+
+    def test_not_started(self):
+
+        """Function:  test_not_started
+
+        Description:  Test the last success time is kept if a dump was not
+            started.
+
+        Arguments:
+
+        """
+
+        self.manifest["Not_Started"] = ["db2"]
+
+        data = dump_report.crt_prom(self.manifest, "srv1", 1000.0)
+
+        self.assertIn('mysql_db_dump_failures{server="srv1"} 0\n', data)
+        self.assertIn('mysql_db_dump_not_started{server="srv1"} 1\n', data)
+        self.assertIn('mysql_db_dump_last_run_success{server="srv1"} 0\n',
+                      data)
+        self.assertIn('mysql_db_dump_last_success_timestamp_seconds'
+                      '{server="srv1"} 1000.0\n', data)
+
+    def test_never_succeeded(self):
+
+        """Function:  test_never_succeeded
+
+        Description:  Test with a failed dump and no previous success.
+
+        Arguments:
+
+        """
+
+        self.manifest["Failed"] = ["db2"]
+
+        self.assertNotIn(
+            "last_success_timestamp_seconds",
+            dump_report.crt_prom(self.manifest, "srv1"))
+
+
+if __name__ == "__main__":
+    unittest.main()
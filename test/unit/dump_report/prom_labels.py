@@ -0,0 +1,72 @@
+# Classification (U)
+
+"""Program:  prom_labels.py
+
+    Description:  Unit testing of prom_labels in dump_report.py.
+
+    Usage:
+        test/unit/dump_report/prom_labels.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import dump_report                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_escape
+        test_prom_labels
+
+    """
+
+    def test_escape(self):
+
+        """Function:  test_escape
+
+        Description:  Test with a label value containing a quote, a
+            backslash and a newline.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            dump_report.prom_labels({"server": 'a"b\\c\nd'}),
+            '{server="a\\"b\\\\c\\nd"}')
+
+    def test_prom_labels(self):
+
+        """Function:  test_prom_labels
+
+        Description:  Test with several labels.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            dump_report.prom_labels({"server": "srv1", "database": "db1"}),
+            '{server="srv1",database="db1"}')
+
+
+if __name__ == "__main__":
+    unittest.main()
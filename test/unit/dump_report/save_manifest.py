@@ -0,0 +1,96 @@
+# Classification (U)
+
+"""Program:  save_manifest.py
+
+    Description:  Unit testing of save_manifest in dump_report.py.
+
+    Usage:
+        test/unit/dump_report/save_manifest.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import json
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import dump_report                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_save_manifest
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.dmp_path = "./test/unit/dump_report/tmp/"
+        self.fname = self.dmp_path + "Manifest_20260101_000000.json"
+        self.manifest = {"Run": "20260101_000000",
+                         "Checksums": {"db1.sql": {"algo": "sha256"}}}
+
+    @mock.patch("dump_report.gen_libs.crt_file_time")
+    def test_save_manifest(self, mock_fname):
+
+        """Function:  test_save_manifest
+
+        Description:  Test saving the manifest to the dump directory.
+
+        Arguments:
+
+        """
+
+        mock_fname.return_value = self.fname
+
+        self.assertEqual(
+            dump_report.save_manifest(self.dmp_path, self.manifest),
+            self.fname)
+        mock_fname.assert_called_once_with("Manifest", self.dmp_path,
+                                           ".json")
+
+        with open(self.fname, mode="r", encoding="UTF-8") as f_hdlr:
+            self.assertEqual(json.load(f_hdlr), self.manifest)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        if os.path.isfile(self.fname):
+            os.remove(self.fname)
+
+
+if __name__ == "__main__":
+    unittest.main()
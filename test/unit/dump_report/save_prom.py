@@ -0,0 +1,115 @@
+# Classification (U)
+
+"""Program:  save_prom.py
+
+    Description:  Unit testing of save_prom in dump_report.py.
+
+    Usage:
+        test/unit/dump_report/save_prom.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import datetime
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import dump_report                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_save_prom
+        test_last_success
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.prom_dir = "./test/unit/dump_report/tmp"
+        self.fname = os.path.join(self.prom_dir, "mysql_db_dump_srv_1.prom")
+        self.manifest = {"End": "2026-01-01T01:00:00", "Seconds": 10.0,
+                         "Failed": [], "Dumps": {}}
+
+    def test_save_prom(self):
+
+        """Function:  test_save_prom
+
+        Description:  Test saving the metrics to the textfile directory.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            dump_report.save_prom(self.prom_dir, self.manifest, "srv-1"),
+            self.fname)
+        self.assertFalse(os.path.exists(self.fname + ".tmp"))
+
+        with open(self.fname, mode="r", encoding="UTF-8") as f_hdlr:
+            self.assertEqual(
+                f_hdlr.read(),
+                dump_report.crt_prom(self.manifest, "srv-1"))
+
+    def test_last_success(self):
+
+        """Function:  test_last_success
+
+        Description:  Test the last success time of the previous file is
+            kept if a dump failed.
+
+        Arguments:
+
+        """
+
+        dump_report.save_prom(self.prom_dir, self.manifest, "srv-1")
+        self.manifest["End"] = "2026-01-02T01:00:00"
+        self.manifest["Failed"] = ["db1"]
+        dump_report.save_prom(self.prom_dir, self.manifest, "srv-1")
+        end = datetime.datetime(2026, 1, 1, 1, 0, 0).timestamp()
+
+        with open(self.fname, mode="r", encoding="UTF-8") as f_hdlr:
+            self.assertIn(f'mysql_db_dump_last_success_timestamp_seconds'
+                          f'{{server="srv-1"}} {end}\n', f_hdlr.read())
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        if os.path.isfile(self.fname):
+            os.remove(self.fname)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,13 @@
+#!/bin/bash
+# Unit testing program for the program module.
+# This will run all the units tests for this program.
+# Will need to run this from the base directory where the module file
+#   is located at.
+
+echo ""
+echo "Unit testing..."
+/usr/bin/python test/unit/dump_report/crt_manifest.py
+/usr/bin/python test/unit/dump_report/crt_prom.py
+/usr/bin/python test/unit/dump_report/prom_labels.py
+/usr/bin/python test/unit/dump_report/save_manifest.py
+/usr/bin/python test/unit/dump_report/save_prom.py
@@ -0,0 +1,26 @@
+#!/bin/bash
+# Unit test code coverage for program module.
+# This will run the Python code coverage module against all unit test modules.
+# This will show the amount of code that was tested and which lines of code
+#   that was skipped during the test.
+
+coverage erase
+
+echo ""
+echo "Running unit test modules in conjunction with coverage"
+coverage run -a --source=dump_sched test/unit/dump_sched/dump_attempt.py
+coverage run -a --source=dump_sched test/unit/dump_sched/dump_consistent.py
+coverage run -a --source=dump_sched test/unit/dump_sched/dump_db.py
+coverage run -a --source=dump_sched test/unit/dump_sched/dump_pool.py
+coverage run -a --source=dump_sched test/unit/dump_sched/dump_retry.py
+coverage run -a --source=dump_sched test/unit/dump_sched/dump_seq.py
+coverage run -a --source=dump_sched test/unit/dump_sched/dump_unit.py
+coverage run -a --source=dump_sched test/unit/dump_sched/plan_units.py
+coverage run -a --source=dump_sched test/unit/dump_sched/publish_dump.py
+coverage run -a --source=dump_sched test/unit/dump_sched/run_unit.py
+coverage run -a --source=dump_sched test/unit/dump_sched/sync_snapshot.py
+
+echo ""
+echo "Producing code coverage report"
+coverage combine
+coverage report -m
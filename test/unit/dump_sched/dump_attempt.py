@@ -0,0 +1,180 @@
+# Classification (U)
+
+"""Program:  dump_attempt.py
+
+    Description:  Unit testing of dump_attempt in dump_sched.py.
+
+    Usage:
+        test/unit/dump_sched/dump_attempt.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import dump_sched                               # pylint:disable=E0401,C0413
+import dump_watch                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_dump_run
+        test_dump_failed
+        test_engine
+        test_split
+        test_watchdog
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.dump_cmd = ["dump_command", "db1"]
+        self.unit = {"name": "db1", "args": ["db1"], "file": "db1"}
+        self.unit2 = {"name": "batch_0001",
+                      "args": ["--databases", "db1", "db2"],
+                      "file": "Batch_0001", "split": ["db1", "db2"]}
+        self.dmp_file = "./test/unit/dump_sched/tmp/.partial_1/db1.sql"
+        self.procs = []
+
+    @mock.patch("dump_proc.dump_run")
+    def test_dump_run(self, mock_run):
+
+        """Function:  test_dump_run
+
+        Description:  Test a unit dumped with the dump command.
+
+        Arguments:
+
+        """
+
+        mock_run.return_value = True
+        files = {}
+
+        self.assertEqual(
+            dump_sched.dump_attempt(
+                self.dump_cmd, self.unit, False, self.dmp_file, files=files,
+                procs=self.procs), (True, {}))
+        self.assertEqual(files, {"db1": self.dmp_file})
+        self.assertIs(mock_run.call_args[1]["procs"], self.procs)
+
+    @mock.patch("dump_proc.dump_run", mock.Mock(return_value=False))
+    def test_dump_failed(self):
+
+        """Function:  test_dump_failed
+
+        Description:  Test a failed dump adds no dump file.
+
+        Arguments:
+
+        """
+
+        files = {}
+
+        self.assertEqual(
+            dump_sched.dump_attempt(
+                self.dump_cmd, self.unit, False, self.dmp_file, files=files),
+            (False, {}))
+        self.assertEqual(files, {})
+
+    def test_engine(self):
+
+        """Function:  test_engine
+
+        Description:  Test a unit dumped with the dump engine.
+
+        Arguments:
+
+        """
+
+        engine = mock.Mock()
+        engine.run.return_value = True
+        engine.fname.return_value = self.dmp_file + ".gz"
+        files = {}
+
+        self.assertEqual(
+            dump_sched.dump_attempt(
+                self.dump_cmd, self.unit, False, self.dmp_file, files=files,
+                engine=engine), (True, {}))
+        self.assertEqual(files, {"db1": self.dmp_file + ".gz"})
+        self.assertEqual(engine.run.call_args[0][:2],
+                         (self.unit, self.dmp_file))
+
+    @mock.patch("dump_proc.dump_split")
+    def test_split(self, mock_split):
+
+        """Function:  test_split
+
+        Description:  Test a batch unit is split into a dump file for each
+            database in the directory of the dump file.
+
+        Arguments:
+
+        """
+
+        mock_split.return_value = True
+        files = {}
+
+        self.assertEqual(
+            dump_sched.dump_attempt(
+                self.dump_cmd, self.unit2, False, self.dmp_file, files=files),
+            (True, {}))
+        self.assertEqual(mock_split.call_args[0][1:],
+                         (["db1", "db2"], False,
+                          "./test/unit/dump_sched/tmp/.partial_1/"))
+        self.assertIs(mock_split.call_args[1]["files"], files)
+
+    @mock.patch("dump_proc.dump_run", mock.Mock(return_value=False))
+    def test_watchdog(self):
+
+        """Function:  test_watchdog
+
+        Description:  Test the reason of a unit killed by the watchdog is
+            added to the dump metrics.
+
+        Arguments:
+
+        """
+
+        watchdog = mock.Mock()
+        watch = dump_watch.UnitWatch("db1")
+        watch.reason = "budget"
+        watchdog.watch.return_value = watch
+        watchdog.unwatch.return_value = True
+
+        self.assertEqual(
+            dump_sched.dump_attempt(
+                self.dump_cmd, self.unit, False, self.dmp_file,
+                procs=self.procs, watchdog=watchdog),
+            (False, {"watchdog": "budget"}))
+        watchdog.watch.assert_called_once_with("db1", self.procs)
+        watchdog.unwatch.assert_called_once_with(watch)
+
+
+if __name__ == "__main__":
+    unittest.main()
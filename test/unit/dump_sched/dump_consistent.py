@@ -0,0 +1,314 @@
+# Classification (U)
+
+"""Program:  dump_consistent.py
+
+    Description:  Unit testing of dump_consistent in dump_sched.py.
+
+    Usage:
+        test/unit/dump_sched/dump_consistent.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import json
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import dump_sched                               # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Proc():                                           # pylint:disable=R0903
+
+    """Class:  Proc
+
+    Description:  Class stub holder for subprocess.Popen class.
+
+    Methods:
+        __init__
+        poll
+        terminate
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.pid = 101
+        self.terminated = False
+
+    def poll(self):
+
+        """Method:  poll
+
+        Description:  Stub method holder for subprocess.Popen.poll.
+
+        Arguments:
+
+        """
+
+        return None if not self.terminated else -15
+
+    def terminate(self):
+
+        """Method:  terminate
+
+        Description:  Stub method holder for subprocess.Popen.terminate.
+
+        Arguments:
+
+        """
+
+        self.terminated = True
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        cmd_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmds = []
+
+    def cmd_sql(self, cmd):
+
+        """Method:  cmd_sql
+
+        Description:  Stub method holder for mysql_class.Server.cmd_sql.
+
+        Arguments:
+
+        """
+
+        self.cmds.append(cmd)
+
+
+def dump_unit(dump_cmd, unit, compress, dmp_path, **kwargs):
+
+    """Function:  dump_unit
+
+    Description:  Stub holder for dump_sched.dump_unit function.
+
+    Arguments:
+
+    """
+
+    proc = Proc()
+    kwargs["procs"].append(proc)
+    kwargs["metrics"][unit["name"]] = {}
+
+    return unit["name"], bool(dump_cmd and dmp_path and not compress)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_not_synced
+        test_cancel
+        test_synced
+        test_metrics
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+        self.dump_cmd = ["dump_command", "params"]
+        self.units = [
+            {"name": "snapshot_01",
+             "args": ["--single-transaction", "--databases", "db1"],
+             "file": "Snapshot_01"},
+            {"name": "snapshot_02",
+             "args": ["--single-transaction", "--databases", "db2", "db3"],
+             "file": "Snapshot_02"}]
+        self.dmp_path = "./test/unit/dump_sched/tmp/"
+        self.coords = [{"File": "binlog.000001", "Position": 154,
+                        "Executed_Gtid_Set": ""}]
+        self.results = {"snapshot_01": True, "snapshot_02": True}
+        self.results2 = {"snapshot_01": False, "snapshot_02": False}
+        self.cmds = ["flush tables with read lock", "unlock tables"]
+
+    @mock.patch("dump_sched.mysql_class.show_master_stat")
+    @mock.patch("dump_sched.sync_snapshot", mock.Mock(return_value=False))
+    @mock.patch("dump_sched.dump_unit", dump_unit)
+    def test_not_synced(self, mock_stat):
+
+        """Function:  test_not_synced
+
+        Description:  Test with the snapshots failing to start.
+
+        Arguments:
+
+        """
+
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                dump_sched.dump_consistent(
+                    self.server, self.dump_cmd, self.units, False,
+                    self.dmp_path), self.results2)
+
+        self.assertEqual(self.server.cmds, self.cmds)
+        mock_stat.assert_not_called()
+        self.assertEqual(
+            gen_libs.filename_search(self.dmp_path, "Snapshot.*.json"), [])
+
+    @mock.patch("dump_sched.mysql_class.show_master_stat",
+                mock.Mock(return_value=[]))
+    @mock.patch("dump_sched.dump_unit")
+    @mock.patch("dump_sched.sync_snapshot")
+    def test_cancel(self, mock_sync, mock_unit):
+
+        """Function:  test_cancel
+
+        Description:  Test the units are cancelled and released when the
+            snapshots fail to start and only released when they start.
+
+        Arguments:
+
+        """
+
+        mock_sync.side_effect = [False, True]
+        mock_unit.side_effect = lambda dump_cmd, unit, *args, **kwargs: (
+            unit["name"], True)
+
+        with gen_libs.no_std_out():
+            dump_sched.dump_consistent(
+                self.server, self.dump_cmd, self.units, False, self.dmp_path)
+
+        kwargs = mock_unit.call_args[1]
+        self.assertTrue(kwargs["sync"].is_set())
+        self.assertTrue(kwargs["cancel"].is_set())
+
+        with gen_libs.no_std_out():
+            dump_sched.dump_consistent(
+                self.server, self.dump_cmd, self.units, False, self.dmp_path)
+
+        kwargs = mock_unit.call_args[1]
+        self.assertTrue(kwargs["sync"].is_set())
+        self.assertFalse(kwargs["cancel"].is_set())
+
+    @mock.patch("dump_sched.mysql_class.show_master_stat")
+    @mock.patch("dump_sched.sync_snapshot", mock.Mock(return_value=True))
+    @mock.patch("dump_sched.dump_unit", dump_unit)
+    def test_synced(self, mock_stat):
+
+        """Function:  test_synced
+
+        Description:  Test with all snapshots started.
+
+        Arguments:
+
+        """
+
+        mock_stat.return_value = self.coords
+
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                dump_sched.dump_consistent(
+                    self.server, self.dump_cmd, self.units, False,
+                    self.dmp_path), self.results)
+
+        self.assertEqual(self.server.cmds, self.cmds)
+        file_list = gen_libs.filename_search(
+            self.dmp_path, "Snapshot.*.json", add_path=True)
+
+        with open(file_list[0], mode="r", encoding="UTF-8") as f_hdlr:
+            data = json.load(f_hdlr)
+
+        self.assertEqual(data["Units"]["snapshot_02"], ["db2", "db3"])
+        self.assertEqual(data["Coordinates"], self.coords[0])
+
+    @mock.patch("dump_sched.mysql_class.show_master_stat")
+    @mock.patch("dump_sched.sync_snapshot", mock.Mock(return_value=True))
+    @mock.patch("dump_sched.dump_unit", dump_unit)
+    def test_metrics(self, mock_stat):
+
+        """Function:  test_metrics
+
+        Description:  Test the coordinates are added to the dump metrics of
+            each unit.
+
+        Arguments:
+
+        """
+
+        mock_stat.return_value = self.coords
+        metrics = {}
+
+        with gen_libs.no_std_out():
+            dump_sched.dump_consistent(
+                self.server, self.dump_cmd, self.units, False, self.dmp_path,
+                metrics=metrics)
+
+        self.assertEqual(
+            metrics, {"snapshot_01": {"coordinates": self.coords[0]},
+                      "snapshot_02": {"coordinates": self.coords[0]}})
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        file_list = gen_libs.filename_search(
+            self.dmp_path, "Snapshot.*.json", add_path=True)
+
+        for item in file_list:
+            if os.path.isfile(item):
+                os.remove(item)
+
+
+if __name__ == "__main__":
+    unittest.main()
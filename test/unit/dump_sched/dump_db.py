@@ -0,0 +1,698 @@
+# Classification (U)
+
+"""Program:  dump_db.py
+
+    Description:  Unit testing of dump_db in dump_sched.py.
+
+    Usage:
+        test/unit/dump_sched/dump_db.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import dump_sched                               # pylint:disable=E0401,C0413
+import dump_stream                              # pylint:disable=E0401,C0413
+import dump_units                               # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Mail():
+
+    """Class:  Mail
+
+    Description:  Class stub holder for gen_class.Mail class.
+
+    Methods:
+        __init__
+        add_2_msg
+        send_mail
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.data = None
+
+    def add_2_msg(self, data):
+
+        """Method:  add_2_msg
+
+        Description:  Stub method holder for Mail.add_2_msg.
+
+        Arguments:
+            (input) data
+
+        """
+
+        self.data = data
+
+        return True
+
+    def send_mail(self, use_mailx=False):
+
+        """Method:  send_mail
+
+        Description:  Stub method holder for Mail.send_mail.
+
+        Arguments:
+            (input) use_mailx
+
+        """
+
+        status = True
+
+        if use_mailx:
+            status = True
+
+        return status
+
+
+class DumpRun():                                        # pylint:disable=R0903
+
+    """Class:  DumpRun
+
+    Description:  Stub holder for dump_proc.dump_run function.  Writes
+        the dump file of the successful dumps.
+
+    Methods:
+        __init__
+        __call__
+
+    """
+
+    def __init__(self, status=None):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) status -> List of the status of each dump, the last
+                status is used for the remaining dumps
+
+        """
+
+        self.status = list(status or [True])
+
+    def __call__(self, dump_cmd, dmp_file, compress, **kwargs):
+
+        """Method:  __call__
+
+        Description:  Stub holder for dump_proc.dump_run function.
+
+        Arguments:
+
+        """
+
+        status = self.status.pop(0) if len(self.status) > 1              \
+            else self.status[0]
+
+        if status:
+            with open(dump_stream.dump_fname(
+                    dmp_file, compress, kwargs.get("comp_opts", {})),
+                      "wb") as f_hdlr:
+                f_hdlr.write(b"Dump")
+
+        return status and bool(dump_cmd)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_workers
+        test_tbl_size
+        test_snapshot
+        test_batch_size
+        test_files
+        test_units
+        test_engine
+        test_resume
+        test_resume_batch
+        test_partial_removed
+        test_write_opts
+        test_write_opts_single
+        test_email_mailx
+        test_email_no_mailx
+        test_email_single_line
+        test_email_multiple_lines
+        test_email_empty
+        test_email
+        test_db_list_w_option
+        test_all_dbs_w_option
+        test_db_list2
+        test_db_list
+        test_all_dbs
+        test_dump_db
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.mail = Mail()
+        self.dump_cmd = ["dump_command", "params"]
+        self.dump_cmd2 = ["--all-databases"]
+        self.db_list = []
+        self.db_list2 = ["db1"]
+        self.db_list3 = ["db1", "db2"]
+        self.dmp_path = "./test/unit/dump_sched/tmp/"
+        self.err_sup = True
+        self.filelist = ["Line 1", "Line 2"]
+        self.filelist2 = ["Line 1"]
+
+    @mock.patch("dump_sched.dump_pool")
+    def test_workers(self, mock_pool):
+
+        """Function:  test_workers
+
+        Description:  Test with multiple workers.
+
+        Arguments:
+
+        """
+
+        mock_pool.return_value = {"db1": True, "db2": True}
+
+        self.assertFalse(dump_sched.dump_db(
+            self.dump_cmd, self.db_list3, False, self.dmp_path, workers=2))
+        mock_pool.assert_called_once_with(
+            self.dump_cmd,
+            [{"name": "db1", "args": ["db1"], "file": "db1", "db": "db1"},
+             {"name": "db2", "args": ["db2"], "file": "db2", "db": "db2"}],
+            False, self.dmp_path, 2, errfile=None, comp_opts={}, files={},
+            engine=None, write_opts=None, hash_opts=None,
+            metrics={}, retries=0, journal=None, stop=None, procs=[],
+            watchdog=None, load=None)
+
+    @mock.patch("dump_sched.dump_pool")
+    def test_tbl_size(self, mock_pool):
+
+        """Function:  test_tbl_size
+
+        Description:  Test with table sizes passed and a single worker.
+
+        Arguments:
+
+        """
+
+        mock_pool.return_value = {}
+
+        self.assertFalse(dump_sched.dump_db(
+            self.dump_cmd, self.db_list2, False, self.dmp_path,
+            tbl_size={"db1": {"t1": 100}}))
+        self.assertEqual(
+            [unit["name"] for unit in mock_pool.call_args[0][1]],
+            ["db1:schema", "db1.t1"])
+
+    @mock.patch("dump_sched.dump_consistent")
+    def test_snapshot(self, mock_cons):
+
+        """Function:  test_snapshot
+
+        Description:  Test with a consistent snapshot.
+
+        Arguments:
+
+        """
+
+        mock_cons.return_value = {"snapshot_01": True}
+
+        self.assertFalse(dump_sched.dump_db(
+            self.dump_cmd, self.db_list3, False, self.dmp_path, workers=1,
+            snapshot="Server", db_size={"db1": 10, "db2": 20}))
+        mock_cons.assert_called_once_with(
+            "Server", self.dump_cmd,
+            [{"name": "snapshot_01",
+              "args": ["--single-transaction", "--databases", "db2", "db1"],
+              "file": "Snapshot_01", "split": ["db2", "db1"]}],
+            False, self.dmp_path, errfile=None, comp_opts={},
+            write_opts=None, hash_opts=None, metrics={}, watchdog=None)
+
+    @mock.patch("dump_sched.dump_pool")
+    def test_batch_size(self, mock_pool):
+
+        """Function:  test_batch_size
+
+        Description:  Test with the small databases batched.
+
+        Arguments:
+
+        """
+
+        mock_pool.return_value = {"batch_0001": True}
+
+        self.assertFalse(dump_sched.dump_db(
+            self.dump_cmd, self.db_list3, False, self.dmp_path,
+            batch_size=100, db_size={"db1": 10, "db2": 20}))
+        self.assertEqual(
+            mock_pool.call_args[0][1],
+            [{"name": "batch_0001", "args": ["--databases", "db1", "db2"],
+              "file": "Batch_0001", "split": ["db1", "db2"]}])
+
+    @mock.patch("dump_proc.dump_run", DumpRun([True, False]))
+    def test_files(self):
+
+        """Function:  test_files
+
+        Description:  Test with the dump file names of the successful dumps
+            recorded.
+
+        Arguments:
+
+        """
+
+        files = {}
+
+        self.assertEqual(dump_sched.dump_db(
+            self.dump_cmd, self.db_list3, True, self.dmp_path,
+            comp_opts={"codec": "gzip"}, files=files), ["db2"])
+        self.assertEqual(list(files), ["db1"])
+        self.assertTrue(files["db1"].endswith(".sql.gz"))
+
+    @mock.patch("dump_sched.dump_pool")
+    def test_units(self, mock_pool):
+
+        """Function:  test_units
+
+        Description:  Test with the units passed.
+
+        Arguments:
+
+        """
+
+        units = [{"name": "db2", "args": ["db2"], "file": "db2", "db": "db2"}]
+        mock_pool.return_value = {"db2": True}
+
+        self.assertFalse(dump_sched.dump_db(
+            self.dump_cmd, self.db_list3, False, self.dmp_path, units=units))
+        self.assertEqual(mock_pool.call_args[0][1], units)
+        self.assertEqual(mock_pool.call_args[0][4], 1)
+
+    @mock.patch("dump_sched.dump_pool")
+    def test_engine(self, mock_pool):
+
+        """Function:  test_engine
+
+        Description:  Test with a dump engine and a single worker.
+
+        Arguments:
+
+        """
+
+        engine = mock.Mock()
+        engine.plan.return_value = ["unit"]
+        mock_pool.return_value = {"db1": True}
+
+        self.assertFalse(dump_sched.dump_db(
+            self.dump_cmd, ["db1"], False, self.dmp_path, engine=engine))
+        engine.plan.assert_called_once_with(
+            [{"name": "db1", "args": ["db1"], "file": "db1", "db": "db1"}])
+        self.assertEqual(mock_pool.call_args[0][1], ["unit"])
+        self.assertEqual(mock_pool.call_args[0][4], 1)
+        self.assertEqual(mock_pool.call_args[1]["engine"], engine)
+
+    @mock.patch("dump_sched.dump_pool")
+    def test_resume(self, mock_pool):
+
+        """Function:  test_resume
+
+        Description:  Test the units completed by the previous run are
+            skipped.
+
+        Arguments:
+
+        """
+
+        journal = mock.Mock()
+        journal.done = {"db1": {"unit": "db1"}}
+        mock_pool.return_value = {"db2": True}
+
+        with gen_libs.no_std_out():
+            self.assertFalse(dump_sched.dump_db(
+                self.dump_cmd, self.db_list3, False, self.dmp_path,
+                workers=2, journal=journal))
+
+        self.assertEqual(
+            mock_pool.call_args[0][1],
+            [{"name": "db2", "args": ["db2"], "file": "db2", "db": "db2"}])
+        self.assertEqual(mock_pool.call_args[1]["journal"], journal)
+
+    @mock.patch("dump_sched.dump_pool")
+    def test_resume_batch(self, mock_pool):
+
+        """Function:  test_resume_batch
+
+        Description:  Test the databases completed by the previous run are
+            not batched.
+
+        Arguments:
+
+        """
+
+        journal = mock.Mock()
+        journal.done = {"db1": {"unit": "batch_0001"}}
+        mock_pool.return_value = {"db2": True}
+
+        with gen_libs.no_std_out():
+            self.assertFalse(dump_sched.dump_db(
+                self.dump_cmd, self.db_list3, False, self.dmp_path,
+                batch_size=100, db_size={"db1": 10, "db2": 20},
+                journal=journal))
+
+        self.assertEqual(
+            mock_pool.call_args[0][1],
+            [{"name": "db2", "args": ["db2"], "file": "db2", "db": "db2"}])
+
+    @mock.patch("dump_proc.dump_run", mock.Mock(return_value=False))
+    def test_partial_removed(self):
+
+        """Function:  test_partial_removed
+
+        Description:  Test the partial dump files of the abandoned units are
+            removed.
+
+        Arguments:
+
+        """
+
+        part_path = dump_units.part_dir(self.dmp_path)
+        fname = os.path.join(part_path, "db1_partial.sql")
+        os.makedirs(part_path)
+
+        with open(fname, "wb") as f_hdlr:
+            f_hdlr.write(b"Partial dump")
+
+        dump_sched.dump_db(
+            self.dump_cmd, self.db_list2, False, self.dmp_path)
+
+        self.assertFalse(os.path.exists(part_path))
+
+    @mock.patch("dump_sched.dump_pool")
+    def test_write_opts(self, mock_pool):
+
+        """Function:  test_write_opts
+
+        Description:  Test the estimated sizes of the database and table dump
+            files and the number of concurrent dumps are passed.
+
+        Arguments:
+
+        """
+
+        mock_pool.return_value = {}
+
+        dump_sched.dump_db(
+            self.dump_cmd, ["db1"], False, self.dmp_path, workers=2,
+            db_size={"db1": 900}, tbl_size={"db1": {"t1": 600}},
+            write_opts={"direct": False,
+                        "sizes": {"db1": 300, "db1.t1": 200}})
+
+        self.assertEqual(
+            mock_pool.call_args[1]["write_opts"],
+            {"direct": False, "sizes": {"db1": 300, "db1.t1": 200},
+             "workers": 2})
+
+    @mock.patch("dump_proc.dump_run")
+    def test_write_opts_single(self, mock_run):
+
+        """Function:  test_write_opts_single
+
+        Description:  Test the estimated size of the dump file of a database
+            dumped sequentially.
+
+        Arguments:
+
+        """
+
+        mock_run.return_value = False
+
+        dump_sched.dump_db(
+            self.dump_cmd, ["db1"], False, self.dmp_path,
+            write_opts={"direct": True, "sizes": {"db1": 300}})
+
+        self.assertEqual(mock_run.call_args[1]["write_opts"],
+                         {"direct": True, "size": 300})
+
+    @mock.patch("dump_sched.gen_libs.is_empty_file",
+                mock.Mock(return_value=False))
+    @mock.patch("dump_proc.dump_run", DumpRun())
+    @mock.patch("dump_sched.gen_libs.file_2_list")
+    def test_email_mailx(self, mock_list):
+
+        """Function:  test_email_mailx
+
+        Description:  Test with override postfix and use mailx.
+
+        Arguments:
+
+        """
+
+        mock_list.return_value = self.filelist
+
+        self.assertFalse(dump_sched.dump_db(
+            self.dump_cmd, self.db_list2, False, self.dmp_path,
+            err_sup=self.err_sup, mail=self.mail, use_mailx=True))
+
+    @mock.patch("dump_sched.gen_libs.is_empty_file",
+                mock.Mock(return_value=False))
+    @mock.patch("dump_proc.dump_run", DumpRun())
+    @mock.patch("dump_sched.gen_libs.file_2_list")
+    def test_email_no_mailx(self, mock_list):
+
+        """Function:  test_email_no_mailx
+
+        Description:  Test with using postfix email command.
+
+        Arguments:
+
+        """
+
+        mock_list.return_value = self.filelist
+
+        self.assertFalse(dump_sched.dump_db(
+            self.dump_cmd, self.db_list2, False, self.dmp_path,
+            err_sup=self.err_sup, mail=self.mail))
+
+    @mock.patch("dump_sched.gen_libs.is_empty_file",
+                mock.Mock(return_value=False))
+    @mock.patch("dump_proc.dump_run", DumpRun())
+    @mock.patch("dump_sched.gen_libs.file_2_list")
+    def test_email_single_line(self, mock_list):
+
+        """Function:  test_email_single_line
+
+        Description:  Test with email with single line.
+
+        Arguments:
+
+        """
+
+        mock_list.return_value = self.filelist2
+
+        self.assertFalse(dump_sched.dump_db(
+            self.dump_cmd, self.db_list2, False, self.dmp_path,
+            err_sup=self.err_sup, mail=self.mail))
+
+    @mock.patch("dump_sched.gen_libs.is_empty_file",
+                mock.Mock(return_value=False))
+    @mock.patch("dump_proc.dump_run", DumpRun())
+    @mock.patch("dump_sched.gen_libs.file_2_list")
+    def test_email_multiple_lines(self, mock_list):
+
+        """Function:  test_email_multiple_lines
+
+        Description:  Test with email with multiple lines.
+
+        Arguments:
+
+        """
+
+        mock_list.return_value = self.filelist
+
+        self.assertFalse(dump_sched.dump_db(
+            self.dump_cmd, self.db_list2, False, self.dmp_path,
+            err_sup=self.err_sup, mail=self.mail))
+
+    @mock.patch("dump_sched.gen_libs.is_empty_file",
+                mock.Mock(return_value=True))
+    @mock.patch("dump_proc.dump_run", DumpRun())
+    @mock.patch("dump_sched.gen_libs.file_2_list")
+    def test_email_empty(self, mock_list):
+
+        """Function:  test_email_empty
+
+        Description:  Test with empty file.
+
+        Arguments:
+
+        """
+
+        mock_list.return_value = self.filelist
+
+        self.assertFalse(dump_sched.dump_db(
+            self.dump_cmd, self.db_list2, False, self.dmp_path,
+            err_sup=self.err_sup, mail=self.mail))
+
+    @mock.patch("dump_sched.gen_libs.is_empty_file",
+                mock.Mock(return_value=False))
+    @mock.patch("dump_proc.dump_run", DumpRun())
+    @mock.patch("dump_sched.gen_libs.file_2_list")
+    def test_email(self, mock_list):
+
+        """Function:  test_email
+
+        Description:  Test with email option.
+
+        Arguments:
+
+        """
+
+        mock_list.return_value = self.filelist
+
+        self.assertFalse(dump_sched.dump_db(
+            self.dump_cmd, self.db_list2, False, self.dmp_path,
+            err_sup=self.err_sup, mail=self.mail))
+
+    @mock.patch("dump_proc.dump_run", DumpRun())
+    def test_db_list_w_option(self):
+
+        """Function:  test_db_list_w_option
+
+        Description:  Test with -w option with list of databases.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(dump_sched.dump_db(
+            self.dump_cmd, self.db_list2, False, self.dmp_path,
+            err_sup=self.err_sup))
+
+    @mock.patch("dump_proc.dump_run", DumpRun())
+    def test_all_dbs_w_option(self):
+
+        """Function:  test_all_dbs_w_option
+
+        Description:  Test with -z option with all databases.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(dump_sched.dump_db(
+            self.dump_cmd2, self.db_list, False, self.dmp_path,
+            err_sup=self.err_sup))
+
+    @mock.patch("dump_proc.dump_run", DumpRun())
+    def test_db_list2(self):
+
+        """Function:  test_db_list2
+
+        Description:  Test with list of databases.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(dump_sched.dump_db(self.dump_cmd, self.db_list3,
+                                               False, self.dmp_path))
+
+    @mock.patch("dump_proc.dump_run", DumpRun())
+    def test_db_list(self):
+
+        """Function:  test_db_list
+
+        Description:  Test with list of databases.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(dump_sched.dump_db(self.dump_cmd, self.db_list2,
+                                               False, self.dmp_path))
+
+    @mock.patch("dump_proc.dump_run", DumpRun())
+    def test_all_dbs(self):
+
+        """Function:  test_all_dbs
+
+        Description:  Test with all databases.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(dump_sched.dump_db(self.dump_cmd2, self.db_list,
+                                               False, self.dmp_path))
+
+    def test_dump_db(self):
+
+        """Function:  test_dump_db
+
+        Description:  Test with only default arguments passed.
+
+        Arguments:
+
+        """
+
+        with gen_libs.no_std_out():
+            self.assertFalse(dump_sched.dump_db(self.dump_cmd, self.db_list,
+                                                   False, self.dmp_path))
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        file_list = gen_libs.filename_search(self.dmp_path, "ErrOut.*.log",
+                                             add_path=True)             \
+            + gen_libs.filename_search(self.dmp_path, r".*\.sql.*",
+                                       add_path=True)
+
+        for item in file_list:
+            if os.path.isfile(item):
+                os.remove(item)
+
+
+if __name__ == "__main__":
+    unittest.main()
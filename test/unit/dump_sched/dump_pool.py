@@ -0,0 +1,232 @@
+# Classification (U)
+
+"""Program:  dump_pool.py
+
+    Description:  Unit testing of dump_pool in dump_sched.py.
+
+    Usage:
+        test/unit/dump_sched/dump_pool.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import dump_sched                               # pylint:disable=E0401,C0413
+import dump_watch                               # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+def dump_unit(dump_cmd, unit, compress, dmp_path, **kwargs):
+
+    """Function:  dump_unit
+
+    Description:  Stub holder for dump_sched.dump_unit function.  The
+        database named "bad" will fail.
+
+    Arguments:
+
+    """
+
+    status = bool(dump_cmd and dmp_path and not compress
+                  and "lock" in kwargs)
+
+    return unit["name"], status and unit["name"] != "bad"
+
+
+class Stalled():                                        # pylint:disable=R0903
+
+    """Class:  Stalled
+
+    Description:  Stub holder for dump_sched.dump_unit function.  The
+        first dump of the database named "bad" is killed by the watchdog.
+
+    Methods:
+        __init__
+        __call__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.calls = []
+
+    def __call__(self, dump_cmd, unit, compress, dmp_path, **kwargs):
+
+        """Method:  __call__
+
+        Description:  Stub holder for dump_sched.dump_unit function.
+
+        Arguments:
+
+        """
+
+        self.calls.append(unit["name"])
+
+        if unit["name"] == "bad" and self.calls.count("bad") == 1:
+            kwargs["metrics"]["bad"] = {"status": False, "watchdog": "stall"}
+
+            return unit["name"], False
+
+        return unit["name"], True
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_failed_dump
+        test_single_worker
+        test_multiple_workers
+        test_requeue
+        test_load
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.dump_cmd = ["dump_command", "params"]
+        self.units = [{"name": dbn, "args": [dbn], "file": dbn}
+                      for dbn in ["db1", "db2", "db3"]]
+        self.units2 = [{"name": dbn, "args": [dbn], "file": dbn}
+                       for dbn in ["db1", "bad"]]
+        self.dmp_path = "./test/unit/dump_sched/tmp/"
+        self.results = {"db1": True, "db2": True, "db3": True}
+        self.results2 = {"db1": True, "bad": False}
+
+    @mock.patch("dump_sched.dump_unit", dump_unit)
+    def test_failed_dump(self):
+
+        """Function:  test_failed_dump
+
+        Description:  Test with a failed database dump.
+
+        Arguments:
+
+        """
+
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                dump_sched.dump_pool(
+                    self.dump_cmd, self.units2, False, self.dmp_path, 2),
+                self.results2)
+
+    @mock.patch("dump_sched.dump_unit", dump_unit)
+    def test_single_worker(self):
+
+        """Function:  test_single_worker
+
+        Description:  Test with a single worker.
+
+        Arguments:
+
+        """
+
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                dump_sched.dump_pool(
+                    self.dump_cmd, self.units, False, self.dmp_path, 1),
+                self.results)
+
+    @mock.patch("dump_sched.dump_unit", dump_unit)
+    def test_multiple_workers(self):
+
+        """Function:  test_multiple_workers
+
+        Description:  Test with multiple workers.
+
+        Arguments:
+
+        """
+
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                dump_sched.dump_pool(
+                    self.dump_cmd, self.units, False, self.dmp_path, 3),
+                self.results)
+
+
+    def test_requeue(self):
+
+        """Function:  test_requeue
+
+        Description:  Test a unit killed by the watchdog is requeued.
+
+        Arguments:
+
+        """
+
+        stalled = Stalled()
+        watchdog = dump_watch.Watchdog(stall=10, interval=60)
+
+        with mock.patch("dump_sched.dump_unit", stalled),                \
+                gen_libs.no_std_out():
+            self.assertEqual(
+                dump_sched.dump_pool(
+                    self.dump_cmd, self.units2, False, self.dmp_path, 2,
+                    watchdog=watchdog),
+                {"db1": True, "bad": True})
+
+        watchdog.close()
+        self.assertEqual(stalled.calls.count("bad"), 2)
+
+    @mock.patch("dump_sched.dump_unit", dump_unit)
+    def test_load(self):
+
+        """Function:  test_load
+
+        Description:  Test the number of dumps running is set by the load
+            controller.
+
+        Arguments:
+
+        """
+
+        load = mock.Mock(interval=60)
+        load.adjust.return_value = 1
+
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                dump_sched.dump_pool(
+                    self.dump_cmd, self.units, False, self.dmp_path, 3,
+                    load=load),
+                self.results)
+
+        self.assertEqual(load.adjust.call_args_list,
+                         [mock.call(0), mock.call(0), mock.call(0)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,244 @@
+# Classification (U)
+
+"""Program:  dump_retry.py
+
+    Description:  Unit testing of dump_retry in dump_sched.py.
+
+    Usage:
+        test/unit/dump_sched/dump_retry.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import tempfile
+import threading
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import dump_sched                               # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class DumpAttempt():                                    # pylint:disable=R0903
+
+    """Class:  DumpAttempt
+
+    Description:  Class stub holder for dump_sched.dump_attempt function.
+        Fails the dumps with the errors passed before succeeding.
+
+    Methods:
+        __init__
+        __call__
+
+    """
+
+    def __init__(self, errors):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) errors -> List of the errors of the failed dumps
+
+        """
+
+        self.errors = list(errors)
+        self.calls = 0
+
+    def __call__(self, dump_cmd, unit, compress, dmp_file, **kwargs):
+
+        """Method:  __call__
+
+        Description:  Stub holder for dump_sched.dump_attempt function.
+
+        Arguments:
+
+        """
+
+        self.calls += 1
+
+        if self.errors:
+            if kwargs.get("errfile", None):
+                kwargs["errfile"].write(self.errors.pop(0))
+
+            return False, {}
+
+        kwargs["files"][unit["name"]] = dmp_file
+
+        return bool(dump_cmd and not compress), {}
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_success
+        test_retry
+        test_not_transient
+        test_retry_exhausted
+        test_stop
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.dump_cmd = ["dump_command", "db1"]
+        self.unit = {"name": "db1", "args": ["db1"], "file": "db1"}
+        self.dmp_file = "./test/unit/dump_sched/tmp/db1.sql"
+        self.e_file = tempfile.TemporaryFile(mode="w+", encoding="UTF-8")
+        self.error = "mysqldump: Lost connection to MySQL server\n"
+        self.error2 = "mysqldump: Unknown database 'db1'\n"
+
+    def test_success(self):
+
+        """Function:  test_success
+
+        Description:  Test a successful dump.
+
+        Arguments:
+
+        """
+
+        with mock.patch("dump_sched.dump_attempt", DumpAttempt([])):
+            self.assertEqual(
+                dump_sched.dump_retry(
+                    self.dump_cmd, self.unit, False, self.dmp_file),
+                (True, {"db1": self.dmp_file},
+                 {"status": True, "attempts": 1}))
+
+    @mock.patch("dump_sched.time.sleep")
+    def test_retry(self, mock_sleep):
+
+        """Function:  test_retry
+
+        Description:  Test a dump failing with a transient error is retried
+            with a backoff.
+
+        Arguments:
+
+        """
+
+        attempt = DumpAttempt([self.error, self.error])
+
+        with mock.patch("dump_sched.dump_attempt", attempt):
+            with gen_libs.no_std_out():
+                status, _, metrics = dump_sched.dump_retry(
+                    self.dump_cmd, self.unit, False, self.dmp_file,
+                    errfile=self.e_file, retries=2)
+
+        self.assertTrue(status)
+        self.assertEqual(metrics["attempts"], 3)
+        self.assertEqual(
+            [item[0][0] for item in mock_sleep.call_args_list],
+            [dump_sched.RETRY_BACKOFF, dump_sched.RETRY_BACKOFF * 2])
+
+    @mock.patch("dump_sched.time.sleep")
+    def test_not_transient(self, mock_sleep):
+
+        """Function:  test_not_transient
+
+        Description:  Test a dump failing with another error is not retried.
+
+        Arguments:
+
+        """
+
+        attempt = DumpAttempt([self.error2])
+
+        with mock.patch("dump_sched.dump_attempt", attempt):
+            self.assertEqual(
+                dump_sched.dump_retry(
+                    self.dump_cmd, self.unit, False, self.dmp_file,
+                    errfile=self.e_file, retries=2),
+                (False, {}, {"status": False, "attempts": 1}))
+
+        mock_sleep.assert_not_called()
+
+    @mock.patch("dump_sched.time.sleep", mock.Mock())
+    def test_retry_exhausted(self):
+
+        """Function:  test_retry_exhausted
+
+        Description:  Test a dump still failing once the retries are used.
+
+        Arguments:
+
+        """
+
+        attempt = DumpAttempt([self.error, self.error])
+
+        with mock.patch("dump_sched.dump_attempt", attempt):
+            with gen_libs.no_std_out():
+                self.assertEqual(
+                    dump_sched.dump_retry(
+                        self.dump_cmd, self.unit, False, self.dmp_file,
+                        errfile=self.e_file, retries=1),
+                    (False, {}, {"status": False, "attempts": 2}))
+
+        self.assertEqual(attempt.calls, 2)
+
+    def test_stop(self):
+
+        """Function:  test_stop
+
+        Description:  Test the unit is not dumped once the stop event is
+            set.
+
+        Arguments:
+
+        """
+
+        stop = threading.Event()
+        stop.set()
+        attempt = DumpAttempt([])
+
+        with mock.patch("dump_sched.dump_attempt", attempt):
+            self.assertEqual(
+                dump_sched.dump_retry(
+                    self.dump_cmd, self.unit, False, self.dmp_file,
+                    stop=stop),
+                (False, {},
+                 {"status": False, "attempts": 0, "stopped": True}))
+
+        self.assertEqual(attempt.calls, 0)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.e_file.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,150 @@
+# Classification (U)
+
+"""Program:  dump_seq.py
+
+    Description:  Unit testing of dump_seq in dump_sched.py.
+
+    Usage:
+        test/unit/dump_sched/dump_seq.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import dump_sched                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_units
+        test_units
+        test_requeue
+        test_not_requeued
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.dump_cmd = ["dump_command"]
+        self.units = [{"name": "db1", "args": ["db1"], "file": "db1"},
+                      {"name": "db2", "args": ["db2"], "file": "db2"}]
+        self.dmp_path = "./test/unit/dump_sched/tmp/"
+
+    @mock.patch("dump_sched.run_unit")
+    def test_no_units(self, mock_run):
+
+        """Function:  test_no_units
+
+        Description:  Test with no units.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            dump_sched.dump_seq(self.dump_cmd, [], False, self.dmp_path),
+            {})
+        mock_run.assert_not_called()
+
+    @mock.patch("dump_sched.run_unit")
+    def test_units(self, mock_run):
+
+        """Function:  test_units
+
+        Description:  Test the units are dumped in order with the same
+            queue time.
+
+        Arguments:
+
+        """
+
+        mock_run.side_effect = [("db1", True), ("db2", False)]
+
+        self.assertEqual(
+            dump_sched.dump_seq(
+                self.dump_cmd, self.units, False, self.dmp_path, retries=1),
+            {"db1": True, "db2": False})
+        self.assertEqual(
+            [item[0][1]["name"] for item in mock_run.call_args_list],
+            ["db1", "db2"])
+        self.assertEqual(mock_run.call_args_list[0][1]["queued"],
+                         mock_run.call_args_list[1][1]["queued"])
+        self.assertEqual(mock_run.call_args[1]["retries"], 1)
+
+    @mock.patch("dump_sched.run_unit")
+    def test_requeue(self, mock_run):
+
+        """Function:  test_requeue
+
+        Description:  Test a unit killed by the watchdog is requeued at the
+            end of the units.
+
+        Arguments:
+
+        """
+
+        mock_run.side_effect = [("db1", False), ("db2", True), ("db1", True)]
+        watchdog = mock.Mock()
+        watchdog.requeue.return_value = True
+
+        self.assertEqual(
+            dump_sched.dump_seq(
+                self.dump_cmd, self.units, False, self.dmp_path,
+                watchdog=watchdog), {"db1": True, "db2": True})
+        self.assertEqual(
+            [item[0][1]["name"] for item in mock_run.call_args_list],
+            ["db1", "db2", "db1"])
+        watchdog.requeue.assert_called_once_with("db1", {})
+
+    @mock.patch("dump_sched.run_unit")
+    def test_not_requeued(self, mock_run):
+
+        """Function:  test_not_requeued
+
+        Description:  Test a failed unit not requeued by the watchdog.
+
+        Arguments:
+
+        """
+
+        mock_run.side_effect = [("db1", False), ("db2", True)]
+        watchdog = mock.Mock()
+        watchdog.requeue.return_value = False
+
+        self.assertEqual(
+            dump_sched.dump_seq(
+                self.dump_cmd, self.units, False, self.dmp_path,
+                watchdog=watchdog, metrics={"db1": {"status": False}}),
+            {"db1": False, "db2": True})
+        watchdog.requeue.assert_called_once_with("db1", {"status": False})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,714 @@
+# Classification (U)
+
+"""Program:  dump_unit.py
+
+    Description:  Unit testing of dump_unit in dump_sched.py.
+
+    Usage:
+        test/unit/dump_sched/dump_unit.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import io
+import shutil
+import threading
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import dump_sched                               # pylint:disable=E0401,C0413
+import dump_stream                              # pylint:disable=E0401,C0413
+import dump_watch                               # pylint:disable=E0401,C0413
+import dump_units                               # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+def dump_run(dump_cmd, dmp_file, compress, **kwargs):
+
+    """Function:  dump_run
+
+    Description:  Stub holder for dump_proc.dump_run function.  Writes to
+        the error stream to simulate a database dump error.
+
+    Arguments:
+
+    """
+
+    status = bool(dump_cmd and dmp_file and not compress)
+
+    if kwargs.get("errfile", None):
+        kwargs["errfile"].write("Error Line\n")
+
+    if status:
+        with open(dmp_file, "wb") as f_hdlr:
+            f_hdlr.write(b"Dump")
+
+    return status
+
+
+def dump_file(dump_cmd, dmp_file, compress, **kwargs):
+
+    """Function:  dump_file
+
+    Description:  Stub holder for dump_proc.dump_run function.  Writes
+        the dump file.
+
+    Arguments:
+
+    """
+
+    fname = dump_stream.dump_fname(
+        dmp_file, compress, kwargs.get("comp_opts", {}))
+
+    with open(fname, "wb") as f_hdlr:
+        f_hdlr.write(b"Dump")
+
+    kwargs["metrics"]["file"] = fname
+
+    return bool(dump_cmd)
+
+
+class LostConnection():                                 # pylint:disable=R0903
+
+    """Class:  LostConnection
+
+    Description:  Stub holder for dump_proc.dump_run function failing
+        with a transient error a number of times before succeeding.
+
+    Methods:
+        __init__
+        __call__
+
+    """
+
+    def __init__(self, count, error="Lost connection to MySQL server"):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.count = count
+        self.error = error
+        self.calls = 0
+
+    def __call__(self, dump_cmd, dmp_file, compress, **kwargs):
+
+        """Method:  __call__
+
+        Description:  Stub holder for dump_proc.dump_run function.
+
+        Arguments:
+
+        """
+
+        self.calls += 1
+        kwargs["metrics"]["file"] = dmp_file
+
+        if self.calls > self.count:
+            with open(dmp_file, "wb") as f_hdlr:
+                f_hdlr.write(b"Dump")
+
+            return True
+
+        kwargs["errfile"].write(f"mysqldump: Error 2013: {self.error}\n")
+
+        return False
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_command_copy
+        test_error_file
+        test_table_unit
+        test_split_unit
+        test_engine
+        test_partial_missing
+        test_write_opts
+        test_metrics
+        test_queue_wait
+        test_files
+        test_files_failed
+        test_retry
+        test_retry_exhausted
+        test_no_retry
+        test_partial_rename
+        test_cancelled
+        test_journal
+        test_journal_failed
+        test_stop
+        test_watchdog
+        test_no_error_file
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.dump_cmd = ["dump_command", "params"]
+        self.unit = {"name": "db1", "args": ["db1"], "file": "db1",
+                     "db": "db1"}
+        self.unit2 = {"name": "db1.t1", "args": ["db1", "t1"],
+                      "file": "db1.t1"}
+        self.unit3 = {"name": "batch_0001",
+                      "args": ["--databases", "db1", "db2"],
+                      "file": "Batch_0001", "split": ["db1", "db2"]}
+        self.dmp_path = "./test/unit/dump_sched/tmp/"
+        self.efile = os.path.join(self.dmp_path, "ErrOut_test.log")
+        self.lock = threading.Lock()
+        self.results = ("db1", True)
+        self.results2 = ("db1.t1", True)
+        self.dmp_files = []
+
+    @mock.patch("dump_proc.dump_run")
+    def test_command_copy(self, mock_run):
+
+        """Function:  test_command_copy
+
+        Description:  Test that the dump command passed in is not changed.
+
+        Arguments:
+
+        """
+
+        mock_run.side_effect = dump_file
+
+        dump_sched.dump_unit(
+            self.dump_cmd, self.unit, False, self.dmp_path)
+
+        self.assertEqual(self.dump_cmd, ["dump_command", "params"])
+        self.assertEqual(
+            mock_run.call_args[0][0], ["dump_command", "params", "db1"])
+
+    @mock.patch("dump_proc.dump_run", dump_run)
+    def test_error_file(self):
+
+        """Function:  test_error_file
+
+        Description:  Test with error file passed.
+
+        Arguments:
+
+        """
+
+        with io.open(self.efile, mode="a", encoding="UTF-8") as errfile:
+            self.assertEqual(
+                dump_sched.dump_unit(
+                    self.dump_cmd, self.unit, False, self.dmp_path,
+                    errfile=errfile, lock=self.lock), self.results)
+
+        self.assertEqual(gen_libs.file_2_list(self.efile), ["Error Line"])
+
+    @mock.patch("dump_proc.dump_run")
+    def test_table_unit(self, mock_run):
+
+        """Function:  test_table_unit
+
+        Description:  Test with a table unit.
+
+        Arguments:
+
+        """
+
+        mock_run.side_effect = dump_file
+
+        self.assertEqual(
+            dump_sched.dump_unit(
+                self.dump_cmd, self.unit2, False, self.dmp_path),
+            self.results2)
+        self.assertEqual(
+            mock_run.call_args[0][0], ["dump_command", "params", "db1", "t1"])
+        self.assertIn("db1.t1_", mock_run.call_args[0][1])
+
+    @mock.patch("dump_proc.dump_split")
+    def test_split_unit(self, mock_split):
+
+        """Function:  test_split_unit
+
+        Description:  Test with a batch unit split into database dump files.
+
+        Arguments:
+
+        """
+
+        mock_split.return_value = True
+
+        self.assertEqual(
+            dump_sched.dump_unit(
+                self.dump_cmd, self.unit3, False, self.dmp_path),
+            ("batch_0001", True))
+        self.assertEqual(
+            mock_split.call_args[0][:2],
+            (["dump_command", "params", "--databases", "db1", "db2"],
+             ["db1", "db2"]))
+
+    @mock.patch("dump_proc.dump_run")
+    def test_engine(self, mock_run):
+
+        """Function:  test_engine
+
+        Description:  Test with a dump engine.
+
+        Arguments:
+
+        """
+
+        engine = mock.Mock()
+        engine.run.return_value = True
+        engine.fname.return_value = os.path.join(
+            dump_units.part_dir(self.dmp_path), "db1.sql")
+        files = {}
+        os.makedirs(dump_units.part_dir(self.dmp_path))
+
+        with open(engine.fname.return_value, "wb") as f_hdlr:
+            f_hdlr.write(b"Dump")
+
+        dump_sched.dump_unit(
+            self.dump_cmd, self.unit, False, self.dmp_path, files=files,
+            engine=engine)
+
+        mock_run.assert_not_called()
+        self.assertEqual(engine.run.call_args[0][0], self.unit)
+        engine.fname.assert_called_once_with(
+            engine.run.call_args[0][1], False, {})
+        self.assertEqual(
+            files, {"db1": os.path.join(self.dmp_path, "db1.sql")})
+        self.dmp_files.append(files["db1"])
+
+    def test_partial_missing(self):
+
+        """Function:  test_partial_missing
+
+        Description:  Test a unit whose dump file is missing from the partial
+            directory fails and is not recorded in the journal.
+
+        Arguments:
+
+        """
+
+        engine = mock.Mock()
+        engine.run.return_value = True
+        engine.fname.return_value = os.path.join(
+            dump_units.part_dir(self.dmp_path), "db1.sql")
+        journal = mock.Mock()
+        files = {}
+        metrics = {}
+
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                dump_sched.dump_unit(
+                    self.dump_cmd, self.unit, False, self.dmp_path,
+                    files=files, engine=engine, journal=journal,
+                    metrics=metrics), ("db1", False))
+
+        self.assertEqual(files, {})
+        self.assertFalse(metrics["db1"]["status"])
+        self.assertIn("Missing dump files", metrics["db1"]["error"])
+        journal.record.assert_not_called()
+
+    @mock.patch("dump_proc.dump_run")
+    def test_write_opts(self, mock_run):
+
+        """Function:  test_write_opts
+
+        Description:  Test with the page cache friendly writer options.
+
+        Arguments:
+
+        """
+
+        mock_run.side_effect = dump_file
+
+        dump_sched.dump_unit(
+            self.dump_cmd, self.unit, False, self.dmp_path,
+            write_opts={"direct": True, "sizes": {"db1": 100}})
+
+        self.assertEqual(mock_run.call_args[1]["write_opts"],
+                         {"direct": True, "size": 100})
+
+    @mock.patch("dump_proc.dump_run")
+    def test_metrics(self, mock_run):
+
+        """Function:  test_metrics
+
+        Description:  Test the dump metrics of the unit are recorded.
+
+        Arguments:
+
+        """
+
+        mock_run.side_effect = dump_file
+        metrics = {}
+
+        dump_sched.dump_unit(
+            self.dump_cmd, self.unit, False, self.dmp_path, metrics=metrics)
+
+        self.assertIs(metrics["db1"], mock_run.call_args[1]["metrics"])
+        self.assertEqual(metrics["db1"]["db"], "db1")
+
+    @mock.patch("dump_sched.time.time", mock.Mock(return_value=110.0))
+    @mock.patch("dump_proc.dump_run")
+    def test_queue_wait(self, mock_run):
+
+        """Function:  test_queue_wait
+
+        Description:  Test the queue wait time is added to the metrics.
+
+        Arguments:
+
+        """
+
+        mock_run.side_effect = dump_file
+        metrics = {}
+
+        dump_sched.dump_unit(
+            self.dump_cmd, self.unit, False, self.dmp_path, metrics=metrics,
+            queued=100.0)
+
+        self.assertEqual(metrics["db1"]["queue_seconds"], 10.0)
+
+    @mock.patch("dump_proc.dump_run")
+    def test_files(self, mock_run):
+
+        """Function:  test_files
+
+        Description:  Test with the dump file names recorded.
+
+        Arguments:
+
+        """
+
+        mock_run.side_effect = dump_file
+        files = {}
+
+        dump_sched.dump_unit(
+            self.dump_cmd, self.unit, True, self.dmp_path,
+            comp_opts={"codec": "xz"}, files=files)
+
+        self.assertEqual(
+            files, {"db1": os.path.join(self.dmp_path, os.path.basename(
+                mock_run.call_args[0][1] + ".xz"))})
+
+    @mock.patch("dump_proc.dump_run")
+    def test_files_failed(self, mock_run):
+
+        """Function:  test_files_failed
+
+        Description:  Test with a failed dump not recorded.
+
+        Arguments:
+
+        """
+
+        mock_run.return_value = False
+        files = {}
+
+        dump_sched.dump_unit(
+            self.dump_cmd, self.unit, False, self.dmp_path, files=files)
+
+        self.assertEqual(files, {})
+
+    @mock.patch("dump_sched.time.sleep")
+    def test_retry(self, mock_sleep):
+
+        """Function:  test_retry
+
+        Description:  Test a dump failing with a transient error is retried
+            with an increasing wait.
+
+        Arguments:
+
+        """
+
+        run = LostConnection(2)
+
+        with mock.patch("dump_proc.dump_run", run),                     \
+                gen_libs.no_std_out():
+            self.assertEqual(
+                dump_sched.dump_unit(
+                    self.dump_cmd, self.unit, False, self.dmp_path,
+                    errfile=io.StringIO(), retries=3), self.results)
+
+        self.assertEqual(run.calls, 3)
+        self.assertEqual(
+            mock_sleep.call_args_list,
+            [mock.call(dump_sched.RETRY_BACKOFF),
+             mock.call(dump_sched.RETRY_BACKOFF * 2)])
+
+    @mock.patch("dump_sched.time.sleep", mock.Mock())
+    def test_retry_exhausted(self):
+
+        """Function:  test_retry_exhausted
+
+        Description:  Test a dump still failing after the retries and its
+            output removed.
+
+        Arguments:
+
+        """
+
+        run = LostConnection(5)
+        metrics = {}
+        dmp_file = os.path.join(self.dmp_path, "db1_retry.sql")
+
+        with open(dmp_file, "w", encoding="UTF-8") as f_hdlr:
+            f_hdlr.write("Partial dump")
+
+        with mock.patch("dump_proc.dump_run", run),                     \
+                mock.patch("dump_sched.gen_libs.crt_file_time",
+                           mock.Mock(return_value=dmp_file)),               \
+                gen_libs.no_std_out(), mock.patch("sys.stderr"):
+            self.assertEqual(
+                dump_sched.dump_unit(
+                    self.dump_cmd, self.unit, False, self.dmp_path,
+                    retries=1, metrics=metrics), ("db1", False))
+
+        self.assertEqual(run.calls, 2)
+        self.assertEqual(metrics["db1"]["attempts"], 2)
+        self.assertFalse(os.path.isfile(dmp_file))
+
+    def test_no_retry(self):
+
+        """Function:  test_no_retry
+
+        Description:  Test a dump failing with an error which is not
+            transient is not retried.
+
+        Arguments:
+
+        """
+
+        run = LostConnection(1, error="Access denied for user")
+        errfile = io.StringIO()
+
+        with mock.patch("dump_proc.dump_run", run):
+            self.assertEqual(
+                dump_sched.dump_unit(
+                    self.dump_cmd, self.unit, False, self.dmp_path,
+                    errfile=errfile, retries=3), ("db1", False))
+
+        self.assertEqual(run.calls, 1)
+        self.assertIn("Access denied", errfile.getvalue())
+
+    @mock.patch("dump_proc.dump_run", dump_file)
+    def test_partial_rename(self):
+
+        """Function:  test_partial_rename
+
+        Description:  Test the dump file is written to the partial directory
+            and moved into the dump directory once completed.
+
+        Arguments:
+
+        """
+
+        files = {}
+        metrics = {}
+
+        dump_sched.dump_unit(
+            self.dump_cmd, self.unit, False, self.dmp_path, files=files,
+            metrics=metrics)
+
+        self.assertEqual(os.path.dirname(files["db1"]),
+                         os.path.dirname(self.efile))
+        self.assertTrue(os.path.isfile(files["db1"]))
+        self.assertEqual(metrics["db1"]["file"], files["db1"])
+        self.assertEqual(
+            os.listdir(dump_units.part_dir(self.dmp_path)), [])
+        self.dmp_files.append(files["db1"])
+
+    @mock.patch("dump_proc.dump_run", dump_file)
+    def test_cancelled(self):
+
+        """Function:  test_cancelled
+
+        Description:  Test the dump file of a unit whose consistent snapshot
+            failed is removed instead of moved into the dump directory.
+
+        Arguments:
+
+        """
+
+        sync = threading.Event()
+        cancel = threading.Event()
+        sync.set()
+        cancel.set()
+        journal = mock.Mock()
+        files = {}
+        metrics = {}
+
+        self.assertEqual(
+            dump_sched.dump_unit(
+                self.dump_cmd, self.unit, False, self.dmp_path, files=files,
+                journal=journal, metrics=metrics, sync=sync, cancel=cancel),
+            ("db1", False))
+
+        self.assertEqual(files, {})
+        self.assertEqual(metrics["db1"]["error"], "Consistent snapshot failed")
+        self.assertEqual(
+            os.listdir(dump_units.part_dir(self.dmp_path)), [])
+        self.assertFalse(
+            os.path.isfile(os.path.join(self.dmp_path, "db1.sql")))
+        journal.record.assert_not_called()
+
+    @mock.patch("dump_proc.dump_run", dump_file)
+    def test_journal(self):
+
+        """Function:  test_journal
+
+        Description:  Test the completed unit is recorded in the journal.
+
+        Arguments:
+
+        """
+
+        journal = mock.Mock()
+        files = {}
+
+        dump_sched.dump_unit(
+            self.dump_cmd, self.unit, False, self.dmp_path, files=files,
+            journal=journal, hash_opts={"digests": {}})
+
+        journal.record.assert_called_once_with(
+            self.unit, [files["db1"]], {"digests": {}})
+        self.dmp_files.append(files["db1"])
+
+    @mock.patch("dump_proc.dump_run")
+    def test_journal_failed(self, mock_run):
+
+        """Function:  test_journal_failed
+
+        Description:  Test a failed unit is not recorded in the journal.
+
+        Arguments:
+
+        """
+
+        mock_run.return_value = False
+        journal = mock.Mock()
+
+        dump_sched.dump_unit(
+            self.dump_cmd, self.unit, False, self.dmp_path, journal=journal)
+
+        journal.record.assert_not_called()
+
+    @mock.patch("dump_proc.dump_run")
+    def test_stop(self, mock_run):
+
+        """Function:  test_stop
+
+        Description:  Test the unit is not dumped once the stop event is
+            set.
+
+        Arguments:
+
+        """
+
+        stop = threading.Event()
+        stop.set()
+        metrics = {}
+
+        self.assertEqual(
+            dump_sched.dump_unit(
+                self.dump_cmd, self.unit, False, self.dmp_path, stop=stop,
+                metrics=metrics), ("db1", False))
+        mock_run.assert_not_called()
+        self.assertTrue(metrics["db1"]["stopped"])
+
+    @mock.patch("dump_proc.dump_run")
+    def test_watchdog(self, mock_run):
+
+        """Function:  test_watchdog
+
+        Description:  Test a unit killed by the watchdog is not retried.
+
+        Arguments:
+
+        """
+
+        mock_run.return_value = False
+        watchdog = mock.Mock()
+        watch = dump_watch.UnitWatch("db1")
+        watch.reason = "stall"
+        watchdog.watch.return_value = watch
+        watchdog.unwatch.return_value = "stall"
+        procs = []
+        metrics = {}
+
+        self.assertEqual(
+            dump_sched.dump_unit(
+                self.dump_cmd, self.unit, False, self.dmp_path, retries=2,
+                procs=procs, watchdog=watchdog, metrics=metrics),
+            ("db1", False))
+        watchdog.watch.assert_called_once_with("db1", procs)
+        self.assertIs(mock_run.call_args[1]["procs"], watch)
+        self.assertEqual(metrics["db1"]["watchdog"], "stall")
+
+    @mock.patch("dump_proc.dump_run", dump_file)
+    def test_no_error_file(self):
+
+        """Function:  test_no_error_file
+
+        Description:  Test with no error file passed.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            dump_sched.dump_unit(
+                self.dump_cmd, self.unit, False, self.dmp_path), self.results)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        file_list = gen_libs.filename_search(self.dmp_path, "ErrOut.*.log",
+                                             add_path=True)             \
+            + gen_libs.filename_search(self.dmp_path, r".*\.sql.*",
+                                       add_path=True)
+
+        for item in file_list + self.dmp_files:
+            if os.path.isfile(item):
+                os.remove(item)
+
+        shutil.rmtree(dump_units.part_dir(self.dmp_path),
+                      ignore_errors=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
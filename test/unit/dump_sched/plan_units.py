@@ -0,0 +1,208 @@
+# Classification (U)
+
+"""Program:  plan_units.py
+
+    Description:  Unit testing of plan_units in dump_sched.py.
+
+    Usage:
+        test/unit/dump_sched/plan_units.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import dump_sched                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_databases
+        test_done
+        test_tables
+        test_units
+        test_engine
+        test_batches
+        test_all_databases
+        test_all_databases_done
+        test_nothing
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.dump_cmd = ["dump_command"]
+        self.dump_cmd2 = ["dump_command", "--all-databases"]
+        self.db_list = ["db1", "db2"]
+        self.done = {"db1": ["db1.sql"]}
+        self.units = [{"name": "db3", "args": ["db3"], "file": "db3"}]
+        self.all_db = [{"name": "All_Databases", "args": [],
+                        "file": "All_Databases"}]
+
+    def test_databases(self):
+
+        """Function:  test_databases
+
+        Description:  Test a unit for each database.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            [unit["name"] for unit in dump_sched.plan_units(
+                self.dump_cmd, self.db_list, {})], ["db1", "db2"])
+
+    def test_done(self):
+
+        """Function:  test_done
+
+        Description:  Test the units completed by the previous run are left
+            out.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            [unit["name"] for unit in dump_sched.plan_units(
+                self.dump_cmd, self.db_list, self.done)], ["db2"])
+
+    def test_tables(self):
+
+        """Function:  test_tables
+
+        Description:  Test a schema unit and a unit for each table.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            [unit["name"] for unit in dump_sched.plan_units(
+                self.dump_cmd, ["db1"], {},
+                tbl_size={"db1": {"t1": 10, "t2": 20}})],
+            ["db1:schema", "db1.t2", "db1.t1"])
+
+    def test_units(self):
+
+        """Function:  test_units
+
+        Description:  Test the units passed are used.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            dump_sched.plan_units(
+                self.dump_cmd, self.db_list, {}, units=self.units),
+            self.units)
+
+    def test_engine(self):
+
+        """Function:  test_engine
+
+        Description:  Test the units are planned by the dump engine.
+
+        Arguments:
+
+        """
+
+        engine = mock.Mock()
+        engine.plan.return_value = self.units
+
+        self.assertEqual(
+            dump_sched.plan_units(
+                self.dump_cmd, self.db_list, self.done, engine=engine),
+            self.units)
+        self.assertEqual(
+            [unit["name"] for unit in engine.plan.call_args[0][0]], ["db2"])
+
+    @mock.patch("dump_units.crt_batches")
+    def test_batches(self, mock_batch):
+
+        """Function:  test_batches
+
+        Description:  Test the databases not completed are batched by size.
+
+        Arguments:
+
+        """
+
+        mock_batch.return_value = self.units
+
+        self.assertEqual(
+            dump_sched.plan_units(
+                self.dump_cmd, self.db_list, self.done, batch_size=100,
+                db_size={"db2": 10}), self.units)
+        mock_batch.assert_called_once_with(["db2"], {"db2": 10}, 100)
+
+    def test_all_databases(self):
+
+        """Function:  test_all_databases
+
+        Description:  Test a single unit of all databases.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            dump_sched.plan_units(self.dump_cmd2, [], {}), self.all_db)
+
+    def test_all_databases_done(self):
+
+        """Function:  test_all_databases_done
+
+        Description:  Test all databases completed by the previous run.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            dump_sched.plan_units(
+                self.dump_cmd2, [], {"All_Databases": []}), [])
+
+    def test_nothing(self):
+
+        """Function:  test_nothing
+
+        Description:  Test with no databases and no --all-databases option.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(dump_sched.plan_units(self.dump_cmd, [], {}))
+
+
+if __name__ == "__main__":
+    unittest.main()
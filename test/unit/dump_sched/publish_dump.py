@@ -0,0 +1,182 @@
+# Classification (U)
+
+"""Program:  publish_dump.py
+
+    Description:  Unit testing of publish_dump in dump_sched.py.
+
+    Usage:
+        test/unit/dump_sched/publish_dump.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import shutil
+import threading
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import dump_sched                               # pylint:disable=E0401,C0413
+import dump_units                               # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_publish
+        test_failed
+        test_cancelled
+        test_missing
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.unit = {"name": "db1", "args": ["db1"], "file": "db1"}
+        self.dmp_path = "./test/unit/dump_sched/tmp/"
+        self.part_path = dump_units.part_dir(self.dmp_path)
+        self.fname = os.path.join(self.part_path, "db1_publish.sql")
+        self.moved = os.path.join(self.dmp_path, "db1_publish.sql")
+        self.dmp_files = {"db1": self.fname}
+        self.metrics = {"status": True, "file": self.fname}
+        os.makedirs(self.part_path)
+
+        with open(self.fname, "wb") as f_hdlr:
+            f_hdlr.write(b"Dump")
+
+    def test_publish(self):
+
+        """Function:  test_publish
+
+        Description:  Test the dump files are moved into the dump directory
+            and recorded in the journal once the sync event is set.
+
+        Arguments:
+
+        """
+
+        sync = threading.Event()
+        sync.set()
+        journal = mock.Mock()
+        files = {}
+
+        self.assertTrue(
+            dump_sched.publish_dump(
+                self.unit, self.dmp_files, self.metrics, self.dmp_path,
+                files=files, journal=journal, sync=sync))
+        self.assertEqual(files, {"db1": self.moved})
+        self.assertEqual(self.metrics["file"], self.moved)
+        self.assertTrue(os.path.isfile(self.moved))
+        journal.record.assert_called_once_with(
+            self.unit, [self.moved], None)
+
+    def test_failed(self):
+
+        """Function:  test_failed
+
+        Description:  Test the dump files of a failed unit are not moved.
+
+        Arguments:
+
+        """
+
+        self.metrics["status"] = False
+        files = {}
+
+        self.assertFalse(
+            dump_sched.publish_dump(
+                self.unit, self.dmp_files, self.metrics, self.dmp_path,
+                files=files))
+        self.assertEqual(files, {})
+        self.assertFalse(os.path.isfile(self.moved))
+
+    def test_cancelled(self):
+
+        """Function:  test_cancelled
+
+        Description:  Test the dump files of a cancelled unit are removed.
+
+        Arguments:
+
+        """
+
+        cancel = threading.Event()
+        cancel.set()
+        files = {}
+
+        self.assertFalse(
+            dump_sched.publish_dump(
+                self.unit, self.dmp_files, self.metrics, self.dmp_path,
+                files=files, cancel=cancel))
+        self.assertEqual(files, {})
+        self.assertFalse(self.metrics["status"])
+        self.assertFalse(os.path.isfile(self.fname))
+        self.assertFalse(os.path.isfile(self.moved))
+
+    def test_missing(self):
+
+        """Function:  test_missing
+
+        Description:  Test a unit with a dump file missing from the partial
+            directory fails.
+
+        Arguments:
+
+        """
+
+        os.remove(self.fname)
+        files = {}
+
+        with gen_libs.no_std_out():
+            self.assertFalse(
+                dump_sched.publish_dump(
+                    self.unit, self.dmp_files, self.metrics, self.dmp_path,
+                    files=files))
+
+        self.assertEqual(files, {})
+        self.assertFalse(self.metrics["status"])
+        self.assertIn("Missing dump files", self.metrics["error"])
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.part_path, ignore_errors=True)
+
+        if os.path.isfile(self.moved):
+            os.remove(self.moved)
+
+
+if __name__ == "__main__":
+    unittest.main()
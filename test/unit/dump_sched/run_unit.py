@@ -0,0 +1,103 @@
+# Classification (U)
+
+"""Program:  run_unit.py
+
+    Description:  Unit testing of run_unit in dump_sched.py.
+
+    Usage:
+        test/unit/dump_sched/run_unit.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import dump_sched                               # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_run_unit
+        test_error
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.dump_cmd = ["dump_command"]
+        self.unit = {"name": "db1", "args": ["db1"], "file": "db1"}
+        self.dmp_path = "./test/unit/dump_sched/tmp/"
+
+    @mock.patch("dump_sched.dump_unit")
+    def test_run_unit(self, mock_unit):
+
+        """Function:  test_run_unit
+
+        Description:  Test the status of the unit dump is returned.
+
+        Arguments:
+
+        """
+
+        mock_unit.return_value = ("db1", True)
+
+        self.assertEqual(
+            dump_sched.run_unit(self.dump_cmd, self.unit, False,
+                                   self.dmp_path, retries=1),
+            ("db1", True))
+        mock_unit.assert_called_once_with(
+            self.dump_cmd, self.unit, False, self.dmp_path, retries=1)
+
+    @mock.patch("dump_sched.dump_unit",
+                mock.Mock(side_effect=OSError(28, "No space left on device")))
+    def test_error(self):
+
+        """Function:  test_error
+
+        Description:  Test an error raised by the dump fails the unit.
+
+        Arguments:
+
+        """
+
+        metrics = {}
+
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                dump_sched.run_unit(self.dump_cmd, self.unit, False,
+                                       self.dmp_path, metrics=metrics),
+                ("db1", False))
+
+        self.assertFalse(metrics["db1"]["status"])
+        self.assertIn("No space left on device", metrics["db1"]["error"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,212 @@
+# Classification (U)
+
+"""Program:  sync_snapshot.py
+
+    Description:  Unit testing of sync_snapshot in dump_sched.py.
+
+    Usage:
+        test/unit/dump_sched/sync_snapshot.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import dump_sched                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Proc():                                           # pylint:disable=R0903
+
+    """Class:  Proc
+
+    Description:  Class stub holder for subprocess.Popen class.
+
+    Methods:
+        __init__
+        poll
+
+    """
+
+    def __init__(self, pid, code=None):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.pid = pid
+        self.code = code
+
+    def poll(self):
+
+        """Method:  poll
+
+        Description:  Stub method holder for subprocess.Popen.poll.
+
+        Arguments:
+
+        """
+
+        return self.code
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        col_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmd = None
+        self.data = []
+
+    def col_sql(self, cmd):
+
+        """Method:  col_sql
+
+        Description:  Stub method holder for mysql_class.Server.col_sql.
+
+        Arguments:
+
+        """
+
+        self.cmd = cmd
+
+        return self.data
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_timeout
+        test_failed_process
+        test_completed_processes
+        test_partial_sync
+        test_synced
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+        self.procs = [Proc(101), Proc(102)]
+        self.procs2 = [Proc(101), Proc(102, 2)]
+        self.procs3 = [Proc(101, 0), Proc(102, 0)]
+
+    def test_timeout(self):
+
+        """Function:  test_timeout
+
+        Description:  Test with the dump processes not started in time.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(
+            dump_sched.sync_snapshot(self.server, self.procs[:1], 2, 0))
+
+    def test_failed_process(self):
+
+        """Function:  test_failed_process
+
+        Description:  Test with a failed dump process.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(
+            dump_sched.sync_snapshot(self.server, self.procs2, 2))
+
+    def test_completed_processes(self):
+
+        """Function:  test_completed_processes
+
+        Description:  Test with dump processes which have completed.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(
+            dump_sched.sync_snapshot(self.server, self.procs3, 2))
+
+    @mock.patch("dump_sched.time.sleep", mock.Mock(return_value=True))
+    def test_partial_sync(self):
+
+        """Function:  test_partial_sync
+
+        Description:  Test with only some transactions started in time.
+
+        Arguments:
+
+        """
+
+        self.server.data = [{"Id": 11}]
+
+        self.assertFalse(
+            dump_sched.sync_snapshot(self.server, self.procs, 2, 0.2))
+
+    def test_synced(self):
+
+        """Function:  test_synced
+
+        Description:  Test with all transactions started.
+
+        Arguments:
+
+        """
+
+        self.server.data = [{"Id": 11}, {"Id": 12}]
+
+        self.assertTrue(
+            dump_sched.sync_snapshot(self.server, self.procs, 2))
+        self.assertIn("'101', '102'", self.server.cmd)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,19 @@
+#!/bin/bash
+# Unit testing program for the program module.
+# This will run all the units tests for this program.
+# Will need to run this from the base directory where the module file
+#   is located at.
+
+echo ""
+echo "Unit testing..."
+/usr/bin/python test/unit/dump_sched/dump_attempt.py
+/usr/bin/python test/unit/dump_sched/dump_consistent.py
+/usr/bin/python test/unit/dump_sched/dump_db.py
+/usr/bin/python test/unit/dump_sched/dump_pool.py
+/usr/bin/python test/unit/dump_sched/dump_retry.py
+/usr/bin/python test/unit/dump_sched/dump_seq.py
+/usr/bin/python test/unit/dump_sched/dump_unit.py
+/usr/bin/python test/unit/dump_sched/plan_units.py
+/usr/bin/python test/unit/dump_sched/publish_dump.py
+/usr/bin/python test/unit/dump_sched/run_unit.py
+/usr/bin/python test/unit/dump_sched/sync_snapshot.py
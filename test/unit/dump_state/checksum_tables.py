@@ -0,0 +1,126 @@
+# Classification (U)
+
+"""Program:  checksum_tables.py
+
+    Description:  Unit testing of checksum_tables in dump_state.py.
+
+    Usage:
+        test/unit/dump_state/checksum_tables.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import dump_state                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        col_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmds = []
+
+    def col_sql(self, cmd):
+
+        """Method:  col_sql
+
+        Description:  Stub method holder for mysql_class.Server.col_sql.
+
+        Arguments:
+
+        """
+
+        self.cmds.append(cmd)
+
+        return [{"Table": "db1.t1", "Checksum": 1000},
+                {"Table": "db1.t2", "Checksum": None}]
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_tables
+        test_checksum_tables
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+
+    def test_no_tables(self):
+
+        """Function:  test_no_tables
+
+        Description:  Test with no tables to checksum.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            dump_state.checksum_tables(self.server, "db1", []), {})
+        self.assertEqual(self.server.cmds, [])
+
+    def test_checksum_tables(self):
+
+        """Function:  test_checksum_tables
+
+        Description:  Test the tables without a checksum are left out.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            dump_state.checksum_tables(self.server, "db1", ["t1", "t2"]),
+            {"t1": {"Table": "db1.t1", "Checksum": 1000}})
+        self.assertEqual(self.server.cmds,
+                         ["checksum table `db1`.`t1`, `db1`.`t2`"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,27 @@
+#!/bin/bash
+# Unit test code coverage for program module.
+# This will run the Python code coverage module against all unit test modules.
+# This will show the amount of code that was tested and which lines of code
+#   that was skipped during the test.
+
+coverage erase
+
+echo ""
+echo "Running unit test modules in conjunction with coverage"
+coverage run -a --source=dump_state test/unit/dump_state/checksum_tables.py
+coverage run -a --source=dump_state test/unit/dump_state/crt_fprint.py
+coverage run -a --source=dump_state test/unit/dump_state/dump_binlog.py
+coverage run -a --source=dump_state test/unit/dump_state/dump_incr.py
+coverage run -a --source=dump_state test/unit/dump_state/fetch_binlog_pos.py
+coverage run -a --source=dump_state test/unit/dump_state/fetch_fprint.py
+coverage run -a --source=dump_state test/unit/dump_state/fetch_fprint_rows.py
+coverage run -a --source=dump_state test/unit/dump_state/link_unchanged.py
+coverage run -a --source=dump_state test/unit/dump_state/load_state.py
+coverage run -a --source=dump_state test/unit/dump_state/record_binlog_pos.py
+coverage run -a --source=dump_state test/unit/dump_state/save_state.py
+coverage run -a --source=dump_state test/unit/dump_state/unit_fprint.py
+
+echo ""
+echo "Producing code coverage report"
+coverage combine
+coverage report -m
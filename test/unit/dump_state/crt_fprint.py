@@ -0,0 +1,101 @@
+# Classification (U)
+
+"""Program:  crt_fprint.py
+
+    Description:  Unit testing of crt_fprint in dump_state.py.
+
+    Usage:
+        test/unit/dump_state/crt_fprint.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import datetime
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import dump_state                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_datetime
+        test_changed
+        test_unchanged
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.data = [{"Table": "t1", "Rows": 10}]
+        self.data2 = [{"Table": "t1", "Rows": 11}]
+
+    def test_datetime(self):
+
+        """Function:  test_datetime
+
+        Description:  Test with data which is not json serializable.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            len(dump_state.crt_fprint(
+                [{"Update": datetime.datetime(2026, 1, 1)}])), 64)
+
+    def test_changed(self):
+
+        """Function:  test_changed
+
+        Description:  Test with changed data.
+
+        Arguments:
+
+        """
+
+        self.assertNotEqual(
+            dump_state.crt_fprint(self.data),
+            dump_state.crt_fprint(self.data2))
+
+    def test_unchanged(self):
+
+        """Function:  test_unchanged
+
+        Description:  Test with unchanged data.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            dump_state.crt_fprint(self.data),
+            dump_state.crt_fprint([{"Rows": 10, "Table": "t1"}]))
+
+
+if __name__ == "__main__":
+    unittest.main()
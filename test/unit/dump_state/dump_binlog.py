@@ -0,0 +1,287 @@
+# Classification (U)
+
+"""Program:  dump_binlog.py
+
+    Description:  Unit testing of dump_binlog in dump_state.py.
+
+    Usage:
+        test/unit/dump_state/dump_binlog.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import dump_state                               # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        col_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmd = None
+        self.data = [{"Log_name": "binlog.000002", "File_size": 100},
+                     {"Log_name": "binlog.000003", "File_size": 100},
+                     {"Log_name": "binlog.000004", "File_size": 100}]
+
+    def col_sql(self, cmd):
+
+        """Method:  col_sql
+
+        Description:  Stub method holder for mysql_class.Server.col_sql.
+
+        Arguments:
+
+        """
+
+        self.cmd = cmd
+
+        return self.data
+
+
+class SubProcess():                                     # pylint:disable=R0903
+
+    """Class:  SubProcess
+
+    Description:  Class stub holder for subprocess.Popen class.  Writes the
+        binary logs to the dump directory.
+
+    Methods:
+        __init__
+        wait
+
+    """
+
+    def __init__(self, cmd, logs, code):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmd = cmd
+        self.logs = logs
+        self.code = code
+
+    def wait(self):
+
+        """Method:  wait
+
+        Description:  Stub method holder for subprocess.Popen.wait.
+
+        Arguments:
+
+        """
+
+        path = self.cmd[-2].split("=", 1)[1]
+
+        for log_name in self.logs:
+            with open(path + log_name, mode="w", encoding="UTF-8") as f_hdlr:
+                f_hdlr.write("Binlog Data")
+
+        return self.code
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_full_dump
+        test_purged_binlog
+        test_failed_stream
+        test_from_last_binlog
+        test_from_full_dump
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+        self.binlog_cmd = ["mysqlbinlog", "-u", "user"]
+        self.dmp_path = "./test/unit/dump_state/tmp/"
+        self.manifest = os.path.join(self.dmp_path, "Binlog_Manifest.json")
+        self.full_dump = {"Run": "20260101_000000", "File": "binlog.000003",
+                          "Position": 154, "Executed_Gtid_Set": ""}
+        self.logs = ["binlog.000003", "binlog.000004"]
+
+    def test_no_full_dump(self):
+
+        """Function:  test_no_full_dump
+
+        Description:  Test with no full dump recorded.
+
+        Arguments:
+
+        """
+
+        with gen_libs.no_std_out():
+            self.assertFalse(
+                dump_state.dump_binlog(
+                    self.server, self.binlog_cmd, self.dmp_path))
+
+    def test_purged_binlog(self):
+
+        """Function:  test_purged_binlog
+
+        Description:  Test with the start binary log purged from the server.
+
+        Arguments:
+
+        """
+
+        self.full_dump["File"] = "binlog.000001"
+        dump_state.save_state(
+            self.manifest, {"Full_Dump": self.full_dump, "Binlogs": {}})
+
+        with gen_libs.no_std_out():
+            self.assertFalse(
+                dump_state.dump_binlog(
+                    self.server, self.binlog_cmd, self.dmp_path))
+
+    @mock.patch("dump_state.subprocess.Popen")
+    def test_failed_stream(self, mock_popen):
+
+        """Function:  test_failed_stream
+
+        Description:  Test with mysqlbinlog failing.
+
+        Arguments:
+
+        """
+
+        mock_popen.side_effect = lambda cmd: SubProcess(cmd, [], 1)
+        dump_state.save_state(
+            self.manifest, {"Full_Dump": self.full_dump, "Binlogs": {}})
+
+        with gen_libs.no_std_out():
+            self.assertFalse(
+                dump_state.dump_binlog(
+                    self.server, self.binlog_cmd, self.dmp_path))
+
+        self.assertEqual(
+            dump_state.load_state(self.manifest)["Binlogs"], {})
+
+    @mock.patch("dump_state.subprocess.Popen")
+    def test_from_last_binlog(self, mock_popen):
+
+        """Function:  test_from_last_binlog
+
+        Description:  Test streaming from the last binary log streamed.
+
+        Arguments:
+
+        """
+
+        mock_popen.side_effect = lambda cmd: SubProcess(
+            cmd, ["binlog.000004"], 0)
+        dump_state.save_state(
+            self.manifest,
+            {"Full_Dump": self.full_dump,
+             "Binlogs": {"binlog.000003": {"Run": "20260101_010000",
+                                           "Size": 11},
+                         "binlog.000004": {"Run": "20260101_010000",
+                                           "Size": 5}}})
+
+        with gen_libs.no_std_out():
+            self.assertTrue(
+                dump_state.dump_binlog(
+                    self.server, self.binlog_cmd, self.dmp_path))
+
+        self.assertEqual(mock_popen.call_args[0][0][-1], "binlog.000004")
+        binlogs = dump_state.load_state(self.manifest)["Binlogs"]
+        self.assertEqual(binlogs["binlog.000003"]["Run"], "20260101_010000")
+        self.assertEqual(binlogs["binlog.000004"]["Size"], 11)
+
+    @mock.patch("dump_state.subprocess.Popen")
+    def test_from_full_dump(self, mock_popen):
+
+        """Function:  test_from_full_dump
+
+        Description:  Test streaming from the full dump position.
+
+        Arguments:
+
+        """
+
+        mock_popen.side_effect = lambda cmd: SubProcess(cmd, self.logs, 0)
+        dump_state.save_state(
+            self.manifest, {"Full_Dump": self.full_dump, "Binlogs": {}})
+
+        with gen_libs.no_std_out():
+            self.assertTrue(
+                dump_state.dump_binlog(
+                    self.server, self.binlog_cmd, self.dmp_path))
+
+        self.assertEqual(
+            mock_popen.call_args[0][0],
+            self.binlog_cmd + [
+                "--read-from-remote-server", "--raw", "--to-last-log",
+                "--result-file=" + self.dmp_path, "binlog.000003"])
+        manifest = dump_state.load_state(self.manifest)
+        self.assertEqual(sorted(manifest["Binlogs"]), self.logs)
+        self.assertEqual(manifest["Full_Dump"], self.full_dump)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        for item in self.logs + ["Binlog_Manifest.json"]:
+            if os.path.isfile(os.path.join(self.dmp_path, item)):
+                os.remove(os.path.join(self.dmp_path, item))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,255 @@
+# Classification (U)
+
+"""Program:  dump_incr.py
+
+    Description:  Unit testing of dump_incr in dump_state.py.
+
+    Usage:
+        test/unit/dump_state/dump_incr.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import dump_state                               # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+def dump_db(dump_cmd, db_list, compress, dmp_path, **kwargs):
+
+    """Function:  dump_db
+
+    Description:  Stub holder for dump_sched.dump_db function.  The
+        database named "bad" will fail.
+
+    Arguments:
+
+    """
+
+    if dump_cmd and db_list and dmp_path and not compress:
+        for unit in kwargs["units"]:
+            if unit["name"] != "bad":
+                kwargs["files"][unit["name"]] = unit["file"] + ".sql"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_all_unchanged
+        test_failed_dump
+        test_table_units
+        test_dump_incr
+        test_checksums
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = "Server"
+        self.state_file = "/dir/state.json"
+        self.dump_cmd = ["dump_command", "params"]
+        self.db_list = ["db1", "db2"]
+        self.dmp_path = "./test/unit/dump_state/tmp/"
+        self.fprint = {"db1": "abc", "db2": "def", "bad": "ghi"}
+        self.state = {"db1": {"fprint": "xyz", "file": "db1_old.sql",
+                              "run": "20260101_000000"}}
+        self.units = [
+            {"name": "db2", "args": ["db2"], "file": "db2", "db": "db2"}]
+
+    @mock.patch("dump_state.save_state")
+    @mock.patch("dump_sched.dump_db")
+    @mock.patch("dump_state.link_unchanged", mock.Mock(return_value=[]))
+    @mock.patch("dump_state.load_state")
+    @mock.patch("dump_state.fetch_fprint")
+    def test_all_unchanged(self, mock_fprint, mock_load, mock_dump,
+                           mock_save):
+
+        """Function:  test_all_unchanged
+
+        Description:  Test with all units unchanged.
+
+        Arguments:
+
+        """
+
+        mock_fprint.return_value = self.fprint
+        mock_load.return_value = self.state
+
+        manifest = dump_state.dump_incr(
+            self.server, self.state_file, self.dump_cmd, ["db1"], False,
+            self.dmp_path)
+
+        mock_dump.assert_not_called()
+        mock_save.assert_called_once_with(self.state_file, self.state)
+        self.assertEqual(
+            manifest["Units"],
+            {"db1": {"File": "db1_old.sql", "Run": "20260101_000000"}})
+
+    @mock.patch("dump_state.save_state")
+    @mock.patch("dump_sched.dump_db", dump_db)
+    @mock.patch("dump_state.link_unchanged")
+    @mock.patch("dump_state.load_state")
+    @mock.patch("dump_state.fetch_fprint")
+    def test_failed_dump(self, mock_fprint, mock_load, mock_link, mock_save):
+
+        """Function:  test_failed_dump
+
+        Description:  Test with a failed unit dump.
+
+        Arguments:
+
+        """
+
+        mock_fprint.return_value = self.fprint
+        mock_load.return_value = self.state
+        mock_link.return_value = [
+            {"name": "bad", "args": ["bad"], "file": "bad", "db": "bad"}]
+
+        manifest = dump_state.dump_incr(
+            self.server, self.state_file, self.dump_cmd, ["db1", "bad"],
+            False, self.dmp_path)
+
+        self.assertEqual(manifest["Failed"], ["bad"])
+        self.assertNotIn("bad", mock_save.call_args[0][1])
+
+    @mock.patch("dump_state.save_state")
+    @mock.patch("dump_sched.dump_db", dump_db)
+    @mock.patch("dump_state.link_unchanged")
+    @mock.patch("dump_state.load_state", mock.Mock(return_value={}))
+    @mock.patch("dump_state.fetch_fprint")
+    def test_table_units(self, mock_fprint, mock_link, mock_save):
+
+        """Function:  test_table_units
+
+        Description:  Test with table units.
+
+        Arguments:
+
+        """
+
+        mock_fprint.return_value = {"db1:schema": "abc", "db1.t1": "def"}
+        mock_link.side_effect = lambda units, *args: units
+
+        manifest = dump_state.dump_incr(
+            self.server, self.state_file, self.dump_cmd, ["db1"], False,
+            self.dmp_path, tbl_size={"db1": {"t1": 100}})
+
+        self.assertEqual(
+            sorted(manifest["Units"]), ["db1.t1", "db1:schema"])
+        self.assertEqual(
+            mock_save.call_args[0][1]["db1.t1"]["file"], "db1.t1.sql")
+
+    @mock.patch("dump_state.save_state")
+    @mock.patch("dump_sched.dump_db", dump_db)
+    @mock.patch("dump_state.link_unchanged")
+    @mock.patch("dump_state.load_state")
+    @mock.patch("dump_state.fetch_fprint")
+    def test_dump_incr(self, mock_fprint, mock_load, mock_link, mock_save):
+
+        """Function:  test_dump_incr
+
+        Description:  Test with changed and unchanged units.
+
+        Arguments:
+
+        """
+
+        mock_fprint.return_value = self.fprint
+        mock_load.return_value = self.state
+        mock_link.return_value = self.units
+
+        manifest = dump_state.dump_incr(
+            self.server, self.state_file, self.dump_cmd, self.db_list, False,
+            self.dmp_path)
+        state = mock_save.call_args[0][1]
+
+        self.assertEqual(state["db1"], self.state["db1"])
+        self.assertEqual(state["db2"]["file"], "db2.sql")
+        self.assertEqual(state["db2"]["run"], manifest["Run"])
+        self.assertEqual(
+            state["db2"]["fprint"],
+            dump_state.unit_fprint(
+                self.units[0], self.fprint,
+                {"cmd": self.dump_cmd, "compress": False, "codec": None,
+                 "level": None, "engine": None}))
+        self.assertEqual(manifest["Failed"], [])
+        self.assertEqual(
+            len(gen_libs.filename_search(self.dmp_path, "Manifest.*.json")),
+            1)
+
+    @mock.patch("dump_report.save_manifest")
+    @mock.patch("dump_state.save_state", mock.Mock())
+    @mock.patch("dump_sched.dump_db", dump_db)
+    @mock.patch("dump_state.link_unchanged")
+    @mock.patch("dump_state.load_state")
+    @mock.patch("dump_state.fetch_fprint")
+    def test_checksums(self, mock_fprint, mock_load, mock_link,
+                       mock_manifest):
+
+        """Function:  test_checksums
+
+        Description:  Test the checksums are added to the manifest.
+
+        Arguments:
+
+        """
+
+        mock_fprint.return_value = self.fprint
+        mock_load.return_value = self.state
+        mock_link.return_value = self.units
+        digests = {"db2.sql": {"algo": "sha256"}}
+
+        manifest = dump_state.dump_incr(
+            self.server, self.state_file, self.dump_cmd, self.db_list, False,
+            self.dmp_path, hash_opts={"algo": "sha256", "digests": digests})
+
+        self.assertEqual(manifest["Checksums"], digests)
+        mock_manifest.assert_called_once_with(self.dmp_path, manifest)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        file_list = gen_libs.filename_search(
+            self.dmp_path, "Manifest.*.json", add_path=True)
+
+        for item in file_list:
+            if os.path.isfile(item):
+                os.remove(item)
+
+
+if __name__ == "__main__":
+    unittest.main()
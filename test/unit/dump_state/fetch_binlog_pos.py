@@ -0,0 +1,95 @@
+# Classification (U)
+
+"""Program:  fetch_binlog_pos.py
+
+    Description:  Unit testing of fetch_binlog_pos in dump_state.py.
+
+    Usage:
+        test/unit/dump_state/fetch_binlog_pos.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import dump_state                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_binlog_disabled
+        test_fetch_position
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = "Server"
+        self.stat = [{"File": "binlog.000003", "Position": 154,
+                      "Binlog_Do_DB": "", "Binlog_Ignore_DB": "",
+                      "Executed_Gtid_Set": "uuid:1-10"}]
+
+    @mock.patch("dump_state.mysql_class.show_master_stat",
+                mock.Mock(return_value=[]))
+    def test_binlog_disabled(self):
+
+        """Function:  test_binlog_disabled
+
+        Description:  Test with binary logging disabled.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(dump_state.fetch_binlog_pos(self.server))
+
+    @mock.patch("dump_state.mysql_class.show_master_stat")
+    def test_fetch_position(self, mock_stat):
+
+        """Function:  test_fetch_position
+
+        Description:  Test getting the full dump position.
+
+        Arguments:
+
+        """
+
+        mock_stat.return_value = self.stat
+
+        position = dump_state.fetch_binlog_pos(self.server)
+
+        self.assertEqual(
+            (position["File"], position["Position"],
+             position["Executed_Gtid_Set"]),
+            ("binlog.000003", 154, "uuid:1-10"))
+        self.assertIn("Run", position)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,417 @@
+# Classification (U)
+
+"""Program:  fetch_fprint.py
+
+    Description:  Unit testing of fetch_fprint in dump_state.py.
+
+    Usage:
+        test/unit/dump_state/fetch_fprint.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import dump_state                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        col_sql
+        cmd_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmds = []
+        self.expiry = [{"Variable_name": "information_schema_stats_expiry",
+                        "Value": "86400"}]
+        self.tables = [
+            {"Database": "db1", "Table": "t1", "Type": "BASE TABLE",
+             "Engine": "InnoDB", "Rows": 10, "Data": 16384, "Index": 0,
+             "Create": "2026-01-01 00:00:00", "Update": None, "Unknown": 1},
+            {"Database": "db1", "Table": "v1", "Type": "VIEW",
+             "Engine": None, "Rows": None, "Data": None, "Index": None,
+             "Create": None, "Update": None, "Unknown": 1},
+            {"Database": "db2", "Table": "t1", "Type": "BASE TABLE",
+             "Engine": "InnoDB", "Rows": 10, "Data": 16384, "Index": 0,
+             "Create": "2026-01-01 00:00:00",
+             "Update": "2026-01-01 00:00:00", "Unknown": 0},
+            {"Database": "mysql", "Table": "user", "Type": "BASE TABLE",
+             "Engine": "InnoDB", "Rows": 5, "Data": 16384, "Index": 0,
+             "Create": "2026-01-01 00:00:00", "Update": None, "Unknown": 1}]
+        self.objects = [{"Database": "db1", "Name": "v1", "Altered": "abc"}]
+        self.checksum = 1000
+
+    def col_sql(self, cmd):
+
+        """Method:  col_sql
+
+        Description:  Stub method holder for mysql_class.Server.col_sql.
+
+        Arguments:
+
+        """
+
+        self.cmds.append(cmd)
+
+        if cmd.startswith("show variables"):
+            data = self.expiry
+
+        elif "information_schema.tables" in cmd:
+            data = [dict(item) for item in self.tables]
+
+        elif "information_schema.routines" in cmd:
+            data = self.objects
+
+        else:
+            data = [{"Table": cmd.split("`")[1] + ".t1",
+                     "Checksum": self.checksum}]
+
+        return data
+
+    def cmd_sql(self, cmd):
+
+        """Method:  cmd_sql
+
+        Description:  Stub method holder for mysql_class.Server.cmd_sql.
+
+        Arguments:
+
+        """
+
+        self.cmds.append(cmd)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        fetch_fprint
+        test_no_stats_expiry
+        test_stats_expiry
+        test_checksum_tables
+        test_known_update
+        test_large_table
+        test_gtid_position
+        test_binlog_position
+        test_no_position
+        test_changed
+        test_unchanged
+        test_table_checksum
+        test_null_checksum
+        test_table_unchanged
+        test_fingerprints
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+        self.db_list = ["db1", "db2"]
+        self.expiry = "set session information_schema_stats_expiry = 0"
+        self.position = {"Run": "20260101_000000", "File": "mysql-bin.000001",
+                         "Position": 100, "Executed_Gtid_Set": "a:1-10"}
+
+    def fetch_fprint(self, position=None, checksum_size=None):
+
+        """Function:  fetch_fprint
+
+        Description:  Fetch the fingerprints with the binary log position.
+
+        Arguments:
+
+        """
+
+        with mock.patch("dump_state.fetch_binlog_pos",
+                        mock.Mock(return_value=position)):
+            return dump_state.fetch_fprint(
+                self.server, self.db_list,
+                checksum_size=dump_state.CHECKSUM_SIZE
+                if checksum_size is None else checksum_size)
+
+    def test_no_stats_expiry(self):
+
+        """Function:  test_no_stats_expiry
+
+        Description:  Test with a server without the statistics cache.
+
+        Arguments:
+
+        """
+
+        self.server.expiry = []
+        self.fetch_fprint()
+
+        self.assertNotIn(self.expiry, self.server.cmds)
+
+    def test_stats_expiry(self):
+
+        """Function:  test_stats_expiry
+
+        Description:  Test with the statistics cache disabled.
+
+        Arguments:
+
+        """
+
+        self.fetch_fprint()
+
+        self.assertIn(self.expiry, self.server.cmds)
+
+    def test_checksum_tables(self):
+
+        """Function:  test_checksum_tables
+
+        Description:  Test the checksum of the small base tables with an
+            unknown update time.
+
+        Arguments:
+
+        """
+
+        fprint = self.fetch_fprint()
+
+        self.assertIn("checksum table `db1`.`t1`", self.server.cmds)
+        self.assertIsNotNone(fprint["db1.t1"])
+
+    def test_known_update(self):
+
+        """Function:  test_known_update
+
+        Description:  Test a base table with a known update time is not
+            checksummed.
+
+        Arguments:
+
+        """
+
+        fprint = self.fetch_fprint()
+
+        self.assertNotIn("checksum table `db2`.`t1`", self.server.cmds)
+        self.assertIsNotNone(fprint["db2.t1"])
+        self.assertIsNotNone(fprint["db2"])
+
+    def test_large_table(self):
+
+        """Function:  test_large_table
+
+        Description:  Test a large base table with an unknown update time is
+            not checksummed.
+
+        Arguments:
+
+        """
+
+        self.fetch_fprint(position=self.position, checksum_size=1024)
+
+        self.assertFalse([cmd for cmd in self.server.cmds
+                          if cmd.startswith("checksum table")])
+
+    def test_gtid_position(self):
+
+        """Function:  test_gtid_position
+
+        Description:  Test the fingerprint of a large base table with an
+            unknown update time changes with the GTID position.
+
+        Arguments:
+
+        """
+
+        fprint = self.fetch_fprint(position=self.position, checksum_size=0)
+        fprint2 = self.fetch_fprint(
+            position=dict(self.position, File="mysql-bin.000002"),
+            checksum_size=0)
+        fprint3 = self.fetch_fprint(
+            position=dict(self.position, Executed_Gtid_Set="a:1-11"),
+            checksum_size=0)
+
+        self.assertEqual(fprint["db1.t1"], fprint2["db1.t1"])
+        self.assertNotEqual(fprint["db1.t1"], fprint3["db1.t1"])
+        self.assertNotEqual(fprint["db1"], fprint3["db1"])
+        self.assertEqual(fprint["db2"], fprint3["db2"])
+
+    def test_binlog_position(self):
+
+        """Function:  test_binlog_position
+
+        Description:  Test the fingerprint of a large base table with an
+            unknown update time changes with the binary log position without
+            GTIDs.
+
+        Arguments:
+
+        """
+
+        position = dict(self.position, Executed_Gtid_Set="")
+        fprint = self.fetch_fprint(position=position, checksum_size=0)
+        fprint2 = self.fetch_fprint(
+            position=dict(position, Position=200), checksum_size=0)
+
+        self.assertIsNotNone(fprint["db1.t1"])
+        self.assertNotEqual(fprint["db1.t1"], fprint2["db1.t1"])
+
+    def test_no_position(self):
+
+        """Function:  test_no_position
+
+        Description:  Test a large base table with an unknown update time has
+            no fingerprint without the binary log position.
+
+        Arguments:
+
+        """
+
+        fprint = self.fetch_fprint(checksum_size=0)
+
+        self.assertIsNone(fprint["db1.t1"])
+        self.assertIsNone(fprint["db1"])
+        self.assertIsNone(fprint["db1:schema"])
+        self.assertIsNotNone(fprint["db2"])
+
+    def test_changed(self):
+
+        """Function:  test_changed
+
+        Description:  Test the fingerprint changes with the database.
+
+        Arguments:
+
+        """
+
+        fprint = self.fetch_fprint()
+        self.server.tables[2]["Update"] = "2026-01-02 00:00:00"
+        fprint2 = self.fetch_fprint()
+
+        self.assertNotEqual(fprint["db2"], fprint2["db2"])
+        self.assertNotEqual(fprint["db2.t1"], fprint2["db2.t1"])
+        self.assertEqual(fprint["db1"], fprint2["db1"])
+        self.assertEqual(fprint["db1.t1"], fprint2["db1.t1"])
+
+    def test_unchanged(self):
+
+        """Function:  test_unchanged
+
+        Description:  Test the fingerprint of an unchanged database.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(self.fetch_fprint(self.position),
+                         self.fetch_fprint(self.position))
+
+    def test_table_checksum(self):
+
+        """Function:  test_table_checksum
+
+        Description:  Test the table fingerprint changes with the checksum.
+
+        Arguments:
+
+        """
+
+        fprint = self.fetch_fprint()
+        self.server.checksum = 12345
+        fprint2 = self.fetch_fprint()
+
+        self.assertNotEqual(fprint["db1.t1"], fprint2["db1.t1"])
+        self.assertNotEqual(fprint["db1"], fprint2["db1"])
+
+    def test_null_checksum(self):
+
+        """Function:  test_null_checksum
+
+        Description:  Test a table without a checksum has no fingerprint
+            without the binary log position.
+
+        Arguments:
+
+        """
+
+        self.server.checksum = None
+        fprint = self.fetch_fprint()
+
+        self.assertIsNone(fprint["db1"])
+        self.assertIsNone(fprint["db1:schema"])
+        self.assertIsNone(fprint["db1.t1"])
+
+    def test_table_unchanged(self):
+
+        """Function:  test_table_unchanged
+
+        Description:  Test the table fingerprint with a changed view.
+
+        Arguments:
+
+        """
+
+        fprint = self.fetch_fprint()
+        self.server.objects[0]["Altered"] = "def"
+        fprint2 = self.fetch_fprint()
+
+        self.assertNotEqual(fprint["db1"], fprint2["db1"])
+        self.assertNotEqual(fprint["db1:schema"], fprint2["db1:schema"])
+        self.assertEqual(fprint["db1.t1"], fprint2["db1.t1"])
+
+    def test_fingerprints(self):
+
+        """Function:  test_fingerprints
+
+        Description:  Test a fingerprint for each database, schema and
+            table.
+
+        Arguments:
+
+        """
+
+        fprint = self.fetch_fprint()
+
+        self.assertEqual(
+            sorted(fprint), ["db1", "db1.t1", "db1:schema", "db2", "db2.t1",
+                             "db2:schema"])
+        self.assertNotEqual(fprint["db1"], fprint["db2"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,160 @@
+# Classification (U)
+
+"""Program:  fetch_fprint_rows.py
+
+    Description:  Unit testing of fetch_fprint_rows in dump_state.py.
+
+    Usage:
+        test/unit/dump_state/fetch_fprint_rows.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import dump_state                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        col_sql
+        cmd_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmds = []
+        self.tables = [
+            {"Database": "db1", "Table": "t1", "Type": "BASE TABLE",
+             "Update": None, "Unknown": 1},
+            {"Database": "db1", "Table": "t2", "Type": "BASE TABLE",
+             "Update": "2026-01-01 00:00:00", "Unknown": 0},
+            {"Database": "db1", "Table": "v1", "Type": "VIEW",
+             "Update": None, "Unknown": 1},
+            {"Database": "mysql", "Table": "user", "Type": "BASE TABLE",
+             "Update": None, "Unknown": 1}]
+        self.objects = [{"Database": "db1", "Name": "v1", "Altered": "abc"},
+                        {"Database": "mysql", "Name": "p1", "Altered": "x"}]
+
+    def col_sql(self, cmd):
+
+        """Method:  col_sql
+
+        Description:  Stub method holder for mysql_class.Server.col_sql.
+
+        Arguments:
+
+        """
+
+        self.cmds.append(cmd)
+
+        if cmd.startswith("show variables"):
+            data = []
+
+        elif "information_schema.tables" in cmd:
+            data = [dict(item) for item in self.tables]
+
+        else:
+            data = self.objects
+
+        return data
+
+    def cmd_sql(self, cmd):
+
+        """Method:  cmd_sql
+
+        Description:  Stub method holder for mysql_class.Server.cmd_sql.
+
+        Arguments:
+
+        """
+
+        self.cmds.append(cmd)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_unknown
+        test_fprint_rows
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+
+    def test_unknown(self):
+
+        """Function:  test_unknown
+
+        Description:  Test the base tables with an unknown update time.
+
+        Arguments:
+
+        """
+
+        _, _, unknown = dump_state.fetch_fprint_rows(self.server, ["db1"])
+
+        self.assertEqual(unknown, {"db1": ["t1"]})
+
+    def test_fprint_rows(self):
+
+        """Function:  test_fprint_rows
+
+        Description:  Test the rows of the databases and their base tables.
+
+        Arguments:
+
+        """
+
+        db_rows, tbl_rows, _ = dump_state.fetch_fprint_rows(
+            self.server, ["db1"])
+
+        self.assertEqual(list(db_rows), ["db1"])
+        self.assertEqual(len(db_rows["db1"]), 4)
+        self.assertEqual(sorted(tbl_rows["db1"]), ["t1", "t2"])
+        self.assertNotIn("Unknown", tbl_rows["db1"]["t1"][0])
+
+
+if __name__ == "__main__":
+    unittest.main()
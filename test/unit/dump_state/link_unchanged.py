@@ -0,0 +1,200 @@
+# Classification (U)
+
+"""Program:  link_unchanged.py
+
+    Description:  Unit testing of link_unchanged in dump_state.py.
+
+    Usage:
+        test/unit/dump_state/link_unchanged.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import dump_state                               # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_changed
+        test_changed_args
+        test_missing_file
+        test_new_database
+        test_link_failed
+        test_unchanged
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.dmp_path = "./test/unit/dump_state/tmp/"
+        self.old_file = os.path.join(self.dmp_path, "db1_20260101_0000.sql.gz")
+        self.new_file = os.path.join(self.dmp_path, "db1_20260102_0000.sql.gz")
+
+        with open(self.old_file, mode="w", encoding="UTF-8") as f_hdlr:
+            f_hdlr.write("Dump Data")
+
+        self.units = [{"name": "db1", "args": ["db1"], "file": "db1"}]
+        self.units2 = [{"name": "db2", "args": ["db2"], "file": "db2"}]
+        self.fprint = {"db1": "abc"}
+        self.state = {"db1": {
+            "fprint": dump_state.unit_fprint(self.units[0], self.fprint),
+            "file": self.old_file, "run": "20260101_000000"}}
+
+    def test_changed(self):
+
+        """Function:  test_changed
+
+        Description:  Test with a changed unit.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            dump_state.link_unchanged(
+                self.units, {"db1": "def"}, self.state, self.dmp_path),
+            self.units)
+
+    def test_changed_args(self):
+
+        """Function:  test_changed_args
+
+        Description:  Test with changed unit dump arguments.
+
+        Arguments:
+
+        """
+
+        units = [{"name": "db1", "args": ["--where=id < 10", "db1"],
+                  "file": "db1"}]
+
+        self.assertEqual(
+            dump_state.link_unchanged(
+                units, self.fprint, self.state, self.dmp_path), units)
+
+    def test_missing_file(self):
+
+        """Function:  test_missing_file
+
+        Description:  Test with the previous dump file missing.
+
+        Arguments:
+
+        """
+
+        os.remove(self.old_file)
+
+        self.assertEqual(
+            dump_state.link_unchanged(
+                self.units, self.fprint, self.state, self.dmp_path),
+            self.units)
+
+    def test_new_database(self):
+
+        """Function:  test_new_database
+
+        Description:  Test with a unit not in the state.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            dump_state.link_unchanged(
+                self.units2, {"db2": "abc"}, self.state, self.dmp_path),
+            self.units2)
+
+    @mock.patch("dump_state.gen_libs.crt_file_time")
+    @mock.patch("dump_state.os.link")
+    def test_link_failed(self, mock_link, mock_time):
+
+        """Function:  test_link_failed
+
+        Description:  Test with the previous dump file failing to link.
+
+        Arguments:
+
+        """
+
+        mock_link.side_effect = OSError("Cross-device link")
+        mock_time.return_value = self.new_file
+
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                dump_state.link_unchanged(
+                    self.units, self.fprint, self.state, self.dmp_path),
+                self.units)
+
+        self.assertEqual(self.state["db1"]["file"], self.old_file)
+
+    @mock.patch("dump_state.gen_libs.crt_file_time")
+    def test_unchanged(self, mock_time):
+
+        """Function:  test_unchanged
+
+        Description:  Test with an unchanged unit.
+
+        Arguments:
+
+        """
+
+        mock_time.return_value = self.new_file
+
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                dump_state.link_unchanged(
+                    self.units, self.fprint, self.state, self.dmp_path),
+                [])
+
+        mock_time.assert_called_once_with("db1", self.dmp_path, ".sql.gz")
+        self.assertEqual(self.state["db1"]["file"], self.new_file)
+        self.assertEqual(self.state["db1"]["run"], "20260101_000000")
+        self.assertTrue(os.path.samefile(self.old_file, self.new_file))
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        for item in [self.old_file, self.new_file]:
+            if os.path.isfile(item):
+                os.remove(item)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+# Classification (U)
+
+"""Program:  load_state.py
+
+    Description:  Unit testing of load_state in dump_state.py.
+
+    Usage:
+        test/unit/dump_state/load_state.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import dump_state                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_missing_file
+        test_load_state
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.state_file = "./test/unit/dump_state/tmp/load_state.json"
+        self.state = {"db1": {"fprint": "abc", "file": "/dir/db1.sql"}}
+
+    def test_missing_file(self):
+
+        """Function:  test_missing_file
+
+        Description:  Test with a missing state file.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(dump_state.load_state(self.state_file), {})
+
+    def test_load_state(self):
+
+        """Function:  test_load_state
+
+        Description:  Test loading the state file.
+
+        Arguments:
+
+        """
+
+        dump_state.save_state(self.state_file, self.state)
+
+        self.assertEqual(
+            dump_state.load_state(self.state_file), self.state)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        if os.path.isfile(self.state_file):
+            os.remove(self.state_file)
+
+
+if __name__ == "__main__":
+    unittest.main()
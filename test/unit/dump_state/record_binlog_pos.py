@@ -0,0 +1,92 @@
+# Classification (U)
+
+"""Program:  record_binlog_pos.py
+
+    Description:  Unit testing of record_binlog_pos in dump_state.py.
+
+    Usage:
+        test/unit/dump_state/record_binlog_pos.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import dump_state                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_record_position
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.dmp_path = "./test/unit/dump_state/tmp/"
+        self.manifest = os.path.join(self.dmp_path, "Binlog_Manifest.json")
+        self.position = {"Run": "20260101_000000", "File": "binlog.000003",
+                         "Position": 154, "Executed_Gtid_Set": "uuid:1-10"}
+
+    def test_record_position(self):
+
+        """Function:  test_record_position
+
+        Description:  Test recording the full dump position clears the
+            binary logs of the previous full dump.
+
+        Arguments:
+
+        """
+
+        dump_state.save_state(
+            self.manifest, {"Full_Dump": {}, "Binlogs": {"binlog.000001": {}}})
+
+        dump_state.record_binlog_pos(self.dmp_path, self.position)
+
+        self.assertEqual(
+            dump_state.load_state(self.manifest),
+            {"Full_Dump": self.position, "Binlogs": {}})
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        if os.path.isfile(self.manifest):
+            os.remove(self.manifest)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+# Classification (U)
+
+"""Program:  save_state.py
+
+    Description:  Unit testing of save_state in dump_state.py.
+
+    Usage:
+        test/unit/dump_state/save_state.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import json
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import dump_state                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_replace_state
+        test_save_state
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.state_file = "./test/unit/dump_state/tmp/save_state.json"
+        self.state = {"db1": {"fprint": "abc", "file": "/dir/db1.sql"}}
+        self.state2 = {"db2": {"fprint": "def", "file": "/dir/db2.sql"}}
+
+    def test_replace_state(self):
+
+        """Function:  test_replace_state
+
+        Description:  Test replacing an existing state file.
+
+        Arguments:
+
+        """
+
+        dump_state.save_state(self.state_file, self.state)
+        dump_state.save_state(self.state_file, self.state2)
+
+        with open(self.state_file, mode="r", encoding="UTF-8") as f_hdlr:
+            self.assertEqual(json.load(f_hdlr), self.state2)
+
+        self.assertFalse(os.path.isfile(self.state_file + ".tmp"))
+
+    def test_save_state(self):
+
+        """Function:  test_save_state
+
+        Description:  Test saving the state file.
+
+        Arguments:
+
+        """
+
+        dump_state.save_state(self.state_file, self.state)
+
+        with open(self.state_file, mode="r", encoding="UTF-8") as f_hdlr:
+            self.assertEqual(json.load(f_hdlr), self.state)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        if os.path.isfile(self.state_file):
+            os.remove(self.state_file)
+
+
+if __name__ == "__main__":
+    unittest.main()
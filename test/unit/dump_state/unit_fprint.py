@@ -0,0 +1,138 @@
+# Classification (U)
+
+"""Program:  unit_fprint.py
+
+    Description:  Unit testing of unit_fprint in dump_state.py.
+
+    Usage:
+        test/unit/dump_state/unit_fprint.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import dump_state                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_fprint
+        test_chunk_unit
+        test_changed_args
+        test_changed_opts
+        test_unit_fprint
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.fprint = {"db1": "abc", "db1.t1": "def"}
+        self.unit = {"name": "db1", "args": ["db1"], "file": "db1"}
+        self.unit2 = {"name": "db1.t1#0001",
+                      "args": ["--where=`id` < 10", "db1", "t1"],
+                      "file": "db1.t1.0001"}
+        self.unit3 = {"name": "db1.t1#0001",
+                      "args": ["--where=`id` < 20", "db1", "t1"],
+                      "file": "db1.t1.0001"}
+
+    def test_no_fprint(self):
+
+        """Function:  test_no_fprint
+
+        Description:  Test with no fingerprint for the unit.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(
+            dump_state.unit_fprint(
+                {"name": "db2", "args": ["db2"], "file": "db2"}, self.fprint))
+
+    def test_chunk_unit(self):
+
+        """Function:  test_chunk_unit
+
+        Description:  Test with a table range unit.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            dump_state.unit_fprint(self.unit2, self.fprint),
+            dump_state.crt_fprint(["def", self.unit2["args"], None]))
+
+    def test_changed_args(self):
+
+        """Function:  test_changed_args
+
+        Description:  Test with changed unit dump arguments.
+
+        Arguments:
+
+        """
+
+        self.assertNotEqual(
+            dump_state.unit_fprint(self.unit2, self.fprint),
+            dump_state.unit_fprint(self.unit3, self.fprint))
+
+    def test_changed_opts(self):
+
+        """Function:  test_changed_opts
+
+        Description:  Test with changed dump options.
+
+        Arguments:
+
+        """
+
+        self.assertNotEqual(
+            dump_state.unit_fprint(self.unit, self.fprint,
+                                      {"compress": False}),
+            dump_state.unit_fprint(self.unit, self.fprint,
+                                      {"compress": True}))
+
+    def test_unit_fprint(self):
+
+        """Function:  test_unit_fprint
+
+        Description:  Test with a database unit.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            dump_state.unit_fprint(self.unit, self.fprint),
+            dump_state.crt_fprint(["abc", ["db1"], None]))
+
+
+if __name__ == "__main__":
+    unittest.main()
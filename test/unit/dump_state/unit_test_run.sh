@@ -0,0 +1,20 @@
+#!/bin/bash
+# Unit testing program for the program module.
+# This will run all the units tests for this program.
+# Will need to run this from the base directory where the module file
+#   is located at.
+
+echo ""
+echo "Unit testing..."
+/usr/bin/python test/unit/dump_state/checksum_tables.py
+/usr/bin/python test/unit/dump_state/crt_fprint.py
+/usr/bin/python test/unit/dump_state/dump_binlog.py
+/usr/bin/python test/unit/dump_state/dump_incr.py
+/usr/bin/python test/unit/dump_state/fetch_binlog_pos.py
+/usr/bin/python test/unit/dump_state/fetch_fprint.py
+/usr/bin/python test/unit/dump_state/fetch_fprint_rows.py
+/usr/bin/python test/unit/dump_state/link_unchanged.py
+/usr/bin/python test/unit/dump_state/load_state.py
+/usr/bin/python test/unit/dump_state/record_binlog_pos.py
+/usr/bin/python test/unit/dump_state/save_state.py
+/usr/bin/python test/unit/dump_state/unit_fprint.py
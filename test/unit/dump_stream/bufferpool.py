@@ -0,0 +1,96 @@
+# Classification (U)
+
+"""Program:  bufferpool.py
+
+    Description:  Unit testing of BufferPool class in dump_stream.py.
+
+    Usage:
+        test/unit/dump_stream/bufferpool.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import threading
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import dump_stream                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_preallocated
+        test_reuse
+        test_empty_pool
+
+    """
+
+    def test_preallocated(self):
+
+        """Function:  test_preallocated
+
+        Description:  Test the buffers are preallocated.
+
+        Arguments:
+
+        """
+
+        pool = dump_stream.BufferPool(count=2, size=100)
+
+        self.assertEqual(pool.free.qsize(), 2)
+        self.assertEqual(len(pool.get()), 100)
+        self.assertEqual(pool.size, 100)
+
+    def test_reuse(self):
+
+        """Function:  test_reuse
+
+        Description:  Test a returned buffer is reused.
+
+        Arguments:
+
+        """
+
+        pool = dump_stream.BufferPool(count=1, size=10)
+        buf = pool.get()
+        pool.put(buf)
+
+        self.assertIs(pool.get(), buf)
+
+    def test_empty_pool(self):
+
+        """Function:  test_empty_pool
+
+        Description:  Test taking a buffer from an empty pool waits for a
+            buffer to be returned.
+
+        Arguments:
+
+        """
+
+        pool = dump_stream.BufferPool(count=1, size=10)
+        buf = pool.get()
+        timer = threading.Timer(0.1, pool.put, args=(buf,))
+        timer.start()
+
+        self.assertIs(pool.get(), buf)
+        timer.join()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,23 @@
+#!/bin/bash
+# Unit test code coverage for program module.
+# This will run the Python code coverage module against all unit test modules.
+# This will show the amount of code that was tested and which lines of code
+#   that was skipped during the test.
+
+coverage erase
+
+echo ""
+echo "Running unit test modules in conjunction with coverage"
+coverage run -a --source=dump_stream test/unit/dump_stream/bufferpool.py
+coverage run -a --source=dump_stream test/unit/dump_stream/copy_stream.py
+coverage run -a --source=dump_stream test/unit/dump_stream/dump_fname.py
+coverage run -a --source=dump_stream test/unit/dump_stream/open_compressor.py
+coverage run -a --source=dump_stream test/unit/dump_stream/parallelgzip.py
+coverage run -a --source=dump_stream test/unit/dump_stream/stage.py
+coverage run -a --source=dump_stream test/unit/dump_stream/streampipeline.py
+coverage run -a --source=dump_stream test/unit/dump_stream/writestage.py
+
+echo ""
+echo "Producing code coverage report"
+coverage combine
+coverage report -m
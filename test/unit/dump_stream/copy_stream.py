@@ -0,0 +1,211 @@
+# Classification (U)
+
+"""Program:  copy_stream.py
+
+    Description:  Unit testing of copy_stream in dump_stream.py.
+
+    Usage:
+        test/unit/dump_stream/copy_stream.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import io
+import errno
+import threading
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import dump_stream                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        write_pipe
+        read_file
+        test_splice
+        test_splice_failed
+        test_no_splice
+        test_readinto
+        test_empty
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.fname = "./test/unit/dump_stream/tmp/test_copy.sql"
+        self.data = b"INSERT INTO t1 VALUES (1),(2),(3);\n" * 10000
+
+    def write_pipe(self):
+
+        """Function:  write_pipe
+
+        Description:  Return the read end of a pipe fed with the data by a
+            writer thread.
+
+        Arguments:
+
+        """
+
+        r_fd, w_fd = os.pipe()
+
+        def writer():
+
+            """Function:  writer
+
+            Description:  Write the data to the pipe and close it.
+
+            Arguments:
+
+            """
+
+            with io.open(w_fd, "wb") as w_hdlr:
+                w_hdlr.write(self.data)
+
+        threading.Thread(target=writer, daemon=True).start()
+
+        return io.open(r_fd, "rb")
+
+    def read_file(self):
+
+        """Function:  read_file
+
+        Description:  Return the contents of the file.
+
+        Arguments:
+
+        """
+
+        with open(self.fname, "rb") as f_hdlr:
+            return f_hdlr.read()
+
+    @unittest.skipUnless(hasattr(os, "splice"), "os.splice not available")
+    def test_splice(self):
+
+        """Function:  test_splice
+
+        Description:  Test moving the data with os.splice.
+
+        Arguments:
+
+        """
+
+        with self.write_pipe() as src, open(self.fname, "wb") as dst:
+            with mock.patch("dump_stream.os.splice",
+                            wraps=os.splice) as mock_splice:
+                self.assertEqual(
+                    dump_stream.copy_stream(src, dst, splice=True),
+                    len(self.data))
+
+        self.assertTrue(mock_splice.called)
+        self.assertEqual(self.read_file(), self.data)
+
+    @unittest.skipUnless(hasattr(os, "splice"), "os.splice not available")
+    @mock.patch("dump_stream.os.splice",
+                mock.Mock(side_effect=OSError(errno.EINVAL, "Invalid")))
+    def test_splice_failed(self):
+
+        """Function:  test_splice_failed
+
+        Description:  Test falling back to readinto when the file does not
+            support os.splice.
+
+        Arguments:
+
+        """
+
+        with self.write_pipe() as src, open(self.fname, "wb") as dst:
+            self.assertEqual(dump_stream.copy_stream(src, dst, splice=True),
+                             len(self.data))
+
+        self.assertEqual(self.read_file(), self.data)
+
+    def test_no_splice(self):
+
+        """Function:  test_no_splice
+
+        Description:  Test with a source stream without a file descriptor.
+
+        Arguments:
+
+        """
+
+        with open(self.fname, "wb") as dst:
+            self.assertEqual(dump_stream.copy_stream(
+                io.BytesIO(self.data), dst, splice=True), len(self.data))
+
+        self.assertEqual(self.read_file(), self.data)
+
+    def test_readinto(self):
+
+        """Function:  test_readinto
+
+        Description:  Test the readinto loop with a small buffer.
+
+        Arguments:
+
+        """
+
+        dst = io.BytesIO()
+
+        self.assertEqual(dump_stream.copy_stream(
+            io.BytesIO(self.data), dst, size=1000), len(self.data))
+        self.assertEqual(dst.getvalue(), self.data)
+
+    def test_empty(self):
+
+        """Function:  test_empty
+
+        Description:  Test with an empty stream.
+
+        Arguments:
+
+        """
+
+        dst = io.BytesIO()
+
+        self.assertEqual(dump_stream.copy_stream(io.BytesIO(), dst), 0)
+        self.assertEqual(dst.getvalue(), b"")
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        if os.path.isfile(self.fname):
+            os.remove(self.fname)
+
+
+if __name__ == "__main__":
+    unittest.main()
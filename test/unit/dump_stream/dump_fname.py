@@ -0,0 +1,99 @@
+# Classification (U)
+
+"""Program:  dump_fname.py
+
+    Description:  Unit testing of dump_fname in dump_stream.py.
+
+    Usage:
+        test/unit/dump_stream/dump_fname.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import dump_stream                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_default_codec
+        test_codec
+        test_no_compress
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.dmp_file = "/dir/db1_20260101_0000.sql"
+
+    def test_default_codec(self):
+
+        """Function:  test_default_codec
+
+        Description:  Test with the default codec.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            dump_stream.dump_fname(self.dmp_file, True, {}),
+            self.dmp_file + ".gz")
+
+    def test_codec(self):
+
+        """Function:  test_codec
+
+        Description:  Test with a codec selected.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            dump_stream.dump_fname(self.dmp_file, True, {"codec": "zstd"}),
+            self.dmp_file + ".zst")
+
+    def test_no_compress(self):
+
+        """Function:  test_no_compress
+
+        Description:  Test with no compression.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            dump_stream.dump_fname(self.dmp_file, False, {"codec": "xz"}),
+            self.dmp_file)
+
+
+if __name__ == "__main__":
+    unittest.main()
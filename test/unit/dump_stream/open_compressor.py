@@ -0,0 +1,203 @@
+# Classification (U)
+
+"""Program:  open_compressor.py
+
+    Description:  Unit testing of open_compressor in dump_stream.py.
+
+    Usage:
+        test/unit/dump_stream/open_compressor.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import gzip
+import lzma
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import dump_stream                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_zstd_threads
+        test_zstd
+        test_lz4
+        test_xz
+        test_gzip_level
+        test_multiple_threads
+        test_single_thread
+        test_no_options
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.fname = "./test/unit/dump_stream/tmp/test_compress.sql.gz"
+
+    @mock.patch("dump_stream.zstandard")
+    def test_zstd_threads(self, mock_zstd):
+
+        """Function:  test_zstd_threads
+
+        Description:  Test with zstd codec and multiple threads.
+
+        Arguments:
+
+        """
+
+        dump_stream.open_compressor(
+            self.fname, {"codec": "zstd", "level": 5, "threads": 4})
+
+        mock_zstd.ZstdCompressor.assert_called_once_with(level=5, threads=4)
+
+    @mock.patch("dump_stream.zstandard")
+    def test_zstd(self, mock_zstd):
+
+        """Function:  test_zstd
+
+        Description:  Test with zstd codec and the default level.
+
+        Arguments:
+
+        """
+
+        dump_stream.open_compressor(self.fname, {"codec": "zstd"})
+
+        mock_zstd.ZstdCompressor.assert_called_once_with(level=3, threads=0)
+
+    @mock.patch("dump_stream.lz4", create=True)
+    def test_lz4(self, mock_lz4):
+
+        """Function:  test_lz4
+
+        Description:  Test with lz4 codec.
+
+        Arguments:
+
+        """
+
+        dump_stream.open_compressor(
+            self.fname, {"codec": "lz4", "level": 9})
+
+        mock_lz4.frame.open.assert_called_once_with(
+            self.fname, "wb", compression_level=9)
+
+    def test_xz(self):
+
+        """Function:  test_xz
+
+        Description:  Test with xz codec.
+
+        Arguments:
+
+        """
+
+        with dump_stream.open_compressor(
+                self.fname, {"codec": "xz", "level": 1}) as f_hdlr:
+            self.assertIsInstance(f_hdlr, lzma.LZMAFile)
+            f_hdlr.write(b"Dump Data")
+
+        with lzma.open(self.fname, "rb") as f_hdlr:
+            self.assertEqual(f_hdlr.read(), b"Dump Data")
+
+    def test_gzip_level(self):
+
+        """Function:  test_gzip_level
+
+        Description:  Test with gzip codec and a compression level.
+
+        Arguments:
+
+        """
+
+        with dump_stream.open_compressor(
+                self.fname, {"codec": "gzip", "level": 1}) as f_hdlr:
+            f_hdlr.write(b"Dump Data")
+
+        with gzip.open(self.fname, "rb") as f_hdlr:
+            self.assertEqual(f_hdlr.read(), b"Dump Data")
+
+    def test_multiple_threads(self):
+
+        """Function:  test_multiple_threads
+
+        Description:  Test with multiple compression threads.
+
+        Arguments:
+
+        """
+
+        with dump_stream.open_compressor(
+                self.fname, {"threads": 2}) as f_hdlr:
+            self.assertIsInstance(f_hdlr, dump_stream.ParallelGzip)
+
+    def test_single_thread(self):
+
+        """Function:  test_single_thread
+
+        Description:  Test with a single compression thread.
+
+        Arguments:
+
+        """
+
+        with dump_stream.open_compressor(
+                self.fname, {"threads": 1}) as f_hdlr:
+            self.assertIsInstance(f_hdlr, gzip.GzipFile)
+
+    def test_no_options(self):
+
+        """Function:  test_no_options
+
+        Description:  Test with no compression options.
+
+        Arguments:
+
+        """
+
+        with dump_stream.open_compressor(self.fname, {}) as f_hdlr:
+            self.assertIsInstance(f_hdlr, gzip.GzipFile)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        if os.path.isfile(self.fname):
+            os.remove(self.fname)
+
+
+if __name__ == "__main__":
+    unittest.main()
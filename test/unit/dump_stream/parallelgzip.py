@@ -0,0 +1,167 @@
+# Classification (U)
+
+"""Program:  parallelgzip.py
+
+    Description:  Unit testing of ParallelGzip class in dump_stream.py.
+
+    Usage:
+        test/unit/dump_stream/parallelgzip.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import gzip
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import dump_stream                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_close_twice
+        test_empty_stream
+        test_multi_member
+        test_file_object
+        test_single_block
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.fname = "./test/unit/dump_stream/tmp/test_pgzip.sql.gz"
+        self.data = b"INSERT INTO t1 VALUES (1),(2),(3);\n" * 1000
+
+    def test_close_twice(self):
+
+        """Function:  test_close_twice
+
+        Description:  Test closing the compressor twice.
+
+        Arguments:
+
+        """
+
+        pgzip = dump_stream.ParallelGzip(self.fname, 2)
+        pgzip.write(self.data)
+        pgzip.close()
+        pgzip.close()
+
+        with gzip.open(self.fname, "rb") as f_hdlr:
+            self.assertEqual(f_hdlr.read(), self.data)
+
+    def test_empty_stream(self):
+
+        """Function:  test_empty_stream
+
+        Description:  Test with no data written to the compressor.
+
+        Arguments:
+
+        """
+
+        with dump_stream.ParallelGzip(self.fname, 2):
+            pass
+
+        with gzip.open(self.fname, "rb") as f_hdlr:
+            self.assertEqual(f_hdlr.read(), b"")
+
+    def test_multi_member(self):
+
+        """Function:  test_multi_member
+
+        Description:  Test data spanning multiple compressed blocks.
+
+        Arguments:
+
+        """
+
+        with dump_stream.ParallelGzip(
+                self.fname, 3, block_size=1000) as pgzip:
+            for pos in range(0, len(self.data), 777):
+                pgzip.write(self.data[pos:pos + 777])
+
+        self.assertEqual(pgzip.members, 35)
+
+        with gzip.open(self.fname, "rb") as f_hdlr:
+            self.assertEqual(f_hdlr.read(), self.data)
+
+    def test_file_object(self):
+
+        """Function:  test_file_object
+
+        Description:  Test writing to a file-like instance.
+
+        Arguments:
+
+        """
+
+        f_name = open(self.fname, "wb")                 # pylint:disable=R1732
+
+        with dump_stream.ParallelGzip(f_name, 2) as pgzip:
+            pgzip.write(self.data)
+
+        self.assertTrue(f_name.closed)
+
+        with gzip.open(self.fname, "rb") as f_hdlr:
+            self.assertEqual(f_hdlr.read(), self.data)
+
+    def test_single_block(self):
+
+        """Function:  test_single_block
+
+        Description:  Test data fitting in a single block.
+
+        Arguments:
+
+        """
+
+        with dump_stream.ParallelGzip(self.fname, 2) as pgzip:
+            self.assertEqual(pgzip.write(self.data), len(self.data))
+
+        self.assertEqual(pgzip.members, 1)
+
+        with gzip.open(self.fname, "rb") as f_hdlr:
+            self.assertEqual(f_hdlr.read(), self.data)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        if os.path.isfile(self.fname):
+            os.remove(self.fname)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+# Classification (U)
+
+"""Program:  stage.py
+
+    Description:  Unit testing of Stage class in dump_stream.py.
+
+    Usage:
+        test/unit/dump_stream/stage.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import dump_stream                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_write
+        test_close
+
+    """
+
+    def test_write(self):
+
+        """Function:  test_write
+
+        Description:  Test the block is passed to the next stage.
+
+        Arguments:
+
+        """
+
+        data = memoryview(b"Dump Data")
+
+        self.assertIs(dump_stream.Stage().write(data), data)
+
+    def test_close(self):
+
+        """Function:  test_close
+
+        Description:  Test the end of the stream.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(dump_stream.Stage().close())
+
+
+if __name__ == "__main__":
+    unittest.main()
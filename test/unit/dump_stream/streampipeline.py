@@ -0,0 +1,242 @@
+# Classification (U)
+
+"""Program:  streampipeline.py
+
+    Description:  Unit testing of StreamPipeline class in dump_stream.py.
+
+    Usage:
+        test/unit/dump_stream/streampipeline.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import io
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import dump_stream                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Collect(dump_stream.Stage):
+
+    """Class:  Collect
+
+    Description:  Stage collecting the stream and the buffers used.
+
+    Methods:
+        __init__
+        write
+        close
+
+    """
+
+    def __init__(self, fail=None):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.data = bytearray()
+        self.buffers = set()
+        self.closed = False
+        self.fail = fail
+
+    def write(self, data):
+
+        """Method:  write
+
+        Description:  Collect a block of the stream.
+
+        Arguments:
+
+        """
+
+        if self.fail and self.fail in bytes(data):
+            raise ValueError("Stage failed")
+
+        self.data.extend(data)
+
+        if isinstance(data, memoryview):
+            self.buffers.add(id(data.obj))
+
+        return data
+
+    def close(self):
+
+        """Method:  close
+
+        Description:  End of the stream.
+
+        Arguments:
+
+        """
+
+        self.closed = True
+
+
+class Filter(dump_stream.Stage):                      # pylint:disable=R0903
+
+    """Class:  Filter
+
+    Description:  Stage dropping the blocks starting with a comment and
+        upper casing the other blocks.
+
+    Methods:
+        write
+
+    """
+
+    def write(self, data):
+
+        """Method:  write
+
+        Description:  Filter a block of the stream.
+
+        Arguments:
+
+        """
+
+        if bytes(data[:2]) == b"--":
+            return None
+
+        return bytes(data).upper()
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_stages
+        test_buffer_reuse
+        test_transform
+        test_empty_stream
+        test_stage_failed
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.data = bytes(range(256)) * 100
+        self.pool = dump_stream.BufferPool(count=2, size=1000)
+
+    def test_stages(self):
+
+        """Function:  test_stages
+
+        Description:  Test the stream is passed in order through all stages.
+
+        Arguments:
+
+        """
+
+        stage1 = Collect()
+        stage2 = Collect()
+        pipeline = dump_stream.StreamPipeline([stage1, stage2], self.pool)
+
+        self.assertEqual(pipeline.run(io.BytesIO(self.data)), len(self.data))
+        self.assertEqual(stage1.data, self.data)
+        self.assertEqual(stage2.data, self.data)
+        self.assertTrue(stage1.closed and stage2.closed)
+
+    def test_buffer_reuse(self):
+
+        """Function:  test_buffer_reuse
+
+        Description:  Test only the pooled buffers are used and all are
+            returned to the pool.
+
+        Arguments:
+
+        """
+
+        stage = Collect()
+        dump_stream.StreamPipeline([stage], self.pool).run(
+            io.BytesIO(self.data))
+
+        self.assertLessEqual(len(stage.buffers), 2)
+        self.assertEqual(self.pool.free.qsize(), 2)
+
+    def test_transform(self):
+
+        """Function:  test_transform
+
+        Description:  Test a stage transforming and dropping blocks.
+
+        Arguments:
+
+        """
+
+        stage = Collect()
+        pool = dump_stream.BufferPool(count=2, size=4)
+        dump_stream.StreamPipeline([Filter(), stage], pool).run(
+            io.BytesIO(b"abcd-- xyzw"))
+
+        self.assertEqual(stage.data, b"ABCDYZW")
+        self.assertEqual(pool.free.qsize(), 2)
+
+    def test_empty_stream(self):
+
+        """Function:  test_empty_stream
+
+        Description:  Test with an empty stream.
+
+        Arguments:
+
+        """
+
+        stage = Collect()
+
+        self.assertEqual(dump_stream.StreamPipeline(
+            [stage], self.pool).run(io.BytesIO()), 0)
+        self.assertTrue(stage.closed)
+        self.assertEqual(stage.data, b"")
+
+    def test_stage_failed(self):
+
+        """Function:  test_stage_failed
+
+        Description:  Test the error of a failed stage is raised.
+
+        Arguments:
+
+        """
+
+        stage1 = Collect(fail=bytes([200]))
+        stage2 = Collect()
+
+        with self.assertRaises(ValueError):
+            dump_stream.StreamPipeline([stage1, stage2], self.pool).run(
+                io.BytesIO(self.data))
+
+        self.assertFalse(stage1.closed or stage2.closed)
+        self.assertEqual(self.pool.free.qsize(), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,16 @@
+#!/bin/bash
+# Unit testing program for the program module.
+# This will run all the units tests for this program.
+# Will need to run this from the base directory where the module file
+#   is located at.
+
+echo ""
+echo "Unit testing..."
+/usr/bin/python test/unit/dump_stream/bufferpool.py
+/usr/bin/python test/unit/dump_stream/copy_stream.py
+/usr/bin/python test/unit/dump_stream/dump_fname.py
+/usr/bin/python test/unit/dump_stream/open_compressor.py
+/usr/bin/python test/unit/dump_stream/parallelgzip.py
+/usr/bin/python test/unit/dump_stream/stage.py
+/usr/bin/python test/unit/dump_stream/streampipeline.py
+/usr/bin/python test/unit/dump_stream/writestage.py
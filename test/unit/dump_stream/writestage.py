@@ -0,0 +1,64 @@
+# Classification (U)
+
+"""Program:  writestage.py
+
+    Description:  Unit testing of WriteStage class in dump_stream.py.
+
+    Usage:
+        test/unit/dump_stream/writestage.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import io
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import dump_stream                              # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_write
+
+    """
+
+    def test_write(self):
+
+        """Function:  test_write
+
+        Description:  Test writing the blocks to the file.
+
+        Arguments:
+
+        """
+
+        f_hdlr = io.BytesIO()
+        stage = dump_stream.WriteStage(f_hdlr)
+        data = memoryview(b"Dump Data")
+
+        block = data[:5]
+
+        self.assertIs(stage.write(block), block)
+        stage.write(data[5:])
+        stage.close()
+        self.assertEqual(f_hdlr.getvalue(), b"Dump Data")
+
+
+if __name__ == "__main__":
+    unittest.main()
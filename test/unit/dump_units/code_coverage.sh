@@ -0,0 +1,30 @@
+#!/bin/bash
+# Unit test code coverage for program module.
+# This will run the Python code coverage module against all unit test modules.
+# This will show the amount of code that was tested and which lines of code
+#   that was skipped during the test.
+
+coverage erase
+
+echo ""
+echo "Running unit test modules in conjunction with coverage"
+coverage run -a --source=dump_units test/unit/dump_units/crt_batches.py
+coverage run -a --source=dump_units test/unit/dump_units/crt_groups.py
+coverage run -a --source=dump_units test/unit/dump_units/crt_units.py
+coverage run -a --source=dump_units test/unit/dump_units/crt_where.py
+coverage run -a --source=dump_units test/unit/dump_units/fetch_data_size.py
+coverage run -a --source=dump_units test/unit/dump_units/fetch_db_size.py
+coverage run -a --source=dump_units test/unit/dump_units/fetch_tbl_chunks.py
+coverage run -a --source=dump_units test/unit/dump_units/fetch_tbl_size.py
+coverage run -a --source=dump_units test/unit/dump_units/journal.py
+coverage run -a --source=dump_units test/unit/dump_units/move_dump.py
+coverage run -a --source=dump_units test/unit/dump_units/not_started.py
+coverage run -a --source=dump_units test/unit/dump_units/order_db_list.py
+coverage run -a --source=dump_units test/unit/dump_units/part_dir.py
+coverage run -a --source=dump_units test/unit/dump_units/print_status.py
+coverage run -a --source=dump_units test/unit/dump_units/remove_dump.py
+
+echo ""
+echo "Producing code coverage report"
+coverage combine
+coverage report -m
@@ -0,0 +1,120 @@
+# Classification (U)
+
+"""Program:  crt_batches.py
+
+    Description:  Unit testing of crt_batches in dump_units.py.
+
+    Usage:
+        test/unit/dump_units/crt_batches.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import dump_units                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_single_database_batch
+        test_large_database
+        test_multiple_batches
+        test_no_databases
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.db_list = ["db1", "db2", "db3", "db4", "db5"]
+        self.db_size = {"db1": 500, "db2": 40, "db3": 40, "db4": 30,
+                        "db5": 10}
+
+    def test_single_database_batch(self):
+
+        """Function:  test_single_database_batch
+
+        Description:  Test with a batch of a single database.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            dump_units.crt_batches(["db1", "db5"], self.db_size, 100),
+            [{"name": "db1", "args": ["db1"], "file": "db1", "db": "db1"},
+             {"name": "db5", "args": ["db5"], "file": "db5", "db": "db5"}])
+
+    def test_large_database(self):
+
+        """Function:  test_large_database
+
+        Description:  Test with a database of the batch size.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            dump_units.crt_batches(["db2", "db3"], self.db_size, 40),
+            [{"name": "db2", "args": ["db2"], "file": "db2", "db": "db2"},
+             {"name": "db3", "args": ["db3"], "file": "db3", "db": "db3"}])
+
+    def test_multiple_batches(self):
+
+        """Function:  test_multiple_batches
+
+        Description:  Test with multiple batches.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            dump_units.crt_batches(self.db_list, self.db_size, 80),
+            [{"name": "db1", "args": ["db1"], "file": "db1", "db": "db1"},
+             {"name": "batch_0001", "args": ["--databases", "db2", "db3"],
+              "file": "Batch_0001", "split": ["db2", "db3"]},
+             {"name": "batch_0002", "args": ["--databases", "db4", "db5"],
+              "file": "Batch_0002", "split": ["db4", "db5"]}])
+
+    def test_no_databases(self):
+
+        """Function:  test_no_databases
+
+        Description:  Test with no databases.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(dump_units.crt_batches([], self.db_size, 80), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
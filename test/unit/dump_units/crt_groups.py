@@ -0,0 +1,108 @@
+# Classification (U)
+
+"""Program:  crt_groups.py
+
+    Description:  Unit testing of crt_groups in dump_units.py.
+
+    Usage:
+        test/unit/dump_units/crt_groups.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import dump_units                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_more_groups
+        test_balanced_groups
+        test_single_group
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.db_list = ["db1", "db2", "db3", "db4"]
+        self.db_size = {"db1": 10, "db2": 60, "db3": 30, "db4": 25}
+
+    def test_more_groups(self):
+
+        """Function:  test_more_groups
+
+        Description:  Test with more groups than databases.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            [unit["name"] for unit in dump_units.crt_groups(
+                ["db1", "db2"], self.db_size, 4)],
+            ["snapshot_01", "snapshot_02"])
+
+    def test_balanced_groups(self):
+
+        """Function:  test_balanced_groups
+
+        Description:  Test the databases are balanced across the groups.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            dump_units.crt_groups(self.db_list, self.db_size, 2),
+            [{"name": "snapshot_01",
+              "args": ["--single-transaction", "--databases", "db2"],
+              "file": "Snapshot_01", "split": ["db2"]},
+             {"name": "snapshot_02",
+              "args": ["--single-transaction", "--databases", "db3", "db4",
+                       "db1"],
+              "file": "Snapshot_02", "split": ["db3", "db4", "db1"]}])
+
+    def test_single_group(self):
+
+        """Function:  test_single_group
+
+        Description:  Test with a single group.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            dump_units.crt_groups(self.db_list, self.db_size, 1)[0]["args"],
+            ["--single-transaction", "--databases", "db2", "db3", "db4",
+             "db1"])
+
+
+if __name__ == "__main__":
+    unittest.main()
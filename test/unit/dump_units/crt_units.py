@@ -0,0 +1,164 @@
+# Classification (U)
+
+"""Program:  crt_units.py
+
+    Description:  Unit testing of crt_units in dump_units.py.
+
+    Usage:
+        test/unit/dump_units/crt_units.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import dump_units                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_table_order
+        test_chunked_table
+        test_table_units
+        test_no_tables
+        test_database_units
+        test_empty_list
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.db_list = ["db1", "db2"]
+        self.tbl_size = {"db1": {"t1": 100, "t2": 5000},
+                         "db2": {"t3": 900}}
+        self.schema = ["--no-data", "--routines", "--events", "--triggers"]
+        self.data = ["--no-create-info", "--skip-triggers"]
+
+    def test_table_order(self):
+
+        """Function:  test_table_order
+
+        Description:  Test schema units are first and table units are ordered
+            largest first.
+
+        Arguments:
+
+        """
+
+        units = dump_units.crt_units(self.db_list, tbl_size=self.tbl_size)
+
+        self.assertEqual(
+            [unit["name"] for unit in units],
+            ["db1:schema", "db2:schema", "db1.t2", "db2.t3", "db1.t1"])
+
+    def test_chunked_table(self):
+
+        """Function:  test_chunked_table
+
+        Description:  Test a chunked table is split into range units.
+
+        Arguments:
+
+        """
+
+        units = dump_units.crt_units(
+            ["db2"], tbl_size=self.tbl_size,
+            tbl_chunks={"db2": {"t3": ("id", [500])}})
+
+        self.assertEqual(
+            units[1:],
+            [{"name": "db2.t3#0001",
+              "args": self.data + ["--where=`id` < 500", "db2", "t3"],
+              "file": "db2.t3.0001", "db": "db2"},
+             {"name": "db2.t3#0002",
+              "args": self.data + ["--where=`id` >= 500", "db2", "t3"],
+              "file": "db2.t3.0002", "db": "db2"}])
+
+    def test_table_units(self):
+
+        """Function:  test_table_units
+
+        Description:  Test the schema and table unit contents.
+
+        Arguments:
+
+        """
+
+        units = dump_units.crt_units(["db2"], tbl_size=self.tbl_size)
+
+        self.assertEqual(
+            units,
+            [{"name": "db2:schema", "args": self.schema + ["db2"],
+              "file": "db2_schema", "db": "db2"},
+             {"name": "db2.t3", "args": self.data + ["db2", "t3"],
+              "file": "db2.t3", "db": "db2"}])
+
+    def test_no_tables(self):
+
+        """Function:  test_no_tables
+
+        Description:  Test with a database with no tables.
+
+        Arguments:
+
+        """
+
+        units = dump_units.crt_units(["db3"], tbl_size=self.tbl_size)
+
+        self.assertEqual([unit["name"] for unit in units], ["db3:schema"])
+
+    def test_database_units(self):
+
+        """Function:  test_database_units
+
+        Description:  Test with no table sizes passed.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            dump_units.crt_units(self.db_list),
+            [{"name": "db1", "args": ["db1"], "file": "db1", "db": "db1"},
+             {"name": "db2", "args": ["db2"], "file": "db2", "db": "db2"}])
+
+    def test_empty_list(self):
+
+        """Function:  test_empty_list
+
+        Description:  Test with empty database list.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(dump_units.crt_units([]), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+# Classification (U)
+
+"""Program:  crt_where.py
+
+    Description:  Unit testing of crt_where in dump_units.py.
+
+    Usage:
+        test/unit/dump_units/crt_where.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import dump_units                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_multiple_bounds
+        test_single_bound
+        test_no_bounds
+        test_no_primary_key
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.pkey = "id"
+        self.results = ["`id` < 100", "`id` >= 100 AND `id` < 200",
+                        "`id` >= 200"]
+        self.results2 = ["`id` < 100", "`id` >= 100"]
+
+    def test_multiple_bounds(self):
+
+        """Function:  test_multiple_bounds
+
+        Description:  Test with multiple range boundaries.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            dump_units.crt_where(self.pkey, [100, 200]), self.results)
+
+    def test_single_bound(self):
+
+        """Function:  test_single_bound
+
+        Description:  Test with a single range boundary.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            dump_units.crt_where(self.pkey, [100]), self.results2)
+
+    def test_no_bounds(self):
+
+        """Function:  test_no_bounds
+
+        Description:  Test with no range boundaries.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(dump_units.crt_where(self.pkey, []), [])
+
+    def test_no_primary_key(self):
+
+        """Function:  test_no_primary_key
+
+        Description:  Test with no primary key column.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(dump_units.crt_where(None, []), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
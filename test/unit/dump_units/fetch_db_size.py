@@ -0,0 +1,146 @@
+# Classification (U)
+
+"""Program:  fetch_db_size.py
+
+    Description:  Unit testing of fetch_db_size in dump_units.py.
+
+    Usage:
+        test/unit/dump_units/fetch_db_size.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import decimal
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import dump_units                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        col_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmd = None
+        self.data = []
+
+    def col_sql(self, cmd):
+
+        """Method:  col_sql
+
+        Description:  Stub method holder for mysql_class.Server.col_sql.
+
+        Arguments:
+
+        """
+
+        self.cmd = cmd
+
+        return self.data
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_null_size
+        test_multiple_databases
+        test_no_databases
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+        self.data = [{"Database": "db1", "Size": decimal.Decimal(16384)},
+                     {"Database": "db2", "Size": decimal.Decimal(1048576)}]
+        self.data2 = [{"Database": "db1", "Size": None}]
+        self.results = {"db1": 16384, "db2": 1048576}
+        self.results2 = {"db1": 0}
+
+    def test_null_size(self):
+
+        """Function:  test_null_size
+
+        Description:  Test with a database with no size.
+
+        Arguments:
+
+        """
+
+        self.server.data = self.data2
+
+        self.assertEqual(
+            dump_units.fetch_db_size(self.server), self.results2)
+
+    def test_multiple_databases(self):
+
+        """Function:  test_multiple_databases
+
+        Description:  Test with multiple databases.
+
+        Arguments:
+
+        """
+
+        self.server.data = self.data
+
+        self.assertEqual(
+            dump_units.fetch_db_size(self.server), self.results)
+        self.assertIn("information_schema.tables", self.server.cmd)
+
+    def test_no_databases(self):
+
+        """Function:  test_no_databases
+
+        Description:  Test with no databases.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(dump_units.fetch_db_size(self.server), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,247 @@
+# Classification (U)
+
+"""Program:  fetch_tbl_chunks.py
+
+    Description:  Unit testing of fetch_tbl_chunks in dump_units.py.
+
+    Usage:
+        test/unit/dump_units/fetch_tbl_chunks.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import dump_units                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        col_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmds = []
+        self.pk_cols = []
+        self.min_max = [{"Min": 1, "Max": 1000}]
+
+    def col_sql(self, cmd):
+
+        """Method:  col_sql
+
+        Description:  Stub method holder for mysql_class.Server.col_sql.
+
+        Arguments:
+
+        """
+
+        self.cmds.append(cmd)
+
+        return self.pk_cols if "information_schema" in cmd else self.min_max
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_empty_table
+        test_few_rows
+        test_single_row
+        test_non_integer_key
+        test_composite_key
+        test_no_primary_key
+        test_small_table
+        test_chunked_table
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+        self.tbl_size = {"db1": {"t1": 400, "t2": 50}}
+        self.pk_id = {"Database": "db1", "Table": "t1", "Column": "id",
+                      "Type": "bigint"}
+        self.pk_id2 = {"Database": "db1", "Table": "t2", "Column": "id",
+                       "Type": "int"}
+        self.pk_name = {"Database": "db1", "Table": "t1", "Column": "name",
+                        "Type": "varchar"}
+        self.chunk_size = 100
+
+    def test_empty_table(self):
+
+        """Function:  test_empty_table
+
+        Description:  Test with an empty table.
+
+        Arguments:
+
+        """
+
+        self.server.pk_cols = [self.pk_id]
+        self.server.min_max = [{"Min": None, "Max": None}]
+
+        self.assertEqual(
+            dump_units.fetch_tbl_chunks(
+                self.server, self.tbl_size, self.chunk_size), {})
+
+    def test_few_rows(self):
+
+        """Function:  test_few_rows
+
+        Description:  Test with fewer key values than chunks.
+
+        Arguments:
+
+        """
+
+        self.server.pk_cols = [self.pk_id]
+        self.server.min_max = [{"Min": 5, "Max": 7}]
+
+        self.assertEqual(
+            dump_units.fetch_tbl_chunks(
+                self.server, self.tbl_size, self.chunk_size),
+            {"db1": {"t1": ("id", [6, 7])}})
+
+    def test_single_row(self):
+
+        """Function:  test_single_row
+
+        Description:  Test with a single key value.
+
+        Arguments:
+
+        """
+
+        self.server.pk_cols = [self.pk_id]
+        self.server.min_max = [{"Min": 5, "Max": 5}]
+
+        self.assertEqual(
+            dump_units.fetch_tbl_chunks(
+                self.server, self.tbl_size, self.chunk_size), {})
+
+    def test_non_integer_key(self):
+
+        """Function:  test_non_integer_key
+
+        Description:  Test with a non-integer primary key.
+
+        Arguments:
+
+        """
+
+        self.server.pk_cols = [self.pk_name]
+
+        self.assertEqual(
+            dump_units.fetch_tbl_chunks(
+                self.server, self.tbl_size, self.chunk_size), {})
+
+    def test_composite_key(self):
+
+        """Function:  test_composite_key
+
+        Description:  Test with a multiple column primary key.
+
+        Arguments:
+
+        """
+
+        self.server.pk_cols = [self.pk_id, self.pk_name]
+
+        self.assertEqual(
+            dump_units.fetch_tbl_chunks(
+                self.server, self.tbl_size, self.chunk_size), {})
+
+    def test_no_primary_key(self):
+
+        """Function:  test_no_primary_key
+
+        Description:  Test with a table with no primary key.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            dump_units.fetch_tbl_chunks(
+                self.server, self.tbl_size, self.chunk_size), {})
+
+    def test_small_table(self):
+
+        """Function:  test_small_table
+
+        Description:  Test a table smaller than the chunk size is not
+            chunked.
+
+        Arguments:
+
+        """
+
+        self.server.pk_cols = [self.pk_id2]
+
+        self.assertEqual(
+            dump_units.fetch_tbl_chunks(
+                self.server, self.tbl_size, self.chunk_size), {})
+        self.assertEqual(len(self.server.cmds), 1)
+
+    def test_chunked_table(self):
+
+        """Function:  test_chunked_table
+
+        Description:  Test a table larger than the chunk size is chunked.
+
+        Arguments:
+
+        """
+
+        self.server.pk_cols = [self.pk_id, self.pk_id2]
+
+        self.assertEqual(
+            dump_units.fetch_tbl_chunks(
+                self.server, self.tbl_size, self.chunk_size),
+            {"db1": {"t1": ("id", [251, 501, 751])}})
+        self.assertEqual(
+            self.server.cmds[1],
+            "select min(`id`) as 'Min', max(`id`) as 'Max' from `db1`.`t1`")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,152 @@
+# Classification (U)
+
+"""Program:  fetch_tbl_size.py
+
+    Description:  Unit testing of fetch_tbl_size in dump_units.py.
+
+    Usage:
+        test/unit/dump_units/fetch_tbl_size.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import dump_units                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        col_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.cmd = None
+        self.data = []
+
+    def col_sql(self, cmd):
+
+        """Method:  col_sql
+
+        Description:  Stub method holder for mysql_class.Server.col_sql.
+
+        Arguments:
+
+        """
+
+        self.cmd = cmd
+
+        return self.data
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_null_size
+        test_other_databases
+        test_no_tables
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+        self.db_list = ["db1", "db2"]
+        self.data = [
+            {"Database": "db1", "Table": "t1", "Size": 16384},
+            {"Database": "db1", "Table": "t2", "Size": 1048576},
+            {"Database": "db3", "Table": "t3", "Size": 16384}]
+        self.data2 = [{"Database": "db1", "Table": "t1", "Size": None}]
+        self.results = {"db1": {"t1": 16384, "t2": 1048576}, "db2": {}}
+        self.results2 = {"db1": {"t1": 0}, "db2": {}}
+
+    def test_null_size(self):
+
+        """Function:  test_null_size
+
+        Description:  Test with a table with no size.
+
+        Arguments:
+
+        """
+
+        self.server.data = self.data2
+
+        self.assertEqual(
+            dump_units.fetch_tbl_size(self.server, self.db_list),
+            self.results2)
+
+    def test_other_databases(self):
+
+        """Function:  test_other_databases
+
+        Description:  Test tables in databases not in the list are skipped.
+
+        Arguments:
+
+        """
+
+        self.server.data = self.data
+
+        self.assertEqual(
+            dump_units.fetch_tbl_size(self.server, self.db_list),
+            self.results)
+        self.assertIn("BASE TABLE", self.server.cmd)
+
+    def test_no_tables(self):
+
+        """Function:  test_no_tables
+
+        Description:  Test with no tables.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            dump_units.fetch_tbl_size(self.server, self.db_list),
+            {"db1": {}, "db2": {}})
+
+
+if __name__ == "__main__":
+    unittest.main()
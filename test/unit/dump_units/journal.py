@@ -0,0 +1,257 @@
+# Classification (U)
+
+"""Program:  journal.py
+
+    Description:  Unit testing of Journal class in dump_units.py.
+
+    Usage:
+        test/unit/dump_units/journal.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import json
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import dump_units                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        write_journal
+        test_new_run
+        test_resume
+        test_resume_changed_file
+        test_resume_truncated_line
+        test_resume_no_journal
+        test_record
+        test_record_split
+        test_flavor
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.dmp_path = "./test/unit/dump_units/tmp/"
+        self.fname = os.path.join(self.dmp_path, "Journal.jsonl")
+        self.dmp_file = os.path.join(self.dmp_path, "db1_journal.sql")
+        self.run = "20260101_000000"
+        self.entry = {"unit": "db1", "names": ["db1"], "run": self.run,
+                      "files": {"db1_journal.sql": 12}, "checksums": {}}
+
+        with open(self.dmp_file, "wb") as f_hdlr:
+            f_hdlr.write(b"Dump of db1\n")
+
+    def write_journal(self, lines):
+
+        """Function:  write_journal
+
+        Description:  Write the lines to the journal file.
+
+        Arguments:
+
+        """
+
+        with open(self.fname, "w", encoding="UTF-8") as f_hdlr:
+            f_hdlr.write("".join(lines))
+
+    def test_new_run(self):
+
+        """Function:  test_new_run
+
+        Description:  Test the journal file is truncated for a new run.
+
+        Arguments:
+
+        """
+
+        self.write_journal([json.dumps(self.entry) + "\n"])
+
+        journal = dump_units.Journal(self.dmp_path, self.run)
+        journal.close()
+
+        self.assertEqual(journal.done, {})
+        self.assertEqual(os.path.getsize(self.fname), 0)
+
+    def test_resume(self):
+
+        """Function:  test_resume
+
+        Description:  Test the completed units are loaded for a resumed
+            run.
+
+        Arguments:
+
+        """
+
+        self.write_journal([json.dumps(self.entry) + "\n"])
+
+        journal = dump_units.Journal(self.dmp_path, self.run, resume=True)
+        journal.close()
+
+        self.assertEqual(journal.done, {"db1": self.entry})
+
+    def test_resume_changed_file(self):
+
+        """Function:  test_resume_changed_file
+
+        Description:  Test a unit whose dump file has changed or is missing
+            is not completed.
+
+        Arguments:
+
+        """
+
+        entry = dict(self.entry, unit="db2", names=["db2"],
+                     files={"db2_journal.sql": 12})
+        self.entry["files"] = {"db1_journal.sql": 100}
+        self.write_journal(
+            [json.dumps(self.entry) + "\n", json.dumps(entry) + "\n"])
+
+        journal = dump_units.Journal(self.dmp_path, self.run, resume=True)
+        journal.close()
+
+        self.assertEqual(journal.done, {})
+
+    def test_resume_truncated_line(self):
+
+        """Function:  test_resume_truncated_line
+
+        Description:  Test a truncated last line of the journal is ignored.
+
+        Arguments:
+
+        """
+
+        self.write_journal(
+            [json.dumps(self.entry) + "\n", json.dumps(self.entry)[:20]])
+
+        journal = dump_units.Journal(self.dmp_path, self.run, resume=True)
+        journal.close()
+
+        self.assertEqual(list(journal.done), ["db1"])
+
+    def test_resume_no_journal(self):
+
+        """Function:  test_resume_no_journal
+
+        Description:  Test resuming without a journal file.
+
+        Arguments:
+
+        """
+
+        journal = dump_units.Journal(self.dmp_path, self.run, resume=True)
+        journal.close()
+
+        self.assertEqual(journal.done, {})
+        self.assertTrue(os.path.isfile(self.fname))
+
+    def test_record(self):
+
+        """Function:  test_record
+
+        Description:  Test recording a completed unit with its checksum.
+
+        Arguments:
+
+        """
+
+        hash_opts = {"digests": {"db1_journal.sql": {"file": "abc123"}}}
+
+        journal = dump_units.Journal(self.dmp_path, self.run)
+        journal.record({"name": "db1", "args": ["db1"], "file": "db1"},
+                       [self.dmp_file], hash_opts)
+        journal.close()
+
+        with open(self.fname, "r", encoding="UTF-8") as f_hdlr:
+            entry = json.loads(f_hdlr.readline())
+
+        self.assertEqual(entry, dict(
+            self.entry, checksums={"db1_journal.sql": "abc123"}))
+
+    def test_record_split(self):
+
+        """Function:  test_record_split
+
+        Description:  Test recording a completed batch unit is loaded as
+            its databases.
+
+        Arguments:
+
+        """
+
+        journal = dump_units.Journal(self.dmp_path, self.run)
+        journal.record({"name": "batch_0001", "split": ["db1", "db2"]},
+                       [self.dmp_file])
+        journal.close()
+
+        journal = dump_units.Journal(self.dmp_path, self.run, resume=True)
+        journal.close()
+
+        self.assertEqual(sorted(journal.done), ["db1", "db2"])
+
+    def test_flavor(self):
+
+        """Function:  test_flavor
+
+        Description:  Test the journal of a flavor id does not truncate the
+            journal of the other runs.
+
+        Arguments:
+
+        """
+
+        self.write_journal([json.dumps(self.entry) + "\n"])
+
+        journal = dump_units.Journal(self.dmp_path, self.run, flavor="f1")
+        journal.close()
+
+        self.assertEqual(
+            journal.fname, os.path.join(self.dmp_path, "Journal_f1.jsonl"))
+        self.assertGreater(os.path.getsize(self.fname), 0)
+        os.remove(journal.fname)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        for fname in [self.fname, self.dmp_file]:
+            if os.path.isfile(fname):
+                os.remove(fname)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+# Classification (U)
+
+"""Program:  move_dump.py
+
+    Description:  Unit testing of move_dump in dump_units.py.
+
+    Usage:
+        test/unit/dump_units/move_dump.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import shutil
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import dump_units                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_missing
+        test_move
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.dmp_path = "./test/unit/dump_units/tmp/"
+        self.part_path = dump_units.part_dir(self.dmp_path)
+        self.fnames = [os.path.join(self.part_path, "db1_move.sql"),
+                       os.path.join(self.part_path, "db2_move.sql")]
+        os.makedirs(self.part_path)
+
+        with open(self.fnames[0], "wb") as f_hdlr:
+            f_hdlr.write(b"Dump")
+
+    def test_missing(self):
+
+        """Function:  test_missing
+
+        Description:  Test no dump file is moved if one is missing.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            dump_units.move_dump(self.fnames, self.dmp_path),
+            ({}, [self.fnames[1]]))
+        self.assertTrue(os.path.isfile(self.fnames[0]))
+
+    def test_move(self):
+
+        """Function:  test_move
+
+        Description:  Test the dump files are moved into the dump directory.
+
+        Arguments:
+
+        """
+
+        moved, missing = dump_units.move_dump(
+            self.fnames[:1], self.dmp_path)
+
+        self.assertEqual(missing, [])
+        self.assertEqual(
+            moved,
+            {self.fnames[0]: os.path.join(self.dmp_path, "db1_move.sql")})
+        self.assertTrue(os.path.isfile(moved[self.fnames[0]]))
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.part_path, ignore_errors=True)
+        fname = os.path.join(self.dmp_path, "db1_move.sql")
+
+        if os.path.isfile(fname):
+            os.remove(fname)
+
+
+if __name__ == "__main__":
+    unittest.main()
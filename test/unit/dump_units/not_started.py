@@ -0,0 +1,60 @@
+# Classification (U)
+
+"""Program:  not_started.py
+
+    Description:  Unit testing of not_started in dump_units.py.
+
+    Usage:
+        test/unit/dump_units/not_started.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import dump_units                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_not_started
+
+    """
+
+    def test_not_started(self):
+
+        """Function:  test_not_started
+
+        Description:  Test only the units stopped before an attempt are
+            returned.
+
+        Arguments:
+
+        """
+
+        metrics = {"db1": {"status": True, "attempts": 1},
+                   "db2": {"status": False, "attempts": 1, "stopped": True},
+                   "db3": {"status": False, "attempts": 0, "stopped": True},
+                   "db4": {"status": False, "error": "No space left"}}
+
+        self.assertEqual(dump_units.not_started(metrics), ["db3"])
+
+
+if __name__ == "__main__":
+    unittest.main()
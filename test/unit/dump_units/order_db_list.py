@@ -0,0 +1,144 @@
+# Classification (U)
+
+"""Program:  order_db_list.py
+
+    Description:  Unit testing of order_db_list in dump_units.py.
+
+    Usage:
+        test/unit/dump_units/order_db_list.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import dump_units                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_interleave_odd
+        test_interleave_even
+        test_missing_size
+        test_same_size
+        test_largest_first
+        test_empty_list
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.db_list = ["db1", "db2", "db3", "db4", "db5"]
+        self.db_size = {"db1": 50, "db2": 10, "db3": 500, "db4": 5, "db5": 90}
+
+    def test_interleave_odd(self):
+
+        """Function:  test_interleave_odd
+
+        Description:  Test interleave with an odd number of databases.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            dump_units.order_db_list(
+                self.db_list, self.db_size, interleave=True),
+            ["db3", "db4", "db5", "db2", "db1"])
+
+    def test_interleave_even(self):
+
+        """Function:  test_interleave_even
+
+        Description:  Test interleave with an even number of databases.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            dump_units.order_db_list(
+                self.db_list[:4], self.db_size, interleave=True),
+            ["db3", "db4", "db1", "db2"])
+
+    def test_missing_size(self):
+
+        """Function:  test_missing_size
+
+        Description:  Test with a database missing from the size list.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            dump_units.order_db_list(["db6", "db2"], self.db_size),
+            ["db2", "db6"])
+
+    def test_same_size(self):
+
+        """Function:  test_same_size
+
+        Description:  Test databases of the same size are ordered by name.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            dump_units.order_db_list(["db9", "db8"], {}), ["db8", "db9"])
+
+    def test_largest_first(self):
+
+        """Function:  test_largest_first
+
+        Description:  Test databases are ordered largest first.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            dump_units.order_db_list(self.db_list, self.db_size),
+            ["db3", "db5", "db1", "db2", "db4"])
+
+    def test_empty_list(self):
+
+        """Function:  test_empty_list
+
+        Description:  Test with empty database list.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(dump_units.order_db_list([], self.db_size), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+# Classification (U)
+
+"""Program:  part_dir.py
+
+    Description:  Unit testing of part_dir in dump_units.py.
+
+    Usage:
+        test/unit/dump_units/part_dir.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import dump_units                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_part_dir
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.dmp_path = "./test/unit/dump_units/tmp/"
+
+    def test_part_dir(self):
+
+        """Function:  test_part_dir
+
+        Description:  Test the partial directory is keyed by the process id.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            dump_units.part_dir(self.dmp_path),
+            os.path.join(self.dmp_path, f".partial_{os.getpid()}", ""))
+
+
+if __name__ == "__main__":
+    unittest.main()
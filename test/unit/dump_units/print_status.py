@@ -0,0 +1,112 @@
+# Classification (U)
+
+"""Program:  print_status.py
+
+    Description:  Unit testing of print_status in dump_units.py.
+
+    Usage:
+        test/unit/dump_units/print_status.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import io
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import dump_units                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_missing_result
+        test_not_started
+        test_print_status
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.units = [{"name": dbn, "args": [dbn], "file": dbn}
+                      for dbn in ["db1", "db2"]]
+        self.results = {"db1": True, "db2": False}
+        self.results2 = {"db1": True}
+        self.output = "Database dump status:\n    db1:  Success\n" \
+                      "    db2:  Failed\n"
+
+    @mock.patch("sys.stdout", new_callable=io.StringIO)
+    def test_missing_result(self, mock_out):
+
+        """Function:  test_missing_result
+
+        Description:  Test with a unit missing from the results.
+
+        Arguments:
+
+        """
+
+        dump_units.print_status(self.units, self.results2)
+
+        self.assertEqual(mock_out.getvalue(), self.output)
+
+    @mock.patch("sys.stdout", new_callable=io.StringIO)
+    def test_not_started(self, mock_out):
+
+        """Function:  test_not_started
+
+        Description:  Test with a unit not started.
+
+        Arguments:
+
+        """
+
+        dump_units.print_status(
+            self.units, self.results2,
+            {"db2": {"status": False, "attempts": 0, "stopped": True}})
+
+        self.assertEqual(mock_out.getvalue(), self.output.replace(
+            "Failed", "Not started"))
+
+    @mock.patch("sys.stdout", new_callable=io.StringIO)
+    def test_print_status(self, mock_out):
+
+        """Function:  test_print_status
+
+        Description:  Test printing the unit status.
+
+        Arguments:
+
+        """
+
+        dump_units.print_status(self.units, self.results)
+
+        self.assertEqual(mock_out.getvalue(), self.output)
+
+
+if __name__ == "__main__":
+    unittest.main()
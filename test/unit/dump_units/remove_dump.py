@@ -0,0 +1,158 @@
+# Classification (U)
+
+"""Program:  remove_dump.py
+
+    Description:  Unit testing of remove_dump in dump_units.py.
+
+    Usage:
+        test/unit/dump_units/remove_dump.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import dump_units                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_file
+        test_file_list
+        test_directory
+        test_missing
+        test_none
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.fname = "./test/unit/dump_units/tmp/remove_dump.sql"
+        self.fname2 = "./test/unit/dump_units/tmp/remove_dump2.sql"
+        self.dir_name = "./test/unit/dump_units/tmp/remove_dump"
+
+        for fname in [self.fname, self.fname2]:
+            with open(fname, "wb") as f_hdlr:
+                f_hdlr.write(b"Partial dump")
+
+    def test_file(self):
+
+        """Function:  test_file
+
+        Description:  Test removing a dump file.
+
+        Arguments:
+
+        """
+
+        dump_units.remove_dump(self.fname)
+
+        self.assertFalse(os.path.exists(self.fname))
+        self.assertTrue(os.path.exists(self.fname2))
+
+    def test_file_list(self):
+
+        """Function:  test_file_list
+
+        Description:  Test removing a list of dump files.
+
+        Arguments:
+
+        """
+
+        dump_units.remove_dump([self.fname, self.fname2])
+
+        self.assertFalse(os.path.exists(self.fname))
+        self.assertFalse(os.path.exists(self.fname2))
+
+    def test_directory(self):
+
+        """Function:  test_directory
+
+        Description:  Test removing a dump directory.
+
+        Arguments:
+
+        """
+
+        os.makedirs(os.path.join(self.dir_name, "db1"))
+
+        dump_units.remove_dump(self.dir_name)
+
+        self.assertFalse(os.path.exists(self.dir_name))
+
+    def test_missing(self):
+
+        """Function:  test_missing
+
+        Description:  Test with a dump file which was not created.
+
+        Arguments:
+
+        """
+
+        dump_units.remove_dump(self.dir_name)
+
+        self.assertTrue(os.path.exists(self.fname))
+
+    def test_none(self):
+
+        """Function:  test_none
+
+        Description:  Test with no dump file name.
+
+        Arguments:
+
+        """
+
+        dump_units.remove_dump(None)
+
+        self.assertTrue(os.path.exists(self.fname))
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        for fname in [self.fname, self.fname2]:
+            if os.path.isfile(fname):
+                os.remove(fname)
+
+        if os.path.isdir(self.dir_name):
+            os.rmdir(os.path.join(self.dir_name, "db1"))
+            os.rmdir(self.dir_name)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,23 @@
+#!/bin/bash
+# Unit testing program for the program module.
+# This will run all the units tests for this program.
+# Will need to run this from the base directory where the module file
+#   is located at.
+
+echo ""
+echo "Unit testing..."
+/usr/bin/python test/unit/dump_units/crt_batches.py
+/usr/bin/python test/unit/dump_units/crt_groups.py
+/usr/bin/python test/unit/dump_units/crt_units.py
+/usr/bin/python test/unit/dump_units/crt_where.py
+/usr/bin/python test/unit/dump_units/fetch_data_size.py
+/usr/bin/python test/unit/dump_units/fetch_db_size.py
+/usr/bin/python test/unit/dump_units/fetch_tbl_chunks.py
+/usr/bin/python test/unit/dump_units/fetch_tbl_size.py
+/usr/bin/python test/unit/dump_units/journal.py
+/usr/bin/python test/unit/dump_units/move_dump.py
+/usr/bin/python test/unit/dump_units/not_started.py
+/usr/bin/python test/unit/dump_units/order_db_list.py
+/usr/bin/python test/unit/dump_units/part_dir.py
+/usr/bin/python test/unit/dump_units/print_status.py
+/usr/bin/python test/unit/dump_units/remove_dump.py
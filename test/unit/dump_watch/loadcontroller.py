@@ -0,0 +1,257 @@
+# Classification (U)
+
+"""Program:  loadcontroller.py
+
+    Description:  Unit testing of LoadController class in dump_watch.py.
+
+    Usage:
+        test/unit/dump_watch/loadcontroller.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import dump_watch                               # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        col_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.status = {"Threads_running": 3, "Innodb_row_lock_waits": 0,
+                       "Innodb_buffer_pool_wait_free": 0}
+        self.cmd = None
+
+    def col_sql(self, cmd):
+
+        """Method:  col_sql
+
+        Description:  Stub holder for mysql_class.Server.col_sql method.
+
+        Arguments:
+
+        """
+
+        self.cmd = cmd
+
+        return [{"Variable_name": name, "Value": str(value)}
+                for name, value in self.status.items()]
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        adjust
+        test_first_poll
+        test_interval
+        test_grow
+        test_grow_max
+        test_threads_running
+        test_wait_free
+        test_lock_waits
+        test_shrink_min
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+        self.load = dump_watch.LoadController(self.server, 2, 8,
+                                                 interval=10)
+
+    def adjust(self, running=2):
+
+        """Function:  adjust
+
+        Description:  Poll the server twice, 10 seconds apart.
+
+        Arguments:
+
+        """
+
+        self.load.adjust(running, now=100.0)
+
+        with gen_libs.no_std_out():
+            return self.load.adjust(running, now=110.0)
+
+    def test_first_poll(self):
+
+        """Function:  test_first_poll
+
+        Description:  Test the first poll only records the status.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(self.load.adjust(2, now=100.0), 2)
+        self.assertEqual(self.load.status["Threads_running"], 3)
+        self.assertIn("show global status", self.server.cmd)
+
+    def test_interval(self):
+
+        """Function:  test_interval
+
+        Description:  Test the server is not polled before the interval.
+
+        Arguments:
+
+        """
+
+        self.load.adjust(2, now=100.0)
+        self.server.cmd = None
+
+        self.assertEqual(self.load.adjust(2, now=105.0), 2)
+        self.assertIsNone(self.server.cmd)
+
+    def test_grow(self):
+
+        """Function:  test_grow
+
+        Description:  Test the workers grow by one on an idle server.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(self.adjust(), 3)
+        self.assertEqual(self.load.events,
+                         [{"time": mock.ANY, "workers": 3, "reasons": []}])
+
+    def test_grow_max(self):
+
+        """Function:  test_grow_max
+
+        Description:  Test the workers do not grow past the maximum.
+
+        Arguments:
+
+        """
+
+        self.load.workers = 8
+
+        self.assertEqual(self.adjust(), 8)
+        self.assertEqual(self.load.events, [])
+
+    def test_threads_running(self):
+
+        """Function:  test_threads_running
+
+        Description:  Test the workers are halved when the threads running,
+            excluding the dumps, exceed the threshold.
+
+        Arguments:
+
+        """
+
+        self.load.workers = 8
+        self.server.status["Threads_running"] = 26
+
+        self.assertEqual(self.adjust(running=8), 4)
+        self.assertEqual(self.load.events[0]["reasons"],
+                         ["Threads_running 17"])
+
+    def test_wait_free(self):
+
+        """Function:  test_wait_free
+
+        Description:  Test the workers are halved when the buffer pool waited
+            for a free page.
+
+        Arguments:
+
+        """
+
+        self.load.workers = 6
+        self.load.adjust(2, now=100.0)
+        self.server.status["Innodb_buffer_pool_wait_free"] = 1
+
+        with gen_libs.no_std_out():
+            self.assertEqual(self.load.adjust(2, now=110.0), 3)
+
+        self.assertEqual(self.load.events[0]["reasons"],
+                         ["Innodb_buffer_pool_wait_free"])
+
+    def test_lock_waits(self):
+
+        """Function:  test_lock_waits
+
+        Description:  Test the workers are halved on row lock waits.
+
+        Arguments:
+
+        """
+
+        self.load.workers = 4
+        self.load.adjust(2, now=100.0)
+        self.server.status["Innodb_row_lock_waits"] = 50
+
+        with gen_libs.no_std_out():
+            self.assertEqual(self.load.adjust(2, now=110.0), 2)
+
+        self.assertEqual(self.load.events[0]["reasons"],
+                         ["Innodb_row_lock_waits 5.0/s"])
+
+    def test_shrink_min(self):
+
+        """Function:  test_shrink_min
+
+        Description:  Test the workers do not shrink below the minimum.
+
+        Arguments:
+
+        """
+
+        self.server.status["Threads_running"] = 50
+
+        self.assertEqual(self.adjust(), 2)
+        self.assertEqual(self.load.events, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+# Classification (U)
+
+"""Program:  proc_bytes.py
+
+    Description:  Unit testing of proc_bytes in dump_watch.py.
+
+    Usage:
+        test/unit/dump_watch/proc_bytes.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import dump_watch                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_process
+        test_no_process
+
+    """
+
+    @unittest.skipUnless(os.path.isfile("/proc/self/io"), "Requires /proc")
+    def test_process(self):
+
+        """Function:  test_process
+
+        Description:  Test the bytes written by a running process.
+
+        Arguments:
+
+        """
+
+        self.assertIsInstance(dump_watch.proc_bytes(os.getpid()), int)
+
+    def test_no_process(self):
+
+        """Function:  test_no_process
+
+        Description:  Test with a process which does not exist.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(dump_watch.proc_bytes(-1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,228 @@
+# Classification (U)
+
+"""Program:  progress.py
+
+    Description:  Unit testing of Progress class in dump_watch.py.
+
+    Usage:
+        test/unit/dump_watch/progress.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import json
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import dump_watch                               # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_crt_report
+        test_running
+        test_finished
+        test_no_estimate
+        test_report
+        test_check
+        test_check_interval
+        test_close
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.dmp_path = "./test/unit/dump_watch/tmp/"
+        self.fname = os.path.join(self.dmp_path, "Progress.json")
+        self.metrics = {"db1": {"raw_bytes": 100, "bytes": 20},
+                        "db2": {"raw_bytes": None, "bytes": 100}}
+        self.progress = dump_watch.Progress(
+            self.dmp_path, 1000, sizes={"db3": 400}, metrics=self.metrics,
+            report=60)
+        self.start = self.progress.start
+
+    def test_crt_report(self):
+
+        """Function:  test_crt_report
+
+        Description:  Test the progress of the completed units.
+
+        Arguments:
+
+        """
+
+        report = self.progress.crt_report(self.start + 10)
+
+        self.assertEqual(
+            (report["Bytes"], report["Percent"], report["ETA_Seconds"],
+             report["Units_Done"], report["Running"]),
+            (200, 20.0, 40, 2, []))
+        self.assertEqual(report["MB_Per_Sec"], round(20 / 1048576, 3))
+
+    def test_running(self):
+
+        """Function:  test_running
+
+        Description:  Test the progress of the running units.
+
+        Arguments:
+
+        """
+
+        watch = self.progress.watch("db3")
+        watch.bytes = 100
+
+        report = self.progress.crt_report(self.start + 10)
+
+        self.assertEqual(report["Bytes"], 300)
+        self.assertEqual(report["Running"],
+                         [{"Unit": "db3", "Bytes": 100, "Percent": 25.0}])
+
+    def test_finished(self):
+
+        """Function:  test_finished
+
+        Description:  Test the progress of a finished run.
+
+        Arguments:
+
+        """
+
+        report = self.progress.crt_report(self.start + 10, finished=True)
+
+        self.assertEqual((report["Percent"], report["ETA_Seconds"]),
+                         (100.0, 0))
+
+    def test_no_estimate(self):
+
+        """Function:  test_no_estimate
+
+        Description:  Test with no size estimate of the run.
+
+        Arguments:
+
+        """
+
+        self.progress.total = 0
+
+        report = self.progress.crt_report(self.start + 10)
+
+        self.assertEqual((report["Percent"], report["ETA_Seconds"]),
+                         (None, 0))
+
+    def test_report(self):
+
+        """Function:  test_report
+
+        Description:  Test the progress is saved to the Progress json file.
+
+        Arguments:
+
+        """
+
+        with gen_libs.no_std_out():
+            self.progress.report(self.start + 10)
+
+        with open(self.fname, "r", encoding="UTF-8") as f_hdlr:
+            report = json.load(f_hdlr)
+
+        self.assertEqual(report["Percent"], 20.0)
+        self.assertFalse(os.path.exists(self.fname + ".tmp"))
+        self.assertEqual(self.progress.reported, self.start + 10)
+
+    @mock.patch("dump_watch.Progress.report")
+    def test_check(self, mock_report):
+
+        """Function:  test_check
+
+        Description:  Test the progress is reported once the report interval
+            has elapsed.
+
+        Arguments:
+
+        """
+
+        self.progress.check(self.start + 30)
+        mock_report.assert_not_called()
+        self.progress.check(self.start + 60)
+
+        mock_report.assert_called_once_with(self.start + 60)
+
+    def test_check_interval(self):
+
+        """Function:  test_check_interval
+
+        Description:  Test the watchdog checks the units at least every
+            WATCH_INTERVAL seconds.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(self.progress.interval, dump_watch.WATCH_INTERVAL)
+
+    def test_close(self):
+
+        """Function:  test_close
+
+        Description:  Test the final progress is reported when closed.
+
+        Arguments:
+
+        """
+
+        with gen_libs.no_std_out():
+            self.progress.close()
+
+        with open(self.fname, "r", encoding="UTF-8") as f_hdlr:
+            report = json.load(f_hdlr)
+
+        self.assertTrue(report["Finished"])
+        self.assertFalse(self.progress.thread.is_alive())
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.progress.done.set()
+        self.progress.thread.join()
+
+        if os.path.isfile(self.fname):
+            os.remove(self.fname)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,13 @@
+#!/bin/bash
+# Unit testing program for the program module.
+# This will run all the units tests for this program.
+# Will need to run this from the base directory where the module file
+#   is located at.
+
+echo ""
+echo "Unit testing..."
+/usr/bin/python test/unit/dump_watch/loadcontroller.py
+/usr/bin/python test/unit/dump_watch/proc_bytes.py
+/usr/bin/python test/unit/dump_watch/progress.py
+/usr/bin/python test/unit/dump_watch/unitwatch.py
+/usr/bin/python test/unit/dump_watch/watchdog.py
@@ -0,0 +1,142 @@
+# Classification (U)
+
+"""Program:  unitwatch.py
+
+    Description:  Unit testing of UnitWatch class in dump_watch.py.
+
+    Usage:
+        test/unit/dump_watch/unitwatch.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import dump_watch                               # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_append
+        test_no_process
+        test_progress
+        test_no_progress
+        test_bytes_not_available
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.procs = []
+        self.proc = mock.Mock()
+        self.proc.poll.return_value = None
+        self.watch = dump_watch.UnitWatch("db1", self.procs)
+        self.watch.append(self.proc)
+        self.watch.bytes = 100
+        self.watch.last = 10.0
+
+    def test_append(self):
+
+        """Function:  test_append
+
+        Description:  Test the dump process is added to the unit and to the
+            run.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(self.watch.procs, [self.proc])
+        self.assertEqual(self.procs, [self.proc])
+
+    def test_no_process(self):
+
+        """Function:  test_no_process
+
+        Description:  Test the output progresses while no dump process is
+            running.
+
+        Arguments:
+
+        """
+
+        self.proc.poll.return_value = 0
+
+        self.watch.progress(20.0)
+
+        self.assertEqual(self.watch.last, 20.0)
+
+    @mock.patch("dump_watch.proc_bytes", mock.Mock(return_value=200))
+    def test_progress(self):
+
+        """Function:  test_progress
+
+        Description:  Test with the dump process writing output.
+
+        Arguments:
+
+        """
+
+        self.watch.progress(20.0)
+
+        self.assertEqual((self.watch.bytes, self.watch.last), (200, 20.0))
+
+    @mock.patch("dump_watch.proc_bytes", mock.Mock(return_value=100))
+    def test_no_progress(self):
+
+        """Function:  test_no_progress
+
+        Description:  Test with the dump process not writing output.
+
+        Arguments:
+
+        """
+
+        self.watch.progress(20.0)
+
+        self.assertEqual((self.watch.bytes, self.watch.last), (100, 10.0))
+
+    @mock.patch("dump_watch.proc_bytes", mock.Mock(return_value=None))
+    def test_bytes_not_available(self):
+
+        """Function:  test_bytes_not_available
+
+        Description:  Test with the bytes written not available.
+
+        Arguments:
+
+        """
+
+        self.watch.progress(20.0)
+
+        self.assertEqual(self.watch.last, 20.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,225 @@
+# Classification (U)
+
+"""Program:  watchdog.py
+
+    Description:  Unit testing of Watchdog class in dump_watch.py.
+
+    Usage:
+        test/unit/dump_watch/watchdog.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import dump_watch                               # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_watch
+        test_timeout
+        test_stall
+        test_progress
+        test_requeue
+        test_requeue_limit
+        test_requeue_not_killed
+        test_close
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.procs = []
+        self.proc = mock.Mock()
+        self.proc.poll.return_value = None
+        self.watchdog = dump_watch.Watchdog(budget=100, stall=10,
+                                               interval=60)
+        self.watch = self.watchdog.watch("db1", self.procs)
+        self.watch.append(self.proc)
+        self.start = self.watch.start
+
+    def test_watch(self):
+
+        """Function:  test_watch
+
+        Description:  Test watching and unwatching a unit.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(self.procs, [self.proc])
+        self.assertIsNone(self.watchdog.unwatch(self.watch))
+        self.assertEqual(self.watchdog.watches, [])
+
+    @mock.patch("dump_watch.proc_bytes")
+    def test_timeout(self, mock_bytes):
+
+        """Function:  test_timeout
+
+        Description:  Test a unit exceeding its wall clock budget is killed.
+
+        Arguments:
+
+        """
+
+        mock_bytes.side_effect = [100, 200]
+
+        with gen_libs.no_std_out():
+            self.watchdog.check(self.start + 5)
+            self.watchdog.check(self.start + 101)
+
+        self.proc.kill.assert_called_once_with()
+        self.assertEqual(self.watchdog.unwatch(self.watch), "timeout")
+        self.assertEqual(
+            self.watchdog.events,
+            [{"unit": "db1", "reason": "timeout", "seconds": 101,
+              "bytes": 200, "requeued": False}])
+
+    @mock.patch("dump_watch.proc_bytes", mock.Mock(return_value=100))
+    def test_stall(self):
+
+        """Function:  test_stall
+
+        Description:  Test a unit producing no output for the stall interval
+            is killed.
+
+        Arguments:
+
+        """
+
+        with gen_libs.no_std_out():
+            self.watchdog.check(self.start + 5)
+            self.watchdog.check(self.start + 14)
+            self.proc.kill.assert_not_called()
+            self.watchdog.check(self.start + 16)
+
+        self.proc.kill.assert_called_once_with()
+        self.assertEqual(self.watch.reason, "stall")
+
+    @mock.patch("dump_watch.proc_bytes")
+    def test_progress(self, mock_bytes):
+
+        """Function:  test_progress
+
+        Description:  Test a unit producing output is not killed.
+
+        Arguments:
+
+        """
+
+        mock_bytes.side_effect = [100, 200, 300]
+
+        self.watchdog.check(self.start + 8)
+        self.watchdog.check(self.start + 16)
+        self.watchdog.check(self.start + 24)
+
+        self.proc.kill.assert_not_called()
+        self.assertEqual(self.watchdog.events, [])
+
+    @mock.patch("dump_watch.proc_bytes", mock.Mock(return_value=100))
+    def test_requeue(self):
+
+        """Function:  test_requeue
+
+        Description:  Test a unit killed by the watchdog is requeued.
+
+        Arguments:
+
+        """
+
+        with gen_libs.no_std_out():
+            self.watchdog.check(self.start + 5)
+            self.watchdog.check(self.start + 20)
+            self.assertTrue(
+                self.watchdog.requeue("db1", {"watchdog": "stall"}))
+
+        self.assertTrue(self.watchdog.events[0]["requeued"])
+
+    def test_requeue_limit(self):
+
+        """Function:  test_requeue_limit
+
+        Description:  Test a unit is requeued up to WATCH_REQUEUES times.
+
+        Arguments:
+
+        """
+
+        with gen_libs.no_std_out():
+            self.assertTrue(
+                self.watchdog.requeue("db1", {"watchdog": "timeout"}))
+            self.assertFalse(
+                self.watchdog.requeue("db1", {"watchdog": "timeout"}))
+
+    def test_requeue_not_killed(self):
+
+        """Function:  test_requeue_not_killed
+
+        Description:  Test a failed unit not killed by the watchdog is not
+            requeued.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(self.watchdog.requeue("db1", {"status": False}))
+
+    def test_close(self):
+
+        """Function:  test_close
+
+        Description:  Test the thread of the watchdog is stopped.
+
+        Arguments:
+
+        """
+
+        self.watchdog.close()
+
+        self.assertFalse(self.watchdog.thread.is_alive())
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.watchdog.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
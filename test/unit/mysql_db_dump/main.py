@@ -22,6 +22,7 @@ import mock
 # Local
 sys.path.append(os.getcwd())
 import mysql_db_dump                            # pylint:disable=E0401,C0413
+import dump_cli                                 # pylint:disable=E0401,C0413
 import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
 import version                                  # pylint:disable=E0401,C0413
 
@@ -231,9 +232,11 @@ class UnitTest(unittest.TestCase):
         test_arg_cond_req_or_false
         test_arg_cond_req_or_true
         test_run_program
+        test_exit_code
         test_programlock_true
         test_programlock_false
         test_programlock_id
+        test_load_above_workers
 
     """
 
@@ -266,7 +269,7 @@ class UnitTest(unittest.TestCase):
 
         mock_arg.return_value = self.args
 
-        self.assertFalse(mysql_db_dump.main())
+        self.assertEqual(mysql_db_dump.main(), dump_cli.EXIT_ERROR)
 
     @mock.patch("mysql_db_dump.gen_libs.help_func")
     @mock.patch("mysql_db_dump.gen_class.ArgParser")
@@ -319,7 +322,7 @@ class UnitTest(unittest.TestCase):
         mock_arg.return_value = self.args
         mock_help.return_value = False
 
-        self.assertFalse(mysql_db_dump.main())
+        self.assertEqual(mysql_db_dump.main(), dump_cli.EXIT_ERROR)
 
     @mock.patch("mysql_db_dump.gen_libs.help_func")
     @mock.patch("mysql_db_dump.gen_class.ArgParser")
@@ -338,7 +341,7 @@ class UnitTest(unittest.TestCase):
         mock_arg.return_value = self.args
         mock_help.return_value = False
 
-        self.assertFalse(mysql_db_dump.main())
+        self.assertEqual(mysql_db_dump.main(), dump_cli.EXIT_ERROR)
 
     @mock.patch("mysql_db_dump.gen_libs.help_func")
     @mock.patch("mysql_db_dump.gen_class.ArgParser")
@@ -357,7 +360,7 @@ class UnitTest(unittest.TestCase):
         mock_arg.return_value = self.args
         mock_help.return_value = False
 
-        self.assertFalse(mysql_db_dump.main())
+        self.assertEqual(mysql_db_dump.main(), dump_cli.EXIT_ERROR)
 
     @mock.patch("mysql_db_dump.gen_libs.help_func")
     @mock.patch("mysql_db_dump.gen_class.ArgParser")
@@ -376,7 +379,7 @@ class UnitTest(unittest.TestCase):
         mock_arg.return_value = self.args
         mock_help.return_value = False
 
-        self.assertFalse(mysql_db_dump.main())
+        self.assertEqual(mysql_db_dump.main(), dump_cli.EXIT_ERROR)
 
     @mock.patch("mysql_db_dump.gen_libs.help_func")
     @mock.patch("mysql_db_dump.gen_class.ArgParser")
@@ -395,7 +398,7 @@ class UnitTest(unittest.TestCase):
         mock_arg.return_value = self.args
         mock_help.return_value = False
 
-        self.assertFalse(mysql_db_dump.main())
+        self.assertEqual(mysql_db_dump.main(), dump_cli.EXIT_ERROR)
 
     @mock.patch("mysql_db_dump.gen_libs.help_func")
     @mock.patch("mysql_db_dump.gen_class.ArgParser")
@@ -414,7 +417,7 @@ class UnitTest(unittest.TestCase):
         mock_arg.return_value = self.args
         mock_help.return_value = False
 
-        self.assertFalse(mysql_db_dump.main())
+        self.assertEqual(mysql_db_dump.main(), dump_cli.EXIT_ERROR)
 
     @mock.patch("mysql_db_dump.gen_libs.help_func")
     @mock.patch("mysql_db_dump.gen_class.ArgParser")
@@ -433,7 +436,7 @@ class UnitTest(unittest.TestCase):
         mock_arg.return_value = self.args
         mock_help.return_value = False
 
-        self.assertFalse(mysql_db_dump.main())
+        self.assertEqual(mysql_db_dump.main(), dump_cli.EXIT_ERROR)
 
     @mock.patch("mysql_db_dump.gen_libs.help_func")
     @mock.patch("mysql_db_dump.gen_class.ArgParser")
@@ -452,7 +455,7 @@ class UnitTest(unittest.TestCase):
         mock_arg.return_value = self.args
         mock_help.return_value = False
 
-        self.assertFalse(mysql_db_dump.main())
+        self.assertEqual(mysql_db_dump.main(), dump_cli.EXIT_ERROR)
 
     @mock.patch("mysql_db_dump.gen_libs.help_func")
     @mock.patch("mysql_db_dump.gen_class.ArgParser")
@@ -471,7 +474,7 @@ class UnitTest(unittest.TestCase):
         mock_arg.return_value = self.args
         mock_help.return_value = False
 
-        self.assertFalse(mysql_db_dump.main())
+        self.assertEqual(mysql_db_dump.main(), dump_cli.EXIT_ERROR)
 
     @mock.patch("mysql_db_dump.gen_libs.help_func")
     @mock.patch("mysql_db_dump.gen_class.ArgParser")
@@ -490,9 +493,9 @@ class UnitTest(unittest.TestCase):
         mock_arg.return_value = self.args
         mock_help.return_value = False
 
-        self.assertFalse(mysql_db_dump.main())
+        self.assertEqual(mysql_db_dump.main(), dump_cli.EXIT_ERROR)
 
-    @mock.patch("mysql_db_dump.run_program", mock.Mock(return_value=True))
+    @mock.patch("mysql_db_dump.run_program", mock.Mock(return_value=0))
     @mock.patch("mysql_db_dump.gen_class.ProgramLock")
     @mock.patch("mysql_db_dump.gen_libs.help_func")
     @mock.patch("mysql_db_dump.gen_class.ArgParser")
@@ -512,7 +515,7 @@ class UnitTest(unittest.TestCase):
 
         self.assertFalse(mysql_db_dump.main())
 
-    @mock.patch("mysql_db_dump.run_program", mock.Mock(return_value=True))
+    @mock.patch("mysql_db_dump.run_program", mock.Mock(return_value=0))
     @mock.patch("mysql_db_dump.gen_class.ProgramLock")
     @mock.patch("mysql_db_dump.gen_libs.help_func")
     @mock.patch("mysql_db_dump.gen_class.ArgParser")
@@ -532,7 +535,27 @@ class UnitTest(unittest.TestCase):
 
         self.assertFalse(mysql_db_dump.main())
 
-    @mock.patch("mysql_db_dump.run_program", mock.Mock(return_value=True))
+    @mock.patch("mysql_db_dump.run_program", mock.Mock(return_value=2))
+    @mock.patch("mysql_db_dump.gen_class.ProgramLock")
+    @mock.patch("mysql_db_dump.gen_libs.help_func")
+    @mock.patch("mysql_db_dump.gen_class.ArgParser")
+    def test_exit_code(self, mock_arg, mock_help, mock_lock):
+
+        """Function:  test_exit_code
+
+        Description:  Test the exit code of run_program is returned.
+
+        Arguments:
+
+        """
+
+        mock_lock.return_value = self.proglock
+        mock_arg.return_value = self.args
+        mock_help.return_value = False
+
+        self.assertEqual(mysql_db_dump.main(), 2)
+
+    @mock.patch("mysql_db_dump.run_program", mock.Mock(return_value=0))
     @mock.patch("mysql_db_dump.gen_class.ProgramLock")
     @mock.patch("mysql_db_dump.gen_libs.help_func")
     @mock.patch("mysql_db_dump.gen_class.ArgParser")
@@ -552,7 +575,7 @@ class UnitTest(unittest.TestCase):
 
         self.assertFalse(mysql_db_dump.main())
 
-    @mock.patch("mysql_db_dump.run_program", mock.Mock(return_value=True))
+    @mock.patch("mysql_db_dump.run_program", mock.Mock(return_value=0))
     @mock.patch("mysql_db_dump.gen_class.ProgramLock")
     @mock.patch("mysql_db_dump.gen_libs.help_func")
     @mock.patch("mysql_db_dump.gen_class.ArgParser")
@@ -572,9 +595,9 @@ class UnitTest(unittest.TestCase):
         mock_help.return_value = False
 
         with gen_libs.no_std_out():
-            self.assertFalse(mysql_db_dump.main())
+            self.assertEqual(mysql_db_dump.main(), dump_cli.EXIT_ERROR)
 
-    @mock.patch("mysql_db_dump.run_program", mock.Mock(return_value=True))
+    @mock.patch("mysql_db_dump.run_program", mock.Mock(return_value=0))
     @mock.patch("mysql_db_dump.gen_class.ProgramLock")
     @mock.patch("mysql_db_dump.gen_libs.help_func")
     @mock.patch("mysql_db_dump.gen_class.ArgParser")
@@ -596,6 +619,30 @@ class UnitTest(unittest.TestCase):
 
         self.assertFalse(mysql_db_dump.main())
 
+    @mock.patch("mysql_db_dump.run_program")
+    @mock.patch("mysql_db_dump.gen_libs.help_func")
+    @mock.patch("mysql_db_dump.gen_class.ArgParser")
+    def test_load_above_workers(self, mock_arg, mock_help, mock_run):
+
+        """Function:  test_load_above_workers
+
+        Description:  Test the -a option greater than the -j option is
+            rejected.
+
+        Arguments:
+
+        """
+
+        self.args.args_array.update({"-j": "2", "-a": "4"})
+
+        mock_arg.return_value = self.args
+        mock_help.return_value = False
+
+        with gen_libs.no_std_out():
+            self.assertEqual(mysql_db_dump.main(), dump_cli.EXIT_ERROR)
+
+        mock_run.assert_not_called()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -16,12 +16,15 @@
 # Standard
 import sys
 import os
+import signal
 import unittest
 import mock
 
 # Local
 sys.path.append(os.getcwd())
 import mysql_db_dump                            # pylint:disable=E0401,C0413
+import dump_units                               # pylint:disable=E0401,C0413
+import dump_cli                                 # pylint:disable=E0401,C0413
 import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
 import version                                  # pylint:disable=E0401,C0413
 
@@ -38,6 +41,7 @@ class ArgParser():
         __init__
         arg_exist
         get_val
+        arg_set_path
 
     """
 
@@ -77,6 +81,18 @@ class ArgParser():
 
         return self.args_array.get(skey, def_val)
 
+    def arg_set_path(self, arg_opt, cmd=None):
+
+        """Method:  arg_set_path
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_set_path.
+
+        Arguments:
+
+        """
+
+        return os.path.join(self.args_array.get(arg_opt, ""), cmd)
+
 
 class Server():
 
@@ -133,6 +149,9 @@ class Server():
         """
 
 
+@mock.patch("dump_report.save_manifest", mock.Mock(return_value=None))
+@mock.patch("dump_units.Journal", mock.Mock())
+@mock.patch("dump_state.fetch_binlog_pos", mock.Mock(return_value=None))
 class UnitTest(unittest.TestCase):
 
     """Class:  UnitTest
@@ -141,6 +160,25 @@ class UnitTest(unittest.TestCase):
 
     Methods:
         setUp
+        test_j_option
+        test_codec_option
+        test_t_option
+        test_k_option
+        test_s_option
+        test_g_option
+        test_e_option
+        test_p_option
+        test_h_option
+        test_n_option
+        test_resume_option
+        test_watchdog_option
+        test_progress_option
+        test_prom_option
+        test_load_option
+        test_dump_failed
+        test_dump_error
+        test_i_option
+        test_b_option
         test_ssl_fail
         test_ssl_success
         test_connect_failure
@@ -206,12 +244,647 @@ class UnitTest(unittest.TestCase):
             "-D": ["--all-databases", "--triggers", "--routines", "--events"],
             "-r": gtid_arg}
 
+    @mock.patch("dump_sched.dump_db")
+    @mock.patch("mysql_db_dump.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_db_dump.set_db_list")
+    @mock.patch("mysql_db_dump.crt_dump_cmd")
+    @mock.patch("mysql_db_dump.mysql_libs.create_instance")
+    def test_j_option(self, mock_inst, mock_cmd, mock_list, mock_dump):
+
+        """Function:  test_j_option
+
+        Description:  Test with -j option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-c": "config", "-d": "/dir", "-j": "4"}
+
+        mock_inst.return_value = self.server
+        mock_dump.return_value = []
+        mock_cmd.return_value = self.dump_cmd
+        mock_list.return_value = self.db_list
+
+        self.assertFalse(
+            mysql_db_dump.run_program(
+                self.args, self.opt_arg_list, self.opt_dump_list))
+        self.assertEqual(mock_dump.call_args[1]["workers"], 4)
+
+    @mock.patch("dump_sched.dump_db")
+    @mock.patch("mysql_db_dump.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_db_dump.set_db_list")
+    @mock.patch("mysql_db_dump.crt_dump_cmd")
+    @mock.patch("mysql_db_dump.mysql_libs.create_instance")
+    def test_codec_option(self, mock_inst, mock_cmd, mock_list, mock_dump):
+
+        """Function:  test_codec_option
+
+        Description:  Test with -C and -L options.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-c": "config", "-d": "/dir", "-z": True,
+                                "-C": "xz", "-L": "0"}
+
+        mock_inst.return_value = self.server
+        mock_dump.return_value = []
+        mock_cmd.return_value = self.dump_cmd
+        mock_list.return_value = self.db_list
+
+        self.assertFalse(
+            mysql_db_dump.run_program(
+                self.args, self.opt_arg_list, self.opt_dump_list))
+        self.assertEqual(
+            mock_dump.call_args[1]["comp_opts"],
+            {"threads": 1, "codec": "xz", "level": 0})
+
+    @mock.patch("dump_units.fetch_tbl_size")
+    @mock.patch("dump_sched.dump_db")
+    @mock.patch("mysql_db_dump.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_db_dump.set_db_list")
+    @mock.patch("mysql_db_dump.crt_dump_cmd")
+    @mock.patch("mysql_db_dump.mysql_libs.create_instance")
+    def test_t_option(                          # pylint:disable=R0913,R0917
+            self, mock_inst, mock_cmd, mock_list, mock_dump, mock_tbl):
+
+        """Function:  test_t_option
+
+        Description:  Test with -T option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-c": "config", "-d": "/dir", "-A": True,
+                                "-T": True}
+
+        mock_inst.return_value = self.server
+        mock_dump.return_value = []
+        mock_cmd.return_value = self.dump_cmd
+        mock_list.return_value = ["db1"]
+        mock_tbl.return_value = {"db1": {"t1": 100}}
+
+        self.assertFalse(
+            mysql_db_dump.run_program(
+                self.args, self.opt_arg_list, self.opt_dump_list))
+        self.assertEqual(
+            mock_dump.call_args[1]["tbl_size"], {"db1": {"t1": 100}})
+
+    @mock.patch("dump_units.fetch_tbl_chunks")
+    @mock.patch("dump_units.fetch_tbl_size")
+    @mock.patch("dump_sched.dump_db")
+    @mock.patch("mysql_db_dump.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_db_dump.set_db_list")
+    @mock.patch("mysql_db_dump.crt_dump_cmd")
+    @mock.patch("mysql_db_dump.mysql_libs.create_instance")
+    def test_k_option(                          # pylint:disable=R0913,R0917
+            self, mock_inst, mock_cmd, mock_list, mock_dump, mock_tbl,
+            mock_chunk):
+
+        """Function:  test_k_option
+
+        Description:  Test with -K option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-c": "config", "-d": "/dir", "-A": True,
+                                "-T": True, "-K": "2"}
+
+        mock_inst.return_value = self.server
+        mock_dump.return_value = []
+        mock_cmd.return_value = self.dump_cmd
+        mock_list.return_value = ["db1"]
+        mock_tbl.return_value = {"db1": {"t1": 4194304}}
+        mock_chunk.return_value = {"db1": {"t1": ("id", [50])}}
+
+        self.assertFalse(
+            mysql_db_dump.run_program(
+                self.args, self.opt_arg_list, self.opt_dump_list))
+        mock_chunk.assert_called_once_with(
+            self.server, {"db1": {"t1": 4194304}}, 2097152)
+        self.assertEqual(
+            mock_dump.call_args[1]["tbl_chunks"],
+            {"db1": {"t1": ("id", [50])}})
+
+    @mock.patch("dump_units.fetch_db_size")
+    @mock.patch("dump_sched.dump_db")
+    @mock.patch("mysql_db_dump.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_db_dump.set_db_list")
+    @mock.patch("mysql_db_dump.crt_dump_cmd")
+    @mock.patch("mysql_db_dump.mysql_libs.create_instance")
+    def test_s_option(                          # pylint:disable=R0913,R0917
+            self, mock_inst, mock_cmd, mock_list, mock_dump, mock_size):
+
+        """Function:  test_s_option
+
+        Description:  Test with -S option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-c": "config", "-d": "/dir", "-A": True,
+                                "-S": True}
+
+        mock_inst.return_value = self.server
+        mock_dump.return_value = []
+        mock_cmd.return_value = self.dump_cmd
+        mock_list.return_value = ["db1"]
+        mock_size.return_value = {"db1": 100}
+
+        self.assertFalse(
+            mysql_db_dump.run_program(
+                self.args, self.opt_arg_list, self.opt_dump_list))
+        self.assertEqual(mock_dump.call_args[1]["snapshot"], self.server)
+        self.assertEqual(mock_dump.call_args[1]["db_size"], {"db1": 100})
+
+    @mock.patch("dump_units.fetch_db_size")
+    @mock.patch("dump_sched.dump_db")
+    @mock.patch("mysql_db_dump.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_db_dump.set_db_list")
+    @mock.patch("mysql_db_dump.crt_dump_cmd")
+    @mock.patch("mysql_db_dump.mysql_libs.create_instance")
+    def test_g_option(                          # pylint:disable=R0913,R0917
+            self, mock_inst, mock_cmd, mock_list, mock_dump, mock_size):
+
+        """Function:  test_g_option
+
+        Description:  Test with -G option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-c": "config", "-d": "/dir", "-A": True,
+                                "-G": "2"}
+
+        mock_inst.return_value = self.server
+        mock_dump.return_value = []
+        mock_cmd.return_value = self.dump_cmd
+        mock_list.return_value = ["db1"]
+        mock_size.return_value = {"db1": 100}
+
+        self.assertFalse(
+            mysql_db_dump.run_program(
+                self.args, self.opt_arg_list, self.opt_dump_list))
+        self.assertEqual(mock_dump.call_args[1]["batch_size"], 2097152)
+        self.assertEqual(mock_dump.call_args[1]["db_size"], {"db1": 100})
+
+    @mock.patch("dump_engine.NativeEngine")
+    @mock.patch("dump_sched.dump_db")
+    @mock.patch("mysql_db_dump.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_db_dump.set_db_list")
+    @mock.patch("mysql_db_dump.crt_dump_cmd")
+    @mock.patch("mysql_db_dump.mysql_libs.create_instance")
+    def test_e_option(                          # pylint:disable=R0913,R0917
+            self, mock_inst, mock_cmd, mock_list, mock_dump, mock_engine):
+
+        """Function:  test_e_option
+
+        Description:  Test with -E option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-c": "config", "-d": "/dir", "-A": True,
+                                "-E": "native"}
+
+        mock_inst.return_value = self.server
+        mock_dump.return_value = []
+        mock_cmd.return_value = self.dump_cmd
+        mock_list.return_value = ["db1"]
+        mock_engine.return_value.stats.return_value = {"engine": "native"}
+
+        with gen_libs.no_std_out():
+            self.assertFalse(
+                mysql_db_dump.run_program(
+                    self.args, self.opt_arg_list, self.opt_dump_list))
+
+        self.assertEqual(mock_dump.call_args[1]["engine"],
+                         mock_engine.return_value)
+        mock_engine.return_value.close.assert_called_once_with()
+
+    @mock.patch("dump_units.fetch_data_size")
+    @mock.patch("dump_sched.dump_db")
+    @mock.patch("mysql_db_dump.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_db_dump.set_db_list")
+    @mock.patch("mysql_db_dump.crt_dump_cmd")
+    @mock.patch("mysql_db_dump.mysql_libs.create_instance")
+    def test_p_option(                          # pylint:disable=R0913,R0917
+            self, mock_inst, mock_cmd, mock_list, mock_dump, mock_size):
+
+        """Function:  test_p_option
+
+        Description:  Test with -P and -O options.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-c": "config", "-d": "/dir", "-A": True,
+                                "-P": True, "-O": True}
+
+        mock_inst.return_value = self.server
+        mock_dump.return_value = []
+        mock_cmd.return_value = self.dump_cmd
+        mock_list.return_value = ["db1"]
+        mock_size.return_value = {"db1": 100}
+
+        self.assertFalse(
+            mysql_db_dump.run_program(
+                self.args, self.opt_arg_list, self.opt_dump_list))
+        self.assertEqual(mock_dump.call_args[1]["write_opts"],
+                         {"direct": True, "sizes": {"db1": 100}})
+        self.assertEqual(mock_dump.call_args[1]["db_size"], {})
+
+    @mock.patch("dump_report.crt_manifest")
+    @mock.patch("dump_sched.dump_db")
+    @mock.patch("mysql_db_dump.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_db_dump.set_db_list")
+    @mock.patch("mysql_db_dump.crt_dump_cmd")
+    @mock.patch("mysql_db_dump.mysql_libs.create_instance")
+    def test_h_option(                          # pylint:disable=R0913,R0917
+            self, mock_inst, mock_cmd, mock_list, mock_dump, mock_manifest):
+
+        """Function:  test_h_option
+
+        Description:  Test with -H option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-c": "config", "-d": "/dir", "-A": True,
+                                "-H": "blake2b"}
+
+        mock_inst.return_value = self.server
+        mock_dump.return_value = []
+        mock_cmd.return_value = self.dump_cmd
+        mock_list.return_value = ["db1"]
+
+        self.assertFalse(
+            mysql_db_dump.run_program(
+                self.args, self.opt_arg_list, self.opt_dump_list))
+        self.assertEqual(mock_dump.call_args[1]["hash_opts"],
+                         {"algo": "blake2b", "digests": {}})
+        self.assertEqual(mock_manifest.call_args[1]["hash_opts"],
+                         mock_dump.call_args[1]["hash_opts"])
+
+    @mock.patch("dump_sched.dump_db")
+    @mock.patch("mysql_db_dump.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_db_dump.set_db_list")
+    @mock.patch("mysql_db_dump.crt_dump_cmd")
+    @mock.patch("mysql_db_dump.mysql_libs.create_instance")
+    def test_n_option(self, mock_inst, mock_cmd, mock_list, mock_dump):
+
+        """Function:  test_n_option
+
+        Description:  Test with -n option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-c": "config", "-d": "/dir", "-A": True,
+                                "-n": "3"}
+
+        mock_inst.return_value = self.server
+        mock_dump.return_value = []
+        mock_cmd.return_value = self.dump_cmd
+        mock_list.return_value = ["db1"]
+
+        self.assertEqual(
+            mysql_db_dump.run_program(
+                self.args, self.opt_arg_list, self.opt_dump_list), 0)
+        self.assertEqual(mock_dump.call_args[1]["retries"], 3)
+
+    @mock.patch("dump_sched.dump_db")
+    @mock.patch("mysql_db_dump.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_db_dump.set_db_list")
+    @mock.patch("mysql_db_dump.crt_dump_cmd")
+    @mock.patch("mysql_db_dump.mysql_libs.create_instance")
+    def test_resume_option(self, mock_inst, mock_cmd, mock_list, mock_dump):
+
+        """Function:  test_resume_option
+
+        Description:  Test with -R option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-c": "config", "-d": "/dir", "-A": True,
+                                "-R": True}
+        handler = signal.getsignal(signal.SIGTERM)
+
+        mock_inst.return_value = self.server
+        mock_dump.return_value = []
+        mock_cmd.return_value = self.dump_cmd
+        mock_list.return_value = ["db1"]
+
+        self.assertEqual(
+            mysql_db_dump.run_program(
+                self.args, self.opt_arg_list, self.opt_dump_list), 0)
+        self.assertTrue(dump_units.Journal.call_args[1]["resume"])
+        self.assertEqual(mock_dump.call_args[1]["journal"],
+                         dump_units.Journal.return_value)
+        self.assertFalse(mock_dump.call_args[1]["stop"].is_set())
+        self.assertEqual(signal.getsignal(signal.SIGTERM), handler)
+
+    @mock.patch("dump_watch.Watchdog")
+    @mock.patch("dump_sched.dump_db")
+    @mock.patch("mysql_db_dump.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_db_dump.set_db_list")
+    @mock.patch("mysql_db_dump.crt_dump_cmd")
+    @mock.patch("mysql_db_dump.mysql_libs.create_instance")
+    def test_watchdog_option(                   # pylint:disable=R0913,R0917
+            self, mock_inst, mock_cmd, mock_list, mock_dump, mock_watch):
+
+        """Function:  test_watchdog_option
+
+        Description:  Test with -W and -M options.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-c": "config", "-d": "/dir", "-A": True,
+                                "-W": "300", "-M": "3600"}
+
+        mock_inst.return_value = self.server
+        mock_dump.return_value = []
+        mock_cmd.return_value = self.dump_cmd
+        mock_list.return_value = ["db1"]
+        mock_watch.return_value.events = [
+            {"unit": "db1", "reason": "stall", "seconds": 301.0,
+             "bytes": 100, "requeued": True}]
+
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                mysql_db_dump.run_program(
+                    self.args, self.opt_arg_list, self.opt_dump_list), 0)
+
+        mock_watch.assert_called_once_with(budget=3600, stall=300)
+        self.assertEqual(mock_dump.call_args[1]["watchdog"],
+                         mock_watch.return_value)
+        mock_watch.return_value.close.assert_called_once_with()
+
+    @mock.patch("dump_cli.crt_progress")
+    @mock.patch("dump_units.fetch_db_size")
+    @mock.patch("dump_sched.dump_db")
+    @mock.patch("mysql_db_dump.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_db_dump.set_db_list")
+    @mock.patch("mysql_db_dump.crt_dump_cmd")
+    @mock.patch("mysql_db_dump.mysql_libs.create_instance")
+    def test_progress_option(                   # pylint:disable=R0913,R0917
+            self, mock_inst, mock_cmd, mock_list, mock_dump, mock_size,
+            mock_prog):
+
+        """Function:  test_progress_option
+
+        Description:  Test with -g option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-c": "config", "-d": "/dir", "-A": True,
+                                "-g": "60", "-W": "300"}
+
+        mock_inst.return_value = self.server
+        mock_dump.return_value = []
+        mock_cmd.return_value = self.dump_cmd
+        mock_list.return_value = ["db1"]
+        mock_size.return_value = {"db1": 100}
+        mock_prog.return_value.events = []
+
+        self.assertEqual(
+            mysql_db_dump.run_program(
+                self.args, self.opt_arg_list, self.opt_dump_list), 0)
+        self.assertEqual(mock_prog.call_args[0][2:], (["db1"], {"db1": 100}))
+        self.assertEqual(mock_dump.call_args[1]["watchdog"],
+                         mock_prog.return_value)
+        mock_prog.return_value.close.assert_called_once_with()
+
+    @mock.patch("dump_report.save_prom")
+    @mock.patch("dump_report.crt_manifest")
+    @mock.patch("dump_sched.dump_db")
+    @mock.patch("mysql_db_dump.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_db_dump.set_db_list")
+    @mock.patch("mysql_db_dump.crt_dump_cmd")
+    @mock.patch("mysql_db_dump.mysql_libs.create_instance")
+    def test_prom_option(                       # pylint:disable=R0913,R0917
+            self, mock_inst, mock_cmd, mock_list, mock_dump, mock_manifest,
+            mock_prom):
+
+        """Function:  test_prom_option
+
+        Description:  Test with -x option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-c": "config", "-d": "/dir", "-A": True,
+                                "-x": "/textfile"}
+
+        mock_inst.return_value = self.server
+        mock_dump.return_value = []
+        mock_cmd.return_value = self.dump_cmd
+        mock_list.return_value = ["db1"]
+
+        self.assertEqual(
+            mysql_db_dump.run_program(
+                self.args, self.opt_arg_list, self.opt_dump_list), 0)
+        mock_prom.assert_called_once_with(
+            "/textfile", mock_manifest.return_value, self.server.name)
+
+    @mock.patch("dump_watch.LoadController")
+    @mock.patch("dump_sched.dump_db")
+    @mock.patch("mysql_db_dump.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_db_dump.set_db_list")
+    @mock.patch("mysql_db_dump.crt_dump_cmd")
+    @mock.patch("mysql_db_dump.mysql_libs.create_instance")
+    def test_load_option(                       # pylint:disable=R0913,R0917
+            self, mock_inst, mock_cmd, mock_list, mock_dump, mock_load):
+
+        """Function:  test_load_option
+
+        Description:  Test with -a option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-c": "config", "-d": "/dir", "-A": True,
+                                "-j": "8", "-a": "2"}
+
+        mock_inst.return_value = self.server
+        mock_dump.return_value = []
+        mock_cmd.return_value = self.dump_cmd
+        mock_list.return_value = ["db1"]
+
+        self.assertEqual(
+            mysql_db_dump.run_program(
+                self.args, self.opt_arg_list, self.opt_dump_list), 0)
+        mock_load.assert_called_once_with(self.server, 2, 8)
+        self.assertEqual(mock_dump.call_args[1]["load"],
+                         mock_load.return_value)
+
+    @mock.patch("dump_sched.dump_db")
+    @mock.patch("mysql_db_dump.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_db_dump.set_db_list")
+    @mock.patch("mysql_db_dump.crt_dump_cmd")
+    @mock.patch("mysql_db_dump.mysql_libs.create_instance")
+    def test_dump_failed(self, mock_inst, mock_cmd, mock_list, mock_dump):
+
+        """Function:  test_dump_failed
+
+        Description:  Test the exit code with a failed dump.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-c": "config", "-d": "/dir", "-A": True}
+
+        mock_inst.return_value = self.server
+        mock_dump.return_value = ["db2"]
+        mock_cmd.return_value = self.dump_cmd
+        mock_list.return_value = ["db1", "db2"]
+
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                mysql_db_dump.run_program(
+                    self.args, self.opt_arg_list, self.opt_dump_list),
+                dump_cli.EXIT_FAILED)
+
+    @mock.patch("dump_sched.dump_db",
+                mock.Mock(side_effect=OSError(28, "No space left")))
+    @mock.patch("mysql_db_dump.mysql_libs.disconnect")
+    @mock.patch("mysql_db_dump.set_db_list")
+    @mock.patch("mysql_db_dump.crt_dump_cmd")
+    @mock.patch("mysql_db_dump.mysql_libs.create_instance")
+    def test_dump_error(self, mock_inst, mock_cmd, mock_list, mock_disc):
+
+        """Function:  test_dump_error
+
+        Description:  Test the signal handler is restored and the server is
+            disconnected on an error.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-c": "config", "-d": "/dir", "-A": True}
+
+        mock_inst.return_value = self.server
+        mock_cmd.return_value = self.dump_cmd
+        mock_list.return_value = ["db1", "db2"]
+        handler = signal.getsignal(signal.SIGTERM)
+
+        with self.assertRaises(OSError):
+            mysql_db_dump.run_program(
+                self.args, self.opt_arg_list, self.opt_dump_list)
+
+        self.assertEqual(signal.getsignal(signal.SIGTERM), handler)
+        mock_disc.assert_called_once_with(self.server)
+
+    @mock.patch("dump_state.dump_incr")
+    @mock.patch("dump_sched.dump_db")
+    @mock.patch("mysql_db_dump.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_db_dump.set_db_list")
+    @mock.patch("mysql_db_dump.crt_dump_cmd")
+    @mock.patch("mysql_db_dump.mysql_libs.create_instance")
+    def test_i_option(                          # pylint:disable=R0913,R0917
+            self, mock_inst, mock_cmd, mock_list, mock_dump, mock_incr):
+
+        """Function:  test_i_option
+
+        Description:  Test with -I option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-c": "config", "-d": "/dir", "-A": True,
+                                "-I": "/dir/state.json", "-j": "2"}
+
+        mock_inst.return_value = self.server
+        mock_incr.return_value = {"Failed": []}
+        mock_cmd.return_value = self.dump_cmd
+        mock_list.return_value = ["db1", "db2"]
+
+        self.assertFalse(
+            mysql_db_dump.run_program(
+                self.args, self.opt_arg_list, self.opt_dump_list))
+        mock_dump.assert_not_called()
+        self.assertEqual(
+            mock_incr.call_args[0][:4],
+            (self.server, "/dir/state.json", self.dump_cmd, ["db1", "db2"]))
+        self.assertEqual(mock_incr.call_args[1]["workers"], 2)
+
+    @mock.patch("dump_state.dump_binlog")
+    @mock.patch("dump_sched.dump_db")
+    @mock.patch("mysql_db_dump.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_db_dump.set_db_list", mock.Mock(return_value=[]))
+    @mock.patch("mysql_db_dump.mysql_libs.crt_cmd")
+    @mock.patch("mysql_db_dump.mysql_libs.create_instance")
+    def test_b_option(                          # pylint:disable=R0913,R0917
+            self, mock_inst, mock_cmd, mock_dump, mock_binlog):
+
+        """Function:  test_b_option
+
+        Description:  Test with -b option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-c": "config", "-d": "/dir", "-b": True,
+                                "-o": "/dir/path"}
+
+        mock_inst.return_value = self.server
+        mock_binlog.return_value = True
+        mock_cmd.return_value = ["mysqlbinlog"]
+
+        self.assertFalse(
+            mysql_db_dump.run_program(
+                self.args, self.opt_arg_list, self.opt_dump_list))
+        mock_dump.assert_not_called()
+        mock_binlog.assert_called_once_with(
+            self.server, ["mysqlbinlog"], "/dir/path/")
+
     @mock.patch("mysql_db_dump.mysql_libs.disconnect",
                 mock.Mock(return_value=True))
     @mock.patch("mysql_db_dump.gen_libs.load_module",
                 mock.Mock(return_value=True))
-    @mock.patch("mysql_db_dump.add_tls")
-    @mock.patch("mysql_db_dump.add_ssl")
+    @mock.patch("dump_cli.add_tls")
+    @mock.patch("dump_cli.add_ssl")
     @mock.patch("mysql_db_dump.set_db_list")
     @mock.patch("mysql_db_dump.crt_dump_cmd")
     @mock.patch("mysql_db_dump.mysql_libs.create_instance")
@@ -235,17 +908,18 @@ class UnitTest(unittest.TestCase):
         mock_tls.return_value = self.dump_cmd
 
         with gen_libs.no_std_out():
-            self.assertFalse(
+            self.assertEqual(
                 mysql_db_dump.run_program(
-                    self.args, self.opt_arg_list, self.opt_dump_list))
+                    self.args, self.opt_arg_list, self.opt_dump_list),
+                dump_cli.EXIT_ERROR)
 
-    @mock.patch("mysql_db_dump.dump_db", mock.Mock(return_value=True))
+    @mock.patch("dump_sched.dump_db", mock.Mock(return_value=[]))
     @mock.patch("mysql_db_dump.mysql_libs.disconnect",
                 mock.Mock(return_value=True))
     @mock.patch("mysql_db_dump.gen_libs.load_module",
                 mock.Mock(return_value=True))
-    @mock.patch("mysql_db_dump.add_tls")
-    @mock.patch("mysql_db_dump.add_ssl")
+    @mock.patch("dump_cli.add_tls")
+    @mock.patch("dump_cli.add_ssl")
     @mock.patch("mysql_db_dump.set_db_list")
     @mock.patch("mysql_db_dump.crt_dump_cmd")
     @mock.patch("mysql_db_dump.mysql_libs.create_instance")
@@ -289,11 +963,12 @@ class UnitTest(unittest.TestCase):
         mock_inst.return_value = self.server
 
         with gen_libs.no_std_out():
-            self.assertFalse(
+            self.assertEqual(
                 mysql_db_dump.run_program(
-                    self.args, self.opt_arg_list, self.opt_dump_list))
+                    self.args, self.opt_arg_list, self.opt_dump_list),
+                dump_cli.EXIT_ERROR)
 
-    @mock.patch("mysql_db_dump.dump_db", mock.Mock(return_value=True))
+    @mock.patch("dump_sched.dump_db", mock.Mock(return_value=[]))
     @mock.patch("mysql_db_dump.mysql_libs.disconnect",
                 mock.Mock(return_value=True))
     @mock.patch("mysql_db_dump.set_db_list")
@@ -319,7 +994,7 @@ class UnitTest(unittest.TestCase):
             mysql_db_dump.run_program(
                 self.args, self.opt_arg_list, self.opt_dump_list))
 
-    @mock.patch("mysql_db_dump.dump_db", mock.Mock(return_value=True))
+    @mock.patch("dump_sched.dump_db", mock.Mock(return_value=[]))
     @mock.patch("mysql_db_dump.mysql_libs.disconnect",
                 mock.Mock(return_value=True))
     @mock.patch("mysql_db_dump.set_db_list")
@@ -345,7 +1020,7 @@ class UnitTest(unittest.TestCase):
             mysql_db_dump.run_program(
                 self.args, self.opt_arg_list, self.opt_dump_list))
 
-    @mock.patch("mysql_db_dump.dump_db", mock.Mock(return_value=True))
+    @mock.patch("dump_sched.dump_db", mock.Mock(return_value=[]))
     @mock.patch("mysql_db_dump.mysql_libs.disconnect",
                 mock.Mock(return_value=True))
     @mock.patch("mysql_db_dump.set_db_list")
@@ -371,7 +1046,7 @@ class UnitTest(unittest.TestCase):
             mysql_db_dump.run_program(
                 self.args, self.opt_arg_list, self.opt_dump_list))
 
-    @mock.patch("mysql_db_dump.dump_db", mock.Mock(return_value=True))
+    @mock.patch("dump_sched.dump_db", mock.Mock(return_value=[]))
     @mock.patch("mysql_db_dump.mysql_libs.disconnect",
                 mock.Mock(return_value=True))
     @mock.patch("mysql_db_dump.set_db_list")
@@ -397,7 +1072,7 @@ class UnitTest(unittest.TestCase):
             mysql_db_dump.run_program(
                 self.args, self.opt_arg_list, self.opt_dump_list))
 
-    @mock.patch("mysql_db_dump.dump_db", mock.Mock(return_value=True))
+    @mock.patch("dump_sched.dump_db", mock.Mock(return_value=[]))
     @mock.patch("mysql_db_dump.mysql_libs.disconnect",
                 mock.Mock(return_value=True))
     @mock.patch("mysql_db_dump.set_db_list")
@@ -423,7 +1098,7 @@ class UnitTest(unittest.TestCase):
             mysql_db_dump.run_program(
                 self.args, self.opt_arg_list, self.opt_dump_list))
 
-    @mock.patch("mysql_db_dump.dump_db", mock.Mock(return_value=True))
+    @mock.patch("dump_sched.dump_db", mock.Mock(return_value=[]))
     @mock.patch("mysql_db_dump.mysql_libs.disconnect",
                 mock.Mock(return_value=True))
     @mock.patch("mysql_db_dump.set_db_list")
@@ -449,7 +1124,7 @@ class UnitTest(unittest.TestCase):
             mysql_db_dump.run_program(
                 self.args, self.opt_arg_list, self.opt_dump_list))
 
-    @mock.patch("mysql_db_dump.dump_db", mock.Mock(return_value=True))
+    @mock.patch("dump_sched.dump_db", mock.Mock(return_value=[]))
     @mock.patch("mysql_db_dump.mysql_libs.disconnect",
                 mock.Mock(return_value=True))
     @mock.patch("mysql_db_dump.set_db_list")
@@ -475,7 +1150,7 @@ class UnitTest(unittest.TestCase):
             mysql_db_dump.run_program(
                 self.args, self.opt_arg_list, self.opt_dump_list))
 
-    @mock.patch("mysql_db_dump.dump_db", mock.Mock(return_value=True))
+    @mock.patch("dump_sched.dump_db", mock.Mock(return_value=[]))
     @mock.patch("mysql_db_dump.mysql_libs.disconnect",
                 mock.Mock(return_value=True))
     @mock.patch("mysql_db_dump.set_db_list")
@@ -501,7 +1176,7 @@ class UnitTest(unittest.TestCase):
             mysql_db_dump.run_program(
                 self.args, self.opt_arg_list, self.opt_dump_list))
 
-    @mock.patch("mysql_db_dump.dump_db", mock.Mock(return_value=True))
+    @mock.patch("dump_sched.dump_db", mock.Mock(return_value=[]))
     @mock.patch("mysql_db_dump.mysql_libs.disconnect",
                 mock.Mock(return_value=True))
     @mock.patch("mysql_db_dump.set_db_list")
@@ -527,7 +1202,7 @@ class UnitTest(unittest.TestCase):
             mysql_db_dump.run_program(
                 self.args, self.opt_arg_list, self.opt_dump_list))
 
-    @mock.patch("mysql_db_dump.dump_db", mock.Mock(return_value=True))
+    @mock.patch("dump_sched.dump_db", mock.Mock(return_value=[]))
     @mock.patch("mysql_db_dump.mysql_libs.disconnect",
                 mock.Mock(return_value=True))
     @mock.patch("mysql_db_dump.set_db_list")
@@ -553,7 +1228,7 @@ class UnitTest(unittest.TestCase):
             mysql_db_dump.run_program(
                 self.args, self.opt_arg_list, self.opt_dump_list))
 
-    @mock.patch("mysql_db_dump.dump_db", mock.Mock(return_value=True))
+    @mock.patch("dump_sched.dump_db", mock.Mock(return_value=[]))
     @mock.patch("mysql_db_dump.mysql_libs.disconnect",
                 mock.Mock(return_value=True))
     @mock.patch("mysql_db_dump.set_db_list")
@@ -579,7 +1254,7 @@ class UnitTest(unittest.TestCase):
             mysql_db_dump.run_program(
                 self.args, self.opt_arg_list, self.opt_dump_list))
 
-    @mock.patch("mysql_db_dump.dump_db", mock.Mock(return_value=True))
+    @mock.patch("dump_sched.dump_db", mock.Mock(return_value=[]))
     @mock.patch("mysql_db_dump.mysql_libs.disconnect",
                 mock.Mock(return_value=True))
     @mock.patch("mysql_db_dump.set_db_list")
@@ -606,7 +1281,7 @@ class UnitTest(unittest.TestCase):
             mysql_db_dump.run_program(
                 self.args, self.opt_arg_list, self.opt_dump_list))
 
-    @mock.patch("mysql_db_dump.dump_db", mock.Mock(return_value=True))
+    @mock.patch("dump_sched.dump_db", mock.Mock(return_value=[]))
     @mock.patch("mysql_db_dump.mysql_libs.disconnect",
                 mock.Mock(return_value=True))
     @mock.patch("mysql_db_dump.set_db_list")
@@ -633,7 +1308,7 @@ class UnitTest(unittest.TestCase):
             mysql_db_dump.run_program(
                 self.args, self.opt_arg_list, self.opt_dump_list))
 
-    @mock.patch("mysql_db_dump.dump_db", mock.Mock(return_value=True))
+    @mock.patch("dump_sched.dump_db", mock.Mock(return_value=[]))
     @mock.patch("mysql_db_dump.mysql_libs.disconnect",
                 mock.Mock(return_value=True))
     @mock.patch("mysql_db_dump.set_db_list")
@@ -660,7 +1335,7 @@ class UnitTest(unittest.TestCase):
             mysql_db_dump.run_program(
                 self.args, self.opt_arg_list, self.opt_dump_list))
 
-    @mock.patch("mysql_db_dump.dump_db", mock.Mock(return_value=True))
+    @mock.patch("dump_sched.dump_db", mock.Mock(return_value=[]))
     @mock.patch("mysql_db_dump.mysql_libs.disconnect",
                 mock.Mock(return_value=True))
     @mock.patch("mysql_db_dump.set_db_list")
@@ -686,7 +1361,7 @@ class UnitTest(unittest.TestCase):
             mysql_db_dump.run_program(
                 self.args, self.opt_arg_list, self.opt_dump_list))
 
-    @mock.patch("mysql_db_dump.dump_db", mock.Mock(return_value=True))
+    @mock.patch("dump_sched.dump_db", mock.Mock(return_value=[]))
     @mock.patch("mysql_db_dump.mysql_libs.disconnect",
                 mock.Mock(return_value=True))
     @mock.patch("mysql_db_dump.set_db_list")
@@ -712,7 +1387,7 @@ class UnitTest(unittest.TestCase):
             mysql_db_dump.run_program(
                 self.args, self.opt_arg_list, self.opt_dump_list))
 
-    @mock.patch("mysql_db_dump.dump_db", mock.Mock(return_value=True))
+    @mock.patch("dump_sched.dump_db", mock.Mock(return_value=[]))
     @mock.patch("mysql_db_dump.mysql_libs.disconnect",
                 mock.Mock(return_value=True))
     @mock.patch("mysql_db_dump.set_db_list")
@@ -738,7 +1413,7 @@ class UnitTest(unittest.TestCase):
             mysql_db_dump.run_program(
                 self.args, self.opt_arg_list, self.opt_dump_list))
 
-    @mock.patch("mysql_db_dump.dump_db", mock.Mock(return_value=True))
+    @mock.patch("dump_sched.dump_db", mock.Mock(return_value=[]))
     @mock.patch("mysql_db_dump.mysql_libs.disconnect",
                 mock.Mock(return_value=True))
     @mock.patch("mysql_db_dump.set_db_list")
@@ -764,7 +1439,7 @@ class UnitTest(unittest.TestCase):
             mysql_db_dump.run_program(
                 self.args, self.opt_arg_list, self.opt_dump_list))
 
-    @mock.patch("mysql_db_dump.dump_db", mock.Mock(return_value=True))
+    @mock.patch("dump_sched.dump_db", mock.Mock(return_value=[]))
     @mock.patch("mysql_db_dump.mysql_libs.disconnect",
                 mock.Mock(return_value=True))
     @mock.patch("mysql_db_dump.set_db_list")
@@ -790,7 +1465,7 @@ class UnitTest(unittest.TestCase):
             mysql_db_dump.run_program(
                 self.args, self.opt_arg_list, self.opt_dump_list))
 
-    @mock.patch("mysql_db_dump.dump_db", mock.Mock(return_value=True))
+    @mock.patch("dump_sched.dump_db", mock.Mock(return_value=[]))
     @mock.patch("mysql_db_dump.mysql_libs.disconnect",
                 mock.Mock(return_value=True))
     @mock.patch("mysql_db_dump.set_db_list")
@@ -114,6 +114,8 @@ class UnitTest(unittest.TestCase):
 
     Methods:
         setUp
+        test_size_order
+        test_size_interleave
         test_b_option_none2
         test_b_option_none
         test_b_option_some2
@@ -150,6 +152,53 @@ class UnitTest(unittest.TestCase):
         self.args_array7 = {"-p": self.local, "-B": self.db_list3}
         self.results = []
 
+    @mock.patch("dump_units.fetch_db_size")
+    @mock.patch("mysql_db_dump.mysql_libs.fetch_db_dict",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_db_dump.gen_libs.dict_2_list")
+    def test_size_order(self, mock_list, mock_size):
+
+        """Function:  test_size_order
+
+        Description:  Test the databases are ordered largest first.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = self.args_array3
+
+        mock_list.return_value = self.db_list
+        mock_size.return_value = {"db1": 10, "db2": 300, "db3": 20}
+
+        self.assertEqual(
+            mysql_db_dump.set_db_list(self.server, self.args),
+            ["db2", "db3", "db1"])
+
+    @mock.patch("dump_units.fetch_db_size")
+    @mock.patch("mysql_db_dump.mysql_libs.fetch_db_dict",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_db_dump.gen_libs.dict_2_list")
+    def test_size_interleave(self, mock_list, mock_size):
+
+        """Function:  test_size_interleave
+
+        Description:  Test the databases are interleaved with the -i option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-p": self.local, "-A": True, "-i": True}
+
+        mock_list.return_value = self.db_list
+        mock_size.return_value = {"db1": 10, "db2": 300, "db3": 20}
+
+        self.assertEqual(
+            mysql_db_dump.set_db_list(self.server, self.args),
+            ["db2", "db1", "db3"])
+
+    @mock.patch("dump_units.fetch_db_size", mock.Mock(return_value={}))
     @mock.patch("mysql_db_dump.mysql_libs.fetch_db_dict",
                 mock.Mock(return_value=True))
     @mock.patch("mysql_db_dump.gen_libs.dict_2_list")
@@ -173,6 +222,7 @@ class UnitTest(unittest.TestCase):
         results.sort()
         self.assertEqual(results, self.results)
 
+    @mock.patch("dump_units.fetch_db_size", mock.Mock(return_value={}))
     @mock.patch("mysql_db_dump.mysql_libs.fetch_db_dict",
                 mock.Mock(return_value=True))
     @mock.patch("mysql_db_dump.gen_libs.dict_2_list")
@@ -196,6 +246,7 @@ class UnitTest(unittest.TestCase):
         results.sort()
         self.assertEqual(results, self.results)
 
+    @mock.patch("dump_units.fetch_db_size", mock.Mock(return_value={}))
     @mock.patch("mysql_db_dump.mysql_libs.fetch_db_dict",
                 mock.Mock(return_value=True))
     @mock.patch("mysql_db_dump.gen_libs.dict_2_list")
@@ -221,6 +272,7 @@ class UnitTest(unittest.TestCase):
         results.sort()
         self.assertEqual(results, self.db_list2)
 
+    @mock.patch("dump_units.fetch_db_size", mock.Mock(return_value={}))
     @mock.patch("mysql_db_dump.mysql_libs.fetch_db_dict",
                 mock.Mock(return_value=True))
     @mock.patch("mysql_db_dump.gen_libs.dict_2_list")
@@ -243,6 +295,7 @@ class UnitTest(unittest.TestCase):
         results.sort()
         self.assertEqual(results, self.db_list2)
 
+    @mock.patch("dump_units.fetch_db_size", mock.Mock(return_value={}))
     @mock.patch("mysql_db_dump.mysql_libs.fetch_db_dict",
                 mock.Mock(return_value=True))
     @mock.patch("mysql_db_dump.gen_libs.dict_2_list")
@@ -265,6 +318,7 @@ class UnitTest(unittest.TestCase):
         results.sort()
         self.assertEqual(results, self.db_list)
 
+    @mock.patch("dump_units.fetch_db_size", mock.Mock(return_value={}))
     @mock.patch("mysql_db_dump.mysql_libs.fetch_db_dict",
                 mock.Mock(return_value=True))
     @mock.patch("mysql_db_dump.gen_libs.dict_2_list")
@@ -287,6 +341,7 @@ class UnitTest(unittest.TestCase):
         results.sort()
         self.assertEqual(results, self.db_list)
 
+    @mock.patch("dump_units.fetch_db_size", mock.Mock(return_value={}))
     @mock.patch("mysql_db_dump.mysql_libs.fetch_db_dict",
                 mock.Mock(return_value=True))
     @mock.patch("mysql_db_dump.gen_libs.dict_2_list")
@@ -307,6 +362,7 @@ class UnitTest(unittest.TestCase):
         self.assertEqual(
             mysql_db_dump.set_db_list(self.server, self.args), self.results)
 
+    @mock.patch("dump_units.fetch_db_size", mock.Mock(return_value={}))
     @mock.patch("mysql_db_dump.mysql_libs.fetch_db_dict",
                 mock.Mock(return_value=True))
     @mock.patch("mysql_db_dump.gen_libs.dict_2_list")
@@ -8,11 +8,99 @@ coverage erase
 
 echo ""
 echo "Running unit test modules in conjunction with coverage"
-coverage run -a --source=mysql_db_dump test/unit/mysql_db_dump/add_ssl.py
-coverage run -a --source=mysql_db_dump test/unit/mysql_db_dump/add_tls.py
+coverage run -a --source=dump_cli test/unit/dump_cli/add_ssl.py
+coverage run -a --source=dump_cli test/unit/dump_cli/add_tls.py
+coverage run -a --source=dump_cli test/unit/dump_cli/chk_codec.py
+coverage run -a --source=dump_cli test/unit/dump_cli/chk_engine.py
+coverage run -a --source=dump_cli test/unit/dump_cli/chk_hash.py
+coverage run -a --source=dump_cli test/unit/dump_cli/chk_int_opts.py
+coverage run -a --source=dump_cli test/unit/dump_cli/chk_load.py
+coverage run -a --source=dump_cli test/unit/dump_cli/crt_dump_opts.py
+coverage run -a --source=dump_cli test/unit/dump_cli/crt_engine.py
+coverage run -a --source=dump_cli test/unit/dump_cli/crt_progress.py
+coverage run -a --source=dump_cli test/unit/dump_cli/crt_server.py
+coverage run -a --source=dump_cli test/unit/dump_cli/dump_full.py
+coverage run -a --source=dump_cli test/unit/dump_cli/run_dump.py
+coverage run -a --source=dump_cli test/unit/dump_cli/term_handler.py
+coverage run -a --source=dump_engine test/unit/dump_engine/dumpengine.py
+coverage run -a --source=dump_engine test/unit/dump_engine/mysqldumpengine.py
+coverage run -a --source=dump_engine test/unit/dump_engine/nativeengine.py
+coverage run -a --source=dump_engine test/unit/dump_engine/pumpengine.py
+coverage run -a --source=dump_engine test/unit/dump_engine/quote_id.py
+coverage run -a --source=dump_engine test/unit/dump_engine/quote_val.py
+coverage run -a --source=dump_engine test/unit/dump_engine/shellengine.py
+coverage run -a --source=dump_file test/unit/dump_file/chainfile.py
+coverage run -a --source=dump_file test/unit/dump_file/dumpwriter.py
+coverage run -a --source=dump_file test/unit/dump_file/hashfile.py
+coverage run -a --source=dump_file test/unit/dump_file/new_hash.py
+coverage run -a --source=dump_file test/unit/dump_file/open_dump.py
+coverage run -a --source=dump_file test/unit/dump_file/path_size.py
+coverage run -a --source=dump_file test/unit/dump_file/prealloc_size.py
+coverage run -a --source=dump_proc test/unit/dump_proc/dump_metrics.py
+coverage run -a --source=dump_proc test/unit/dump_proc/dump_run.py
+coverage run -a --source=dump_proc test/unit/dump_proc/dump_split.py
+coverage run -a --source=dump_proc test/unit/dump_proc/dumpsplitter.py
+coverage run -a --source=dump_proc test/unit/dump_proc/split_footer.py
+coverage run -a --source=dump_proc test/unit/dump_proc/split_header.py
+coverage run -a --source=dump_proc test/unit/dump_proc/stop_proc.py
+coverage run -a --source=dump_proc test/unit/dump_proc/wait_proc.py
+coverage run -a --source=dump_report test/unit/dump_report/crt_manifest.py
+coverage run -a --source=dump_report test/unit/dump_report/crt_prom.py
+coverage run -a --source=dump_report test/unit/dump_report/prom_labels.py
+coverage run -a --source=dump_report test/unit/dump_report/save_manifest.py
+coverage run -a --source=dump_report test/unit/dump_report/save_prom.py
+coverage run -a --source=dump_sched test/unit/dump_sched/dump_attempt.py
+coverage run -a --source=dump_sched test/unit/dump_sched/dump_consistent.py
+coverage run -a --source=dump_sched test/unit/dump_sched/dump_db.py
+coverage run -a --source=dump_sched test/unit/dump_sched/dump_pool.py
+coverage run -a --source=dump_sched test/unit/dump_sched/dump_retry.py
+coverage run -a --source=dump_sched test/unit/dump_sched/dump_seq.py
+coverage run -a --source=dump_sched test/unit/dump_sched/dump_unit.py
+coverage run -a --source=dump_sched test/unit/dump_sched/plan_units.py
+coverage run -a --source=dump_sched test/unit/dump_sched/publish_dump.py
+coverage run -a --source=dump_sched test/unit/dump_sched/run_unit.py
+coverage run -a --source=dump_sched test/unit/dump_sched/sync_snapshot.py
+coverage run -a --source=dump_state test/unit/dump_state/checksum_tables.py
+coverage run -a --source=dump_state test/unit/dump_state/crt_fprint.py
+coverage run -a --source=dump_state test/unit/dump_state/dump_binlog.py
+coverage run -a --source=dump_state test/unit/dump_state/dump_incr.py
+coverage run -a --source=dump_state test/unit/dump_state/fetch_binlog_pos.py
+coverage run -a --source=dump_state test/unit/dump_state/fetch_fprint.py
+coverage run -a --source=dump_state test/unit/dump_state/fetch_fprint_rows.py
+coverage run -a --source=dump_state test/unit/dump_state/link_unchanged.py
+coverage run -a --source=dump_state test/unit/dump_state/load_state.py
+coverage run -a --source=dump_state test/unit/dump_state/record_binlog_pos.py
+coverage run -a --source=dump_state test/unit/dump_state/save_state.py
+coverage run -a --source=dump_state test/unit/dump_state/unit_fprint.py
+coverage run -a --source=dump_stream test/unit/dump_stream/bufferpool.py
+coverage run -a --source=dump_stream test/unit/dump_stream/copy_stream.py
+coverage run -a --source=dump_stream test/unit/dump_stream/dump_fname.py
+coverage run -a --source=dump_stream test/unit/dump_stream/open_compressor.py
+coverage run -a --source=dump_stream test/unit/dump_stream/parallelgzip.py
+coverage run -a --source=dump_stream test/unit/dump_stream/stage.py
+coverage run -a --source=dump_stream test/unit/dump_stream/streampipeline.py
+coverage run -a --source=dump_stream test/unit/dump_stream/writestage.py
+coverage run -a --source=dump_units test/unit/dump_units/crt_batches.py
+coverage run -a --source=dump_units test/unit/dump_units/crt_groups.py
+coverage run -a --source=dump_units test/unit/dump_units/crt_units.py
+coverage run -a --source=dump_units test/unit/dump_units/crt_where.py
+coverage run -a --source=dump_units test/unit/dump_units/fetch_data_size.py
+coverage run -a --source=dump_units test/unit/dump_units/fetch_db_size.py
+coverage run -a --source=dump_units test/unit/dump_units/fetch_tbl_chunks.py
+coverage run -a --source=dump_units test/unit/dump_units/fetch_tbl_size.py
+coverage run -a --source=dump_units test/unit/dump_units/journal.py
+coverage run -a --source=dump_units test/unit/dump_units/move_dump.py
+coverage run -a --source=dump_units test/unit/dump_units/not_started.py
+coverage run -a --source=dump_units test/unit/dump_units/order_db_list.py
+coverage run -a --source=dump_units test/unit/dump_units/part_dir.py
+coverage run -a --source=dump_units test/unit/dump_units/print_status.py
+coverage run -a --source=dump_units test/unit/dump_units/remove_dump.py
+coverage run -a --source=dump_watch test/unit/dump_watch/loadcontroller.py
+coverage run -a --source=dump_watch test/unit/dump_watch/proc_bytes.py
+coverage run -a --source=dump_watch test/unit/dump_watch/progress.py
+coverage run -a --source=dump_watch test/unit/dump_watch/unitwatch.py
+coverage run -a --source=dump_watch test/unit/dump_watch/watchdog.py
 coverage run -a --source=mysql_db_dump test/unit/mysql_db_dump/crt_dump_cmd.py
-coverage run -a --source=mysql_db_dump test/unit/mysql_db_dump/dump_db.py
-coverage run -a --source=mysql_db_dump test/unit/mysql_db_dump/dump_run.py
 coverage run -a --source=mysql_db_dump test/unit/mysql_db_dump/help_message.py
 coverage run -a --source=mysql_db_dump test/unit/mysql_db_dump/main.py
 coverage run -a --source=mysql_db_dump test/unit/mysql_db_dump/run_program.py
@@ -6,4 +6,4 @@
 
 """
 
-__version__ = "4.0.2"
+__version__ = "4.1.0"